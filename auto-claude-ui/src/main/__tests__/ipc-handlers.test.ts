@@ -503,6 +503,26 @@ describe('IPC Handlers', () => {
       );
     });
 
+    it('should forward task log events as stream chunks', async () => {
+      const { setupIpcHandlers } = await import('../ipc-handlers');
+      setupIpcHandlers(mockAgentManager as never, mockTerminalManager as never, () => mockMainWindow as never, mockPythonEnvManager as never);
+
+      mockAgentManager.emit('task-log-events', 'task-1', [
+        { type: 'TOOL_START', data: { name: 'Read', input: 'app.py', phase: 'coding' } },
+        { type: 'SUBPHASE_START', data: { subphase: 'analysis', phase: 'coding' } }
+      ]);
+
+      expect(mockMainWindow.webContents.send).toHaveBeenCalledWith(
+        'task:logsStream',
+        'task-1',
+        { type: 'tool_start', phase: 'coding', tool: { name: 'Read', input: 'app.py' } }
+      );
+      const streamCalls = mockMainWindow.webContents.send.mock.calls.filter(
+        ([channel]: unknown[]) => channel === 'task:logsStream'
+      );
+      expect(streamCalls).toHaveLength(1);
+    });
+
     it('should forward exit events with status change', async () => {
       const { setupIpcHandlers } = await import('../ipc-handlers');
       setupIpcHandlers(mockAgentManager as never, mockTerminalManager as never, () => mockMainWindow as never, mockPythonEnvManager as never);
@@ -10,6 +10,8 @@ import { detectRateLimit, createSDKRateLimitInfo, getProfileEnv, detectAuthFailu
 import { projectStore } from '../project-store';
 import { getClaudeProfileManager } from '../claude-profile-manager';
 import { findPythonCommand, parsePythonCommand } from '../python-detector';
+import { TASK_EVENT_FD, TaskEventDecoder } from './task-event-channel';
+import type { Readable } from 'stream';
 
 /**
  * Process spawning and lifecycle management
@@ -165,16 +167,25 @@ export class AgentProcessManager {
 
     // Parse Python command to handle space-separated commands like "py -3"
     const [pythonCommand, pythonBaseArgs] = parsePythonCommand(this.pythonPath);
+    // Task log markers arrive as batched frames on an extra pipe instead of
+    // stdout lines (POSIX only; Python falls back to stdout without it)
+    const useEventChannel = process.platform !== 'win32';
+    const eventChannelEnv: Record<string, string> = useEventChannel
+      ? { AUTO_CLAUDE_EVENT_FD: String(TASK_EVENT_FD), AUTO_CLAUDE_EVENT_PARENT: String(process.pid) }
+      : {};
+
     const childProcess = spawn(pythonCommand, [...pythonBaseArgs, ...args], {
       cwd,
       env: {
         ...process.env,
         ...extraEnv,
         ...profileEnv, // Include active Claude profile config
+        ...eventChannelEnv,
         PYTHONUNBUFFERED: '1', // Ensure real-time output
         PYTHONIOENCODING: 'utf-8', // Ensure UTF-8 encoding on Windows
         PYTHONUTF8: '1' // Force Python UTF-8 mode on Windows (Python 3.7+)
-      }
+      },
+      ...(useEventChannel ? { stdio: ['pipe', 'pipe', 'pipe', 'pipe'] as const } : {})
     });
 
     this.state.addProcess(taskId, {
@@ -247,6 +258,21 @@ export class AgentProcessManager {
       }
     });
 
+    // Handle structured task log events
+    const eventStream = childProcess.stdio?.[TASK_EVENT_FD] as Readable | null | undefined;
+    if (eventStream) {
+      const decoder = new TaskEventDecoder();
+      eventStream.on('data', (chunk: Buffer) => {
+        const events = decoder.push(chunk);
+        if (events.length > 0) {
+          this.emitter.emit('task-log-events', taskId, events);
+        }
+      });
+      eventStream.on('error', () => {
+        // The child closed its end early; markers fall back to stdout
+      });
+    }
+
     // Handle stderr - explicitly decode as UTF-8 for cross-platform Unicode support
     childProcess.stderr?.on('data', (data: Buffer) => {
       const log = data.toString('utf8');
@@ -7,6 +7,7 @@
  * - AgentEvents: Event handling and progress parsing
  * - AgentProcessManager: Process spawning and lifecycle
  * - AgentQueueManager: Ideation and roadmap queue management
+ * - TaskEventDecoder: Batched task log events from the Python event pipe
  */
 
 export { AgentManager } from './agent-manager';
@@ -14,6 +15,7 @@ export { AgentState } from './agent-state';
 export { AgentEvents } from './agent-events';
 export { AgentProcessManager } from './agent-process';
 export { AgentQueueManager } from './agent-queue';
+export { TaskEventDecoder, toStreamChunk } from './task-event-channel';
 
 export type {
   AgentProcess,
@@ -25,6 +27,7 @@ export type {
   IdeationProgressData,
   RoadmapProgressData
 } from './types';
+export type { TaskLogEvent } from './task-event-channel';
 
 // Re-export IdeationConfig from shared types for consistency
 export type { IdeationConfig } from '../../shared/types';
@@ -0,0 +1,86 @@
+/**
+ * Decoder for the structured task log event channel
+ *
+ * Python's task_logger.streaming.EventChannel writes batches of streaming
+ * markers to a dedicated pipe (fd 3) as frames: a 4-byte big-endian length
+ * followed by a UTF-8 JSON array of events. Without the pipe the same markers
+ * are printed to stdout as `__TASK_LOG_<TYPE>__:<json>` lines.
+ */
+
+import type { TaskLogPhase, TaskLogStreamChunk } from '../../shared/types';
+
+// File descriptor of the event pipe in the child process
+export const TASK_EVENT_FD = 3;
+
+export interface TaskLogEvent {
+  type: string;
+  data: Record<string, unknown>;
+}
+
+/**
+ * Incrementally decode frames from pipe chunks (frames may span chunks)
+ */
+export class TaskEventDecoder {
+  private buffer: Buffer = Buffer.alloc(0);
+
+  push(chunk: Buffer): TaskLogEvent[] {
+    this.buffer = this.buffer.length > 0 ? Buffer.concat([this.buffer, chunk]) : chunk;
+
+    const events: TaskLogEvent[] = [];
+    while (this.buffer.length >= 4) {
+      const length = this.buffer.readUInt32BE(0);
+      if (this.buffer.length < 4 + length) break;
+
+      const payload = this.buffer.subarray(4, 4 + length);
+      this.buffer = this.buffer.subarray(4 + length);
+      try {
+        const batch = JSON.parse(payload.toString('utf8'));
+        if (Array.isArray(batch)) {
+          events.push(...(batch as TaskLogEvent[]));
+        }
+      } catch (_e) {
+        // Skip a malformed frame; the length prefix keeps us in sync
+      }
+    }
+    return events;
+  }
+}
+
+/**
+ * Convert a task log event to the stream chunk sent to the renderer
+ * (null for events the renderer does not stream, such as subphases)
+ */
+export function toStreamChunk(event: TaskLogEvent): TaskLogStreamChunk | null {
+  const data = event.data ?? {};
+  const phase = data.phase as TaskLogPhase | undefined;
+  const timestamp = data.timestamp as string | undefined;
+
+  switch (event.type) {
+    case 'PHASE_START':
+      return { type: 'phase_start', phase, timestamp };
+    case 'PHASE_END':
+      return { type: 'phase_end', phase, timestamp };
+    case 'TEXT':
+      return {
+        type: (data.type as TaskLogStreamChunk['type']) || 'text',
+        content: data.content as string | undefined,
+        phase,
+        timestamp,
+        subtask_id: (data.subtask_id as string | null) ?? undefined
+      };
+    case 'TOOL_START':
+      return {
+        type: 'tool_start',
+        phase,
+        tool: { name: data.name as string, input: data.input as string | undefined }
+      };
+    case 'TOOL_END':
+      return {
+        type: 'tool_end',
+        phase,
+        tool: { name: data.name as string, success: data.success as boolean | undefined }
+      };
+    default:
+      return null;
+  }
+}
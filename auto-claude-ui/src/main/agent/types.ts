@@ -1,5 +1,6 @@
 import { ChildProcess } from 'child_process';
 import type { IdeationConfig } from '../../shared/types';
+import type { TaskLogEvent } from './task-event-channel';
 
 /**
  * Agent-specific types for process and state management
@@ -31,6 +32,7 @@ export interface AgentManagerEvents {
   error: (taskId: string, error: string) => void;
   exit: (taskId: string, code: number | null, processType: ProcessType) => void;
   'execution-progress': (taskId: string, progress: ExecutionProgressData) => void;
+  'task-log-events': (taskId: string, events: TaskLogEvent[]) => void;
 }
 
 // IdeationConfig now imported from shared types to maintain consistency
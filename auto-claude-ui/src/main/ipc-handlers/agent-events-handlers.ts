@@ -9,8 +9,8 @@ import type {
   Project,
   ImplementationPlan
 } from '../../shared/types';
-import { AgentManager } from '../agent';
-import type { ProcessType, ExecutionProgressData } from '../agent';
+import { AgentManager, toStreamChunk } from '../agent';
+import type { ProcessType, ExecutionProgressData, TaskLogEvent } from '../agent';
 import { titleGenerator } from '../title-generator';
 import { fileWatcher } from '../file-watcher';
 import { projectStore } from '../project-store';
@@ -35,6 +35,18 @@ export function registerAgenteventsHandlers(
     }
   });
 
+  // Structured task log events from the event pipe (task IDs are spec IDs)
+  agentManager.on('task-log-events', (taskId: string, events: TaskLogEvent[]) => {
+    const mainWindow = getMainWindow();
+    if (!mainWindow) return;
+    for (const event of events) {
+      const chunk = toStreamChunk(event);
+      if (chunk) {
+        mainWindow.webContents.send(IPC_CHANNELS.TASK_LOGS_STREAM, taskId, chunk);
+      }
+    }
+  });
+
   agentManager.on('error', (taskId: string, error: string) => {
     const mainWindow = getMainWindow();
     if (mainWindow) {
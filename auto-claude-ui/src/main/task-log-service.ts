@@ -1,10 +1,107 @@
 import path from 'path';
-import { existsSync, readFileSync, watchFile } from 'fs';
+import { closeSync, existsSync, fstatSync, openSync, readFileSync, readSync, statSync, watchFile } from 'fs';
+import type { Stats } from 'fs';
 import { EventEmitter } from 'events';
-import type { TaskLogs, TaskLogPhase, TaskLogStreamChunk, TaskPhaseLog } from '../shared/types';
+import type { TaskLogEntry, TaskLogs, TaskLogPhase, TaskLogStreamChunk, TaskPhaseLog } from '../shared/types';
+
+const LOG_FILE = 'task_logs.json';
+const JOURNAL_FILE = 'task_logs.jsonl';
+
+/**
+ * A record in the append-only task_logs.jsonl journal written by the Python backend
+ */
+interface TaskLogRecord {
+  seq: number;
+  ts?: string;
+  op: 'entry' | 'phase' | 'spec_id';
+  entry?: TaskLogEntry;
+  phase?: string;
+  status?: TaskPhaseLog['status'];
+  started_at?: string | null;
+  completed_at?: string | null;
+  spec_id?: string;
+}
 
 /**
- * Service for loading and watching phase-based task logs (task_logs.json)
+ * Incremental read position for one spec directory
+ */
+interface LogReaderState {
+  logs: TaskLogs;
+  // Bytes of the journal already applied to logs
+  offset: number;
+  // Identity of the snapshot the logs were loaded from
+  snapshotKey: string;
+}
+
+function statKey(stats: Stats): string {
+  return `${stats.ino}:${stats.mtimeMs}:${stats.size}`;
+}
+
+function parseRecords(buffer: Buffer): { records: (TaskLogRecord | null)[]; end: number } {
+  // Only complete lines; the last one may still be mid-write
+  const end = buffer.lastIndexOf(0x0a) + 1;
+  const records = buffer
+    .subarray(0, end)
+    .toString('utf-8')
+    .split('\n')
+    .filter((line) => line.length > 0)
+    .map((line) => {
+      try {
+        const record = JSON.parse(line) as TaskLogRecord;
+        return typeof record?.seq === 'number' ? record : null;
+      } catch (_e) {
+        return null;
+      }
+    });
+  return { records, end };
+}
+
+/**
+ * Apply journal records without mutating the input, so consumers holding the
+ * previous logs (e.g. for diffing new entries) keep an unchanged copy
+ */
+function applyLogRecords(logs: TaskLogs, records: TaskLogRecord[]): TaskLogs {
+  if (records.length === 0) return logs;
+
+  const next: TaskLogs = { ...logs, phases: { ...logs.phases } };
+  const phases = next.phases as Record<string, TaskPhaseLog>;
+  const copied = new Set<string>();
+
+  const phaseFor = (key: string): TaskPhaseLog => {
+    if (!copied.has(key)) {
+      const current = phases[key];
+      phases[key] = current
+        ? { ...current, entries: [...current.entries] }
+        : { phase: key as TaskLogPhase, status: 'pending', started_at: null, completed_at: null, entries: [] };
+      copied.add(key);
+    }
+    return phases[key];
+  };
+
+  for (const record of records) {
+    if (record.op === 'entry' && record.entry) {
+      phaseFor(record.entry.phase).entries.push(record.entry);
+    } else if (record.op === 'phase' && record.phase) {
+      const phase = phaseFor(record.phase);
+      if (record.status !== undefined) phase.status = record.status;
+      if (record.started_at !== undefined) phase.started_at = record.started_at;
+      if (record.completed_at !== undefined) phase.completed_at = record.completed_at;
+    } else if (record.op === 'spec_id' && record.spec_id) {
+      next.spec_id = record.spec_id;
+    }
+    next.log_seq = record.seq;
+    if (record.ts) next.updated_at = record.ts;
+  }
+  return next;
+}
+
+/**
+ * Service for loading and watching phase-based task logs
+ *
+ * The backend keeps a compacted snapshot (task_logs.json) plus an append-only
+ * journal of newer records (task_logs.jsonl). Logs are read by replaying the
+ * journal on top of the snapshot; after the first load only journal bytes
+ * appended since the previous read are parsed.
  *
  * This service provides:
  * - Loading logs from the spec directory (and worktree spec directory when active)
@@ -19,6 +116,7 @@ import type { TaskLogs, TaskLogPhase, TaskLogStreamChunk, TaskPhaseLog } from '.
 export class TaskLogService extends EventEmitter {
   private watchers: Map<string, { watcher: ReturnType<typeof watchFile>; specDir: string }> = new Map();
   private logCache: Map<string, TaskLogs> = new Map();
+  private readerStates: Map<string, LogReaderState> = new Map();
   private pollIntervals: Map<string, NodeJS.Timeout> = new Map();
   // Store paths being watched for each specId (main + worktree)
   private watchedPaths: Map<string, { mainSpecDir: string; worktreeSpecDir: string | null; specsRelPath: string }> = new Map();
@@ -35,18 +133,20 @@ export class TaskLogService extends EventEmitter {
    * Returns cached logs if the file is corrupted (e.g., mid-write by Python backend)
    */
   loadLogsFromPath(specDir: string): TaskLogs | null {
-    const logFile = path.join(specDir, 'task_logs.json');
+    const logFile = path.join(specDir, LOG_FILE);
 
     if (!existsSync(logFile)) {
+      this.readerStates.delete(specDir);
       return null;
     }
 
     try {
-      const content = readFileSync(logFile, 'utf-8');
-      const logs = JSON.parse(content) as TaskLogs;
+      const state = this.readerStates.get(specDir);
+      const logs = (state && this.readJournalTail(specDir, state)) || this.reloadLogs(specDir);
       this.logCache.set(specDir, logs);
       return logs;
     } catch (error) {
+      this.readerStates.delete(specDir);
       // JSON parse error - file may be mid-write, return cached version if available
       const cached = this.logCache.get(specDir);
       if (cached) {
@@ -59,6 +159,94 @@ export class TaskLogService extends EventEmitter {
     }
   }
 
+  /**
+   * Apply journal records appended since the last read.
+   * Returns null when the backend compacted the journal and a full reload is needed.
+   */
+  private readJournalTail(specDir: string, state: LogReaderState): TaskLogs | null {
+    if (statKey(statSync(path.join(specDir, LOG_FILE))) !== state.snapshotKey) {
+      return null;
+    }
+
+    const journalFile = path.join(specDir, JOURNAL_FILE);
+    if (!existsSync(journalFile)) {
+      return state.offset === 0 ? state.logs : null;
+    }
+
+    let buffer: Buffer;
+    const fd = openSync(journalFile, 'r');
+    try {
+      const size = fstatSync(fd).size;
+      if (size < state.offset) return null;
+      buffer = Buffer.alloc(size - state.offset);
+      readSync(fd, buffer, 0, buffer.length, state.offset);
+    } finally {
+      closeSync(fd);
+    }
+
+    const { records, end } = parseRecords(buffer);
+    let seq = state.logs.log_seq ?? 0;
+    for (const record of records) {
+      // A gap means the journal was rewritten underneath us
+      if (!record || record.seq !== seq + 1) return null;
+      seq = record.seq;
+    }
+
+    state.logs = applyLogRecords(state.logs, records as TaskLogRecord[]);
+    state.offset += end;
+    return state.logs;
+  }
+
+  /**
+   * Load the snapshot and replay the whole journal on top of it
+   */
+  private reloadLogs(specDir: string): TaskLogs {
+    // Read the journal before the snapshot: if a compaction happens in between,
+    // the new snapshot already contains every record of the old journal
+    let journal = Buffer.alloc(0);
+    try {
+      journal = readFileSync(path.join(specDir, JOURNAL_FILE));
+    } catch (_e) {
+      // No journal yet
+    }
+
+    const fd = openSync(path.join(specDir, LOG_FILE), 'r');
+    let snapshotKey: string;
+    let content: string;
+    try {
+      snapshotKey = statKey(fstatSync(fd));
+      content = readFileSync(fd, 'utf-8');
+    } finally {
+      closeSync(fd);
+    }
+    const snapshot = JSON.parse(content) as TaskLogs;
+
+    const { records, end } = parseRecords(journal);
+    const snapshotSeq = snapshot.log_seq ?? 0;
+    const logs = applyLogRecords(
+      { ...snapshot, log_seq: snapshotSeq },
+      records.filter((record): record is TaskLogRecord => record !== null && record.seq > snapshotSeq)
+    );
+
+    this.readerStates.set(specDir, { logs, offset: end, snapshotKey });
+    return logs;
+  }
+
+  /**
+   * Cheap change signature for a spec directory's log files
+   */
+  private logSignature(specDir: string): string {
+    return [LOG_FILE, JOURNAL_FILE]
+      .map((name) => {
+        try {
+          return statKey(statSync(path.join(specDir, name)));
+        } catch (_e) {
+          return '-';
+        }
+      })
+      .join('|');
+  }
+
   /**
    * Merge logs from main and worktree spec directories
    */
@@ -175,8 +363,6 @@ export class TaskLogService extends EventEmitter {
     // Stop any existing watch
     this.stopWatching(specId);
 
-    const mainLogFile = path.join(specDir, 'task_logs.json');
-
     // Calculate worktree spec directory path if we have project info
     // Worktree structure: .worktrees/{specId}/{specsRelPath}/{specId}/
     let worktreeSpecDir: string | null = null;
@@ -191,29 +377,10 @@ export class TaskLogService extends EventEmitter {
       specsRelPath: specsRelPath || ''
     });
 
-    let lastMainContent = '';
-    let lastWorktreeContent = '';
-
-    // Initial load from main spec dir
-    if (existsSync(mainLogFile)) {
-      try {
-        lastMainContent = readFileSync(mainLogFile, 'utf-8');
-      } catch (_e) {
-        // Ignore parse errors on initial load
-      }
-    }
-
-    // Initial load from worktree spec dir
-    if (worktreeSpecDir) {
-      const worktreeLogFile = path.join(worktreeSpecDir, 'task_logs.json');
-      if (existsSync(worktreeLogFile)) {
-        try {
-          lastWorktreeContent = readFileSync(worktreeLogFile, 'utf-8');
-        } catch (_e) {
-          // Ignore parse errors on initial load
-        }
-      }
-    }
+    // Compare file stats instead of contents: the journal grows with every
+    // log entry and re-reading whole files each second is what it avoids
+    let lastMainSignature = this.logSignature(specDir);
+    let lastWorktreeSignature = worktreeSpecDir ? this.logSignature(worktreeSpecDir) : '';
 
     // Do initial merged load
     const initialLogs = this.loadLogs(specDir);
@@ -227,31 +394,18 @@ export class TaskLogService extends EventEmitter {
       let worktreeChanged = false;
 
       // Check main spec dir
-      if (existsSync(mainLogFile)) {
-        try {
-          const currentContent = readFileSync(mainLogFile, 'utf-8');
-          if (currentContent !== lastMainContent) {
-            lastMainContent = currentContent;
-            mainChanged = true;
-          }
-        } catch (_error) {
-          // Ignore read/parse errors
-        }
+      const mainSignature = this.logSignature(specDir);
+      if (mainSignature !== lastMainSignature) {
+        lastMainSignature = mainSignature;
+        mainChanged = true;
       }
 
       // Check worktree spec dir
       if (worktreeSpecDir) {
-        const worktreeLogFile = path.join(worktreeSpecDir, 'task_logs.json');
-        if (existsSync(worktreeLogFile)) {
-          try {
-            const currentContent = readFileSync(worktreeLogFile, 'utf-8');
-            if (currentContent !== lastWorktreeContent) {
-              lastWorktreeContent = currentContent;
-              worktreeChanged = true;
-            }
-          } catch (_error) {
-            // Ignore read/parse errors
-          }
+        const worktreeSignature = this.logSignature(worktreeSpecDir);
+        if (worktreeSignature !== lastWorktreeSignature) {
+          lastWorktreeSignature = worktreeSignature;
+          worktreeChanged = true;
         }
       }
 
@@ -367,13 +521,14 @@ export class TaskLogService extends EventEmitter {
    */
   clearCache(specDir: string): void {
     this.logCache.delete(specDir);
+    this.readerStates.delete(specDir);
   }
 
   /**
    * Check if logs exist for a spec
    */
   hasLogs(specDir: string): boolean {
-    const logFile = path.join(specDir, 'task_logs.json');
+    const logFile = path.join(specDir, LOG_FILE);
     return existsSync(logFile);
   }
 }
@@ -86,6 +86,8 @@ export interface TaskLogs {
   spec_id: string;
   created_at: string;
   updated_at: string;
+  // Sequence number of the last journal record folded into these logs
+  log_seq?: number;
   phases: {
     planning: TaskPhaseLog;
     coding: TaskPhaseLog;
@@ -31,9 +31,11 @@ from .planner import run_followup_planner
 
 # Session management
 from .session import (
+    handle_stuck_subtask,
     post_session_processing,
     run_agent_session,
 )
+from .subtask_scheduler import SubtaskScheduler
 
 # Utility functions
 from .utils import (
@@ -57,6 +59,8 @@ __all__ = [
     # Session
     "run_agent_session",
     "post_session_processing",
+    "handle_stuck_subtask",
+    "SubtaskScheduler",
     # Utils
     "get_latest_commit",
     "get_commit_count",
@@ -15,7 +15,6 @@ from linear_updater import (
     is_linear_enabled,
     linear_build_complete,
     linear_task_started,
-    linear_task_stuck,
 )
 from phase_config import get_phase_model, get_phase_thinking_budget
 from progress import (
@@ -28,12 +27,7 @@ from progress import (
     print_progress_summary,
     print_session_header,
 )
-from prompt_generator import (
-    format_context_for_prompt,
-    generate_planner_prompt,
-    generate_subtask_prompt,
-    load_subtask_context,
-)
+from prompt_generator import generate_planner_prompt
 from prompts import is_first_run
 from recovery import RecoveryManager
 from task_logger import (
@@ -54,19 +48,59 @@ from ui import (
 )
 
 from .base import AUTO_CONTINUE_DELAY_SECONDS, HUMAN_INTERVENTION_FILE
-from .memory_manager import debug_memory_system_status, get_graphiti_context
-from .session import post_session_processing, run_agent_session
+from .memory_manager import debug_memory_system_status
+from .session import (
+    handle_stuck_subtask,
+    post_session_processing,
+    run_agent_session,
+)
+from .subtask_scheduler import (
+    SubtaskScheduler,
+    build_subtask_prompt,
+    get_subtask_concurrency,
+    use_subtask_worktrees,
+)
 from .utils import (
-    find_phase_for_subtask,
     get_commit_count,
     get_latest_commit,
-    load_implementation_plan,
     sync_plan_to_source,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _start_coding_phase(task_logger) -> None:
+    """Switch the task log from planning to coding."""
+    if task_logger:
+        task_logger.end_phase(
+            LogPhase.PLANNING,
+            success=True,
+            message="Implementation plan created",
+        )
+        task_logger.start_phase(LogPhase.CODING, "Starting implementation...")
+
+
+async def _finish_build(
+    spec_dir: Path, status_manager: StatusManager, task_logger, linear_task
+) -> None:
+    """Report a completed build to the terminal, task log and Linear."""
+    print_build_complete_banner(spec_dir)
+    status_manager.update(state=BuildState.COMPLETE)
+
+    # End coding phase in task logger
+    if task_logger:
+        task_logger.end_phase(
+            LogPhase.CODING,
+            success=True,
+            message="All subtasks completed successfully",
+        )
+
+    # Notify Linear that build is complete (moving to QA)
+    if linear_task and linear_task.task_id:
+        await linear_build_complete(spec_dir)
+        print_status("Linear notified: build complete, ready for QA", "success")
+
+
 async def run_autonomous_agent(
     project_dir: Path,
     spec_dir: Path,
@@ -183,6 +217,36 @@ async def run_autonomous_agent(
     print(box(content, width=70, style="light"))
     print()
 
+    linear_is_enabled = linear_task is not None and linear_task.task_id is not None
+
+    # Concurrent sessions for parallel-safe phases (opt-in via environment)
+    scheduler = None
+    concurrency = get_subtask_concurrency()
+    if concurrency > 1 and not use_subtask_worktrees():
+        # Sessions sharing the project directory can't be told apart by
+        # their commits, so concurrency needs a worktree per session
+        print_status(
+            "AUTO_CLAUDE_SUBTASK_CONCURRENCY needs AUTO_CLAUDE_SUBTASK_WORKTREES=true"
+            " - running subtasks sequentially",
+            "warning",
+        )
+    elif concurrency > 1:
+        scheduler = SubtaskScheduler(
+            project_dir=project_dir,
+            spec_dir=spec_dir,
+            model=model,
+            recovery_manager=recovery_manager,
+            max_concurrency=concurrency,
+            use_worktrees=True,
+            verbose=verbose,
+            linear_enabled=linear_is_enabled,
+            status_manager=status_manager,
+            source_spec_dir=source_spec_dir,
+        )
+        print_status(
+            f"Parallel-safe phases run up to {concurrency} sessions at once", "info"
+        )
+
     # Main loop
     iteration = 0
 
@@ -212,6 +276,25 @@ async def run_autonomous_agent(
             print("To continue, run the script again without --max-iterations")
             break
 
+        # Run subtasks of parallel-safe phases concurrently
+        if scheduler and not first_run and scheduler.has_parallel_work():
+            if is_planning_phase:
+                is_planning_phase = False
+                current_log_phase = LogPhase.CODING
+                _start_coding_phase(task_logger)
+
+            status_manager.update(state=BuildState.BUILDING)
+            status_manager.update_session(iteration)
+            budget = max_iterations - iteration + 1 if max_iterations else None
+            started = await scheduler.run(first_session=iteration, max_sessions=budget)
+            iteration += max(started, 1) - 1
+            print_progress_summary(spec_dir)
+
+            if is_build_complete(spec_dir):
+                await _finish_build(spec_dir, status_manager, task_logger, linear_task)
+                break
+            continue
+
         # Get the next subtask to work on
         next_subtask = get_next_subtask(spec_dir)
         subtask_id = next_subtask.get("id") if next_subtask else None
@@ -273,55 +356,18 @@ async def run_autonomous_agent(
             if is_planning_phase:
                 is_planning_phase = False
                 current_log_phase = LogPhase.CODING
-                if task_logger:
-                    task_logger.end_phase(
-                        LogPhase.PLANNING,
-                        success=True,
-                        message="Implementation plan created",
-                    )
-                    task_logger.start_phase(
-                        LogPhase.CODING, "Starting implementation..."
-                    )
+                _start_coding_phase(task_logger)
 
             if not next_subtask:
                 print("No pending subtasks found - build may be complete!")
                 break
 
-            # Get attempt count for recovery context
+            # Generate focused prompt with recovery hints and memory context
             attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
+            prompt = await build_subtask_prompt(
+                spec_dir, project_dir, next_subtask, recovery_manager
             )
 
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
-
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
-            )
-
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
-
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
-            )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
-
             # Show what we're working on
             print(f"Working on: {highlight(subtask_id)}")
             print(f"Description: {next_subtask.get('description', 'No description')}")
@@ -342,9 +388,6 @@ async def run_autonomous_agent(
 
         # === POST-SESSION PROCESSING (100% reliable) ===
         if subtask_id and not first_run:
-            linear_is_enabled = (
-                linear_task is not None and linear_task.task_id is not None
-            )
             success = await post_session_processing(
                 spec_dir=spec_dir,
                 project_dir=project_dir,
@@ -359,26 +402,9 @@ async def run_autonomous_agent(
             )
 
             # Check for stuck subtasks
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            if not success and attempt_count >= 3:
-                recovery_manager.mark_subtask_stuck(
-                    subtask_id, f"Failed after {attempt_count} attempts"
-                )
-                print()
-                print_status(
-                    f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
-                    "error",
-                )
-                print(muted("Consider: manual intervention or skipping this subtask"))
-
-                # Record stuck subtask in Linear (if enabled)
-                if linear_is_enabled:
-                    await linear_task_stuck(
-                        spec_dir=spec_dir,
-                        subtask_id=subtask_id,
-                        attempt_count=attempt_count,
-                    )
-                    print_status("Linear notified of stuck subtask", "info")
+            await handle_stuck_subtask(
+                spec_dir, subtask_id, success, recovery_manager, linear_is_enabled
+            )
         elif is_planning_phase and source_spec_dir:
             # After planning phase, sync the newly created implementation plan back to source
             if sync_plan_to_source(spec_dir, source_spec_dir):
@@ -386,22 +412,7 @@ async def run_autonomous_agent(
 
         # Handle session status
         if status == "complete":
-            print_build_complete_banner(spec_dir)
-            status_manager.update(state=BuildState.COMPLETE)
-
-            # End coding phase in task logger
-            if task_logger:
-                task_logger.end_phase(
-                    LogPhase.CODING,
-                    success=True,
-                    message="All subtasks completed successfully",
-                )
-
-            # Notify Linear that build is complete (moving to QA)
-            if linear_task and linear_task.task_id:
-                await linear_build_complete(spec_dir)
-                print_status("Linear notified: build complete, ready for QA", "success")
-
+            await _finish_build(spec_dir, status_manager, task_logger, linear_task)
             break
 
         elif status == "continue":
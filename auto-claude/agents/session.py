@@ -15,6 +15,7 @@ from insight_extractor import extract_session_insights
 from linear_updater import (
     linear_subtask_completed,
     linear_subtask_failed,
+    linear_task_stuck,
 )
 from progress import (
     count_subtasks_detailed,
@@ -310,6 +311,53 @@ async def post_session_processing(
         return False
 
 
+async def handle_stuck_subtask(
+    spec_dir: Path,
+    subtask_id: str,
+    success: bool,
+    recovery_manager: RecoveryManager,
+    linear_enabled: bool = False,
+    max_attempts: int = 3,
+) -> bool:
+    """
+    Mark a subtask as stuck once it has failed too many times.
+
+    Args:
+        spec_dir: Spec directory
+        subtask_id: The subtask that was worked on
+        success: Result of post_session_processing for the session
+        recovery_manager: Recovery manager instance
+        linear_enabled: Whether Linear integration is enabled
+        max_attempts: Failed attempts before the subtask is marked stuck
+
+    Returns:
+        True if the subtask was marked stuck
+    """
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    if success or attempt_count < max_attempts:
+        return False
+
+    recovery_manager.mark_subtask_stuck(
+        subtask_id, f"Failed after {attempt_count} attempts"
+    )
+    print()
+    print_status(
+        f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
+        "error",
+    )
+    print(muted("Consider: manual intervention or skipping this subtask"))
+
+    # Record stuck subtask in Linear (if enabled)
+    if linear_enabled:
+        await linear_task_stuck(
+            spec_dir=spec_dir,
+            subtask_id=subtask_id,
+            attempt_count=attempt_count,
+        )
+        print_status("Linear notified of stuck subtask", "info")
+    return True
+
+
 async def run_agent_session(
     client: ClaudeSDKClient,
     message: str,
@@ -0,0 +1,497 @@
+"""
+Concurrent Subtask Scheduler
+============================
+
+Runs several coder sessions at once for subtasks in phases the planner marked
+``parallel_safe``. Sequential phases keep running one session at a time in
+the main loop of run_autonomous_agent.
+
+Configuration (environment):
+    AUTO_CLAUDE_SUBTASK_CONCURRENCY  Maximum concurrent sessions (default 1,
+                                     which keeps the build fully sequential)
+    AUTO_CLAUDE_SUBTASK_WORKTREES    "true" to give every concurrent session
+                                     its own git worktree (required for
+                                     concurrency above 1)
+
+Each session works on a detached worktree of the current build commit and
+a copy of the spec directory. When it finishes, its commits are cherry-picked
+onto the build and its subtask status is copied into the real plan. A
+session whose commits don't apply is treated as a failed attempt.
+
+Sessions in the shared project directory commit there directly, so their
+commits can only be attributed to the right subtask if nothing else commits
+meanwhile. Without worktrees the scheduler therefore runs one session at a
+time, and a session whose worktree cannot be created waits until it is the
+only one running.
+
+Post-session processing runs for one finished session at a time, so
+RecoveryManager and plan updates never interleave.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.client import create_client
+from phase_config import get_phase_model, get_phase_thinking_budget
+from progress import get_parallel_subtasks
+from prompt_generator import (
+    format_context_for_prompt,
+    generate_subtask_prompt,
+    load_subtask_context,
+)
+from recovery import RecoveryManager
+from task_logger import LogPhase, get_task_logger
+from ui import StatusManager, highlight, print_status
+
+from .base import HUMAN_INTERVENTION_FILE
+from .memory_manager import get_graphiti_context
+from .session import handle_stuck_subtask, post_session_processing, run_agent_session
+from .utils import (
+    find_phase_for_subtask,
+    get_commit_count,
+    get_latest_commit,
+    load_implementation_plan,
+)
+
+logger = logging.getLogger(__name__)
+
+# Directory inside the spec directory holding per-subtask worktrees
+SUBTASK_WORKTREES_DIR = "subtask-worktrees"
+
+# Spec files that belong to the main build only
+_SPEC_COPY_IGNORE = shutil.ignore_patterns(
+    SUBTASK_WORKTREES_DIR, "task_logs.json", "task_logs.jsonl", ".task_logs_*"
+)
+
+
+def get_subtask_concurrency() -> int:
+    """Maximum number of concurrent coder sessions (at least 1)."""
+    try:
+        return max(1, int(os.environ.get("AUTO_CLAUDE_SUBTASK_CONCURRENCY", "1")))
+    except ValueError:
+        return 1
+
+
+def use_subtask_worktrees() -> bool:
+    """Whether concurrent sessions get isolated git worktrees."""
+    value = os.environ.get("AUTO_CLAUDE_SUBTASK_WORKTREES", "")
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+async def build_subtask_prompt(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    recovery_manager: RecoveryManager,
+) -> str:
+    """
+    Build the full coder prompt for a subtask.
+
+    Includes recovery hints from earlier attempts, relevant file context and
+    Graphiti memory context (if enabled).
+
+    Args:
+        spec_dir: Spec directory the session works with
+        project_dir: Working directory of the session
+        subtask: Subtask dict from get_next_subtask()/get_parallel_subtasks()
+        recovery_manager: Recovery manager of the build
+
+    Returns:
+        Prompt text
+    """
+    subtask_id = subtask.get("id")
+
+    # Get attempt count for recovery context
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(subtask_id) if attempt_count > 0 else None
+    )
+
+    # Find the phase for this subtask
+    plan = load_implementation_plan(spec_dir)
+    phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+
+    # Generate focused, minimal prompt for this subtask
+    prompt = generate_subtask_prompt(
+        spec_dir=spec_dir,
+        project_dir=project_dir,
+        subtask=subtask,
+        phase=phase or {},
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+    )
+
+    # Load and append relevant file context
+    context = load_subtask_context(spec_dir, project_dir, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        prompt += "\n\n" + format_context_for_prompt(context)
+
+    # Retrieve and append Graphiti memory context (if enabled)
+    graphiti_context = await get_graphiti_context(spec_dir, project_dir, subtask)
+    if graphiti_context:
+        prompt += "\n\n" + graphiti_context
+        print_status("Graphiti memory context loaded", "success")
+
+    return prompt
+
+
+# =============================================================================
+# Isolated worktrees
+# =============================================================================
+
+
+@dataclass
+class SubtaskWorkspace:
+    """A detached git worktree in which one subtask session runs."""
+
+    subtask_id: str
+    path: Path
+    spec_dir: Path
+    base_commit: str
+
+
+def _git(cwd: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+
+
+def create_subtask_workspace(
+    project_dir: Path, spec_dir: Path, subtask_id: str
+) -> SubtaskWorkspace | None:
+    """
+    Create a worktree of the current build commit for one subtask.
+
+    Args:
+        project_dir: Build working directory (main repo or spec worktree)
+        spec_dir: Spec directory inside project_dir
+        subtask_id: Subtask the worktree is for
+
+    Returns:
+        The workspace, or None if one cannot be created (the session then
+        runs in the shared project directory)
+    """
+    try:
+        spec_rel = spec_dir.resolve().relative_to(project_dir.resolve())
+    except ValueError:
+        return None
+
+    base_commit = get_latest_commit(project_dir)
+    if not base_commit:
+        return None
+
+    safe_id = re.sub(r"[^A-Za-z0-9._-]", "_", subtask_id)
+    path = spec_dir / SUBTASK_WORKTREES_DIR / safe_id
+    if path.exists():
+        _remove_worktree(project_dir, path)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    result = _git(project_dir, "worktree", "add", "--detach", str(path), base_commit)
+    if result.returncode != 0:
+        logger.warning(f"Could not create worktree for {subtask_id}: {result.stderr}")
+        return None
+
+    workspace_spec_dir = path / spec_rel
+    shutil.copytree(
+        spec_dir, workspace_spec_dir, ignore=_SPEC_COPY_IGNORE, dirs_exist_ok=True
+    )
+    return SubtaskWorkspace(subtask_id, path, workspace_spec_dir, base_commit)
+
+
+def integrate_subtask_workspace(
+    project_dir: Path, spec_dir: Path, workspace: SubtaskWorkspace
+) -> bool:
+    """
+    Apply a finished session's commits and subtask status to the build.
+
+    Args:
+        project_dir: Build working directory
+        spec_dir: Spec directory of the build
+        workspace: Workspace the session ran in
+
+    Returns:
+        False if the commits conflict with the build (nothing is applied)
+    """
+    head = get_latest_commit(workspace.path)
+    if head and head != workspace.base_commit:
+        result = _git(
+            project_dir,
+            "cherry-pick",
+            "--allow-empty",
+            f"{workspace.base_commit}..{head}",
+        )
+        if result.returncode != 0:
+            logger.warning(
+                f"Cherry-pick of {workspace.subtask_id} failed: {result.stderr}"
+            )
+            _git(project_dir, "cherry-pick", "--abort")
+            return False
+
+    _copy_subtask_status(workspace.spec_dir, spec_dir, workspace.subtask_id)
+    return True
+
+
+def _copy_subtask_status(from_spec_dir: Path, to_spec_dir: Path, subtask_id: str):
+    """Copy one subtask's status fields between implementation plans."""
+    source_plan = load_implementation_plan(from_spec_dir)
+    target_plan = load_implementation_plan(to_spec_dir)
+    if not source_plan or not target_plan:
+        return
+
+    source = find_phase_for_subtask(source_plan, subtask_id)
+    target = find_phase_for_subtask(target_plan, subtask_id)
+    if not source or not target:
+        return
+    source_subtask = next(s for s in source["subtasks"] if s.get("id") == subtask_id)
+    target_subtask = next(s for s in target["subtasks"] if s.get("id") == subtask_id)
+
+    for key in ("status", "notes", "updated_at"):
+        if key in source_subtask:
+            target_subtask[key] = source_subtask[key]
+    if "last_updated" in source_plan:
+        target_plan["last_updated"] = source_plan["last_updated"]
+
+    plan_file = to_spec_dir / "implementation_plan.json"
+    tmp_file = plan_file.with_suffix(".json.tmp")
+    with open(tmp_file, "w") as f:
+        json.dump(target_plan, f, indent=2)
+    os.replace(tmp_file, plan_file)
+
+
+def _remove_worktree(project_dir: Path, path: Path) -> None:
+    _git(project_dir, "worktree", "remove", "--force", str(path))
+    if path.exists():
+        shutil.rmtree(path, ignore_errors=True)
+    _git(project_dir, "worktree", "prune")
+
+
+def remove_subtask_workspace(project_dir: Path, workspace: SubtaskWorkspace) -> None:
+    """Delete a subtask worktree."""
+    _remove_worktree(project_dir, workspace.path)
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+
+@dataclass
+class _SubtaskRun:
+    subtask: dict
+    session_num: int
+    workspace: SubtaskWorkspace | None = None
+    commit_before: str | None = None
+    commit_count_before: int = 0
+    status: str = field(default="error")
+
+    @property
+    def subtask_id(self) -> str:
+        return self.subtask["id"]
+
+
+class SubtaskScheduler:
+    """Keeps up to ``max_concurrency`` coder sessions running."""
+
+    def __init__(
+        self,
+        project_dir: Path,
+        spec_dir: Path,
+        model: str,
+        recovery_manager: RecoveryManager,
+        max_concurrency: int,
+        use_worktrees: bool = False,
+        verbose: bool = False,
+        linear_enabled: bool = False,
+        status_manager: StatusManager | None = None,
+        source_spec_dir: Path | None = None,
+    ):
+        self.project_dir = project_dir
+        self.spec_dir = spec_dir
+        self.model = model
+        self.recovery_manager = recovery_manager
+        # Shared-directory sessions must run alone (see module docstring)
+        self.max_concurrency = max(1, max_concurrency) if use_worktrees else 1
+        self.use_worktrees = use_worktrees
+        self.verbose = verbose
+        self.linear_enabled = linear_enabled
+        self.status_manager = status_manager
+        self.source_spec_dir = source_spec_dir
+        self._running: dict[asyncio.Task, _SubtaskRun] = {}
+        # True while a session runs (or waits to run) in the shared directory
+        self._exclusive = False
+        self._finished: asyncio.Condition | None = None
+
+    def has_parallel_work(self) -> bool:
+        """True if more than one subtask could run right now."""
+        return len(get_parallel_subtasks(self.spec_dir, 2, self._stuck_ids())) > 1
+
+    def _stuck_ids(self) -> set[str]:
+        return {s["subtask_id"] for s in self.recovery_manager.get_stuck_subtasks()}
+
+    async def run(self, first_session: int, max_sessions: int | None = None) -> int:
+        """
+        Run sessions until no parallel-safe subtask is left to start.
+
+        Args:
+            first_session: Session number of the first session started
+            max_sessions: Maximum number of sessions to start (None = no limit)
+
+        Returns:
+            Number of sessions started
+        """
+        running = self._running = {}
+        self._exclusive = False
+        self._finished = asyncio.Condition()
+        started = 0
+
+        try:
+            while True:
+                free = self.max_concurrency - len(running)
+                if max_sessions is not None:
+                    free = min(free, max_sessions - started)
+                paused = (self.spec_dir / HUMAN_INTERVENTION_FILE).exists()
+
+                if free > 0 and not paused and not self._exclusive:
+                    claimed = {run.subtask_id for run in running.values()}
+                    for subtask in get_parallel_subtasks(
+                        self.spec_dir, free, claimed | self._stuck_ids()
+                    ):
+                        run = _SubtaskRun(subtask, first_session + started)
+                        started += 1
+                        print(
+                            f"Starting session {run.session_num}: "
+                            f"{highlight(run.subtask_id)} - {subtask.get('description')}"
+                        )
+                        running[asyncio.create_task(self._run_session(run))] = run
+
+                if self.status_manager:
+                    self.status_manager.update_workers(
+                        len(running), self.max_concurrency
+                    )
+                    self.status_manager.update_subtasks(in_progress=len(running))
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    run = running.pop(task)
+                    try:
+                        run.status = task.result()
+                    except Exception as e:
+                        logger.warning(f"Session for {run.subtask_id} failed: {e}")
+                        run.status = "error"
+                    await self._finish(run)
+                    async with self._finished:
+                        self._finished.notify_all()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            for run in running.values():
+                if run.workspace:
+                    remove_subtask_workspace(self.project_dir, run.workspace)
+
+        return started
+
+    async def _run_session(self, run: _SubtaskRun) -> str:
+        if self.use_worktrees:
+            run.workspace = await asyncio.to_thread(
+                create_subtask_workspace,
+                self.project_dir,
+                self.spec_dir,
+                run.subtask_id,
+            )
+        if run.workspace is None:
+            # Commits made in the shared directory are attributed to this
+            # session, so nothing else may run (or integrate) meanwhile
+            self._exclusive = True
+            if len(self._running) > 1:
+                print_status(
+                    f"No worktree for {run.subtask_id} - "
+                    "waiting for the other sessions to finish",
+                    "warning",
+                )
+            async with self._finished:
+                await self._finished.wait_for(lambda: len(self._running) <= 1)
+            run.commit_before = get_latest_commit(self.project_dir)
+            run.commit_count_before = get_commit_count(self.project_dir)
+
+        session_project_dir = run.workspace.path if run.workspace else self.project_dir
+        session_spec_dir = run.workspace.spec_dir if run.workspace else self.spec_dir
+
+        prompt = await build_subtask_prompt(
+            session_spec_dir, session_project_dir, run.subtask, self.recovery_manager
+        )
+        client = create_client(
+            session_project_dir,
+            session_spec_dir,
+            get_phase_model(self.spec_dir, "coding", self.model),
+            max_thinking_tokens=get_phase_thinking_budget(self.spec_dir, "coding"),
+        )
+
+        # Log under the build's spec directory, labelled with this session
+        task_logger = get_task_logger(self.spec_dir)
+        scope = (
+            task_logger.session_scope(run.session_num, run.subtask_id)
+            if task_logger
+            else nullcontext()
+        )
+        with scope:
+            async with client:
+                status, _ = await run_agent_session(
+                    client, prompt, self.spec_dir, self.verbose, phase=LogPhase.CODING
+                )
+        return status
+
+    async def _finish(self, run: _SubtaskRun) -> None:
+        """Integrate and post-process one finished session."""
+        if run.workspace is None:
+            self._exclusive = False
+        else:
+            run.commit_before = get_latest_commit(self.project_dir)
+            run.commit_count_before = get_commit_count(self.project_dir)
+            try:
+                integrated = await asyncio.to_thread(
+                    integrate_subtask_workspace,
+                    self.project_dir,
+                    self.spec_dir,
+                    run.workspace,
+                )
+            finally:
+                await asyncio.to_thread(
+                    remove_subtask_workspace, self.project_dir, run.workspace
+                )
+            if not integrated:
+                print_status(
+                    f"Changes for {run.subtask_id} conflict with the build - will retry",
+                    "warning",
+                )
+
+        success = await post_session_processing(
+            spec_dir=self.spec_dir,
+            project_dir=self.project_dir,
+            subtask_id=run.subtask_id,
+            session_num=run.session_num,
+            commit_before=run.commit_before,
+            commit_count_before=run.commit_count_before,
+            recovery_manager=self.recovery_manager,
+            linear_enabled=self.linear_enabled,
+            status_manager=self.status_manager,
+            source_spec_dir=self.source_spec_dir,
+        )
+        await handle_stuck_subtask(
+            self.spec_dir,
+            run.subtask_id,
+            success,
+            self.recovery_manager,
+            self.linear_enabled,
+        )
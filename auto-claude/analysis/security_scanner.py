@@ -21,21 +21,36 @@ Usage:
         print("Security issues found - blocking QA approval")
 """
 
+import asyncio
+import concurrent.futures
 import json
+import os
+import shutil
 import subprocess
+import threading
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 # Import the existing secrets scanner
 try:
-    from security.scan_secrets import SecretMatch, get_all_tracked_files, scan_files
+    from security.scan_secrets import (
+        SecretMatch,
+        get_all_tracked_files,
+        scan_files,
+        scan_files_cached,
+    )
 
     HAS_SECRETS_SCANNER = True
 except ImportError:
     HAS_SECRETS_SCANNER = False
     SecretMatch = None
 
+# Shared deadline for all tool stages of one scan (seconds)
+SCAN_TIMEOUT = 120.0
+
 
 # =============================================================================
 # DATA CLASSES
@@ -77,6 +92,7 @@ class SecurityScanResult:
         scan_errors: List of errors during scanning
         has_critical_issues: Whether any critical issues were found
         should_block_qa: Whether these results should block QA approval
+        stage_timings: Wall-clock seconds spent in each stage that ran
     """
 
     secrets: list[dict[str, Any]] = field(default_factory=list)
@@ -84,6 +100,74 @@ class SecurityScanResult:
     scan_errors: list[str] = field(default_factory=list)
     has_critical_issues: bool = False
     should_block_qa: bool = False
+    stage_timings: dict[str, float] = field(default_factory=dict)
+
+
+# =============================================================================
+# TOOL HELPERS
+# =============================================================================
+
+# Resolved tool paths keyed by (tool, PATH), shared by all scanners
+_tool_paths: dict[tuple[str, str], str | None] = {}
+_tool_paths_lock = threading.Lock()
+
+
+def find_tool(name: str) -> str | None:
+    """
+    Find an executable on PATH, caching the answer for the process.
+
+    Args:
+        name: Executable name (e.g. "bandit")
+
+    Returns:
+        Absolute path of the executable, or None if it is not installed
+    """
+    key = (name, os.environ.get("PATH", ""))
+    with _tool_paths_lock:
+        if key not in _tool_paths:
+            _tool_paths[key] = shutil.which(name)
+        return _tool_paths[key]
+
+
+def reset_tool_cache() -> None:
+    """Forget cached tool lookups (e.g. after installing a tool)."""
+    with _tool_paths_lock:
+        _tool_paths.clear()
+
+
+async def run_tool(cmd: list[str], cwd: Path, deadline: float) -> str:
+    """
+    Run a tool as an async subprocess and return its stdout.
+
+    Args:
+        cmd: Command line; cmd[0] should be a path from find_tool()
+        cwd: Working directory
+        deadline: Event loop time by which the tool must have finished
+
+    Returns:
+        Decoded stdout
+
+    Raises:
+        subprocess.TimeoutExpired: If the deadline passed (the tool is killed)
+        FileNotFoundError: If the executable does not exist
+    """
+    timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except (TimeoutError, asyncio.CancelledError) as e:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        if isinstance(e, TimeoutError):
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+        raise
+    return stdout.decode("utf-8", errors="replace")
 
 
 # =============================================================================
@@ -114,10 +198,14 @@ class SecurityScanner:
         run_secrets: bool = True,
         run_sast: bool = True,
         run_dependency_audit: bool = True,
+        timeout: float = SCAN_TIMEOUT,
     ) -> SecurityScanResult:
         """
         Run all applicable security scans.
 
+        Blocking wrapper around scan_async(); safe to call from inside a
+        running event loop.
+
         Args:
             project_dir: Path to the project root
             spec_dir: Path to the spec directory (for storing results)
@@ -125,24 +213,85 @@ class SecurityScanner:
             run_secrets: Whether to run secrets scanning
             run_sast: Whether to run SAST tools
             run_dependency_audit: Whether to run dependency audits
+            timeout: Shared deadline for the SAST and audit tools, in seconds
 
         Returns:
             SecurityScanResult with all findings
         """
-        project_dir = Path(project_dir)
-        result = SecurityScanResult()
 
-        # Run secrets scan
-        if run_secrets:
-            self._run_secrets_scan(project_dir, changed_files, result)
+        def run() -> SecurityScanResult:
+            return asyncio.run(
+                self.scan_async(
+                    project_dir,
+                    spec_dir,
+                    changed_files,
+                    run_secrets=run_secrets,
+                    run_sast=run_sast,
+                    run_dependency_audit=run_dependency_audit,
+                    timeout=timeout,
+                )
+            )
 
-        # Run SAST based on project type
-        if run_sast:
-            self._run_sast_scans(project_dir, result)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
 
-        # Run dependency audits
-        if run_dependency_audit:
-            self._run_dependency_audits(project_dir, result)
+        if loop and loop.is_running():
+            # Already in an async context - run in a new thread
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                return pool.submit(run).result()
+        return run()
+
+    async def scan_async(
+        self,
+        project_dir: Path,
+        spec_dir: Path | None = None,
+        changed_files: list[str] | None = None,
+        run_secrets: bool = True,
+        run_sast: bool = True,
+        run_dependency_audit: bool = True,
+        timeout: float = SCAN_TIMEOUT,
+    ) -> SecurityScanResult:
+        """
+        Run all applicable security scans concurrently.
+
+        The secrets scan runs in a worker thread while Bandit, npm audit and
+        pip-audit run as async subprocesses. The tools share one deadline;
+        any still running when it passes are killed and reported as timed
+        out. Findings are merged in a fixed stage order.
+
+        Args:
+            See scan()
+
+        Returns:
+            SecurityScanResult with all findings and per-stage timings
+        """
+        project_dir = Path(project_dir)
+        deadline = asyncio.get_running_loop().time() + timeout
+
+        stages = self._plan_stages(
+            project_dir,
+            changed_files,
+            deadline,
+            run_secrets=run_secrets,
+            run_sast=run_sast,
+            run_dependency_audit=run_dependency_audit,
+        )
+        partials = [SecurityScanResult() for _ in stages]
+        durations = await asyncio.gather(
+            *(
+                self._timed(stage(partial))
+                for (_, stage), partial in zip(stages, partials)
+            )
+        )
+
+        result = SecurityScanResult()
+        for (name, _), partial, duration in zip(stages, partials, durations):
+            result.secrets.extend(partial.secrets)
+            result.vulnerabilities.extend(partial.vulnerabilities)
+            result.scan_errors.extend(partial.scan_errors)
+            result.stage_timings[name] = duration
 
         # Determine if should block QA
         result.has_critical_issues = (
@@ -161,6 +310,61 @@ class SecurityScanner:
 
         return result
 
+    def _plan_stages(
+        self,
+        project_dir: Path,
+        changed_files: list[str] | None,
+        deadline: float,
+        run_secrets: bool,
+        run_sast: bool,
+        run_dependency_audit: bool,
+    ) -> list[tuple[str, Callable[[SecurityScanResult], Awaitable[None]]]]:
+        """Pick the stages that apply to the project, in merge order."""
+        is_python = self._is_python_project(project_dir)
+        stages: list[tuple[str, Callable[[SecurityScanResult], Awaitable[None]]]] = []
+
+        if run_secrets:
+            stages.append(
+                (
+                    "secrets",
+                    lambda r: asyncio.to_thread(
+                        self._run_secrets_scan, project_dir, changed_files, r
+                    ),
+                )
+            )
+
+        # Python SAST with Bandit
+        # (JavaScript is covered by npm audit in the dependency audits)
+        if run_sast and is_python:
+            stages.append(
+                ("bandit", lambda r: self._run_bandit(project_dir, r, deadline))
+            )
+
+        if run_dependency_audit:
+            if (project_dir / "package.json").exists():
+                stages.append(
+                    (
+                        "npm_audit",
+                        lambda r: self._run_npm_audit(project_dir, r, deadline),
+                    )
+                )
+            if is_python:
+                stages.append(
+                    (
+                        "pip_audit",
+                        lambda r: self._run_pip_audit(project_dir, r, deadline),
+                    )
+                )
+
+        return stages
+
+    @staticmethod
+    async def _timed(stage: Awaitable[None]) -> float:
+        """Await a stage and return its duration in seconds."""
+        started = time.perf_counter()
+        await stage
+        return round(time.perf_counter() - started, 3)
+
     def _run_secrets_scan(
         self,
         project_dir: Path,
@@ -173,14 +377,11 @@ class SecurityScanner:
             return
 
         try:
-            # Get files to scan
+            # Get files to scan; full-repo scans reuse results for unchanged blobs
             if changed_files:
-                files_to_scan = changed_files
+                matches = scan_files(changed_files, project_dir)
             else:
-                files_to_scan = get_all_tracked_files()
-
-            # Run scan
-            matches = scan_files(files_to_scan, project_dir)
+                matches = scan_files_cached(get_all_tracked_files(), project_dir)
 
             # Convert matches to result format
             for match in matches:
@@ -208,16 +409,9 @@ class SecurityScanner:
         except Exception as e:
             result.scan_errors.append(f"Secrets scan error: {str(e)}")
 
-    def _run_sast_scans(self, project_dir: Path, result: SecurityScanResult) -> None:
-        """Run SAST tools based on project type."""
-        # Python SAST with Bandit
-        if self._is_python_project(project_dir):
-            self._run_bandit(project_dir, result)
-
-        # JavaScript/Node.js - npm audit
-        # (handled in dependency audits for Node projects)
-
-    def _run_bandit(self, project_dir: Path, result: SecurityScanResult) -> None:
+    async def _run_bandit(
+        self, project_dir: Path, result: SecurityScanResult, deadline: float
+    ) -> None:
         """Run Bandit security scanner for Python projects."""
         if not self._check_bandit_available():
             return
@@ -235,14 +429,13 @@ class SecurityScanner:
 
             if not src_dirs:
                 # Try to find any Python files
-                py_files = list(project_dir.glob("**/*.py"))
-                if not py_files:
+                if next(project_dir.glob("**/*.py"), None) is None:
                     return
                 src_dirs = ["."]
 
             # Run bandit
             cmd = [
-                "bandit",
+                find_tool("bandit") or "bandit",
                 "-r",
                 *src_dirs,
                 "-f",
@@ -250,17 +443,11 @@ class SecurityScanner:
                 "--exit-zero",  # Don't fail on findings
             ]
 
-            proc = subprocess.run(
-                cmd,
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            stdout = await run_tool(cmd, project_dir, deadline)
 
-            if proc.stdout:
+            if stdout:
                 try:
-                    bandit_output = json.loads(proc.stdout)
+                    bandit_output = json.loads(stdout)
                     for finding in bandit_output.get("results", []):
                         severity = finding.get("issue_severity", "MEDIUM").lower()
                         if severity == "high":
@@ -291,34 +478,21 @@ class SecurityScanner:
         except Exception as e:
             result.scan_errors.append(f"Bandit error: {str(e)}")
 
-    def _run_dependency_audits(
-        self, project_dir: Path, result: SecurityScanResult
+    async def _run_npm_audit(
+        self, project_dir: Path, result: SecurityScanResult, deadline: float
     ) -> None:
-        """Run dependency vulnerability audits."""
-        # npm audit for JavaScript projects
-        if (project_dir / "package.json").exists():
-            self._run_npm_audit(project_dir, result)
-
-        # pip-audit for Python projects (if available)
-        if self._is_python_project(project_dir):
-            self._run_pip_audit(project_dir, result)
-
-    def _run_npm_audit(self, project_dir: Path, result: SecurityScanResult) -> None:
         """Run npm audit for JavaScript projects."""
+        if not self._check_npm_available():
+            return  # npm not available
+
         try:
-            cmd = ["npm", "audit", "--json"]
-
-            proc = subprocess.run(
-                cmd,
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            cmd = [find_tool("npm") or "npm", "audit", "--json"]
 
-            if proc.stdout:
+            stdout = await run_tool(cmd, project_dir, deadline)
+
+            if stdout:
                 try:
-                    audit_output = json.loads(proc.stdout)
+                    audit_output = json.loads(stdout)
 
                     # npm audit v2+ format
                     vulnerabilities = audit_output.get("vulnerabilities", {})
@@ -357,22 +531,22 @@ class SecurityScanner:
         except Exception as e:
             result.scan_errors.append(f"npm audit error: {str(e)}")
 
-    def _run_pip_audit(self, project_dir: Path, result: SecurityScanResult) -> None:
+    async def _run_pip_audit(
+        self, project_dir: Path, result: SecurityScanResult, deadline: float
+    ) -> None:
         """Run pip-audit for Python projects (if available)."""
+        pip_audit = find_tool("pip-audit")
+        if not pip_audit:
+            return  # pip-audit not available
+
         try:
-            cmd = ["pip-audit", "--format", "json"]
-
-            proc = subprocess.run(
-                cmd,
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            cmd = [pip_audit, "--format", "json"]
+
+            stdout = await run_tool(cmd, project_dir, deadline)
 
-            if proc.stdout:
+            if stdout:
                 try:
-                    audit_output = json.loads(proc.stdout)
+                    audit_output = json.loads(stdout)
                     for vuln in audit_output:
                         severity = "high" if vuln.get("fix_versions") else "medium"
 
@@ -408,19 +582,17 @@ class SecurityScanner:
         return any(p.exists() for p in indicators)
 
     def _check_bandit_available(self) -> bool:
-        """Check if Bandit is available."""
+        """Check if Bandit is available (cached, no process is spawned)."""
         if self._bandit_available is None:
-            try:
-                subprocess.run(
-                    ["bandit", "--version"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                self._bandit_available = True
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                self._bandit_available = False
+            self._bandit_available = find_tool("bandit") is not None
         return self._bandit_available
 
+    def _check_npm_available(self) -> bool:
+        """Check if npm is available (cached, no process is spawned)."""
+        if self._npm_available is None:
+            self._npm_available = find_tool("npm") is not None
+        return self._npm_available
+
     def _redact_secret(self, text: str) -> str:
         """Redact a secret for safe logging."""
         if len(text) <= 8:
@@ -457,6 +629,7 @@ class SecurityScanner:
             "scan_errors": result.scan_errors,
             "has_critical_issues": result.has_critical_issues,
             "should_block_qa": result.should_block_qa,
+            "stage_timings": result.stage_timings,
             "summary": {
                 "total_secrets": len(result.secrets),
                 "total_vulnerabilities": len(result.vulnerabilities),
@@ -592,6 +765,11 @@ def main() -> None:
             for error in result.scan_errors:
                 print(f"  - {error}")
 
+        if result.stage_timings:
+            print("\nStage Timings:")
+            for stage, seconds in result.stage_timings.items():
+                print(f"  - {stage}: {seconds:.2f}s")
+
 
 if __name__ == "__main__":
     main()
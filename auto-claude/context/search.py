@@ -3,19 +3,26 @@ Code Search Functionality
 ==========================
 
 Search codebase for relevant files based on keywords.
+
+Keyword lookups are served from a persistent inverted index
+(see search_index.py) so unchanged files are never re-read between tasks.
 """
 
+import sqlite3
 from pathlib import Path
 
 from .constants import CODE_EXTENSIONS, SKIP_DIRS
 from .models import FileMatch
+from .search_index import SearchIndex, is_indexable_keyword
 
 
 class CodeSearcher:
     """Searches code files for relevant matches."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, use_index: bool = True):
         self.project_dir = project_dir.resolve()
+        self.use_index = use_index
+        self.index = SearchIndex(self.project_dir)
 
     def search_service(
         self,
@@ -34,10 +41,91 @@ class CodeSearcher:
         Returns:
             List of FileMatch objects sorted by relevance
         """
+        if not service_path.exists():
+            return []
+
+        if self.use_index and all(is_indexable_keyword(k) for k in keywords):
+            try:
+                matches = self._search_index(service_path, service_name, keywords)
+            except (sqlite3.Error, OSError):
+                matches = self._search_files(service_path, service_name, keywords)
+        else:
+            matches = self._search_files(service_path, service_name, keywords)
+
+        # Sort by relevance
+        matches.sort(key=lambda m: m.relevance_score, reverse=True)
+        top_matches = matches[:20]  # Top 20 per service
+        self._fill_line_text(top_matches)
+        return top_matches
+
+    def _search_index(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """
+        Score files using the persistent inverted index.
+
+        Line numbers come from the index; line text is filled in later for
+        the top matches only (see _fill_line_text).
+        """
+        paths, hits = self.index.query(service_path, keywords)
+
         matches = []
+        for rel_path in paths:
+            file_hits = hits.get(rel_path)
+            if not file_hits:
+                continue
 
-        if not service_path.exists():
-            return matches
+            score = 0
+            matching_keywords = []
+            matching_lines = []
+            for keyword in keywords:
+                keyword_hits = file_hits.get(keyword)
+                if keyword_hits is None or keyword_hits.count == 0:
+                    continue
+                score += min(keyword_hits.count, 10)  # Cap at 10 per keyword
+                matching_keywords.append(keyword)
+                matching_lines.extend((line_no, "") for line_no in keyword_hits.lines)
+
+            if score > 0:
+                matches.append(
+                    FileMatch(
+                        path=str(Path(rel_path)),
+                        service=service_name,
+                        reason=f"Contains: {', '.join(matching_keywords)}",
+                        relevance_score=score,
+                        matching_lines=matching_lines[:5],  # Top 5 lines
+                    )
+                )
+        return matches
+
+    def _fill_line_text(self, matches: list[FileMatch]) -> None:
+        """Replace index-only line hits with the stripped line text."""
+        for match in matches:
+            if not match.matching_lines or match.matching_lines[0][1]:
+                continue
+            try:
+                text = (self.project_dir / match.path).read_text(errors="ignore")
+            except OSError:
+                continue
+            lines = text.split("\n")
+            match.matching_lines = [
+                (line_no, lines[line_no - 1].strip()[:100])
+                if line_no <= len(lines)
+                else (line_no, "")
+                for line_no, _ in match.matching_lines
+            ]
+
+    def _search_files(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """Score files by reading every code file in the service."""
+        matches = []
 
         for file_path in self._iter_code_files(service_path):
             try:
@@ -79,9 +167,7 @@ class CodeSearcher:
             except (OSError, UnicodeDecodeError):
                 continue
 
-        # Sort by relevance
-        matches.sort(key=lambda m: m.relevance_score, reverse=True)
-        return matches[:20]  # Top 20 per service
+        return matches
 
     def _iter_code_files(self, directory: Path):
         """
@@ -0,0 +1,330 @@
+"""
+Persistent Search Index
+=======================
+
+On-disk inverted index of lowercase identifier tokens used by CodeSearcher.
+
+The index lives in .auto-claude/context_index.db (SQLite) and is refreshed
+incrementally: a file is only re-tokenized when its mtime or size changes.
+Keyword queries are answered from the postings table without opening files.
+
+Because keywords are matched as substrings of the lowercased file content,
+and a keyword made only of word characters can never span a token boundary,
+the occurrence count of a keyword in a file equals the sum over indexed
+tokens of ``token.count(keyword) * token_frequency``.
+"""
+
+import os
+import re
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .constants import CODE_EXTENSIONS, SKIP_DIRS
+
+# Bump when the schema or tokenization changes to force a rebuild
+INDEX_VERSION = "1"
+
+INDEX_FILENAME = "context_index.db"
+
+# Lowercase identifier runs - the unit of the inverted index
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+# Keywords that can be answered from the index (no cross-token matches)
+INDEXABLE_KEYWORD = re.compile(r"[a-z0-9_]+")
+
+# Line numbers stored per (token, file). CodeSearcher only needs the first
+# three matching lines per keyword, and the first three lines of a union of
+# tokens are always among the first three lines of each token.
+MAX_LINES_PER_TOKEN = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    id INTEGER PRIMARY KEY,
+    token TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS postings (
+    token_id INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    lines TEXT NOT NULL,
+    PRIMARY KEY (token_id, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_file ON postings (file_id);
+"""
+
+
+@dataclass
+class KeywordHits:
+    """Occurrences of one keyword in one file."""
+
+    count: int = 0
+    lines: list[int] = field(default_factory=list)
+
+
+def is_indexable_keyword(keyword: str) -> bool:
+    """Return True if the keyword can be answered from the token index."""
+    return bool(INDEXABLE_KEYWORD.fullmatch(keyword))
+
+
+def tokenize(content: str) -> dict[str, tuple[int, list[int]]]:
+    """
+    Tokenize file content into lowercase identifier tokens.
+
+    Args:
+        content: Raw file content
+
+    Returns:
+        Dict mapping token to (occurrence count, first matching line numbers)
+    """
+    postings: dict[str, tuple[int, list[int]]] = {}
+    for line_no, line in enumerate(content.lower().split("\n"), 1):
+        for token in TOKEN_PATTERN.findall(line):
+            entry = postings.get(token)
+            if entry is None:
+                postings[token] = (1, [line_no])
+                continue
+            count, lines = entry
+            if len(lines) < MAX_LINES_PER_TOKEN and lines[-1] != line_no:
+                lines.append(line_no)
+            postings[token] = (count + 1, lines)
+    return postings
+
+
+def iter_code_files(directory: Path):
+    """
+    Walk a directory once, pruning SKIP_DIRS, yielding code files with stats.
+
+    Args:
+        directory: Root directory to walk
+
+    Yields:
+        Tuples of (path, mtime_ns, size)
+    """
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = sorted(os.scandir(current), key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    if os.path.splitext(entry.name)[1] in CODE_EXTENSIONS:
+                        stat = entry.stat()
+                        yield Path(entry.path), stat.st_mtime_ns, stat.st_size
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+class SearchIndex:
+    """Incrementally maintained inverted index over project code files."""
+
+    def __init__(self, project_dir: Path, index_path: Path | None = None):
+        self.project_dir = project_dir.resolve()
+        self.index_path = index_path or (
+            self.project_dir / ".auto-claude" / INDEX_FILENAME
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != INDEX_VERSION:
+            with conn:
+                conn.execute("DELETE FROM postings")
+                conn.execute("DELETE FROM tokens")
+                conn.execute("DELETE FROM files")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (INDEX_VERSION,),
+                )
+        return conn
+
+    def refresh(self, directory: Path) -> dict[str, int]:
+        """
+        Bring the index up to date for all code files under a directory.
+
+        Only files whose (mtime_ns, size) changed since the last refresh are
+        re-read. Indexed files under the directory that no longer exist are
+        removed.
+
+        Args:
+            directory: Directory to refresh (usually a service root)
+
+        Returns:
+            Mapping of relative path to file id for every code file found,
+            in walk order
+        """
+        with closing(self._connect()) as conn:
+            return self._refresh(conn, directory)
+
+    def _refresh(self, conn: sqlite3.Connection, directory: Path) -> dict[str, int]:
+        directory = directory.resolve()
+        prefix = self._rel_path(directory)
+
+        known: dict[str, tuple[int, int, int]] = {}
+        if prefix == ".":
+            rows = conn.execute("SELECT path, id, mtime_ns, size FROM files")
+        else:
+            rows = conn.execute(
+                "SELECT path, id, mtime_ns, size FROM files "
+                "WHERE substr(path, 1, ?) = ?",
+                (len(prefix) + 1, prefix + "/"),
+            )
+        for path, file_id, mtime_ns, size in rows:
+            known[path] = (file_id, mtime_ns, size)
+
+        seen: dict[str, int] = {}
+        with conn:
+            for file_path, mtime_ns, size in iter_code_files(directory):
+                rel_path = self._rel_path(file_path)
+                entry = known.get(rel_path)
+                if entry and entry[1] == mtime_ns and entry[2] == size:
+                    seen[rel_path] = entry[0]
+                    continue
+
+                try:
+                    content = file_path.read_text(errors="ignore")
+                except (OSError, UnicodeDecodeError):
+                    continue
+
+                seen[rel_path] = self._index_file(
+                    conn, rel_path, mtime_ns, size, content, entry[0] if entry else None
+                )
+
+            stale = [known[path][0] for path in known.keys() - seen.keys()]
+            for file_id in stale:
+                conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+                conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+        return seen
+
+    def _index_file(
+        self,
+        conn: sqlite3.Connection,
+        rel_path: str,
+        mtime_ns: int,
+        size: int,
+        content: str,
+        file_id: int | None,
+    ) -> int:
+        if file_id is None:
+            file_id = conn.execute(
+                "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                (rel_path, mtime_ns, size),
+            ).lastrowid
+        else:
+            conn.execute(
+                "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                (mtime_ns, size, file_id),
+            )
+            conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+
+        postings = tokenize(content)
+        if not postings:
+            return file_id
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO tokens (token) VALUES (?)",
+            ((token,) for token in postings),
+        )
+        token_ids = self._token_ids(conn, list(postings))
+        conn.executemany(
+            "INSERT INTO postings (token_id, file_id, count, lines) VALUES (?, ?, ?, ?)",
+            (
+                (token_ids[token], file_id, count, ",".join(map(str, lines)))
+                for token, (count, lines) in postings.items()
+            ),
+        )
+        return file_id
+
+    @staticmethod
+    def _token_ids(conn: sqlite3.Connection, tokens: list[str]) -> dict[str, int]:
+        token_ids: dict[str, int] = {}
+        for start in range(0, len(tokens), 500):
+            chunk = tokens[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for token_id, token in conn.execute(
+                f"SELECT id, token FROM tokens WHERE token IN ({placeholders})",
+                chunk,
+            ):
+                token_ids[token] = token_id
+        return token_ids
+
+    def query(
+        self, directory: Path, keywords: list[str]
+    ) -> tuple[list[str], dict[str, dict[str, KeywordHits]]]:
+        """
+        Refresh the index for a directory and look up keyword hits.
+
+        Args:
+            directory: Directory to search (usually a service root)
+            keywords: Indexable keywords (see is_indexable_keyword)
+
+        Returns:
+            Tuple of (relative paths in walk order,
+            {relative path: {keyword: KeywordHits}})
+        """
+        with closing(self._connect()) as conn:
+            seen = self._refresh(conn, directory)
+            paths_by_id = {file_id: path for path, file_id in seen.items()}
+
+            hits: dict[str, dict[str, KeywordHits]] = {}
+            for keyword in dict.fromkeys(keywords):
+                tokens = {
+                    token_id: token.count(keyword)
+                    for token_id, token in conn.execute(
+                        "SELECT id, token FROM tokens WHERE instr(token, ?) > 0",
+                        (keyword,),
+                    )
+                }
+                token_ids = list(tokens)
+                for start in range(0, len(token_ids), 500):
+                    chunk = token_ids[start : start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    for token_id, file_id, count, lines in conn.execute(
+                        "SELECT token_id, file_id, count, lines FROM postings "
+                        f"WHERE token_id IN ({placeholders})",
+                        chunk,
+                    ):
+                        path = paths_by_id.get(file_id)
+                        if path is None:
+                            continue
+                        keyword_hits = hits.setdefault(path, {}).setdefault(
+                            keyword, KeywordHits()
+                        )
+                        keyword_hits.count += count * tokens[token_id]
+                        keyword_hits.lines.extend(int(n) for n in lines.split(","))
+
+            for file_hits in hits.values():
+                for keyword_hits in file_hits.values():
+                    keyword_hits.lines = sorted(set(keyword_hits.lines))[
+                        :MAX_LINES_PER_TOKEN
+                    ]
+
+        return list(seen), hits
+
+    def _rel_path(self, path: Path) -> str:
+        return path.relative_to(self.project_dir).as_posix()
@@ -6,11 +6,16 @@ Functions for tracking and displaying progress of the autonomous coding agent.
 Uses subtask-based implementation plans (implementation_plan.json).
 
 Enhanced with colored output, icons, and better visual formatting.
+
+The plan is read through implementation_plan.cache, so repeated calls only
+touch the disk when implementation_plan.json changes.
 """
 
-import json
+import copy
+from collections.abc import Iterable
 from pathlib import Path
 
+from implementation_plan.cache import get_cached_plan
 from ui import (
     Icons,
     bold,
@@ -36,27 +41,11 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     Returns:
         (completed_count, total_count)
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    cached = get_cached_plan(spec_dir)
+    if cached is None:
         return 0, 0
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        total = 0
-        completed = 0
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
-
-        return completed, total
-    except (OSError, json.JSONDecodeError):
-        return 0, 0
+    return cached.counts["completed"], cached.counts["total"]
 
 
 def count_subtasks_detailed(spec_dir: Path) -> dict:
@@ -66,35 +55,17 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
     Returns:
         Dict with completed, in_progress, pending, failed counts
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    result = {
-        "completed": 0,
-        "in_progress": 0,
-        "pending": 0,
-        "failed": 0,
-        "total": 0,
-    }
-
-    if not plan_file.exists():
-        return result
-
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
+    cached = get_cached_plan(spec_dir)
+    if cached is None:
+        return {
+            "completed": 0,
+            "in_progress": 0,
+            "pending": 0,
+            "failed": 0,
+            "total": 0,
+        }
 
-        return result
-    except (OSError, json.JSONDecodeError):
-        return result
+    return dict(cached.counts)
 
 
 def is_build_complete(spec_dir: Path) -> bool:
@@ -180,9 +151,9 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json") as f:
-                plan = json.load(f)
+        cached = get_cached_plan(spec_dir)
+        if cached is not None:
+            plan = cached.data
 
             print("\nPhases:")
             for phase in plan.get("phases", []):
@@ -228,9 +199,6 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
                     print(
                         f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                     )
-
-        except (OSError, json.JSONDecodeError):
-            pass
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
@@ -286,9 +254,9 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    cached = get_cached_plan(spec_dir)
 
-    if not plan_file.exists():
+    if cached is None:
         return {
             "workflow_type": None,
             "total_phases": 0,
@@ -300,103 +268,88 @@ def get_plan_summary(spec_dir: Path) -> dict:
             "phases": [],
         }
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+    plan = cached.data
+    summary = {
+        "workflow_type": plan.get("workflow_type"),
+        "total_phases": len(plan.get("phases", [])),
+        "total_subtasks": 0,
+        "completed_subtasks": 0,
+        "pending_subtasks": 0,
+        "in_progress_subtasks": 0,
+        "failed_subtasks": 0,
+        "phases": [],
+    }
 
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
+    for phase in plan.get("phases", []):
+        phase_info = {
+            "id": phase.get("id"),
+            "phase": phase.get("phase"),
+            "name": phase.get("name"),
+            "depends_on": list(phase.get("depends_on", [])),
+            "subtasks": [],
+            "completed": 0,
+            "total": 0,
         }
 
-        for phase in plan.get("phases", []):
-            phase_info = {
-                "id": phase.get("id"),
-                "phase": phase.get("phase"),
-                "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
-            }
-
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
-
-            summary["phases"].append(phase_info)
+        for subtask in phase.get("subtasks", []):
+            status = subtask.get("status", "pending")
+            summary["total_subtasks"] += 1
+            phase_info["total"] += 1
+
+            if status == "completed":
+                summary["completed_subtasks"] += 1
+                phase_info["completed"] += 1
+            elif status == "in_progress":
+                summary["in_progress_subtasks"] += 1
+            elif status == "failed":
+                summary["failed_subtasks"] += 1
+            else:
+                summary["pending_subtasks"] += 1
+
+            phase_info["subtasks"].append(
+                {
+                    "id": subtask.get("id"),
+                    "description": subtask.get("description"),
+                    "status": status,
+                    "service": subtask.get("service"),
+                }
+            )
 
-        return summary
+        summary["phases"].append(phase_info)
 
-    except (OSError, json.JSONDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    return summary
 
 
 def get_current_phase(spec_dir: Path) -> dict | None:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    cached = get_cached_plan(spec_dir)
+    if cached is None:
         return None
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            subtasks = phase.get("subtasks", [])
-            # Phase is current if it has incomplete subtasks and dependencies are met
-            has_incomplete = any(s.get("status") != "completed" for s in subtasks)
-            if has_incomplete:
-                return {
-                    "id": phase.get("id"),
-                    "phase": phase.get("phase"),
-                    "name": phase.get("name"),
-                    "completed": sum(
-                        1 for s in subtasks if s.get("status") == "completed"
-                    ),
-                    "total": len(subtasks),
-                }
+    for phase in cached.data.get("phases", []):
+        subtasks = phase.get("subtasks", [])
+        # Phase is current if it has incomplete subtasks and dependencies are met
+        has_incomplete = any(s.get("status") != "completed" for s in subtasks)
+        if has_incomplete:
+            return {
+                "id": phase.get("id"),
+                "phase": phase.get("phase"),
+                "name": phase.get("name"),
+                "completed": sum(1 for s in subtasks if s.get("status") == "completed"),
+                "total": len(subtasks),
+            }
 
-        return None
+    return None
 
-    except (OSError, json.JSONDecodeError):
-        return None
+
+def _subtask_info(phase: dict, phase_id, subtask: dict) -> dict:
+    """Subtask dict with phase fields, detached from the cached plan."""
+    return {
+        "phase_id": phase_id,
+        "phase_name": phase.get("name"),
+        "phase_num": phase.get("phase"),
+        **copy.deepcopy(subtask),
+    }
 
 
 def get_next_subtask(spec_dir: Path) -> dict | None:
@@ -409,50 +362,83 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    cached = get_cached_plan(spec_dir)
+    if cached is None:
         return None
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+    phase_complete = cached.phase_complete
 
-        phases = plan.get("phases", [])
+    # Find next available subtask
+    for phase in cached.data.get("phases", []):
+        phase_id = phase.get("id") or phase.get("phase")
+        depends_on = phase.get("depends_on", [])
 
-        # Build a map of phase completion
-        phase_complete = {}
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            subtasks = phase.get("subtasks", [])
-            phase_complete[phase_id] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
+        # Check if dependencies are satisfied
+        deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
+        if not deps_satisfied:
+            continue
 
-        # Find next available subtask
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            depends_on = phase.get("depends_on", [])
-
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
-
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", []):
-                if subtask.get("status") == "pending":
-                    return {
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                        **subtask,
-                    }
+        # Find first pending subtask in this phase
+        for subtask in phase.get("subtasks", []):
+            if subtask.get("status") == "pending":
+                return _subtask_info(phase, phase_id, subtask)
 
-        return None
+    return None
 
-    except (OSError, json.JSONDecodeError):
-        return None
+
+def get_parallel_subtasks(
+    spec_dir: Path, limit: int, exclude: Iterable[str] = ()
+) -> list[dict]:
+    """
+    Find pending subtasks that can run at the same time.
+
+    Walks the available phases (dependencies satisfied) in plan order and
+    collects pending subtasks from phases marked ``parallel_safe``. Collection
+    stops at the first available phase that is not parallel-safe, so the
+    result never runs ahead of the order get_next_subtask() would follow.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+        limit: Maximum number of subtasks to return
+        exclude: Subtask IDs to skip (e.g. already running or stuck)
+
+    Returns:
+        Subtask dicts in the same format as get_next_subtask(); empty if the
+        next subtask belongs to a phase that must run sequentially
+    """
+    if limit <= 0:
+        return []
+
+    cached = get_cached_plan(spec_dir)
+    if cached is None:
+        return []
+
+    excluded = set(exclude)
+    phase_complete = cached.phase_complete
+
+    batch = []
+    for phase in cached.data.get("phases", []):
+        phase_id = phase.get("id") or phase.get("phase")
+        depends_on = phase.get("depends_on", [])
+        if not all(phase_complete.get(dep, False) for dep in depends_on):
+            continue
+
+        pending = [
+            s
+            for s in phase.get("subtasks", [])
+            if s.get("status") == "pending" and s.get("id") not in excluded
+        ]
+        if not pending:
+            continue
+        if not phase.get("parallel_safe"):
+            break
+
+        for subtask in pending:
+            batch.append(_subtask_info(phase, phase_id, subtask))
+            if len(batch) >= limit:
+                return batch
+
+    return batch
 
 
 def format_duration(seconds: float) -> str:
@@ -23,9 +23,11 @@ Package Structure:
 - phase.py: Phase model grouping subtasks with dependencies
 - plan.py: ImplementationPlan model for complete feature plans
 - factories.py: Factory functions for creating different plan types
+- cache.py: Process-wide cache of parsed plan files
 """
 
 # Export all public types and functions for backwards compatibility
+from .cache import CachedPlan, add_plan_listener, get_cached_plan, reset_plan_cache
 from .enums import (
     ChunkStatus,  # Backwards compatibility
     PhaseType,
@@ -58,6 +60,11 @@ __all__ = [
     "create_feature_plan",
     "create_investigation_plan",
     "create_refactor_plan",
+    # Cache
+    "CachedPlan",
+    "get_cached_plan",
+    "add_plan_listener",
+    "reset_plan_cache",
     # Backwards compatibility
     "Chunk",
     "ChunkStatus",
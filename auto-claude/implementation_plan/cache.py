@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Implementation Plan Cache
+=========================
+
+Process-wide cache of parsed implementation_plan.json files.
+
+Progress helpers are called several times per agent iteration, and each of
+them used to re-read and re-parse the plan. A cached plan is now reused until
+the file's stat signature (inode, mtime_ns, size) changes. Aggregate subtask
+counters are computed once per version of the file.
+
+If a file's mtime is very recent, an in-place rewrite of the same size
+could keep the same signature. For such files the bytes are kept and
+compared on the next lookup, like git's "racy" index entries.
+
+Listeners registered with add_plan_listener() are called whenever a lookup
+finds that a cached plan changed on disk.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .plan import ImplementationPlan
+
+PLAN_FILE = "implementation_plan.json"
+
+# Maximum number of plans kept in memory
+PLAN_CACHE_SIZE = 64
+
+# Files modified this recently are re-checked byte-for-byte on every lookup
+RACY_WINDOW_NS = 2_000_000_000
+
+SUBTASK_STATUSES = ("completed", "in_progress", "pending", "failed")
+
+
+@dataclass
+class CachedPlan:
+    """
+    One parsed version of an implementation plan.
+
+    ``data`` is shared by every caller and must be treated as read-only.
+    """
+
+    data: dict
+    counts: dict[str, int]
+    phase_complete: dict
+    _raw: bytes | None = field(default=None, repr=False)
+    _plan: ImplementationPlan | None = field(default=None, repr=False)
+
+    @property
+    def plan(self) -> ImplementationPlan | None:
+        """The plan as an ImplementationPlan (parsed on first access)."""
+        if self._plan is None:
+            try:
+                self._plan = ImplementationPlan.from_dict(self.data)
+            except (KeyError, TypeError, ValueError):
+                return None
+        return self._plan
+
+
+def _build_entry(data: dict) -> CachedPlan:
+    counts = dict.fromkeys(SUBTASK_STATUSES, 0)
+    counts["total"] = 0
+    phase_complete = {}
+
+    for phase in data.get("phases", []):
+        subtasks = phase.get("subtasks", [])
+        for subtask in subtasks:
+            counts["total"] += 1
+            status = subtask.get("status", "pending")
+            counts[status if status in counts else "pending"] += 1
+        phase_id = phase.get("id") or phase.get("phase")
+        phase_complete[phase_id] = all(s.get("status") == "completed" for s in subtasks)
+
+    return CachedPlan(data=data, counts=counts, phase_complete=phase_complete)
+
+
+# =============================================================================
+# GLOBAL STATE
+# =============================================================================
+
+# plan file -> (stat signature, entry), in LRU order
+_plan_cache: OrderedDict[Path, tuple[tuple, CachedPlan]] = OrderedDict()
+_cache_lock = threading.Lock()
+_listeners: list[Callable[[Path, CachedPlan | None], None]] = []
+
+
+def _signature(st: os.stat_result) -> tuple:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def get_cached_plan(path: Path) -> CachedPlan | None:
+    """
+    Get the parsed implementation plan, reading the file only if it changed.
+
+    Args:
+        path: Spec directory or path to implementation_plan.json
+
+    Returns:
+        The cached plan, or None if the file is missing or not a valid plan
+    """
+    path = Path(path)
+    plan_file = path if path.suffix == ".json" else path / PLAN_FILE
+
+    try:
+        st = os.stat(plan_file)
+    except OSError:
+        _forget(plan_file)
+        return None
+    signature = _signature(st)
+
+    with _cache_lock:
+        cached = _plan_cache.get(plan_file)
+    if cached is not None and cached[0] == signature and cached[1]._raw is None:
+        with _cache_lock:
+            if plan_file in _plan_cache:
+                _plan_cache.move_to_end(plan_file)
+        return cached[1]
+
+    try:
+        raw = plan_file.read_bytes()
+        data = json.loads(raw)
+    except (OSError, ValueError):
+        _forget(plan_file)
+        return None
+    if not isinstance(data, dict):
+        _forget(plan_file)
+        return None
+
+    # Racy entry whose bytes did not change: keep the parsed version
+    if cached is not None and cached[1]._raw == raw:
+        entry = cached[1]
+        changed = False
+    else:
+        entry = _build_entry(data)
+        changed = cached is not None
+    entry._raw = raw if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS else None
+
+    with _cache_lock:
+        _plan_cache[plan_file] = (signature, entry)
+        _plan_cache.move_to_end(plan_file)
+        while len(_plan_cache) > PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+
+    if changed:
+        _notify(plan_file, entry)
+    return entry
+
+
+def _forget(plan_file: Path) -> None:
+    with _cache_lock:
+        removed = _plan_cache.pop(plan_file, None)
+    if removed is not None:
+        _notify(plan_file, None)
+
+
+def _notify(plan_file: Path, entry: CachedPlan | None) -> None:
+    for listener in list(_listeners):
+        try:
+            listener(plan_file, entry)
+        except Exception:
+            pass  # A failing listener must not break plan lookups
+
+
+def add_plan_listener(
+    listener: Callable[[Path, CachedPlan | None], None],
+) -> Callable[[], None]:
+    """
+    Register a callback for plans that changed on disk.
+
+    The callback receives the plan file and the new version (None if the
+    file was removed or became invalid). It runs on the thread that looked
+    the plan up.
+
+    Returns:
+        A function that unregisters the callback
+    """
+    _listeners.append(listener)
+
+    def remove() -> None:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+    return remove
+
+
+def reset_plan_cache() -> None:
+    """Reset the cached plans (useful for testing)."""
+    with _cache_lock:
+        _plan_cache.clear()
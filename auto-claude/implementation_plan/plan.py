@@ -197,6 +197,26 @@ class ImplementationPlan:
                 return phase, pending[0]
         return None
 
+    def get_parallel_subtasks(self, limit: int) -> list[tuple[Phase, Subtask]]:
+        """
+        Get pending subtasks that can run concurrently.
+
+        Collects pending subtasks from available parallel-safe phases, stopping
+        at the first available phase that must run sequentially.
+        """
+        batch = []
+        for phase in self.get_available_phases():
+            pending = phase.get_pending_subtasks()
+            if not pending:
+                continue
+            if not phase.parallel_safe:
+                break
+            for subtask in pending:
+                batch.append((phase, subtask))
+                if len(batch) >= limit:
+                    return batch
+        return batch
+
     def get_progress(self) -> dict:
         """Get overall progress statistics."""
         total_subtasks = sum(len(p.subtasks) for p in self.phases)
@@ -11,6 +11,10 @@ Migrates Graphiti memory data from one embedding provider to another by:
 This handles the dimension mismatch issue when switching between providers
 (e.g., OpenAI 1536D → Ollama embeddinggemma 768D).
 
+Embeddings go through the persistent embedding cache (see
+providers_pkg/embedding_cache.py), so re-running an interrupted migration
+only embeds text the target provider has not seen yet.
+
 Usage:
     # Interactive mode (recommended)
     python integrations/graphiti/migrate_embeddings.py
@@ -0,0 +1,425 @@
+"""
+Persistent Embedding Cache
+==========================
+
+Content-addressed on-disk cache of embedding vectors shared by all embedder
+providers. Identical text is embedded once per (provider, model, dimension),
+across sessions and across runs of migrate_embeddings.py.
+
+Each (provider, model, dimension) gets its own directory under
+``<GRAPHITI_DB_PATH>/embedding_cache`` holding:
+
+- vectors.f32: append-only float32 rows of ``dimension`` values, read
+  through a memory map
+- index.bin: append-only 16-byte BLAKE2b digests of the embedded text; the
+  n-th digest belongs to the n-th row of vectors.f32
+- meta.json: provider, model and dimension, for humans
+
+Writers append under an exclusive file lock, and readers pick up rows
+appended by other processes. A torn append (crash between the two files)
+is truncated away the next time the store is opened.
+
+Configuration (environment):
+    GRAPHITI_EMBEDDING_CACHE  Set to "false" to disable the cache
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import threading
+from array import array
+from collections.abc import Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads of this process are serialized
+    fcntl = None
+
+if TYPE_CHECKING:
+    from graphiti_config import GraphitiConfig
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = "embedding_cache"
+VECTORS_FILE = "vectors.f32"
+INDEX_FILE = "index.bin"
+LOCK_FILE = ".lock"
+META_FILE = "meta.json"
+
+DIGEST_SIZE = 16
+FLOAT_SIZE = array("f").itemsize
+
+
+def text_digest(text: str) -> bytes:
+    """Content address of a text in the cache."""
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=DIGEST_SIZE
+    ).digest()
+
+
+class EmbeddingStore:
+    """
+    Append-only float32 vector store for one (provider, model, dimension).
+
+    Lookups are served from an in-memory digest index and a read-only memory
+    map of the vector file. Safe to share between threads.
+    """
+
+    def __init__(self, directory: Path, dimension: int):
+        """
+        Open (or create) a store.
+
+        Args:
+            directory: Directory holding the store files
+            dimension: Number of floats per vector
+        """
+        if dimension <= 0:
+            raise ValueError(f"Invalid embedding dimension: {dimension}")
+
+        self.directory = Path(directory)
+        self.dimension = dimension
+        self._row_size = dimension * FLOAT_SIZE
+        self._vectors_path = self.directory / VECTORS_FILE
+        self._index_path = self.directory / INDEX_FILE
+        self._lock_path = self.directory / LOCK_FILE
+
+        self._index: dict[bytes, int] = {}
+        self._rows = 0
+        self._mmap: mmap.mmap | None = None
+        self._view: memoryview | None = None
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._vectors_path.touch(exist_ok=True)
+        self._index_path.touch(exist_ok=True)
+        with self._lock, self._file_lock():
+            self._repair()
+            self._refresh()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive lock shared with other processes using the store."""
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _repair(self) -> None:
+        """Drop rows left incomplete by an interrupted append."""
+        rows = min(
+            self._index_path.stat().st_size // DIGEST_SIZE,
+            self._vectors_path.stat().st_size // self._row_size,
+        )
+        for path, size in (
+            (self._index_path, rows * DIGEST_SIZE),
+            (self._vectors_path, rows * self._row_size),
+        ):
+            if path.stat().st_size != size:
+                logger.debug(f"Truncating torn embedding cache file {path}")
+                os.truncate(path, size)
+
+    def _refresh(self) -> None:
+        """Load index entries and vectors appended since the last refresh."""
+        rows = min(
+            self._index_path.stat().st_size // DIGEST_SIZE,
+            self._vectors_path.stat().st_size // self._row_size,
+        )
+        if rows <= self._rows:
+            return
+
+        with open(self._index_path, "rb") as f:
+            f.seek(self._rows * DIGEST_SIZE)
+            data = f.read((rows - self._rows) * DIGEST_SIZE)
+        for offset in range(0, len(data) - DIGEST_SIZE + 1, DIGEST_SIZE):
+            # First occurrence wins, later duplicates are unreachable rows
+            self._index.setdefault(
+                data[offset : offset + DIGEST_SIZE], self._rows + offset // DIGEST_SIZE
+            )
+        self._rows = rows
+        self._remap()
+
+    def _remap(self) -> None:
+        self._unmap()
+        with open(self._vectors_path, "rb") as f:
+            self._mmap = mmap.mmap(
+                f.fileno(), self._rows * self._row_size, access=mmap.ACCESS_READ
+            )
+        self._view = memoryview(self._mmap).cast("f")
+
+    def _unmap(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _index_changed(self) -> bool:
+        return self._index_path.stat().st_size // DIGEST_SIZE > self._rows
+
+    def get_many(self, texts: Sequence[str]) -> list[list[float] | None]:
+        """
+        Look up cached vectors.
+
+        Returns:
+            One vector (or None on a miss) per text
+        """
+        digests = [text_digest(text) for text in texts]
+        with self._lock:
+            if any(d not in self._index for d in digests) and self._index_changed():
+                self._refresh()
+
+            vectors: list[list[float] | None] = []
+            for digest in digests:
+                row = self._index.get(digest)
+                if row is None:
+                    vectors.append(None)
+                else:
+                    start = row * self.dimension
+                    vectors.append(self._view[start : start + self.dimension].tolist())
+            return vectors
+
+    def get(self, text: str) -> list[float] | None:
+        """Look up the cached vector of a single text."""
+        return self.get_many([text])[0]
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> int:
+        """
+        Append vectors that are not cached yet.
+
+        Vectors whose length does not match the store dimension are skipped.
+
+        Returns:
+            Number of vectors written
+        """
+        pending: dict[bytes, Sequence[float]] = {}
+        for text, vector in zip(texts, vectors):
+            if vector is not None and len(vector) == self.dimension:
+                pending.setdefault(text_digest(text), vector)
+        if not pending:
+            return 0
+
+        with self._lock, self._file_lock():
+            self._refresh()
+            new = [(d, v) for d, v in pending.items() if d not in self._index]
+            if not new:
+                return 0
+
+            # Vectors first: an index entry must never point past the data
+            with open(self._vectors_path, "ab") as f:
+                for _, vector in new:
+                    f.write(array("f", vector).tobytes())
+            with open(self._index_path, "ab") as f:
+                f.write(b"".join(d for d, _ in new))
+            self._refresh()
+            return len(new)
+
+    def put(self, text: str, vector: Sequence[float]) -> bool:
+        """Append the vector of a single text. Returns True if it was written."""
+        return self.put_many([text], [vector]) == 1
+
+    def close(self) -> None:
+        """Release the memory map."""
+        with self._lock:
+            self._unmap()
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", value).strip("_") or "default"
+
+
+def embedding_model_name(config: "GraphitiConfig") -> str:
+    """Name of the embedding model the configured provider uses."""
+    attribute = {
+        "openai": "openai_embedding_model",
+        "voyage": "voyage_embedding_model",
+        "azure_openai": "azure_openai_embedding_deployment",
+        "ollama": "ollama_embedding_model",
+        "google": "google_embedding_model",
+    }.get(config.embedder_provider)
+    return getattr(config, attribute, "") if attribute else ""
+
+
+def embedding_cache_enabled() -> bool:
+    """Check whether the persistent embedding cache is enabled."""
+    value = os.environ.get("GRAPHITI_EMBEDDING_CACHE", "true").lower()
+    return value not in ("false", "0", "no")
+
+
+_stores: dict[Path, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(config: "GraphitiConfig") -> EmbeddingStore:
+    """
+    Get the process-wide store for the configured provider, model and dimension.
+
+    Args:
+        config: GraphitiConfig with embedder settings
+
+    Returns:
+        EmbeddingStore for the configuration
+    """
+    provider = config.embedder_provider
+    model = embedding_model_name(config)
+    dimension = config.get_embedding_dimension()
+    directory = (
+        Path(config.db_path).expanduser()
+        / CACHE_DIR_NAME
+        / f"{_safe_name(provider)}_{_safe_name(model)}_{dimension}"
+    )
+
+    with _stores_lock:
+        store = _stores.get(directory)
+        if store is None:
+            store = EmbeddingStore(directory, dimension)
+            meta = directory / META_FILE
+            if not meta.exists():
+                meta.write_text(
+                    json.dumps(
+                        {"provider": provider, "model": model, "dimension": dimension},
+                        indent=2,
+                    )
+                )
+            _stores[directory] = store
+        return store
+
+
+def reset_embedding_stores() -> None:
+    """Close all open stores (mainly for tests)."""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
+
+
+def single_text_input(args: tuple, kwargs: dict) -> str | None:
+    """
+    The text embedded by an embedder ``create`` call for exactly one string.
+
+    Accepts ``input_data`` positionally or by keyword, as ``text`` or
+    ``[text]`` (graphiti embeds single texts as ``create(input_data=[text])``).
+
+    Returns:
+        The text, or None for batches, token inputs and extra arguments
+    """
+    if len(args) == 1 and not kwargs:
+        input_data = args[0]
+    elif not args and kwargs.keys() == {"input_data"}:
+        input_data = kwargs["input_data"]
+    else:
+        return None
+    if isinstance(input_data, list) and len(input_data) == 1:
+        input_data = input_data[0]
+    return input_data if isinstance(input_data, str) else None
+
+
+def cache_embeddings(embedder: Any, store: EmbeddingStore) -> Any:
+    """
+    Make an embedder consult a persistent store before calling its provider.
+
+    ``create`` for a single string (``text`` or ``[text]``) and
+    ``create_batch`` with a list of strings are served from the store; a batch sends only its misses to the
+    provider, in one call. Other inputs pass straight through, and store
+    errors only cost a cache miss. The embedder is patched in place so it
+    keeps its own type.
+
+    Args:
+        embedder: Graphiti embedder instance
+        store: Store for the embedder's provider, model and dimension
+
+    Returns:
+        The same embedder
+    """
+    if embedder is None or hasattr(embedder, "_embedding_store"):
+        return embedder
+
+    original_create = embedder.create
+    original_create_batch = getattr(embedder, "create_batch", None)
+
+    def lookup(texts: list[str]) -> list[list[float] | None]:
+        try:
+            return store.get_many(texts)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Embedding cache lookup failed: {e}")
+            return [None] * len(texts)
+
+    def save(texts: list[str], vectors: list[list[float]]) -> None:
+        try:
+            store.put_many(texts, vectors)
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Embedding cache write failed: {e}")
+
+    async def create(*args, **kwargs):
+        text = single_text_input(args, kwargs)
+        if text is None:
+            return await original_create(*args, **kwargs)
+
+        vector = lookup([text])[0]
+        if vector is not None:
+            return vector
+        vector = await original_create(*args, **kwargs)
+        save([text], [vector])
+        return vector
+
+    async def create_batch(input_data_list, *args, **kwargs):
+        texts = list(input_data_list)
+        if args or kwargs or not all(isinstance(text, str) for text in texts):
+            return await original_create_batch(input_data_list, *args, **kwargs)
+
+        vectors = lookup(texts)
+        misses = list(
+            dict.fromkeys(text for text, v in zip(texts, vectors) if v is None)
+        )
+        if misses:
+            computed = await original_create_batch(misses)
+            save(misses, computed)
+            by_text = dict(zip(misses, computed))
+            vectors = [
+                by_text[text] if v is None else v for text, v in zip(texts, vectors)
+            ]
+            logger.debug(
+                f"Embedding cache: {len(texts) - len(misses)} hits, "
+                f"{len(misses)} misses"
+            )
+        return vectors
+
+    try:
+        embedder.create = create
+        if original_create_batch is not None:
+            embedder.create_batch = create_batch
+        embedder._embedding_store = store
+    except (AttributeError, TypeError, ValueError):
+        logger.debug("Embedder does not allow patching; embeddings not cached")
+    return embedder
+
+
+def with_embedding_cache(embedder: Any, config: "GraphitiConfig") -> Any:
+    """
+    Attach the persistent embedding cache for a configuration to an embedder.
+
+    Returns the embedder unchanged if the cache is disabled or its store
+    cannot be opened.
+    """
+    if not embedding_cache_enabled():
+        return embedder
+    try:
+        store = get_embedding_store(config)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Embedding cache unavailable: {e}")
+        return embedder
+    return cache_embeddings(embedder, store)
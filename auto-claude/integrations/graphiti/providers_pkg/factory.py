@@ -18,6 +18,7 @@ from .embedder_providers import (
     create_openai_embedder,
     create_voyage_embedder,
 )
+from .embedding_cache import with_embedding_cache
 from .exceptions import ProviderError
 from .llm_providers import (
     create_anthropic_llm_client,
@@ -70,7 +71,7 @@ def create_embedder(config: "GraphitiConfig") -> Any:
         config: GraphitiConfig with provider settings
 
     Returns:
-        Embedder instance for Graphiti
+        Embedder instance for Graphiti, backed by the persistent embedding cache
 
     Raises:
         ProviderNotInstalled: If required packages are missing
@@ -81,14 +82,17 @@ def create_embedder(config: "GraphitiConfig") -> Any:
     logger.info(f"Creating embedder for provider: {provider}")
 
     if provider == "openai":
-        return create_openai_embedder(config)
+        embedder = create_openai_embedder(config)
     elif provider == "voyage":
-        return create_voyage_embedder(config)
+        embedder = create_voyage_embedder(config)
     elif provider == "azure_openai":
-        return create_azure_openai_embedder(config)
+        embedder = create_azure_openai_embedder(config)
     elif provider == "ollama":
-        return create_ollama_embedder(config)
+        embedder = create_ollama_embedder(config)
     elif provider == "google":
-        return create_google_embedder(config)
+        embedder = create_google_embedder(config)
     else:
         raise ProviderError(f"Unknown embedder provider: {provider}")
+
+    # Reuse vectors computed by earlier sessions and migrations
+    return with_embedding_cache(embedder, config)
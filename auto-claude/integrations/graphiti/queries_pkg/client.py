@@ -11,6 +11,8 @@ from datetime import datetime, timezone
 
 from graphiti_config import GraphitiConfig, GraphitiState
 
+from .search_cache import cache_query_embeddings
+
 logger = logging.getLogger(__name__)
 
 
@@ -122,7 +124,8 @@ class GraphitiClient:
                 return False
 
             try:
-                self._embedder = create_embedder(self.config)
+                # Repeated searches embed the same query text; reuse it
+                self._embedder = cache_query_embeddings(create_embedder(self.config))
                 logger.info(
                     f"Created embedder for provider: {self.config.embedder_provider}"
                 )
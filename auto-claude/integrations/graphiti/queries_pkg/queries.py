@@ -4,21 +4,39 @@ Graph query operations for Graphiti memory.
 Handles episode storage, retrieval, and filtering operations.
 """
 
+import asyncio
 import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from .schema import (
+    EPISODE_INGEST_CONCURRENCY,
     EPISODE_TYPE_CODEBASE_DISCOVERY,
     EPISODE_TYPE_GOTCHA,
     EPISODE_TYPE_PATTERN,
     EPISODE_TYPE_SESSION_INSIGHT,
     EPISODE_TYPE_TASK_OUTCOME,
 )
+from .search_cache import cache_namespace, get_search_cache
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class EpisodeSpec:
+    """An episode waiting to be added to the knowledge graph."""
+
+    kind: str  # What the episode describes, used in log messages
+    name: str
+    content: dict
+    source_description: str
+
+
+def _is_dedup_warning(error: Exception) -> bool:
+    return "duplicate_facts" in str(error)
+
+
 class GraphitiQueries:
     """
     Manages episode storage and retrieval operations.
@@ -40,6 +58,10 @@ class GraphitiQueries:
         self.group_id = group_id
         self.spec_context_id = spec_context_id
 
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached searches of this group after adding episodes."""
+        get_search_cache().invalidate_group(cache_namespace(self.client), self.group_id)
+
     async def add_session_insight(
         self,
         session_num: int,
@@ -74,6 +96,7 @@ class GraphitiQueries:
                 reference_time=datetime.now(timezone.utc),
                 group_id=self.group_id,
             )
+            self._invalidate_search_cache()
 
             logger.info(
                 f"Saved session {session_num} insights to Graphiti (group: {self.group_id})"
@@ -118,6 +141,7 @@ class GraphitiQueries:
                 reference_time=datetime.now(timezone.utc),
                 group_id=self.group_id,
             )
+            self._invalidate_search_cache()
 
             logger.info(f"Saved {len(discoveries)} codebase discoveries to Graphiti")
             return True
@@ -154,6 +178,7 @@ class GraphitiQueries:
                 reference_time=datetime.now(timezone.utc),
                 group_id=self.group_id,
             )
+            self._invalidate_search_cache()
 
             logger.info(f"Saved pattern to Graphiti: {pattern[:50]}...")
             return True
@@ -190,6 +215,7 @@ class GraphitiQueries:
                 reference_time=datetime.now(timezone.utc),
                 group_id=self.group_id,
             )
+            self._invalidate_search_cache()
 
             logger.info(f"Saved gotcha to Graphiti: {gotcha[:50]}...")
             return True
@@ -238,6 +264,7 @@ class GraphitiQueries:
                 reference_time=datetime.now(timezone.utc),
                 group_id=self.group_id,
             )
+            self._invalidate_search_cache()
 
             status = "succeeded" if success else "failed"
             logger.info(f"Saved task outcome to Graphiti: {task_id} {status}")
@@ -247,149 +274,93 @@ class GraphitiQueries:
             logger.warning(f"Failed to save task outcome: {e}")
             return False
 
-    async def add_structured_insights(self, insights: dict) -> bool:
+    def build_structured_episodes(self, insights: dict) -> list[EpisodeSpec]:
         """
-        Save extracted insights as multiple focused episodes.
+        Turn extracted insights into the episodes add_structured_insights saves.
 
         Args:
             insights: Dictionary from insight_extractor with structured data
 
         Returns:
-            True if saved successfully (or partially)
+            One episode per file insight, pattern and gotcha, plus one for the
+            approach outcome and one for the recommendations (if present)
         """
-        if not insights:
-            return True
-
-        saved_count = 0
-        total_count = 0
-
-        try:
-            from graphiti_core.nodes import EpisodeType
-
-            # 1. Save file insights
-            for file_insight in insights.get("file_insights", []):
-                total_count += 1
-                try:
-                    episode_content = {
+        episodes = []
+        now = datetime.now(timezone.utc)
+        timestamp = now.isoformat()
+
+        # 1. File insights
+        for file_insight in insights.get("file_insights", []):
+            path = file_insight.get("path", "unknown")
+            episodes.append(
+                EpisodeSpec(
+                    kind="file insight",
+                    name=f"file_insight_{path.replace('/', '_')}",
+                    content={
                         "type": EPISODE_TYPE_CODEBASE_DISCOVERY,
                         "spec_id": self.spec_context_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "file_path": file_insight.get("path", "unknown"),
+                        "timestamp": timestamp,
+                        "file_path": path,
                         "purpose": file_insight.get("purpose", ""),
                         "changes_made": file_insight.get("changes_made", ""),
                         "patterns_used": file_insight.get("patterns_used", []),
                         "gotchas": file_insight.get("gotchas", []),
-                    }
-
-                    await self.client.graphiti.add_episode(
-                        name=f"file_insight_{file_insight.get('path', 'unknown').replace('/', '_')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"File insight: {file_insight.get('path', 'unknown')}",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1
-                    else:
-                        logger.debug(f"Failed to save file insight: {e}")
-
-            # 2. Save patterns
-            for pattern in insights.get("patterns_discovered", []):
-                total_count += 1
-                try:
-                    pattern_text = (
-                        pattern.get("pattern", "")
-                        if isinstance(pattern, dict)
-                        else str(pattern)
-                    )
-                    applies_to = (
-                        pattern.get("applies_to", "")
-                        if isinstance(pattern, dict)
-                        else ""
-                    )
-                    example = (
-                        pattern.get("example", "") if isinstance(pattern, dict) else ""
-                    )
+                    },
+                    source_description=f"File insight: {path}",
+                )
+            )
 
-                    episode_content = {
+        # 2. Patterns
+        for i, pattern in enumerate(insights.get("patterns_discovered", [])):
+            is_dict = isinstance(pattern, dict)
+            pattern_text = pattern.get("pattern", "") if is_dict else str(pattern)
+            episodes.append(
+                EpisodeSpec(
+                    kind="pattern",
+                    name=f"pattern_{now.strftime('%Y%m%d_%H%M%S%f')}_{i}",
+                    content={
                         "type": EPISODE_TYPE_PATTERN,
                         "spec_id": self.spec_context_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": timestamp,
                         "pattern": pattern_text,
-                        "applies_to": applies_to,
-                        "example": example,
-                    }
-
-                    await self.client.graphiti.add_episode(
-                        name=f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"Pattern: {pattern_text[:50]}...",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1
-                    else:
-                        logger.debug(f"Failed to save pattern: {e}")
-
-            # 3. Save gotchas
-            for gotcha in insights.get("gotchas_discovered", []):
-                total_count += 1
-                try:
-                    gotcha_text = (
-                        gotcha.get("gotcha", "")
-                        if isinstance(gotcha, dict)
-                        else str(gotcha)
-                    )
-                    trigger = (
-                        gotcha.get("trigger", "") if isinstance(gotcha, dict) else ""
-                    )
-                    solution = (
-                        gotcha.get("solution", "") if isinstance(gotcha, dict) else ""
-                    )
+                        "applies_to": pattern.get("applies_to", "") if is_dict else "",
+                        "example": pattern.get("example", "") if is_dict else "",
+                    },
+                    source_description=f"Pattern: {pattern_text[:50]}...",
+                )
+            )
 
-                    episode_content = {
+        # 3. Gotchas
+        for i, gotcha in enumerate(insights.get("gotchas_discovered", [])):
+            is_dict = isinstance(gotcha, dict)
+            gotcha_text = gotcha.get("gotcha", "") if is_dict else str(gotcha)
+            episodes.append(
+                EpisodeSpec(
+                    kind="gotcha",
+                    name=f"gotcha_{now.strftime('%Y%m%d_%H%M%S%f')}_{i}",
+                    content={
                         "type": EPISODE_TYPE_GOTCHA,
                         "spec_id": self.spec_context_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": timestamp,
                         "gotcha": gotcha_text,
-                        "trigger": trigger,
-                        "solution": solution,
-                    }
-
-                    await self.client.graphiti.add_episode(
-                        name=f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"Gotcha: {gotcha_text[:50]}...",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1
-                    else:
-                        logger.debug(f"Failed to save gotcha: {e}")
-
-            # 4. Save approach outcome
-            outcome = insights.get("approach_outcome", {})
-            if outcome:
-                total_count += 1
-                try:
-                    subtask_id = insights.get("subtask_id", "unknown")
-                    success = outcome.get("success", insights.get("success", False))
+                        "trigger": gotcha.get("trigger", "") if is_dict else "",
+                        "solution": gotcha.get("solution", "") if is_dict else "",
+                    },
+                    source_description=f"Gotcha: {gotcha_text[:50]}...",
+                )
+            )
 
-                    episode_content = {
+        subtask_id = insights.get("subtask_id", "unknown")
+
+        # 4. Approach outcome
+        outcome = insights.get("approach_outcome", {})
+        if outcome:
+            success = outcome.get("success", insights.get("success", False))
+            episodes.append(
+                EpisodeSpec(
+                    kind="task outcome",
+                    name=f"task_outcome_{subtask_id}_{now.strftime('%Y%m%d_%H%M%S')}",
+                    content={
                         "type": EPISODE_TYPE_TASK_OUTCOME,
                         "spec_id": self.spec_context_id,
                         "task_id": subtask_id,
@@ -398,61 +369,119 @@ class GraphitiQueries:
                         "why_worked": outcome.get("why_it_worked"),
                         "why_failed": outcome.get("why_it_failed"),
                         "alternatives_tried": outcome.get("alternatives_tried", []),
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": timestamp,
                         "changed_files": insights.get("changed_files", []),
-                    }
+                    },
+                    source_description=(
+                        f"Task outcome: {subtask_id} "
+                        f"{'succeeded' if success else 'failed'}"
+                    ),
+                )
+            )
 
-                    await self.client.graphiti.add_episode(
-                        name=f"task_outcome_{subtask_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
-                        episode_body=json.dumps(episode_content),
-                        source=EpisodeType.text,
-                        source_description=f"Task outcome: {subtask_id} {'succeeded' if success else 'failed'}",
-                        reference_time=datetime.now(timezone.utc),
-                        group_id=self.group_id,
-                    )
-                    saved_count += 1
-                except Exception as e:
-                    # Graphiti deduplication can fail with "invalid duplicate_facts idx"
-                    # This is a known issue in graphiti-core - episode is still partially saved
-                    if "duplicate_facts" in str(e):
-                        logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1  # Episode likely saved, just dedup failed
-                    else:
-                        logger.debug(f"Failed to save task outcome: {e}")
-
-            # 5. Save recommendations
-            recommendations = insights.get("recommendations", [])
-            if recommendations:
-                total_count += 1
-                try:
-                    episode_content = {
+        # 5. Recommendations
+        recommendations = insights.get("recommendations", [])
+        if recommendations:
+            episodes.append(
+                EpisodeSpec(
+                    kind="recommendations",
+                    name=f"recommendations_{subtask_id}",
+                    content={
                         "type": EPISODE_TYPE_SESSION_INSIGHT,
                         "spec_id": self.spec_context_id,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "subtask_id": insights.get("subtask_id", "unknown"),
+                        "timestamp": timestamp,
+                        "subtask_id": subtask_id,
                         "session_number": insights.get("session_num", 0),
                         "recommendations": recommendations,
                         "success": insights.get("success", False),
-                    }
+                    },
+                    source_description=f"Recommendations for {subtask_id}",
+                )
+            )
 
-                    await self.client.graphiti.add_episode(
-                        name=f"recommendations_{insights.get('subtask_id', 'unknown')}",
-                        episode_body=json.dumps(episode_content),
+        return episodes
+
+    async def add_episodes(
+        self,
+        episodes: list[EpisodeSpec],
+        max_concurrency: int = EPISODE_INGEST_CONCURRENCY,
+    ) -> list[bool]:
+        """
+        Save several episodes at once.
+
+        Runs up to ``max_concurrency`` add_episode calls at a time. Graphiti's
+        bulk API is not used: it does not report which episodes it persisted,
+        so a failed batch could neither be retried without duplicating
+        episodes nor reported per episode.
+
+        Args:
+            episodes: Episodes to save
+            max_concurrency: Maximum concurrent add_episode calls
+
+        Returns:
+            Whether each episode was saved, in input order
+        """
+        if not episodes:
+            return []
+
+        try:
+            return await self._add_episodes(episodes, max_concurrency)
+        finally:
+            self._invalidate_search_cache()
+
+    async def _add_episodes(
+        self, episodes: list[EpisodeSpec], max_concurrency: int
+    ) -> list[bool]:
+        from graphiti_core.nodes import EpisodeType
+
+        graphiti = self.client.graphiti
+        reference_time = datetime.now(timezone.utc)
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def save(episode: EpisodeSpec) -> bool:
+            async with semaphore:
+                try:
+                    await graphiti.add_episode(
+                        name=episode.name,
+                        episode_body=json.dumps(episode.content),
                         source=EpisodeType.text,
-                        source_description=f"Recommendations for {insights.get('subtask_id', 'unknown')}",
-                        reference_time=datetime.now(timezone.utc),
+                        source_description=episode.source_description,
+                        reference_time=reference_time,
                         group_id=self.group_id,
                     )
-                    saved_count += 1
+                    return True
                 except Exception as e:
-                    if "duplicate_facts" in str(e):
+                    # Graphiti deduplication can fail with "invalid duplicate_facts idx"
+                    # This is a known issue in graphiti-core - episode is still saved
+                    if _is_dedup_warning(e):
                         logger.debug(f"Graphiti deduplication warning (non-fatal): {e}")
-                        saved_count += 1
-                    else:
-                        logger.debug(f"Failed to save recommendations: {e}")
+                        return True
+                    logger.debug(f"Failed to save {episode.kind}: {e}")
+                    return False
+
+        return list(await asyncio.gather(*(save(episode) for episode in episodes)))
+
+    async def add_structured_insights(self, insights: dict) -> bool:
+        """
+        Save extracted insights as multiple focused episodes.
+
+        Args:
+            insights: Dictionary from insight_extractor with structured data
+
+        Returns:
+            True if saved successfully (or partially)
+        """
+        if not insights:
+            return True
+
+        try:
+            episodes = self.build_structured_episodes(insights)
+            results = await self.add_episodes(episodes)
+            saved_count = sum(results)
 
             logger.info(
-                f"Saved {saved_count}/{total_count} structured insights to Graphiti "
+                f"Saved {saved_count}/{len(episodes)} structured insights to Graphiti "
                 f"(group: {self.group_id})"
             )
             return saved_count > 0
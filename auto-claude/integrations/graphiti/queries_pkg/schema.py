@@ -16,6 +16,11 @@ EPISODE_TYPE_HISTORICAL_CONTEXT = "historical_context"
 # Maximum results to return for context queries (avoid overwhelming agent context)
 MAX_CONTEXT_RESULTS = 10
 
+# add_episode calls in flight when saving several episodes at once. Entity
+# extraction and embedding requests overlap; database queries are still
+# serialized by the driver.
+EPISODE_INGEST_CONCURRENCY = 4
+
 # Retry configuration
 MAX_RETRIES = 2
 RETRY_DELAY_SECONDS = 1
@@ -15,6 +15,7 @@ from .schema import (
     MAX_CONTEXT_RESULTS,
     GroupIdMode,
 )
+from .search_cache import cache_namespace, get_search_cache
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,25 @@ class GraphitiSearch:
         self.group_id_mode = group_id_mode
         self.project_dir = project_dir
 
+    async def _search(self, query: str, group_ids: list[str], num_results: int):
+        """Run graphiti.search, reusing recent results for the same query."""
+        cache = get_search_cache()
+        namespace = cache_namespace(self.client)
+
+        results = cache.get(namespace, group_ids, query, num_results)
+        if results is not None:
+            logger.debug(f"Search cache hit for: {query[:50]}...")
+            return results
+
+        generations = cache.snapshot(namespace, group_ids)
+        results = await self.client.graphiti.search(
+            query=query,
+            group_ids=group_ids,
+            num_results=num_results,
+        )
+        cache.put(namespace, group_ids, query, num_results, results, generations)
+        return results
+
     async def get_relevant_context(
         self,
         query: str,
@@ -81,10 +101,8 @@ class GraphitiSearch:
                 if project_group_id != self.group_id:
                     group_ids.append(project_group_id)
 
-            results = await self.client.graphiti.search(
-                query=query,
-                group_ids=group_ids,
-                num_results=min(num_results, MAX_CONTEXT_RESULTS),
+            results = await self._search(
+                query, group_ids, min(num_results, MAX_CONTEXT_RESULTS)
             )
 
             context_items = []
@@ -129,10 +147,10 @@ class GraphitiSearch:
             List of session insight summaries
         """
         try:
-            results = await self.client.graphiti.search(
-                query="session insight completed subtasks recommendations",
-                group_ids=[self.group_id],
-                num_results=limit * 2,  # Get more to filter
+            results = await self._search(
+                "session insight completed subtasks recommendations",
+                [self.group_id],
+                limit * 2,  # Get more to filter
             )
 
             sessions = []
@@ -180,10 +198,8 @@ class GraphitiSearch:
             List of similar task outcomes with success/failure info
         """
         try:
-            results = await self.client.graphiti.search(
-                query=f"task outcome: {task_description}",
-                group_ids=[self.group_id],
-                num_results=limit * 2,
+            results = await self._search(
+                f"task outcome: {task_description}", [self.group_id], limit * 2
             )
 
             outcomes = []
@@ -0,0 +1,232 @@
+"""
+Search caches for Graphiti memory.
+
+The coder loop asks Graphiti for context before every subtask session, often
+with near-identical queries, and every ``graphiti.search`` embeds the query
+and scans the graph database. Two process-wide caches avoid repeating that:
+
+- SearchResultCache: raw search results keyed by (database, group IDs,
+  normalized query, num_results). Entries expire after a TTL and are dropped
+  as soon as an episode is added to one of their groups.
+- Query embedding cache: single-text embeddings, so the same query text is
+  not sent to the embedding provider twice.
+
+Configuration (environment):
+    GRAPHITI_SEARCH_CACHE_TTL  Seconds a search result stays valid
+                               (default 300, 0 disables the result cache)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from ..providers_pkg.embedding_cache import single_text_input
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_CACHE_TTL = 300.0
+
+# Maximum number of cached searches
+SEARCH_CACHE_SIZE = 256
+
+# Maximum number of cached query embeddings
+QUERY_EMBEDDING_CACHE_SIZE = 512
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query used in cache keys."""
+    return " ".join(query.casefold().split())
+
+
+def _ttl_from_env() -> float:
+    try:
+        return max(
+            0.0,
+            float(
+                os.environ.get("GRAPHITI_SEARCH_CACHE_TTL", DEFAULT_SEARCH_CACHE_TTL)
+            ),
+        )
+    except ValueError:
+        return DEFAULT_SEARCH_CACHE_TTL
+
+
+class SearchResultCache:
+    """
+    TTL cache of search results that is invalidated per group.
+
+    Every group has a generation number that add_episode callers bump through
+    invalidate_group(). An entry remembers the generations of its groups and
+    is only served while all of them are unchanged.
+    """
+
+    def __init__(self, ttl: float | None = None, max_entries: int = SEARCH_CACHE_SIZE):
+        self.ttl = _ttl_from_env() if ttl is None else ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, tuple[int, ...], list]] = (
+            OrderedDict()
+        )
+        self._generations: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(
+        self, namespace: str, group_ids: Iterable[str], query: str, num_results: int
+    ) -> tuple:
+        return (
+            namespace,
+            tuple(sorted(group_ids)),
+            normalize_query(query),
+            num_results,
+        )
+
+    def _group_generations(self, key: tuple) -> tuple[int, ...]:
+        namespace, group_ids = key[0], key[1]
+        return tuple(self._generations.get((namespace, g), 0) for g in group_ids)
+
+    def get(
+        self, namespace: str, group_ids: Iterable[str], query: str, num_results: int
+    ) -> list | None:
+        """
+        Get cached results for a search.
+
+        Returns:
+            A copy of the cached result list, or None on a miss
+        """
+        if self.ttl <= 0:
+            return None
+        key = self._key(namespace, group_ids, query, num_results)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, generations, results = entry
+                if (
+                    time.monotonic() < expires_at
+                    and generations == self._group_generations(key)
+                ):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return list(results)
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def put(
+        self,
+        namespace: str,
+        group_ids: Iterable[str],
+        query: str,
+        num_results: int,
+        results: list,
+        generations: tuple[int, ...] | None = None,
+    ) -> None:
+        """
+        Store the results of a search.
+
+        Args:
+            generations: Group generations from snapshot() taken before the
+                search started; results of a search that overlapped with an
+                invalidation are not stored
+        """
+        if self.ttl <= 0:
+            return
+        key = self._key(namespace, group_ids, query, num_results)
+        with self._lock:
+            current = self._group_generations(key)
+            if generations is not None and generations != current:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, current, list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def snapshot(self, namespace: str, group_ids: Iterable[str]) -> tuple[int, ...]:
+        """Current generations of the given groups (pass to put())."""
+        key = self._key(namespace, group_ids, "", 0)
+        with self._lock:
+            return self._group_generations(key)
+
+    def invalidate_group(self, namespace: str, group_id: str) -> None:
+        """Drop every cached search that covers the group."""
+        with self._lock:
+            gen_key = (namespace, group_id)
+            self._generations[gen_key] = self._generations.get(gen_key, 0) + 1
+            stale = [
+                key
+                for key in self._entries
+                if key[0] == namespace and group_id in key[1]
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached searches."""
+        with self._lock:
+            self._entries.clear()
+
+
+_search_cache = SearchResultCache()
+
+
+def cache_namespace(client) -> str:
+    """Identify a client's graph database in cache keys."""
+    config = getattr(client, "config", None)
+    if config is None:
+        return str(id(client))
+    return f"{config.db_path}/{config.database}"
+
+
+def get_search_cache() -> SearchResultCache:
+    """Get the process-wide search result cache."""
+    return _search_cache
+
+
+def cache_query_embeddings(embedder, max_entries: int = QUERY_EMBEDDING_CACHE_SIZE):
+    """
+    Make an embedder reuse embeddings of single texts it has already seen.
+
+    Only ``create`` calls for one string, given as ``text`` or ``[text]``
+    (that is how search embeds its query), are cached; batches and token
+    inputs pass straight through. The embedder is patched in place so it
+    keeps its own type.
+
+    Args:
+        embedder: Graphiti embedder instance
+
+    Returns:
+        The same embedder
+    """
+    if embedder is None or hasattr(embedder, "_query_embedding_cache"):
+        return embedder
+
+    original_create = embedder.create
+    cache: OrderedDict[str, list[float]] = OrderedDict()
+    lock = threading.Lock()
+
+    async def create(*args, **kwargs):
+        text = single_text_input(args, kwargs)
+        if text is None:
+            return await original_create(*args, **kwargs)
+
+        with lock:
+            vector = cache.get(text)
+            if vector is not None:
+                cache.move_to_end(text)
+                return list(vector)
+
+        vector = await original_create(*args, **kwargs)
+        with lock:
+            cache[text] = list(vector)
+            while len(cache) > max_entries:
+                cache.popitem(last=False)
+        return vector
+
+    try:
+        embedder.create = create
+        embedder._query_embedding_cache = cache
+    except (AttributeError, TypeError, ValueError):
+        logger.debug("Embedder does not allow patching; query embeddings not cached")
+    return embedder
@@ -46,7 +46,7 @@ from .file_timeline import (
     TaskIntent,
     WorktreeState,
 )
-from .git_utils import find_worktree, get_file_from_branch
+from .git_utils import find_worktree, get_file_from_branch, get_files_from_branch
 from .merge_pipeline import MergePipeline
 from .models import MergeReport, MergeStats, TaskMergeRequest
 from .orchestrator import MergeOrchestrator
@@ -99,6 +99,7 @@ __all__ = [
     # Utilities
     "find_worktree",
     "get_file_from_branch",
+    "get_files_from_branch",
     "apply_single_task_changes",
     "combine_non_conflicting_changes",
     "find_import_end",
@@ -11,6 +11,7 @@ resolution of conflicts using AI with minimal context.
 from __future__ import annotations
 
 import logging
+import threading
 from collections.abc import Callable
 
 from ..types import (
@@ -71,6 +72,8 @@ class AIResolver:
         self.max_context_tokens = max_context_tokens
         self._call_count = 0
         self._total_tokens = 0
+        # Conflicts may be resolved from several merge worker threads
+        self._stats_lock = threading.Lock()
 
     def set_ai_function(self, ai_call_fn: AICallFunction) -> None:
         """Set the AI call function after initialization."""
@@ -199,8 +202,9 @@ class AIResolver:
         try:
             logger.info(f"Calling AI to resolve conflict in {conflict.file_path}")
             response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
-            self._call_count += 1
-            self._total_tokens += context.estimated_tokens + len(response) // 4
+            with self._stats_lock:
+                self._call_count += 1
+                self._total_tokens += context.estimated_tokens + len(response) // 4
 
             # Parse response
             merged_code = extract_code_block(response, context.language)
@@ -352,8 +356,9 @@ class AIResolver:
 
         try:
             response = self.ai_call_fn(SYSTEM_PROMPT, batch_prompt)
-            self._call_count += 1
-            self._total_tokens += total_tokens + len(response) // 4
+            with self._stats_lock:
+                self._call_count += 1
+                self._total_tokens += total_tokens + len(response) // 4
 
             # Parse batch response
             # This is a simplified parser - production would be more robust
@@ -13,6 +13,8 @@ This module handles:
 from __future__ import annotations
 
 import logging
+import threading
+from contextlib import nullcontext
 
 from .ai_resolver import AIResolver
 from .auto_merger import AutoMerger, MergeContext
@@ -41,6 +43,7 @@ class ConflictResolver:
         auto_merger: AutoMerger,
         ai_resolver: AIResolver | None = None,
         enable_ai: bool = True,
+        max_ai_concurrency: int | None = None,
     ):
         """
         Initialize the conflict resolver.
@@ -49,10 +52,17 @@ class ConflictResolver:
             auto_merger: AutoMerger instance for deterministic resolution
             ai_resolver: Optional AIResolver instance for AI-based resolution
             enable_ai: Whether to use AI for ambiguous conflicts
+            max_ai_concurrency: Maximum number of AI calls in flight at once
+                when files are merged from several threads (None = unlimited)
         """
         self.auto_merger = auto_merger
         self.ai_resolver = ai_resolver
         self.enable_ai = enable_ai
+        self._ai_slots = (
+            threading.BoundedSemaphore(max_ai_concurrency)
+            if max_ai_concurrency
+            else None
+        )
 
     def resolve_conflicts(
         self,
@@ -111,11 +121,12 @@ class ConflictResolver:
                     baseline_content, conflict.location
                 )
 
-                ai_result = self.ai_resolver.resolve_conflict(
-                    conflict=conflict,
-                    baseline_code=conflict_baseline,
-                    task_snapshots=task_snapshots,
-                )
+                with self._ai_slots or nullcontext():
+                    ai_result = self.ai_resolver.resolve_conflict(
+                        conflict=conflict,
+                        baseline_code=conflict_baseline,
+                        task_snapshots=task_snapshots,
+                    )
 
                 ai_calls += ai_result.ai_calls_made
                 tokens_used += ai_result.tokens_used
@@ -15,6 +15,7 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from ..git_batch import read_files_at
 from ..semantic_analyzer import SemanticAnalyzer
 from ..types import FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
@@ -175,6 +176,9 @@ class ModificationTracker:
                 else changed_files,
             )
 
+            # Content before (from target branch), fetched in one round trip
+            old_contents = read_files_at(worktree_path, target_branch, changed_files)
+
             for file_path in changed_files:
                 # Get the diff for this file
                 diff_result = subprocess.run(
@@ -185,19 +189,8 @@ class ModificationTracker:
                     check=True,
                 )
 
-                # Get content before (from target branch) and after (current)
-                try:
-                    show_result = subprocess.run(
-                        ["git", "show", f"{target_branch}:{file_path}"],
-                        cwd=worktree_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    old_content = show_result.stdout
-                except subprocess.CalledProcessError:
-                    # File is new
-                    old_content = ""
+                # Content before; None means the file is new
+                old_content = old_contents.get(file_path) or ""
 
                 current_file = worktree_path / file_path
                 if current_file.exists():
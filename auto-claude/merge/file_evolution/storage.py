@@ -3,7 +3,9 @@ Storage and Persistence Module
 ================================
 
 Handles file system operations for evolution tracking:
-- Loading/saving evolution data from JSON
+- Loading/saving evolution data (one SQLite record per file)
+- Lazy loading of evolutions on first access
+- Migrating the legacy file_evolution.json
 - Storing baseline content snapshots
 - Reading file contents from disk
 """
@@ -12,19 +14,102 @@ from __future__ import annotations
 
 import json
 import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, MutableMapping
+from datetime import datetime
 from pathlib import Path
 
 from ..types import FileEvolution
 
 logger = logging.getLogger(__name__)
 
+EVOLUTION_DB_FILENAME = "file_evolution.db"
+LEGACY_EVOLUTION_FILENAME = "file_evolution.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS evolutions (
+    id INTEGER PRIMARY KEY,
+    file_path TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL
+);
+"""
+
+
+class LazyEvolutionMap(MutableMapping):
+    """
+    Dict-like view of all evolutions that parses each record on first access.
+
+    File paths are read up front. Iterating over values or items loads the
+    remaining records in a single query.
+    """
+
+    def __init__(self, storage: EvolutionStorage):
+        self._storage = storage
+        self._keys: dict[str, None] = dict.fromkeys(storage.list_files())
+        self._loaded: dict[str, FileEvolution] = {}
+
+    def __getitem__(self, file_path: str) -> FileEvolution:
+        evolution = self._loaded.get(file_path)
+        if evolution is not None:
+            return evolution
+        if file_path not in self._keys:
+            raise KeyError(file_path)
+        evolution = self._storage.load_evolution(file_path)
+        if evolution is None:
+            raise KeyError(file_path)
+        self._loaded[file_path] = evolution
+        return evolution
+
+    def __setitem__(self, file_path: str, evolution: FileEvolution) -> None:
+        self._keys[file_path] = None
+        self._loaded[file_path] = evolution
+
+    def __delitem__(self, file_path: str) -> None:
+        del self._keys[file_path]
+        self._loaded.pop(file_path, None)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _load_all(self) -> None:
+        missing = [k for k in self._keys if k not in self._loaded]
+        if missing:
+            self._loaded.update(self._storage.load_evolutions_bulk(missing))
+            for file_path in missing:
+                if file_path not in self._loaded:
+                    del self._keys[file_path]
+
+    def items(self):
+        self._load_all()
+        return {k: self._loaded[k] for k in self._keys}.items()
+
+    def values(self):
+        self._load_all()
+        return [self._loaded[k] for k in self._keys]
+
+    def loaded(self) -> dict[str, FileEvolution]:
+        """Evolutions already held in memory (the only ones that can change)."""
+        return dict(self._loaded)
+
 
 class EvolutionStorage:
     """
     Manages persistence of file evolution data.
 
     Responsibilities:
-    - Load/save evolution data to JSON
+    - Load/save evolution data, one record per file, writing only
+      records whose content changed
     - Store baseline content snapshots
     - Read file contents safely
     """
@@ -44,57 +129,199 @@ class EvolutionStorage:
         self.project_dir = Path(project_dir).resolve()
         self.storage_dir = Path(storage_dir).resolve()
         self.baselines_dir = self.storage_dir / "baselines"
-        self.evolution_file = self.storage_dir / "file_evolution.json"
+        self.evolution_file = self.storage_dir / EVOLUTION_DB_FILENAME
+        self.legacy_evolution_file = self.storage_dir / LEGACY_EVOLUTION_FILENAME
 
         # Ensure directories exist
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.baselines_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_evolutions(self) -> dict[str, FileEvolution]:
+        self._lock = threading.RLock()
+        # file_path -> serialized record last written or read
+        self._saved: dict[str, str] = {}
+
+        self._conn = sqlite3.connect(
+            self.evolution_file, timeout=30, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._import_legacy_json()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def list_files(self) -> list[str]:
         """
-        Load evolution data from disk.
+        List tracked file paths without parsing any evolution.
 
         Returns:
-            Dictionary mapping file paths to FileEvolution objects
+            File paths in the order they were first tracked
         """
-        if not self.evolution_file.exists():
-            return {}
+        with self._lock:
+            rows = self._conn.execute("SELECT file_path FROM evolutions ORDER BY id")
+            return [row[0] for row in rows]
 
-        try:
-            with open(self.evolution_file) as f:
-                data = json.load(f)
+    def load_evolution(self, file_path: str) -> FileEvolution | None:
+        """
+        Load a single file's evolution.
 
-            evolutions = {}
-            for file_path, evolution_data in data.items():
-                evolutions[file_path] = FileEvolution.from_dict(evolution_data)
+        Args:
+            file_path: Path relative to the project root
 
-            logger.debug(f"Loaded evolution data for {len(evolutions)} files")
-            return evolutions
+        Returns:
+            FileEvolution, or None if the file is not tracked
+        """
+        return self.load_evolutions_bulk([file_path]).get(file_path)
 
-        except Exception as e:
-            logger.error(f"Failed to load evolution data: {e}")
-            return {}
+    def load_evolutions_bulk(self, file_paths: list[str]) -> dict[str, FileEvolution]:
+        """
+        Load several evolutions in as few queries as possible.
 
-    def save_evolutions(self, evolutions: dict[str, FileEvolution]) -> None:
+        Args:
+            file_paths: Paths relative to the project root
+
+        Returns:
+            Mapping of file path to FileEvolution for the paths that exist
+        """
+        evolutions: dict[str, FileEvolution] = {}
+        with self._lock:
+            for start in range(0, len(file_paths), 500):
+                chunk = file_paths[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                try:
+                    rows = self._conn.execute(
+                        "SELECT file_path, data FROM evolutions "
+                        f"WHERE file_path IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to load evolution data: {e}")
+                    continue
+                for file_path, data in rows:
+                    try:
+                        evolutions[file_path] = FileEvolution.from_dict(
+                            json.loads(data)
+                        )
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.error(f"Corrupt evolution record for {file_path}: {e}")
+                        continue
+                    self._saved[file_path] = data
+        return evolutions
+
+    def load_evolutions(self) -> LazyEvolutionMap:
+        """
+        Load evolution data from disk.
+
+        Records are parsed lazily, when a file's evolution is first accessed.
+
+        Returns:
+            Mapping of file paths to FileEvolution objects
+        """
+        evolutions = LazyEvolutionMap(self)
+        logger.debug(f"Found evolution data for {len(evolutions)} files")
+        return evolutions
+
+    def save_evolutions(
+        self,
+        evolutions: MutableMapping[str, FileEvolution],
+        changed: Iterable[str] | None = None,
+    ) -> None:
         """
         Persist evolution data to disk.
 
+        Only records whose serialized content differs from what was last
+        written are updated. Evolutions that were never loaded from a
+        LazyEvolutionMap cannot have changed and are skipped.
+
         Args:
-            evolutions: Dictionary mapping file paths to FileEvolution objects
+            evolutions: Mapping of file paths to FileEvolution objects
+            changed: File paths known to be the only ones modified. When
+                omitted, every loaded evolution is checked and records for
+                files no longer in the mapping are deleted.
         """
-        try:
-            data = {
-                file_path: evolution.to_dict()
-                for file_path, evolution in evolutions.items()
-            }
-
-            with open(self.evolution_file, "w") as f:
-                json.dump(data, f, indent=2)
+        if changed is not None:
+            candidates = {k: evolutions[k] for k in changed if k in evolutions}
+        elif isinstance(evolutions, LazyEvolutionMap):
+            candidates = evolutions.loaded()
+        else:
+            candidates = dict(evolutions)
+
+        with self._lock:
+            try:
+                written = 0
+                with self._conn:
+                    for file_path, evolution in candidates.items():
+                        data = json.dumps(evolution.to_dict())
+                        if self._saved.get(file_path) == data:
+                            continue
+                        self._conn.execute(
+                            "INSERT INTO evolutions (file_path, data) VALUES (?, ?) "
+                            "ON CONFLICT (file_path) DO UPDATE SET data = excluded.data",
+                            (file_path, data),
+                        )
+                        self._saved[file_path] = data
+                        written += 1
+
+                    if changed is None:
+                        removed = [
+                            (file_path,)
+                            for file_path in self.list_files()
+                            if file_path not in evolutions
+                        ]
+                        self._conn.executemany(
+                            "DELETE FROM evolutions WHERE file_path = ?", removed
+                        )
+                        for (file_path,) in removed:
+                            self._saved.pop(file_path, None)
+
+                logger.debug(f"Saved evolution data for {written} files")
 
-            logger.debug(f"Saved evolution data for {len(evolutions)} files")
+            except Exception as e:
+                # Forget cached state so the next save rewrites these records
+                for file_path in candidates:
+                    self._saved.pop(file_path, None)
+                logger.error(f"Failed to save evolution data: {e}")
+
+    def _import_legacy_json(self) -> None:
+        """Import the legacy single-file file_evolution.json, once."""
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'legacy_json_imported'"
+            ).fetchone()
+            if done:
+                return
 
-        except Exception as e:
-            logger.error(f"Failed to save evolution data: {e}")
+            try:
+                data = {}
+                if self.legacy_evolution_file.exists():
+                    with open(self.legacy_evolution_file) as f:
+                        data = json.load(f)
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO evolutions (file_path, data) "
+                        "VALUES (?, ?)",
+                        (
+                            (file_path, json.dumps(evolution_data))
+                            for file_path, evolution_data in data.items()
+                        ),
+                    )
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) "
+                        "VALUES ('legacy_json_imported', ?)",
+                        (datetime.now().isoformat(),),
+                    )
+            except Exception as e:
+                logger.error(f"Failed to import legacy evolution data: {e}")
+                return
+
+            if data:
+                logger.info(
+                    f"Migrated evolution data for {len(data)} files from "
+                    f"{self.legacy_evolution_file.name}"
+                )
 
     def store_baseline_content(
         self,
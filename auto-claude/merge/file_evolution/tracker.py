@@ -12,6 +12,7 @@ Main entry point that orchestrates the modular components:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, MutableMapping
 from pathlib import Path
 
 from ..semantic_analyzer import SemanticAnalyzer
@@ -93,13 +94,15 @@ class FileEvolutionTracker:
         )
         self.queries = EvolutionQueries(self.storage)
 
-        # Load existing evolution data
-        self._evolutions: dict[str, FileEvolution] = self.storage.load_evolutions()
+        # Existing evolution data, parsed lazily on first access
+        self._evolutions: MutableMapping[str, FileEvolution] = (
+            self.storage.load_evolutions()
+        )
 
         debug_success(
             MODULE,
             "FileEvolutionTracker initialized",
-            evolutions_loaded=len(self._evolutions),
+            evolutions_tracked=len(self._evolutions),
         )
 
     # Expose storage_dir and baselines_dir for backward compatibility
@@ -118,9 +121,15 @@ class FileEvolutionTracker:
         """Get the evolution file path."""
         return self.storage.evolution_file
 
-    def _save_evolutions(self) -> None:
-        """Persist evolution data to disk."""
-        self.storage.save_evolutions(self._evolutions)
+    def _save_evolutions(self, changed: Iterable[str] | None = None) -> None:
+        """
+        Persist evolution data to disk.
+
+        Args:
+            changed: Files known to be the only ones modified (default: check
+                every loaded evolution)
+        """
+        self.storage.save_evolutions(self._evolutions, changed=changed)
 
     def capture_baselines(
         self,
@@ -147,7 +156,7 @@ class FileEvolutionTracker:
             intent=intent,
             evolutions=self._evolutions,
         )
-        self._save_evolutions()
+        self._save_evolutions(changed=captured)
         logger.info(f"Captured baselines for {len(captured)} files for task {task_id}")
         return captured
 
@@ -182,7 +191,8 @@ class FileEvolutionTracker:
             evolutions=self._evolutions,
             raw_diff=raw_diff,
         )
-        self._save_evolutions()
+        if snapshot is not None:
+            self._save_evolutions(changed=[self.storage.get_relative_path(file_path)])
         return snapshot
 
     def get_file_evolution(self, file_path: Path | str) -> FileEvolution | None:
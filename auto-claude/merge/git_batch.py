@@ -0,0 +1,351 @@
+"""
+Git Batch Object Reader
+=======================
+
+Long-lived ``git cat-file --batch`` processes for reading file content at
+arbitrary revisions without spawning ``git show`` once per file.
+
+Each repository (or worktree) gets a small pool of cat-file processes.
+A request for many ``(revision, path)`` pairs is written to one process in
+a single round trip and the responses are read back in order, so timeline
+refreshes and baseline capture for hundreds of files cost one process spawn
+instead of hundreds.
+
+Usage:
+    content = read_file_at(repo, "main", "src/app.py")
+    contents = read_files_at(repo, "main", ["src/app.py", "src/utils.py"])
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# cat-file processes kept per repository (one per concurrently reading thread)
+POOL_SIZE = 4
+
+# Repositories with live pools; the least recently used pool is closed
+MAX_POOLS = 8
+
+_OBJECT_TYPES = {b"blob", b"tree", b"commit", b"tag"}
+
+
+class GitBatchError(Exception):
+    """Raised when a cat-file process dies or returns malformed output."""
+
+
+class CatFileProcess:
+    """A single ``git cat-file --batch`` process bound to one repository."""
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def fetch(self, specs: list[str]) -> list[tuple[str, bytes] | None]:
+        """
+        Read many objects in one round trip.
+
+        Args:
+            specs: Object names understood by git, e.g. "HEAD:src/app.py"
+
+        Returns:
+            (object type, raw content) per spec, or None if the object is missing
+        """
+        request = b"".join(spec.encode("utf-8") + b"\n" for spec in specs)
+
+        # Write from a separate thread for large requests: git starts
+        # answering before it has read all input, and both pipes can fill.
+        writer = None
+        if len(specs) > 1:
+            writer = threading.Thread(target=self._write, args=(request,), daemon=True)
+            writer.start()
+        else:
+            self._write(request)
+
+        try:
+            return [self._read_response() for _ in specs]
+        finally:
+            if writer is not None:
+                writer.join()
+
+    def _write(self, data: bytes) -> None:
+        try:
+            self._proc.stdin.write(data)
+            self._proc.stdin.flush()
+        except (BrokenPipeError, ValueError, OSError):
+            # The reader notices the dead process and raises
+            pass
+
+    def _read_response(self) -> tuple[str, bytes] | None:
+        stdout = self._proc.stdout
+        header = stdout.readline()
+        if not header:
+            raise GitBatchError(f"git cat-file exited in {self.repo_path}")
+
+        # "<oid> <type> <size>" for found objects, "<spec> missing" otherwise
+        parts = header.rstrip(b"\n").rsplit(b" ", 2)
+        if len(parts) != 3 or parts[1] not in _OBJECT_TYPES or not parts[2].isdigit():
+            return None
+
+        size = int(parts[2])
+        data = stdout.read(size)
+        trailer = stdout.read(1)
+        if len(data) != size or trailer != b"\n":
+            raise GitBatchError(f"Truncated git cat-file output in {self.repo_path}")
+        return parts[1].decode("ascii"), data
+
+    def close(self) -> None:
+        try:
+            if self._proc.stdin:
+                self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+        finally:
+            if self._proc.stdout:
+                self._proc.stdout.close()
+
+
+class GitObjectPool:
+    """Thread-safe pool of cat-file processes for one repository."""
+
+    def __init__(self, repo_path: Path, size: int = POOL_SIZE):
+        self.repo_path = Path(repo_path).resolve()
+        self.size = max(1, size)
+        self._idle: list[CatFileProcess] = []
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _acquire(self) -> CatFileProcess:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise GitBatchError(f"Pool for {self.repo_path} is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._cond.wait()
+        try:
+            return CatFileProcess(self.repo_path)
+        except OSError as e:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise GitBatchError(f"Could not start git cat-file: {e}") from e
+
+    def _release(self, proc: CatFileProcess | None) -> None:
+        with self._cond:
+            if proc is not None and proc.alive and not self._closed:
+                self._idle.append(proc)
+            else:
+                self._created -= 1
+                if proc is not None:
+                    proc.close()
+            self._cond.notify()
+
+    def read_objects(self, specs: list[str]) -> list[tuple[str, bytes] | None]:
+        """
+        Read objects by name, restarting the process once if it died.
+
+        Args:
+            specs: Object names, e.g. "main:src/app.py"
+
+        Returns:
+            (object type, raw content) or None per spec, in input order
+        """
+        if not specs:
+            return []
+
+        for attempt in range(2):
+            proc = self._acquire()
+            try:
+                result = proc.fetch(specs)
+            except (GitBatchError, OSError):
+                proc.close()
+                self._release(None)
+                if attempt:
+                    raise
+                continue
+            self._release(proc)
+            return result
+        return []  # unreachable
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for proc in idle:
+            proc.close()
+
+
+_pools: OrderedDict[Path, GitObjectPool] = OrderedDict()
+_pools_lock = threading.Lock()
+
+
+def get_object_pool(repo_path: Path) -> GitObjectPool:
+    """Get (or create) the shared cat-file pool for a repository or worktree."""
+    key = Path(repo_path).resolve()
+    evicted = None
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = GitObjectPool(key)
+            if len(_pools) > MAX_POOLS:
+                _, evicted = _pools.popitem(last=False)
+        else:
+            _pools.move_to_end(key)
+    if evicted is not None:
+        evicted.close()
+    return pool
+
+
+def close_object_pools() -> None:
+    """Terminate every cat-file process started by this module."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_object_pools)
+
+
+def decode_text(data: bytes) -> str | None:
+    """
+    Decode blob content the way ``subprocess.run(..., text=True)`` would.
+
+    Returns:
+        UTF-8 text with universal newlines, or None if the blob is not UTF-8
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _show(repo_path: Path, spec: str) -> str | None:
+    """Fallback for object names cat-file's line protocol cannot carry."""
+    try:
+        result = subprocess.run(
+            ["git", "show", spec],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, UnicodeDecodeError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def read_files(
+    repo_path: Path, requests: Iterable[tuple[str, str]]
+) -> dict[tuple[str, str], str | None]:
+    """
+    Read many (revision, path) blobs in one round trip.
+
+    Args:
+        repo_path: Repository or worktree directory
+        requests: (revision, path relative to repository root) pairs
+
+    Returns:
+        Mapping of each (revision, path) to its text content, or None if the
+        file does not exist at that revision or is not UTF-8 text
+    """
+    results: dict[tuple[str, str], str | None] = {}
+    batched: list[tuple[str, str]] = []
+    for rev, file_path in dict.fromkeys(requests):
+        if "\n" in rev or "\n" in file_path:
+            results[(rev, file_path)] = _show(repo_path, f"{rev}:{file_path}")
+        else:
+            batched.append((rev, file_path))
+
+    if batched:
+        specs = [f"{rev}:{file_path}" for rev, file_path in batched]
+        try:
+            objects = get_object_pool(repo_path).read_objects(specs)
+        except GitBatchError as e:
+            logger.debug(f"Falling back to git show: {e}")
+            for key, spec in zip(batched, specs):
+                results[key] = _show(repo_path, spec)
+        else:
+            for key, obj in zip(batched, objects):
+                if obj is None or obj[0] != "blob":
+                    results[key] = None
+                else:
+                    results[key] = decode_text(obj[1])
+
+    return results
+
+
+def read_files_at(
+    repo_path: Path, rev: str, file_paths: Iterable[str]
+) -> dict[str, str | None]:
+    """
+    Read many files at one revision.
+
+    Args:
+        repo_path: Repository or worktree directory
+        rev: Commit hash, branch or other revision
+        file_paths: Paths relative to the repository root
+
+    Returns:
+        Mapping of file path to content, or None if missing at that revision
+    """
+    contents = read_files(repo_path, ((rev, path) for path in file_paths))
+    return {path: content for (_, path), content in contents.items()}
+
+
+def read_file_at(repo_path: Path, rev: str, file_path: str) -> str | None:
+    """
+    Read one file at a revision (a pooled replacement for ``git show rev:path``).
+
+    Args:
+        repo_path: Repository or worktree directory
+        rev: Commit hash, branch or other revision
+        file_path: Path relative to the repository root
+
+    Returns:
+        File content, or None if the file does not exist at that revision
+    """
+    return read_files(repo_path, [(rev, file_path)])[(rev, file_path)]
+
+
+def read_commit(repo_path: Path, commit: str) -> bytes | None:
+    """
+    Read a raw commit object (headers and message).
+
+    Returns:
+        The commit object body, or None if the commit cannot be resolved
+    """
+    if "\n" in commit:
+        return None
+    try:
+        obj = get_object_pool(repo_path).read_objects([f"{commit}^{{commit}}"])[0]
+    except GitBatchError:
+        return None
+    return obj[1] if obj and obj[0] == "commit" else None
@@ -15,6 +15,8 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+from .git_batch import read_file_at, read_files_at
+
 
 def find_worktree(project_dir: Path, task_id: str) -> Path | None:
     """
@@ -65,14 +67,21 @@ def get_file_from_branch(project_dir: Path, file_path: str, branch: str) -> str
     Returns:
         File content as string, or None if file doesn't exist on branch
     """
-    try:
-        result = subprocess.run(
-            ["git", "show", f"{branch}:{file_path}"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
-        return None
+    return read_file_at(project_dir, branch, file_path)
+
+
+def get_files_from_branch(
+    project_dir: Path, file_paths: list[str], branch: str
+) -> dict[str, str | None]:
+    """
+    Get the content of many files from a git branch in one round trip.
+
+    Args:
+        project_dir: The project root directory
+        file_paths: Paths to the files relative to project root
+        branch: Branch name
+
+    Returns:
+        Mapping of file path to content, or None if missing on the branch
+    """
+    return read_files_at(project_dir, branch, file_paths)
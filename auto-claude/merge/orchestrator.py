@@ -19,6 +19,8 @@ with maximum automation and minimum AI token usage.
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -38,6 +40,8 @@ from .types import (
     ConflictRegion,
     FileAnalysis,
     MergeDecision,
+    MergeResult,
+    TaskSnapshot,
 )
 
 # Import debug utilities
@@ -82,6 +86,24 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.orchestrator"
 
+# Default number of files merged at once
+DEFAULT_MERGE_WORKERS = 4
+
+# Default cap on concurrent AI resolver calls when merging with several workers
+DEFAULT_MAX_AI_CONCURRENCY = 2
+
+
+def get_merge_concurrency() -> int:
+    """Number of files merged concurrently (AUTO_CLAUDE_MERGE_CONCURRENCY)."""
+    try:
+        return max(
+            1,
+            int(os.environ.get("AUTO_CLAUDE_MERGE_CONCURRENCY", DEFAULT_MERGE_WORKERS)),
+        )
+    except ValueError:
+        return DEFAULT_MERGE_WORKERS
+
+
 # Export all public classes for backwards compatibility
 __all__ = [
     "MergeOrchestrator",
@@ -119,6 +141,8 @@ class MergeOrchestrator:
         enable_ai: bool = True,
         ai_resolver: AIResolver | None = None,
         dry_run: bool = False,
+        max_workers: int | None = None,
+        max_ai_concurrency: int = DEFAULT_MAX_AI_CONCURRENCY,
     ):
         """
         Initialize the merge orchestrator.
@@ -129,7 +153,13 @@ class MergeOrchestrator:
             enable_ai: Whether to use AI for ambiguous conflicts
             ai_resolver: Optional pre-configured AI resolver
             dry_run: If True, don't write any files
+            max_workers: Number of files merged concurrently (1 = sequential,
+                default: get_merge_concurrency())
+            max_ai_concurrency: Maximum AI resolver calls in flight at once
         """
+        if max_workers is None:
+            max_workers = get_merge_concurrency()
+
         debug_section(MODULE, "Initializing MergeOrchestrator")
         debug(
             MODULE,
@@ -137,12 +167,15 @@ class MergeOrchestrator:
             project_dir=str(project_dir),
             enable_ai=enable_ai,
             dry_run=dry_run,
+            max_workers=max_workers,
         )
 
         self.project_dir = Path(project_dir).resolve()
         self.storage_dir = storage_dir or (self.project_dir / ".auto-claude")
         self.enable_ai = enable_ai
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers)
+        self.max_ai_concurrency = max(1, max_ai_concurrency)
 
         # Initialize components
         debug_detailed(MODULE, "Initializing sub-components...")
@@ -190,6 +223,7 @@ class MergeOrchestrator:
                 auto_merger=self.auto_merger,
                 ai_resolver=self.ai_resolver if self.enable_ai else None,
                 enable_ai=self.enable_ai,
+                max_ai_concurrency=self.max_ai_concurrency,
             )
         return self._conflict_resolver
 
@@ -264,24 +298,11 @@ class MergeOrchestrator:
                 return report
 
             # Process each modified file
-            for file_path, snapshot in modifications:
-                debug_detailed(
-                    MODULE,
-                    f"Processing file: {file_path}",
-                    changes=len(snapshot.semantic_changes),
-                )
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=[snapshot],
-                    target_branch=target_branch,
-                )
+            jobs = [(file_path, [snapshot]) for file_path, snapshot in modifications]
+            results = self._merge_files(jobs, target_branch)
+            for (file_path, _), result in zip(jobs, results):
                 report.file_results[file_path] = result
                 self._update_stats(report.stats, result)
-                debug_verbose(
-                    MODULE,
-                    f"File merge result: {result.decision.value}",
-                    file=file_path,
-                )
 
             report.success = report.stats.files_failed == 0
 
@@ -353,9 +374,9 @@ class MergeOrchestrator:
             task_ids = [r.task_id for r in requests]
             file_tasks = self.evolution_tracker.get_files_modified_by_tasks(task_ids)
 
-            # Process each file
+            # Collect snapshots from all tasks that modified each file
+            jobs: list[tuple[str, list[TaskSnapshot]]] = []
             for file_path, modifying_tasks in file_tasks.items():
-                # Get snapshots from all tasks that modified this file
                 evolution = self.evolution_tracker.get_file_evolution(file_path)
                 if not evolution:
                     continue
@@ -366,14 +387,12 @@ class MergeOrchestrator:
                     if evolution.get_task_snapshot(tid)
                 ]
 
-                if not snapshots:
-                    continue
+                if snapshots:
+                    jobs.append((file_path, snapshots))
 
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=snapshots,
-                    target_branch=target_branch,
-                )
+            # Process each file
+            results = self._merge_files(jobs, target_branch)
+            for (file_path, _), result in zip(jobs, results):
                 report.file_results[file_path] = result
                 self._update_stats(report.stats, result)
 
@@ -396,6 +415,58 @@ class MergeOrchestrator:
 
         return report
 
+    def _merge_files(
+        self,
+        jobs: list[tuple[str, list[TaskSnapshot]]],
+        target_branch: str,
+    ) -> list[MergeResult]:
+        """
+        Merge a batch of files, concurrently when max_workers > 1.
+
+        Files are independent of each other, so baseline lookups, conflict
+        detection and AI resolution for different files can overlap. Results
+        are returned in job order so reports and stats do not depend on
+        which worker finished first.
+
+        Args:
+            jobs: (file_path, task_snapshots) pairs to merge
+            target_branch: Branch to merge into
+
+        Returns:
+            MergeResults in the same order as jobs
+        """
+
+        def merge_one(job: tuple[str, list[TaskSnapshot]]) -> MergeResult:
+            file_path, snapshots = job
+            debug_detailed(
+                MODULE,
+                f"Processing file: {file_path}",
+                changes=sum(len(s.semantic_changes) for s in snapshots),
+            )
+            result = self._merge_file(
+                file_path=file_path,
+                task_snapshots=snapshots,
+                target_branch=target_branch,
+            )
+            debug_verbose(
+                MODULE,
+                f"File merge result: {result.decision.value}",
+                file=file_path,
+            )
+            return result
+
+        workers = min(self.max_workers, len(jobs))
+        if workers <= 1:
+            return [merge_one(job) for job in jobs]
+
+        debug(MODULE, f"Merging {len(jobs)} files with {workers} workers")
+        # Initialize lazy components before workers race to create them
+        _ = self.merge_pipeline
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="merge"
+        ) as executor:
+            return list(executor.map(merge_one, jobs))
+
     def _merge_file(
         self,
         file_path: str,
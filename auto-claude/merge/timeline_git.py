@@ -17,6 +17,8 @@ import logging
 import subprocess
 from pathlib import Path
 
+from .git_batch import read_commit, read_file_at, read_files_at
+
 logger = logging.getLogger(__name__)
 
 # Import debug utilities
@@ -80,18 +82,23 @@ class TimelineGitHelper:
         Returns:
             File content as string, or None if file doesn't exist at that commit
         """
-        try:
-            result = subprocess.run(
-                ["git", "show", f"{commit_hash}:{file_path}"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                return result.stdout
-            return None
-        except Exception:
-            return None
+        return read_file_at(self.project_path, commit_hash, file_path)
+
+    def get_files_content_at_commit(
+        self, file_paths: list[str], commit_hash: str
+    ) -> dict[str, str | None]:
+        """
+        Get the content of many files at a commit in a single git round trip.
+
+        Args:
+            file_paths: Paths to the files (relative to project root)
+            commit_hash: Git commit hash
+
+        Returns:
+            Mapping of file path to content, or None if the file doesn't exist
+            at that commit
+        """
+        return read_files_at(self.project_path, commit_hash, file_paths)
 
     def get_files_changed_in_commit(self, commit_hash: str) -> list[str]:
         """
@@ -134,25 +141,10 @@ class TimelineGitHelper:
         """
         info = {}
         try:
-            # Get commit message
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%s", commit_hash],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                info["message"] = result.stdout.strip()
-
-            # Get author
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%an", commit_hash],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                info["author"] = result.stdout.strip()
+            # Message and author come straight from the commit object
+            raw = read_commit(self.project_path, commit_hash)
+            if raw is not None:
+                info.update(_parse_commit_object(raw))
 
             # Get diff stat
             result = subprocess.run(
@@ -337,3 +329,28 @@ class TimelineGitHelper:
             logger.error(f"Failed to count commits: {e}")
 
         return 0
+
+
+def _parse_commit_object(raw: bytes) -> dict:
+    """
+    Extract subject and author name from a raw commit object.
+
+    Mirrors ``git log --format=%s`` (first paragraph, lines joined by
+    spaces) and ``--format=%an``.
+    """
+    text = raw.decode("utf-8", errors="replace")
+    headers, _, message = text.partition("\n\n")
+
+    info = {}
+    for line in headers.split("\n"):
+        if line.startswith("author "):
+            info["author"] = line[len("author ") :].split(" <", 1)[0]
+            break
+
+    subject_lines = []
+    for line in message.strip("\n").split("\n"):
+        if not line.strip():
+            break
+        subject_lines.append(line.strip())
+    info["message"] = " ".join(subject_lines)
+    return info
@@ -5,15 +5,24 @@ Timeline Persistence Layer
 Storage and persistence for file timelines.
 
 This module handles:
-- Saving/loading timelines to/from disk
-- Managing the timeline index
-- File path encoding for safe storage
+- Saving/loading timelines to/from a SQLite store
+- Lazy, per-file loading of timelines on first access
+- Appending main branch events instead of rewriting whole timelines
+- Indexed lookups of the timelines a task touches
+- One-time import of the legacy per-file JSON layout
+
+Timelines live in .auto-claude/file-timelines/timelines.db. Main branch
+events are append-only rows, and each task view is a separate row that is
+rewritten only when its serialized form changes.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import sqlite3
+import threading
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -34,12 +43,45 @@ except ImportError:
 
 MODULE = "merge.timeline_persistence"
 
+TIMELINE_DB_FILENAME = "timelines.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS timelines (
+    id INTEGER PRIMARY KEY,
+    file_path TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL,
+    last_updated TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS main_events (
+    timeline_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (timeline_id, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS task_views (
+    timeline_id INTEGER NOT NULL,
+    task_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (timeline_id, task_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_task_views_task ON task_views (task_id);
+"""
+
 
 class TimelinePersistence:
     """
     Handles persistence of file timelines to disk.
 
-    Timelines are stored as JSON files with an index for quick lookup.
+    Timelines are stored in SQLite, one row per timeline, main branch event
+    and task view. The store remembers what it last wrote for each timeline
+    so saving after an event only appends the new event and rewrites the
+    task views that actually changed.
     """
 
     def __init__(self, storage_path: Path):
@@ -51,80 +93,301 @@ class TimelinePersistence:
         """
         self.storage_path = Path(storage_path).resolve()
         self.timelines_dir = self.storage_path / "file-timelines"
+        self.db_path = self.timelines_dir / TIMELINE_DB_FILENAME
 
         # Ensure storage directory exists
         self.timelines_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_all_timelines(self) -> dict[str, FileTimeline]:
+        self._lock = threading.RLock()
+        # file_path -> (timeline id, saved event count, {task_id: saved json})
+        self._saved: dict[str, tuple[int, int, dict[str, str]]] = {}
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._import_legacy_json()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def list_timelines(self) -> list[str]:
         """
-        Load all timelines from disk on startup.
+        List tracked file paths without loading any timeline.
 
         Returns:
-            Dictionary mapping file_path to FileTimeline objects
+            File paths in the order they were first tracked
         """
-        from .timeline_models import FileTimeline
+        with self._lock:
+            rows = self._conn.execute("SELECT file_path FROM timelines ORDER BY id")
+            return [row[0] for row in rows]
 
-        timelines = {}
-        index_path = self.timelines_dir / "index.json"
+    def load_timeline(self, file_path: str) -> FileTimeline | None:
+        """
+        Load a single timeline.
 
-        if not index_path.exists():
-            return timelines
+        Args:
+            file_path: The file path (used as key)
 
-        try:
-            with open(index_path) as f:
-                index = json.load(f)
+        Returns:
+            The FileTimeline, or None if the file is not tracked
+        """
+        from .timeline_models import FileTimeline, MainBranchEvent, TaskFileView
+
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT id, created_at, last_updated FROM timelines "
+                    "WHERE file_path = ?",
+                    (file_path,),
+                ).fetchone()
+                if row is None:
+                    return None
+                timeline_id, created_at, last_updated = row
+
+                events = [
+                    data
+                    for (data,) in self._conn.execute(
+                        "SELECT data FROM main_events WHERE timeline_id = ? "
+                        "ORDER BY seq",
+                        (timeline_id,),
+                    )
+                ]
+                views = dict(
+                    self._conn.execute(
+                        "SELECT task_id, data FROM task_views WHERE timeline_id = ? "
+                        "ORDER BY seq",
+                        (timeline_id,),
+                    ).fetchall()
+                )
+
+                timeline = FileTimeline(
+                    file_path=file_path,
+                    created_at=datetime.fromisoformat(created_at),
+                    last_updated=datetime.fromisoformat(last_updated),
+                )
+                timeline.main_branch_history = [
+                    MainBranchEvent.from_dict(json.loads(data)) for data in events
+                ]
+                timeline.task_views = {
+                    task_id: TaskFileView.from_dict(json.loads(data))
+                    for task_id, data in views.items()
+                }
+            except (sqlite3.Error, ValueError, KeyError) as e:
+                logger.error(f"Failed to load timeline for {file_path}: {e}")
+                return None
+
+            self._saved[file_path] = (timeline_id, len(events), views)
+            return timeline
 
-            for file_path in index.get("files", []):
-                timeline_file = self._get_timeline_file_path(file_path)
-                if timeline_file.exists():
-                    with open(timeline_file) as f:
-                        data = json.load(f)
-                    timelines[file_path] = FileTimeline.from_dict(data)
+    def load_all_timelines(self) -> dict[str, FileTimeline]:
+        """
+        Load every timeline eagerly.
 
-            debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
+        Prefer LazyTimelineMap, which loads timelines on first access.
 
-        except Exception as e:
-            logger.error(f"Failed to load timelines: {e}")
+        Returns:
+            Dictionary mapping file_path to FileTimeline objects
+        """
+        timelines = {}
+        for file_path in self.list_timelines():
+            timeline = self.load_timeline(file_path)
+            if timeline is not None:
+                timelines[file_path] = timeline
 
+        debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
         return timelines
 
     def save_timeline(self, file_path: str, timeline: FileTimeline) -> None:
         """
         Save a single timeline to disk.
 
+        New main branch events are appended; task views are rewritten only
+        if they changed since the last save. Main branch events are treated
+        as immutable once recorded.
+
         Args:
             file_path: The file path (used as key)
             timeline: The FileTimeline object to save
         """
-        try:
-            # Save timeline file
-            timeline_file = self._get_timeline_file_path(file_path)
-            timeline_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(timeline_file, "w") as f:
-                json.dump(timeline.to_dict(), f, indent=2)
-
-        except Exception as e:
-            logger.error(f"Failed to persist timeline for {file_path}: {e}")
+        with self._lock:
+            try:
+                with self._conn:
+                    self._save(file_path, timeline)
+            except Exception as e:
+                # Forget what we thought was on disk so the next save is full
+                self._saved.pop(file_path, None)
+                logger.error(f"Failed to persist timeline for {file_path}: {e}")
+
+    def _save(self, file_path: str, timeline: FileTimeline) -> None:
+        conn = self._conn
+        saved = self._saved.get(file_path)
+
+        if saved is None:
+            row = conn.execute(
+                "SELECT id FROM timelines WHERE file_path = ?", (file_path,)
+            ).fetchone()
+            if row is None:
+                timeline_id = conn.execute(
+                    "INSERT INTO timelines (file_path, created_at, last_updated) "
+                    "VALUES (?, ?, ?)",
+                    (
+                        file_path,
+                        timeline.created_at.isoformat(),
+                        timeline.last_updated.isoformat(),
+                    ),
+                ).lastrowid
+            else:
+                # Unknown on-disk state: replace the timeline's rows wholesale
+                timeline_id = row[0]
+                conn.execute(
+                    "DELETE FROM main_events WHERE timeline_id = ?", (timeline_id,)
+                )
+                conn.execute(
+                    "DELETE FROM task_views WHERE timeline_id = ?", (timeline_id,)
+                )
+            saved = (timeline_id, 0, {})
+
+        timeline_id, event_count, view_data = saved
+        conn.execute(
+            "UPDATE timelines SET created_at = ?, last_updated = ? WHERE id = ?",
+            (
+                timeline.created_at.isoformat(),
+                timeline.last_updated.isoformat(),
+                timeline_id,
+            ),
+        )
+
+        events = timeline.main_branch_history
+        if len(events) < event_count:
+            # History was truncated in memory - rewrite it
+            conn.execute(
+                "DELETE FROM main_events WHERE timeline_id = ?", (timeline_id,)
+            )
+            event_count = 0
+        conn.executemany(
+            "INSERT INTO main_events (timeline_id, seq, data) VALUES (?, ?, ?)",
+            (
+                (timeline_id, seq, json.dumps(events[seq].to_dict()))
+                for seq in range(event_count, len(events))
+            ),
+        )
+
+        new_view_data: dict[str, str] = {}
+        for task_id, task_view in timeline.task_views.items():
+            data = json.dumps(task_view.to_dict())
+            new_view_data[task_id] = data
+            if view_data.get(task_id) != data:
+                # New views go last; updated views keep their position
+                conn.execute(
+                    "INSERT INTO task_views (timeline_id, task_id, seq, status, data) "
+                    "VALUES (?, ?, (SELECT COALESCE(MAX(seq) + 1, 0) FROM task_views "
+                    "WHERE timeline_id = ?), ?, ?) "
+                    "ON CONFLICT (timeline_id, task_id) DO UPDATE SET "
+                    "status = excluded.status, data = excluded.data",
+                    (timeline_id, task_id, timeline_id, task_view.status, data),
+                )
+        for task_id in view_data.keys() - new_view_data.keys():
+            conn.execute(
+                "DELETE FROM task_views WHERE timeline_id = ? AND task_id = ?",
+                (timeline_id, task_id),
+            )
+
+        self._saved[file_path] = (timeline_id, len(events), new_view_data)
+
+    def delete_timeline(self, file_path: str) -> None:
+        """
+        Remove a timeline and its events and task views from disk.
 
-    def update_index(self, file_paths: list[str]) -> None:
+        Args:
+            file_path: The file path (used as key)
         """
-        Update the index file with all tracked files.
+        with self._lock:
+            self._saved.pop(file_path, None)
+            try:
+                with self._conn:
+                    row = self._conn.execute(
+                        "SELECT id FROM timelines WHERE file_path = ?", (file_path,)
+                    ).fetchone()
+                    if row is None:
+                        return
+                    for table in ("main_events", "task_views"):
+                        self._conn.execute(
+                            f"DELETE FROM {table} WHERE timeline_id = ?", (row[0],)
+                        )
+                    self._conn.execute("DELETE FROM timelines WHERE id = ?", (row[0],))
+            except sqlite3.Error as e:
+                logger.error(f"Failed to delete timeline for {file_path}: {e}")
+
+    def files_for_task(self, task_id: str, status: str | None = None) -> list[str]:
+        """
+        Indexed lookup of the timelines a task touches.
 
         Args:
-            file_paths: List of all file paths being tracked
+            task_id: Unique task identifier
+            status: Only include task views with this status, if given
+
+        Returns:
+            File paths in the order they were first tracked
         """
-        index_path = self.timelines_dir / "index.json"
-        index = {
-            "files": file_paths,
-            "last_updated": datetime.now().isoformat(),
-        }
-        with open(index_path, "w") as f:
-            json.dump(index, f, indent=2)
+        query = (
+            "SELECT t.file_path FROM task_views v "
+            "JOIN timelines t ON t.id = v.timeline_id WHERE v.task_id = ?"
+        )
+        params: tuple = (task_id,)
+        if status is not None:
+            query += " AND v.status = ?"
+            params = (task_id, status)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY t.id", params)
+            return [row[0] for row in rows]
+
+    def _import_legacy_json(self) -> None:
+        """Import timelines written by the old per-file JSON layout, once."""
+        from .timeline_models import FileTimeline
+
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'legacy_json_imported'"
+            ).fetchone()
+            if done:
+                return
+
+            index_path = self.timelines_dir / "index.json"
+            imported = 0
+            try:
+                with self._conn:
+                    if index_path.exists():
+                        with open(index_path) as f:
+                            index = json.load(f)
+                        for file_path in index.get("files", []):
+                            timeline_file = self._get_timeline_file_path(file_path)
+                            if not timeline_file.exists():
+                                continue
+                            with open(timeline_file) as f:
+                                data = json.load(f)
+                            self._save(file_path, FileTimeline.from_dict(data))
+                            imported += 1
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) "
+                        "VALUES ('legacy_json_imported', ?)",
+                        (datetime.now().isoformat(),),
+                    )
+            except Exception as e:
+                self._saved.clear()
+                logger.error(f"Failed to import legacy timelines: {e}")
+                return
+
+            # Imported timelines are loaded lazily later; drop the write state
+            self._saved.clear()
+            if imported:
+                debug(MODULE, f"Imported {imported} legacy JSON timelines")
 
     def _get_timeline_file_path(self, file_path: str) -> Path:
         """
-        Get the storage path for a file's timeline.
+        Get the legacy JSON storage path for a file's timeline.
 
         Encodes the file path to create a safe filename.
 
@@ -137,3 +400,51 @@ class TimelinePersistence:
         # Encode path: src/App.tsx -> src_App.tsx.json
         safe_name = file_path.replace("/", "_").replace("\\", "_")
         return self.timelines_dir / f"{safe_name}.json"
+
+
+class LazyTimelineMap(MutableMapping):
+    """
+    Dict-like view of all timelines that loads each one on first access.
+
+    Keys (tracked file paths) are read up front; timeline documents are
+    only parsed when looked up.
+    """
+
+    def __init__(self, persistence: TimelinePersistence):
+        self._persistence = persistence
+        self._keys: dict[str, None] = dict.fromkeys(persistence.list_timelines())
+        self._loaded: dict[str, FileTimeline] = {}
+
+    def __getitem__(self, file_path: str) -> FileTimeline:
+        timeline = self._loaded.get(file_path)
+        if timeline is not None:
+            return timeline
+        if file_path not in self._keys:
+            raise KeyError(file_path)
+        timeline = self._persistence.load_timeline(file_path)
+        if timeline is None:
+            raise KeyError(file_path)
+        self._loaded[file_path] = timeline
+        return timeline
+
+    def __setitem__(self, file_path: str, timeline: FileTimeline) -> None:
+        self._keys[file_path] = None
+        self._loaded[file_path] = timeline
+
+    def __delitem__(self, file_path: str) -> None:
+        del self._keys[file_path]
+        self._loaded.pop(file_path, None)
+        self._persistence.delete_timeline(file_path)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def loaded(self) -> dict[str, FileTimeline]:
+        """Timelines already held in memory."""
+        return dict(self._loaded)
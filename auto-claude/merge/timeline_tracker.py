@@ -26,7 +26,7 @@ from .timeline_models import (
     TaskIntent,
     WorktreeState,
 )
-from .timeline_persistence import TimelinePersistence
+from .timeline_persistence import LazyTimelineMap, TimelinePersistence
 
 logger = logging.getLogger(__name__)
 
@@ -74,16 +74,13 @@ class FileTimelineTracker:
         self.git = TimelineGitHelper(self.project_path)
         self.persistence = TimelinePersistence(self.storage_path)
 
-        # In-memory cache of timelines
-        self._timelines: dict[str, FileTimeline] = {}
-
-        # Load existing timelines
-        self._timelines = self.persistence.load_all_timelines()
+        # Timelines are loaded from storage on first access
+        self._timelines: LazyTimelineMap = LazyTimelineMap(self.persistence)
 
         debug_success(
             MODULE,
             "FileTimelineTracker initialized",
-            timelines_loaded=len(self._timelines),
+            timelines_tracked=len(self._timelines),
         )
 
     # =========================================================================
@@ -127,14 +124,17 @@ class FileTimelineTracker:
 
         timestamp = datetime.now()
 
+        # Fetch every file's branch point content in one git round trip
+        contents = self.git.get_files_content_at_commit(
+            files_to_modify, branch_point_commit
+        )
+
         for file_path in files_to_modify:
             # Get or create timeline for this file
             timeline = self._get_or_create_timeline(file_path)
 
             # Get file content at branch point
-            content = self.git.get_file_content_at_commit(
-                file_path, branch_point_commit
-            )
+            content = contents.get(file_path)
             if content is None:
                 # File doesn't exist at this commit - might be created by task
                 content = ""
@@ -178,21 +178,19 @@ class FileTimelineTracker:
         # Get list of files changed in this commit
         changed_files = self.git.get_files_changed_in_commit(commit_hash)
 
-        for file_path in changed_files:
-            # Only update existing timelines (we don't create new ones for random files)
-            if file_path not in self._timelines:
-                continue
+        # Only update existing timelines (we don't create new ones for random files)
+        tracked_files = [f for f in changed_files if f in self._timelines]
+        contents = self.git.get_files_content_at_commit(tracked_files, commit_hash)
+        commit_info = self.git.get_commit_info(commit_hash) if tracked_files else {}
 
+        for file_path in tracked_files:
             timeline = self._timelines[file_path]
 
             # Get file content at this commit
-            content = self.git.get_file_content_at_commit(file_path, commit_hash)
+            content = contents.get(file_path)
             if content is None:
                 continue
 
-            # Get commit metadata
-            commit_info = self.git.get_commit_info(commit_hash)
-
             # Create main branch event
             event = MainBranchEvent(
                 commit_hash=commit_hash,
@@ -266,6 +264,7 @@ class FileTimelineTracker:
 
         # Get list of files this task modified
         task_files = self.get_files_for_task(task_id)
+        contents = self.git.get_files_content_at_commit(task_files, merge_commit)
 
         for file_path in task_files:
             timeline = self._timelines.get(file_path)
@@ -281,7 +280,7 @@ class FileTimelineTracker:
             task_view.merged_at = datetime.now()
 
             # Add main branch event for the merge
-            content = self.git.get_file_content_at_commit(file_path, merge_commit)
+            content = contents.get(file_path)
             if content:
                 event = MainBranchEvent(
                     commit_hash=merge_commit,
@@ -423,8 +422,9 @@ class FileTimelineTracker:
             List of file paths
         """
         files = []
-        for file_path, timeline in self._timelines.items():
-            if task_id in timeline.task_views:
+        for file_path in self._candidate_files_for_task(task_id):
+            timeline = self._timelines.get(file_path)
+            if timeline and task_id in timeline.task_views:
                 files.append(file_path)
         return files
 
@@ -454,8 +454,9 @@ class FileTimelineTracker:
             Dictionary mapping file_path to commits_behind_main count
         """
         drift = {}
-        for file_path, timeline in self._timelines.items():
-            task_view = timeline.get_task_view(task_id)
+        for file_path in self._candidate_files_for_task(task_id):
+            timeline = self._timelines.get(file_path)
+            task_view = timeline.get_task_view(task_id) if timeline else None
             if task_view and task_view.status == "active":
                 drift[file_path] = task_view.commits_behind_main
         return drift
@@ -604,6 +605,21 @@ class FileTimelineTracker:
             self._timelines[file_path] = FileTimeline(file_path=file_path)
         return self._timelines[file_path]
 
+    def _candidate_files_for_task(self, task_id: str) -> list[str]:
+        """
+        Files that may hold a view for a task, in tracking order.
+
+        Uses the storage index instead of loading every timeline, plus any
+        in-memory timelines that have not been persisted yet.
+        """
+        candidates = set(self.persistence.files_for_task(task_id))
+        candidates.update(
+            file_path
+            for file_path, timeline in self._timelines.loaded().items()
+            if task_id in timeline.task_views
+        )
+        return [file_path for file_path in self._timelines if file_path in candidates]
+
     def _persist_timeline(self, file_path: str) -> None:
         """Save a single timeline to disk."""
         timeline = self._timelines.get(file_path)
@@ -611,4 +627,3 @@ class FileTimelineTracker:
             return
 
         self.persistence.save_timeline(file_path, timeline)
-        self.persistence.update_index(list(self._timelines.keys()))
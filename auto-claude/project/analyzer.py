@@ -23,6 +23,7 @@ from .command_registry import (
     VERSION_MANAGER_COMMANDS,
 )
 from .config_parser import ConfigParser
+from .file_census import FileCensus
 from .framework_detector import FrameworkDetector
 from .models import SecurityProfile
 from .stack_detector import StackDetector
@@ -43,6 +44,30 @@ class ProjectAnalyzer:
 
     PROFILE_FILENAME = ".auto-claude-security.json"
 
+    # Key project files whose changes trigger re-analysis
+    HASH_FILES = (
+        "package.json",
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "pyproject.toml",
+        "requirements.txt",
+        "Pipfile",
+        "poetry.lock",
+        "Cargo.toml",
+        "Cargo.lock",
+        "go.mod",
+        "go.sum",
+        "Gemfile",
+        "Gemfile.lock",
+        "composer.json",
+        "composer.lock",
+        "Makefile",
+        "Dockerfile",
+        "docker-compose.yml",
+        "docker-compose.yaml",
+    )
+
     def __init__(self, project_dir: Path, spec_dir: Path | None = None):
         """
         Initialize analyzer.
@@ -55,6 +80,14 @@ class ProjectAnalyzer:
         self.spec_dir = Path(spec_dir).resolve() if spec_dir else None
         self.profile = SecurityProfile()
         self.parser = ConfigParser(project_dir)
+        self._census: FileCensus | None = None
+
+    @property
+    def census(self) -> FileCensus:
+        """File census shared by all detectors (built on first use)."""
+        if self._census is None:
+            self._census = FileCensus(self.project_dir)
+        return self._census
 
     def get_profile_path(self) -> Path:
         """Get the path where profile should be stored."""
@@ -89,33 +122,10 @@ class ProjectAnalyzer:
 
         This allows us to know when to re-analyze.
         """
-        hash_files = [
-            "package.json",
-            "package-lock.json",
-            "yarn.lock",
-            "pnpm-lock.yaml",
-            "pyproject.toml",
-            "requirements.txt",
-            "Pipfile",
-            "poetry.lock",
-            "Cargo.toml",
-            "Cargo.lock",
-            "go.mod",
-            "go.sum",
-            "Gemfile",
-            "Gemfile.lock",
-            "composer.json",
-            "composer.lock",
-            "Makefile",
-            "Dockerfile",
-            "docker-compose.yml",
-            "docker-compose.yaml",
-        ]
-
         hasher = hashlib.md5()
         files_found = 0
 
-        for filename in hash_files:
+        for filename in self.HASH_FILES:
             filepath = self.project_dir / filename
             if filepath.exists():
                 try:
@@ -130,13 +140,34 @@ class ProjectAnalyzer:
         if files_found == 0:
             # Count Python, JS, and other source files as a proxy for project structure
             for ext in ["*.py", "*.js", "*.ts", "*.go", "*.rs"]:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
+                count = self.census.count(ext[1:])
                 hasher.update(f"{ext}:{count}".encode())
             # Also include the project directory name for uniqueness
             hasher.update(self.project_dir.name.encode())
 
         return hasher.hexdigest()
 
+    def hash_input_signature(self) -> tuple[tuple[str, int, int], ...]:
+        """
+        Stat signature of the inputs to compute_project_hash.
+
+        Cheap to compute (one stat per key file, no reads) and changes
+        whenever one of HASH_FILES changes, so callers can cache profiles
+        and only consult the analyzer again when this signature differs.
+        Projects without any key file get an empty signature.
+
+        Returns:
+            Tuple of (filename, mtime_ns, size) for each existing key file
+        """
+        signature = []
+        for filename in self.HASH_FILES:
+            try:
+                stat = (self.project_dir / filename).stat()
+            except OSError:
+                continue
+            signature.append((filename, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
     def should_reanalyze(self, profile: SecurityProfile) -> bool:
         """Check if project has changed since last analysis."""
         current_hash = self.compute_project_hash()
@@ -152,6 +183,9 @@ class ProjectAnalyzer:
         Returns:
             SecurityProfile with all detected commands
         """
+        # One filesystem walk per analysis, shared by hashing and detection
+        self._census = None
+
         # Check for existing profile
         existing = self.load_profile()
         if existing and not force and not self.should_reanalyze(existing):
@@ -187,17 +221,17 @@ class ProjectAnalyzer:
 
     def _detect_stack(self) -> None:
         """Detect technology stack."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.census)
         self.profile.detected_stack = detector.detect_all()
 
     def _detect_frameworks(self) -> None:
         """Detect frameworks from dependencies."""
-        detector = FrameworkDetector(self.project_dir)
+        detector = FrameworkDetector(self.project_dir, self.census)
         self.profile.detected_stack.frameworks = detector.detect_all()
 
     def _detect_structure(self) -> None:
         """Detect project structure and custom scripts."""
-        analyzer = StructureAnalyzer(self.project_dir)
+        analyzer = StructureAnalyzer(self.project_dir, self.census)
         scripts, script_commands, custom_commands = analyzer.analyze()
         self.profile.custom_scripts = scripts
         self.profile.script_commands = script_commands
@@ -206,37 +240,37 @@ class ProjectAnalyzer:
     # Public methods for backward compatibility with tests
     def _detect_languages(self) -> None:
         """Detect programming languages (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.census)
         detector.detect_languages()
         self.profile.detected_stack.languages = detector.stack.languages
 
     def _detect_package_managers(self) -> None:
         """Detect package managers (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.census)
         detector.detect_package_managers()
         self.profile.detected_stack.package_managers = detector.stack.package_managers
 
     def _detect_databases(self) -> None:
         """Detect databases (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.census)
         detector.detect_databases()
         self.profile.detected_stack.databases = detector.stack.databases
 
     def _detect_infrastructure(self) -> None:
         """Detect infrastructure (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.census)
         detector.detect_infrastructure()
         self.profile.detected_stack.infrastructure = detector.stack.infrastructure
 
     def _detect_cloud_providers(self) -> None:
         """Detect cloud providers (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.census)
         detector.detect_cloud_providers()
         self.profile.detected_stack.cloud_providers = detector.stack.cloud_providers
 
     def _detect_code_quality_tools(self) -> None:
         """Detect code quality tools (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.census)
         detector.detect_code_quality_tools()
         self.profile.detected_stack.code_quality_tools = (
             detector.stack.code_quality_tools
@@ -244,27 +278,27 @@ class ProjectAnalyzer:
 
     def _detect_version_managers(self) -> None:
         """Detect version managers (backward compatibility)."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.census)
         detector.detect_version_managers()
         self.profile.detected_stack.version_managers = detector.stack.version_managers
 
     def _detect_custom_scripts(self) -> None:
         """Detect custom scripts (backward compatibility)."""
-        analyzer = StructureAnalyzer(self.project_dir)
+        analyzer = StructureAnalyzer(self.project_dir, self.census)
         scripts, script_commands, _ = analyzer.analyze()
         self.profile.custom_scripts = scripts
         self.profile.script_commands = script_commands
 
     def _load_custom_allowlist(self) -> None:
         """Load custom allowlist (backward compatibility)."""
-        analyzer = StructureAnalyzer(self.project_dir)
+        analyzer = StructureAnalyzer(self.project_dir, self.census)
         _, _, custom_commands = analyzer.analyze()
         self.profile.custom_commands = custom_commands
 
     def _build_stack_commands(self) -> None:
         """Build the set of allowed commands from detected stack."""
         stack = self.profile.detected_stack
-        commands = self.profile.stack_commands
+        commands = set(self.profile.stack_commands)
 
         # Add language commands
         for lang in stack.languages:
@@ -306,6 +340,8 @@ class ProjectAnalyzer:
             if vm in VERSION_MANAGER_COMMANDS:
                 commands.update(VERSION_MANAGER_COMMANDS[vm])
 
+        self.profile.stack_commands = commands
+
     def _print_summary(self) -> None:
         """Print a summary of what was detected."""
         stack = self.profile.detected_stack
@@ -10,6 +10,8 @@ import json
 import sys
 from pathlib import Path
 
+from .file_census import FileCensus
+
 # tomllib is available in Python 3.11+, use tomli for older versions
 if sys.version_info >= (3, 11):
     import tomllib
@@ -26,14 +28,17 @@ else:
 class ConfigParser:
     """Parses project configuration files."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, census: FileCensus | None = None):
         """
         Initialize config parser.
 
         Args:
             project_dir: Root directory of the project
+            census: Optional shared file census used to answer existence
+                and glob queries without walking the tree again
         """
         self.project_dir = Path(project_dir).resolve()
+        self.census = census
 
     def read_json(self, filename: str) -> dict | None:
         """Read a JSON file from project root."""
@@ -69,13 +74,20 @@ class ConfigParser:
         for p in paths:
             # Handle glob patterns
             if "*" in p:
-                if list(self.project_dir.glob(p)):
+                if self.glob_files(p):
                     return True
             else:
-                if (self.project_dir / p).exists():
+                exists = self.census.exists(p) if self.census else None
+                if exists is None:
+                    exists = (self.project_dir / p).exists()
+                if exists:
                     return True
         return False
 
     def glob_files(self, pattern: str) -> list[Path]:
         """Find files matching a pattern."""
+        if self.census:
+            matches = self.census.glob(pattern)
+            if matches is not None:
+                return [self.project_dir / m for m in matches]
         return list(self.project_dir.glob(pattern))
@@ -0,0 +1,137 @@
+"""
+Project File Census
+===================
+
+Single-pass inventory of a project's files, shared by the stack,
+framework and structure detectors.
+
+Instead of running a separate recursive glob for every "**/*.ext" pattern,
+the census walks the tree once with os.scandir (pruning dependency, VCS and
+cache directories) and indexes files by extension and by name so detectors
+can answer existence and glob queries without touching the filesystem again.
+"""
+
+import os
+from collections import defaultdict
+from pathlib import Path
+
+# Directories never descended into. These hold third-party code, build
+# caches or VCS metadata and would otherwise dominate the walk.
+PRUNED_DIRS = {
+    "node_modules",
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".next",
+    ".nuxt",
+    ".turbo",
+    ".cache",
+    ".gradle",
+    ".worktrees",
+    ".auto-claude",
+}
+
+
+class FileCensus:
+    """Extension and filename index built from one pruned directory walk."""
+
+    def __init__(self, project_dir: Path):
+        """
+        Walk the project and build the census.
+
+        Args:
+            project_dir: Root directory of the project
+        """
+        self.project_dir = Path(project_dir).resolve()
+        # Relative POSIX paths of every file and directory seen
+        self.paths: set[str] = set()
+        # Extension (".py") -> relative paths, anywhere in the tree
+        self.files_by_ext: dict[str, list[str]] = defaultdict(list)
+        # File name ("deployment.yaml") -> relative paths, anywhere in the tree
+        self.files_by_name: dict[str, list[str]] = defaultdict(list)
+        # Names of files directly in the project root
+        self.root_files: list[str] = []
+        self._walk()
+
+    def _walk(self) -> None:
+        stack = [(str(self.project_dir), "")]
+        while stack:
+            current, rel_dir = stack.pop()
+            try:
+                entries = sorted(os.scandir(current), key=lambda e: e.name)
+            except OSError:
+                continue
+            for entry in entries:
+                rel_path = f"{rel_dir}{entry.name}"
+                try:
+                    if entry.is_dir():
+                        self.paths.add(rel_path)
+                        if entry.name not in PRUNED_DIRS and not entry.is_symlink():
+                            stack.append((entry.path, rel_path + "/"))
+                    elif entry.is_file():
+                        self.paths.add(rel_path)
+                        self.files_by_name[entry.name].append(rel_path)
+                        ext = os.path.splitext(entry.name)[1]
+                        if ext:
+                            self.files_by_ext[ext].append(rel_path)
+                        if not rel_dir:
+                            self.root_files.append(entry.name)
+                except OSError:
+                    continue
+
+    def count(self, ext: str) -> int:
+        """Number of files with the given extension (e.g. ".py")."""
+        return len(self.files_by_ext.get(ext, ()))
+
+    def exists(self, path: str) -> bool | None:
+        """
+        Check whether a literal relative path exists.
+
+        Returns:
+            True/False if the census covers the path, None if the path lies
+            inside a pruned directory and must be checked on disk
+        """
+        path = path.rstrip("/")
+        if not path:
+            return True
+        if any(part in PRUNED_DIRS for part in path.split("/")[:-1]):
+            return None
+        return path in self.paths
+
+    def glob(self, pattern: str) -> list[str] | None:
+        """
+        Answer simple glob patterns from the census.
+
+        Supported shapes are "*.ext" (project root), "**/*.ext" and
+        "**/name" (anywhere in the tree).
+
+        Returns:
+            Matching relative paths, or None if the pattern shape is not
+            supported and the caller should fall back to Path.glob
+        """
+        recursive = pattern.startswith("**/")
+        tail = pattern[3:] if recursive else pattern
+        if "/" in tail or "?" in tail or "[" in tail:
+            return None
+
+        if tail.startswith("*"):
+            ext = tail[1:]
+            if "*" in ext or not ext.startswith(".") or ext.count(".") != 1:
+                return None
+            if recursive:
+                return list(self.files_by_ext.get(ext, ()))
+            return [name for name in self.root_files if name.endswith(ext)]
+
+        if "*" in tail:
+            return None
+        if recursive:
+            return list(self.files_by_name.get(tail, ()))
+        return [tail] if tail in self.root_files else []
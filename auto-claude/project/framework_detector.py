@@ -10,20 +10,22 @@ import re
 from pathlib import Path
 
 from .config_parser import ConfigParser
+from .file_census import FileCensus
 
 
 class FrameworkDetector:
     """Detects frameworks from project dependencies."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, census: FileCensus | None = None):
         """
         Initialize framework detector.
 
         Args:
             project_dir: Root directory of the project
+            census: Optional shared file census (see FileCensus)
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = ConfigParser(project_dir, census)
         self.frameworks = []
 
     def detect_all(self) -> list[str]:
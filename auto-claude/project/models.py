@@ -34,15 +34,31 @@ class CustomScripts:
     shell_scripts: list[str] = field(default_factory=list)
 
 
+# Command set fields of SecurityProfile (stored as frozensets)
+COMMAND_SET_FIELDS = (
+    "base_commands",
+    "stack_commands",
+    "script_commands",
+    "custom_commands",
+)
+
+
 @dataclass
 class SecurityProfile:
-    """Complete security profile for a project."""
+    """
+    Complete security profile for a project.
+
+    The command sets are stored as frozensets: assigning a new set
+    (any iterable of commands) replaces it and clears the precomputed
+    allowlist, and in-place changes are not possible, so the allowlist
+    can never go stale.
+    """
 
     # Command sets
-    base_commands: set[str] = field(default_factory=set)
-    stack_commands: set[str] = field(default_factory=set)
-    script_commands: set[str] = field(default_factory=set)
-    custom_commands: set[str] = field(default_factory=set)
+    base_commands: frozenset[str] = field(default_factory=frozenset)
+    stack_commands: frozenset[str] = field(default_factory=frozenset)
+    script_commands: frozenset[str] = field(default_factory=frozenset)
+    custom_commands: frozenset[str] = field(default_factory=frozenset)
 
     # Detected info
     detected_stack: TechnologyStack = field(default_factory=TechnologyStack)
@@ -53,14 +69,33 @@ class SecurityProfile:
     created_at: str = ""
     project_hash: str = ""
 
-    def get_all_allowed_commands(self) -> set[str]:
-        """Get the complete set of allowed commands."""
-        return (
-            self.base_commands
-            | self.stack_commands
-            | self.script_commands
-            | self.custom_commands
-        )
+    # Precomputed allowlist, cleared whenever a command set is assigned
+    _allowed_commands: frozenset[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in COMMAND_SET_FIELDS:
+            value = frozenset(value)
+            object.__setattr__(self, "_allowed_commands", None)
+        object.__setattr__(self, name, value)
+
+    def get_all_allowed_commands(self) -> frozenset[str]:
+        """
+        Get the complete set of allowed commands.
+
+        The union is computed once and reused until a command set is
+        assigned, so the security hook can call this on every Bash
+        invocation without rebuilding the set.
+        """
+        if self._allowed_commands is None:
+            self._allowed_commands = (
+                self.base_commands
+                | self.stack_commands
+                | self.script_commands
+                | self.custom_commands
+            )
+        return self._allowed_commands
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
@@ -80,10 +115,10 @@ class SecurityProfile:
     def from_dict(cls, data: dict) -> "SecurityProfile":
         """Load from dict."""
         profile = cls(
-            base_commands=set(data.get("base_commands", [])),
-            stack_commands=set(data.get("stack_commands", [])),
-            script_commands=set(data.get("script_commands", [])),
-            custom_commands=set(data.get("custom_commands", [])),
+            base_commands=data.get("base_commands", []),
+            stack_commands=data.get("stack_commands", []),
+            script_commands=data.get("script_commands", []),
+            custom_commands=data.get("custom_commands", []),
             project_dir=data.get("project_dir", ""),
             created_at=data.get("created_at", ""),
             project_hash=data.get("project_hash", ""),
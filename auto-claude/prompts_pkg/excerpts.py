@@ -0,0 +1,291 @@
+"""
+File Excerpts
+=============
+
+Line-bounded excerpts of project files for subtask prompts.
+
+Files are streamed: a head excerpt reads only its first lines, and the
+lines after it are counted from raw bytes without decoding them (or not at
+all for very large files). Excerpts are cached per (path, mtime, size), so
+the pattern files shared by many subtasks of a plan are read once per
+session.
+
+When a subtask names code symbols (``parse_config``, ``UserService``, ...),
+an excerpt can instead show the window of the file where those symbols
+appear most, rather than the file head.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+# Maximum number of excerpts kept in memory
+EXCERPT_CACHE_SIZE = 256
+
+# Files (or remainders of files) larger than this are not scanned for
+# symbols or line counts
+MAX_SCAN_BYTES = 4 * 1024 * 1024
+
+_CHUNK_SIZE = 64 * 1024
+
+# Weight of a line that defines a symbol, relative to one that mentions it
+DEFINITION_WEIGHT = 5
+
+_BACKTICKED = re.compile(r"`([A-Za-z_][\w.]*)(?:\(\))?`")
+_IDENTIFIER = re.compile(
+    r"\b(?:[A-Za-z]\w*_\w+|_\w+|[a-z]+[A-Z]\w*|[A-Z][a-z0-9]+[A-Z]\w*)\b"
+    r"|\b[A-Za-z_]\w*(?=\()"
+)
+_DEFINITION_KEYWORDS = (
+    r"def|class|function|const|let|var|interface|type|struct|enum|fn|func"
+)
+
+
+@dataclass
+class FileExcerpt:
+    """
+    A contiguous range of lines from a file.
+
+    Attributes:
+        text: The excerpt
+        start_line: 1-based number of the first line in the excerpt
+        end_line: Number of the last line in the excerpt
+        more_lines: Lines after the excerpt, or None if they were not counted
+        more_bytes: Bytes after the excerpt
+        symbols: Symbols the excerpt was centered on
+    """
+
+    text: str
+    start_line: int
+    end_line: int
+    more_lines: int | None
+    more_bytes: int
+    symbols: tuple[str, ...] = ()
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the file continues after the excerpt."""
+        return self.more_bytes > 0
+
+    def render(self) -> str:
+        """Excerpt with notes on the lines left out, for a prompt."""
+        content = self.text
+        if self.start_line > 1:
+            content = (
+                f"... (lines {self.start_line}-{self.end_line}, around "
+                f"{', '.join(self.symbols)})\n\n{content}"
+            )
+        if self.truncated:
+            if self.more_lines is not None:
+                content += f"\n\n... (truncated, {self.more_lines} more lines)"
+            else:
+                content += f"\n\n... (truncated, {self.more_bytes} more bytes)"
+        return content
+
+
+# =============================================================================
+# SYMBOLS
+# =============================================================================
+
+
+def extract_symbols(text: str) -> list[str]:
+    """
+    Find code symbols named in free text.
+
+    Backticked names, snake_case and camelCase identifiers, and names
+    followed by ``(`` count as symbols; plain words do not.
+
+    Returns:
+        Unique symbols in order of first appearance
+    """
+    found: dict[str, None] = {}
+    for match in _BACKTICKED.finditer(text):
+        found.setdefault(match.group(1).rsplit(".", 1)[-1], None)
+    for match in _IDENTIFIER.finditer(text):
+        found.setdefault(match.group(0), None)
+    return [symbol for symbol in found if len(symbol) > 2]
+
+
+def subtask_symbols(subtask: dict) -> list[str]:
+    """Symbols named by a subtask (its ``symbols`` list and description)."""
+    symbols = [str(s) for s in subtask.get("symbols", []) if s]
+    symbols += extract_symbols(subtask.get("description", ""))
+    return list(dict.fromkeys(symbols))
+
+
+def _line_scorer(symbols: tuple[str, ...]):
+    alternatives = "|".join(
+        re.escape(s) for s in sorted(symbols, key=len, reverse=True)
+    )
+    mention = re.compile(rf"\b(?:{alternatives})\b")
+    definition = re.compile(
+        rf"\b(?:{_DEFINITION_KEYWORDS})\s+\*?(?:{alternatives})\b"
+        rf"|\b(?:{alternatives})\s*(?:=|:)\s*(?:async\s+)?(?:function|\()"
+    )
+
+    def score(line: str) -> int:
+        if not mention.search(line):
+            return 0
+        return DEFINITION_WEIGHT if definition.search(line) else 1
+
+    return score
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+
+def _decode(line: bytes) -> str:
+    return line.decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+def _count_lines(f, remaining: int) -> int | None:
+    """Count the lines left in a binary file, or None if there are too many."""
+    if remaining > MAX_SCAN_BYTES:
+        return None
+    count = 0
+    last = b""
+    for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+        count += chunk.count(b"\n")
+        last = chunk
+    if last and not last.endswith(b"\n"):
+        count += 1
+    return count
+
+
+def _read_head(path: Path, max_lines: int, size: int) -> FileExcerpt:
+    with open(path, "rb") as f:
+        lines = []
+        for _ in range(max_lines):
+            line = f.readline()
+            if not line:
+                break
+            lines.append(_decode(line))
+        remaining = size - f.tell()
+        more_lines = _count_lines(f, remaining) if remaining else 0
+
+    text = "".join(lines)
+    if remaining:
+        text = text[:-1] if text.endswith("\n") else text
+    return FileExcerpt(
+        text=text,
+        start_line=1,
+        end_line=len(lines),
+        more_lines=more_lines,
+        more_bytes=remaining,
+    )
+
+
+def _best_window(scores: list[int], max_lines: int) -> int | None:
+    """
+    Start of the max_lines window with the highest total score.
+
+    The window is shifted so its first scoring line sits a quarter of the
+    way down, which keeps every scoring line it already covered.
+    """
+    total = sum(scores[:max_lines])
+    best, best_start = total, 0
+    for start in range(1, len(scores) - max_lines + 1):
+        total += scores[start + max_lines - 1] - scores[start - 1]
+        if total > best:
+            best, best_start = total, start
+    if best == 0:
+        return None
+
+    first_hit = next(i for i in range(best_start, best_start + max_lines) if scores[i])
+    start = max(best_start, first_hit - max_lines // 4)
+    return min(start, len(scores) - max_lines)
+
+
+def _read_window(
+    path: Path, max_lines: int, size: int, symbols: tuple[str, ...]
+) -> FileExcerpt | None:
+    """Excerpt around the symbols, or None if the file doesn't mention them."""
+    score = _line_scorer(symbols)
+    with open(path, "rb") as f:
+        scores = [score(_decode(line)) for line in f]
+    if len(scores) <= max_lines:
+        return None
+    start = _best_window(scores, max_lines)
+    if not start:
+        return None
+
+    with open(path, "rb") as f:
+        for _ in range(start):
+            f.readline()
+        lines = [_decode(f.readline()) for _ in range(max_lines)]
+        remaining = size - f.tell()
+
+    text = "".join(lines)
+    if remaining:
+        text = text[:-1] if text.endswith("\n") else text
+    end = start + max_lines
+    return FileExcerpt(
+        text=text,
+        start_line=start + 1,
+        end_line=end,
+        more_lines=len(scores) - end,
+        more_bytes=remaining,
+        symbols=tuple(s for s in symbols if any(s in line for line in lines)),
+    )
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+# (path, mtime_ns, size, max_lines, symbols) -> excerpt, in LRU order
+_excerpt_cache: OrderedDict[tuple, FileExcerpt] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def read_excerpt(
+    path: Path, max_lines: int = 200, symbols: list[str] | None = None
+) -> FileExcerpt:
+    """
+    Read at most max_lines lines of a file, using the cache when possible.
+
+    Args:
+        path: File to read
+        max_lines: Maximum lines in the excerpt
+        symbols: If given, show the window where these symbols appear most
+            instead of the file head (when the file mentions any of them)
+
+    Returns:
+        FileExcerpt of the file
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    symbols_key = tuple(symbols or ())
+    key = (path, stat.st_mtime_ns, stat.st_size, max_lines, symbols_key)
+
+    with _cache_lock:
+        cached = _excerpt_cache.get(key)
+        if cached is not None:
+            _excerpt_cache.move_to_end(key)
+            return cached
+
+    excerpt = None
+    if symbols_key and stat.st_size <= MAX_SCAN_BYTES:
+        excerpt = _read_window(path, max_lines, stat.st_size, symbols_key)
+    if excerpt is None:
+        excerpt = _read_head(path, max_lines, stat.st_size)
+
+    with _cache_lock:
+        _excerpt_cache[key] = excerpt
+        _excerpt_cache.move_to_end(key)
+        while len(_excerpt_cache) > EXCERPT_CACHE_SIZE:
+            _excerpt_cache.popitem(last=False)
+    return excerpt
+
+
+def reset_excerpt_cache() -> None:
+    """Forget all cached excerpts (mainly for tests)."""
+    with _cache_lock:
+        _excerpt_cache.clear()
@@ -15,6 +15,8 @@ This approach:
 import json
 from pathlib import Path
 
+from .excerpts import read_excerpt, subtask_symbols
+
 
 def get_relative_spec_path(spec_dir: Path, project_dir: Path) -> str:
     """
@@ -292,20 +294,36 @@ not in the spec directory.
     return header + prompt
 
 
+def _load_file_excerpt(
+    full_path: Path, max_file_lines: int, symbols: list[str] | None
+) -> str:
+    """Excerpt of a context file for the prompt."""
+    try:
+        return read_excerpt(full_path, max_file_lines, symbols).render()
+    except Exception:
+        return "(Could not read file)"
+
+
 def load_subtask_context(
     spec_dir: Path,
     project_dir: Path,
     subtask: dict,
     max_file_lines: int = 200,
+    focus_on_symbols: bool = False,
 ) -> dict:
     """
     Load minimal context needed for a subtask.
 
+    Files are streamed and only their first max_file_lines lines are read;
+    excerpts are cached across subtasks until a file changes.
+
     Args:
         spec_dir: Spec directory
         project_dir: Project root
         subtask: The subtask being implemented
         max_file_lines: Maximum lines to include per file
+        focus_on_symbols: Show the part of each file around the symbols the
+            subtask names instead of the file head
 
     Returns:
         Dict with file contents and relevant context
@@ -315,40 +333,23 @@ def load_subtask_context(
         "files_to_modify": {},
         "spec_excerpt": None,
     }
+    symbols = subtask_symbols(subtask) if focus_on_symbols else None
 
     # Load pattern files (truncated)
     for pattern_path in subtask.get("patterns_from", []):
         full_path = project_dir / pattern_path
         if full_path.exists():
-            try:
-                lines = full_path.read_text().split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["patterns"][pattern_path] = content
-            except Exception:
-                context["patterns"][pattern_path] = "(Could not read file)"
+            context["patterns"][pattern_path] = _load_file_excerpt(
+                full_path, max_file_lines, symbols
+            )
 
     # Load files to modify (truncated)
     for file_path in subtask.get("files_to_modify", []):
         full_path = project_dir / file_path
         if full_path.exists():
-            try:
-                lines = full_path.read_text().split("\n")
-                if len(lines) > max_file_lines:
-                    content = "\n".join(lines[:max_file_lines])
-                    content += (
-                        f"\n\n... (truncated, {len(lines) - max_file_lines} more lines)"
-                    )
-                else:
-                    content = "\n".join(lines)
-                context["files_to_modify"][file_path] = content
-            except Exception:
-                context["files_to_modify"][file_path] = "(Could not read file)"
+            context["files_to_modify"][file_path] = _load_file_excerpt(
+                full_path, max_file_lines, symbols
+            )
 
     return context
 
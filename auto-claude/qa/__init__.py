@@ -52,6 +52,7 @@ from .report import (
     check_test_discovery,
     create_manual_test_plan,
     escalate_to_human,
+    get_issue_index,
     get_iteration_history,
     get_recurring_issue_summary,
     has_recurring_issues,
@@ -83,6 +84,7 @@ __all__ = [
     "print_qa_status",
     # Report & tracking
     "get_iteration_history",
+    "get_issue_index",
     "record_iteration",
     "has_recurring_issues",
     "get_recurring_issue_summary",
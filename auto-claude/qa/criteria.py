@@ -134,7 +134,11 @@ def should_run_fixes(spec_dir: Path) -> bool:
 
 def print_qa_status(spec_dir: Path) -> None:
     """Print the current QA status."""
-    from .report import get_iteration_history, get_recurring_issue_summary
+    from .report import (
+        get_issue_index,
+        get_iteration_history,
+        get_recurring_issue_summary,
+    )
 
     status = get_qa_signoff_status(spec_dir)
 
@@ -168,7 +172,7 @@ def print_qa_status(spec_dir: Path) -> None:
     # Show iteration history summary
     history = get_iteration_history(spec_dir)
     if history:
-        summary = get_recurring_issue_summary(history)
+        summary = get_recurring_issue_summary(history, get_issue_index(spec_dir))
         print("\nIteration History:")
         print(f"  Total iterations: {len(history)}")
         print(f"  Approved: {summary.get('iterations_approved', 0)}")
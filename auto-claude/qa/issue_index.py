@@ -0,0 +1,334 @@
+"""
+QA Issue Fingerprint Index
+==========================
+
+Finds issues similar to a given issue without comparing it against every
+issue ever reported.
+
+Each distinct normalized issue key (see report._normalize_issue_key) is
+stored once with its occurrence count and a MinHash signature over its
+character bigrams. The signature is split into LSH bands; two keys become
+candidates when any band matches, and only candidates are compared with the
+exact SequenceMatcher ratio. Small indexes are scanned exhaustively instead,
+so results there are identical to a full pairwise comparison.
+
+The index also keeps the greedy issue grouping used by the recurring issue
+summary, and is persisted in implementation_plan.json as
+``qa_issue_index``, next to ``qa_iteration_history``. It is extended
+incrementally as iterations are recorded.
+"""
+
+import hashlib
+import random
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any
+
+INDEX_VERSION = 1
+
+# MinHash signature layout: BANDS bands of ROWS_PER_BAND hashes each. Two rows
+# per band over bigrams keep recall high for keys with SequenceMatcher
+# ratios around the 0.8 similarity threshold.
+BANDS = 24
+ROWS_PER_BAND = 2
+NUM_HASHES = BANDS * ROWS_PER_BAND
+
+# Indexes with at most this many distinct keys are scanned exhaustively
+EXACT_SCAN_LIMIT = 64
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x51A)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_HASHES)
+]
+
+
+def _shingles(key: str) -> set[str]:
+    if len(key) < 2:
+        return {key}
+    return {key[i : i + 2] for i in range(len(key) - 1)}
+
+
+def band_signature(key: str) -> list[str]:
+    """
+    LSH band hashes of a key's MinHash signature.
+
+    Returns:
+        BANDS hex strings; keys sharing any band are candidates
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+        for s in _shingles(key)
+    ]
+    signature = [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    ]
+    return [
+        hashlib.blake2b(
+            repr(signature[i : i + ROWS_PER_BAND]).encode(), digest_size=4
+        ).hexdigest()
+        for i in range(0, NUM_HASHES, ROWS_PER_BAND)
+    ]
+
+
+def key_similarity(key1: str, key2: str) -> float:
+    """Exact similarity of two normalized issue keys."""
+    return SequenceMatcher(None, key1, key2).ratio()
+
+
+@dataclass
+class IndexedKey:
+    """A distinct normalized issue key."""
+
+    key: str
+    count: int
+    group: int
+    bands: list[str]
+
+
+@dataclass
+class IssueGroup:
+    """Issues the summary treats as one (the first issue represents the group)."""
+
+    key: str
+    title: str | None
+    file: str | None
+    count: int = 0
+
+
+class IssueIndex:
+    """
+    Index of all issues in a QA iteration history.
+
+    Args:
+        normalize: Function mapping an issue to its normalized key
+        threshold: Similarity at which two keys count as the same issue
+    """
+
+    def __init__(
+        self,
+        normalize: Callable[[dict[str, Any]], str],
+        threshold: float,
+    ) -> None:
+        self.normalize = normalize
+        self.threshold = threshold
+        self._reset()
+
+    def _reset(self) -> None:
+        self.issues_indexed = 0
+        self.entries: dict[str, IndexedKey] = {}
+        self.groups: list[IssueGroup] = []
+        self._char_counts: dict[str, Counter] = {}
+        self._key_buckets: list[dict[str, list[str]]] = [
+            defaultdict(list) for _ in range(BANDS)
+        ]
+        self._group_buckets: list[dict[str, list[int]]] = [
+            defaultdict(list) for _ in range(BANDS)
+        ]
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def _chars(self, key: str) -> Counter:
+        counts = self._char_counts.get(key)
+        if counts is None:
+            counts = self._char_counts[key] = Counter(key)
+        return counts
+
+    def _is_similar(self, key: str, other: str) -> bool:
+        """
+        Exact similarity test of two keys.
+
+        Length and character-count upper bounds of the ratio (as in
+        SequenceMatcher.real_quick_ratio/quick_ratio) reject most pairs
+        before the full comparison.
+        """
+        if key == other:
+            return True
+        total = len(key) + len(other)
+        if 2.0 * min(len(key), len(other)) / total < self.threshold:
+            return False
+        chars, other_chars = self._chars(key), self._chars(other)
+        matches = sum(min(n, other_chars[c]) for c, n in chars.items())
+        if 2.0 * matches / total < self.threshold:
+            return False
+        return key_similarity(key, other) >= self.threshold
+
+    def _candidate_keys(self, bands: list[str]) -> Iterable[str]:
+        if len(self.entries) <= EXACT_SCAN_LIMIT:
+            return list(self.entries)
+        found: dict[str, None] = {}
+        for buckets, band in zip(self._key_buckets, bands):
+            for key in buckets.get(band, ()):
+                found[key] = None
+        return list(found)
+
+    def _candidate_groups(self, bands: list[str]) -> list[int]:
+        if len(self.groups) <= EXACT_SCAN_LIMIT:
+            return list(range(len(self.groups)))
+        found: set[int] = set()
+        for buckets, band in zip(self._group_buckets, bands):
+            found.update(buckets.get(band, ()))
+        return sorted(found)
+
+    def count_similar(self, issue: dict[str, Any]) -> int:
+        """
+        Count indexed issues similar to an issue.
+
+        Returns:
+            Number of indexed issue occurrences whose key similarity to the
+            issue is at least the threshold
+        """
+        key = self.normalize(issue)
+        total = 0
+        for candidate in self._candidate_keys(band_signature(key)):
+            if self._is_similar(key, candidate):
+                total += self.entries[candidate].count
+        return total
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def _find_group(self, key: str, bands: list[str]) -> int | None:
+        """First group (in creation order) whose representative matches."""
+        for group_id in self._candidate_groups(bands):
+            if self._is_similar(key, self.groups[group_id].key):
+                return group_id
+        return None
+
+    def _bucket_group(self, group_id: int, bands: list[str]) -> None:
+        for buckets, band in zip(self._group_buckets, bands):
+            buckets[band].append(group_id)
+
+    def _bucket_key(self, entry: IndexedKey) -> None:
+        for buckets, band in zip(self._key_buckets, entry.bands):
+            buckets[band].append(entry.key)
+
+    def add(self, issue: dict[str, Any]) -> None:
+        """Add one issue occurrence."""
+        key = self.normalize(issue)
+        entry = self.entries.get(key)
+        if entry is None:
+            bands = band_signature(key)
+            group_id = self._find_group(key, bands)
+            if group_id is None:
+                group_id = len(self.groups)
+                self.groups.append(
+                    IssueGroup(
+                        key=key, title=issue.get("title", key), file=issue.get("file")
+                    )
+                )
+                self._bucket_group(group_id, bands)
+            entry = IndexedKey(key=key, count=0, group=group_id, bands=bands)
+            self.entries[key] = entry
+            self._bucket_key(entry)
+
+        entry.count += 1
+        self.groups[entry.group].count += 1
+        self.issues_indexed += 1
+
+    def sync(self, history: list[dict[str, Any]]) -> "IssueIndex":
+        """
+        Add the issues of a history not indexed yet.
+
+        History is append-only, so only issues past issues_indexed are new.
+        If the history has fewer issues than the index (it was rewritten),
+        the index is rebuilt.
+
+        Returns:
+            self
+        """
+        issues = [issue for record in history for issue in record.get("issues", [])]
+        if len(issues) < self.issues_indexed:
+            self._reset()
+        for issue in issues[self.issues_indexed :]:
+            self.add(issue)
+        return self
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for implementation_plan.json."""
+        return {
+            "version": INDEX_VERSION,
+            "threshold": self.threshold,
+            "issues_indexed": self.issues_indexed,
+            "keys": [
+                {
+                    "key": e.key,
+                    "count": e.count,
+                    "group": e.group,
+                    "bands": "".join(e.bands),
+                }
+                for e in self.entries.values()
+            ],
+            "groups": [
+                {"key": g.key, "title": g.title, "file": g.file, "count": g.count}
+                for g in self.groups
+            ],
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any] | None,
+        normalize: Callable[[dict[str, Any]], str],
+        threshold: float,
+    ) -> "IssueIndex":
+        """
+        Load a persisted index.
+
+        Returns an empty index if data is missing, from another version or
+        threshold, or malformed.
+        """
+        index = cls(normalize, threshold)
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_VERSION
+            or data.get("threshold") != threshold
+        ):
+            return index
+
+        try:
+            groups = [
+                IssueGroup(
+                    key=g["key"],
+                    title=g.get("title"),
+                    file=g.get("file"),
+                    count=g["count"],
+                )
+                for g in data["groups"]
+            ]
+            entries = []
+            for item in data["keys"]:
+                bands = item["bands"]
+                entries.append(
+                    IndexedKey(
+                        key=item["key"],
+                        count=item["count"],
+                        group=item["group"],
+                        bands=[bands[i : i + 8] for i in range(0, len(bands), 8)],
+                    )
+                )
+            issues_indexed = int(data["issues_indexed"])
+        except (KeyError, TypeError, ValueError):
+            return index
+
+        index.groups = groups
+        index.issues_indexed = issues_indexed
+        seen_groups = set()
+        for entry in entries:
+            index.entries[entry.key] = entry
+            index._bucket_key(entry)
+            if entry.group not in seen_groups:
+                # A group's representative is its first key
+                seen_groups.add(entry.group)
+                index._bucket_group(entry.group, entry.bands)
+        return index
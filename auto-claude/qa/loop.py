@@ -35,6 +35,7 @@ from .fixer import run_qa_fixer_session
 from .report import (
     create_manual_test_plan,
     escalate_to_human,
+    get_issue_index,
     get_iteration_history,
     get_recurring_issue_summary,
     has_recurring_issues,
@@ -310,7 +311,7 @@ async def run_qa_validation_loop(
             # Check for recurring issues
             history = get_iteration_history(spec_dir)
             has_recurring, recurring_issues = has_recurring_issues(
-                current_issues, history
+                current_issues, history, index=get_issue_index(spec_dir)
             )
 
             if has_recurring:
@@ -469,7 +470,7 @@ async def run_qa_validation_loop(
 
     # Show iteration summary
     history = get_iteration_history(spec_dir)
-    summary = get_recurring_issue_summary(history)
+    summary = get_recurring_issue_summary(history, get_issue_index(spec_dir))
     debug(
         "qa_loop",
         "QA loop final summary",
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any
 
 from .criteria import load_implementation_plan, save_implementation_plan
+from .issue_index import IssueIndex
 
 # Configuration
 RECURRING_ISSUE_THRESHOLD = 3  # Escalate if same issue appears this many times
@@ -92,9 +93,36 @@ def record_iteration(
             issue_types[issue_type] += 1
     plan["qa_stats"]["issues_by_type"] = dict(issue_types)
 
+    # Extend the recurring issue index with this iteration's issues
+    plan["qa_issue_index"] = (
+        _load_issue_index(plan).sync(plan["qa_iteration_history"]).to_dict()
+    )
+
     return save_implementation_plan(spec_dir, plan)
 
 
+def _load_issue_index(plan: dict[str, Any]) -> IssueIndex:
+    return IssueIndex.from_dict(
+        plan.get("qa_issue_index"), _normalize_issue_key, ISSUE_SIMILARITY_THRESHOLD
+    )
+
+
+def get_issue_index(spec_dir: Path) -> IssueIndex:
+    """
+    Get the recurring issue index of a spec, up to date with its history.
+
+    Returns:
+        IssueIndex covering all issues in qa_iteration_history
+    """
+    plan = load_implementation_plan(spec_dir) or {}
+    return _load_issue_index(plan).sync(plan.get("qa_iteration_history", []))
+
+
+def build_issue_index(history: list[dict[str, Any]]) -> IssueIndex:
+    """Build a recurring issue index for an iteration history in memory."""
+    return IssueIndex(_normalize_issue_key, ISSUE_SIMILARITY_THRESHOLD).sync(history)
+
+
 # =============================================================================
 # RECURRING ISSUE DETECTION
 # =============================================================================
@@ -137,6 +165,7 @@ def has_recurring_issues(
     current_issues: list[dict[str, Any]],
     history: list[dict[str, Any]],
     threshold: int = RECURRING_ISSUE_THRESHOLD,
+    index: IssueIndex | None = None,
 ) -> tuple[bool, list[dict[str, Any]]]:
     """
     Check if any current issues have appeared repeatedly in history.
@@ -145,27 +174,23 @@ def has_recurring_issues(
         current_issues: Issues from current iteration
         history: Previous iteration records
         threshold: Number of occurrences to consider "recurring"
+        index: Index of the history's issues (see get_issue_index);
+            built in memory if not given
 
     Returns:
         (has_recurring, recurring_issues) tuple
     """
-    # Flatten all historical issues
-    historical_issues = []
-    for record in history:
-        historical_issues.extend(record.get("issues", []))
+    if index is None:
+        index = build_issue_index(history)
 
-    if not historical_issues:
+    if not index.issues_indexed:
         return False, []
 
     recurring = []
 
     for current in current_issues:
-        occurrence_count = 1  # Count current occurrence
-
-        for historical in historical_issues:
-            similarity = _issue_similarity(current, historical)
-            if similarity >= ISSUE_SIMILARITY_THRESHOLD:
-                occurrence_count += 1
+        # Count current occurrence plus similar historical ones
+        occurrence_count = 1 + index.count_similar(current)
 
         if occurrence_count >= threshold:
             recurring.append(
@@ -180,49 +205,35 @@ def has_recurring_issues(
 
 def get_recurring_issue_summary(
     history: list[dict[str, Any]],
+    index: IssueIndex | None = None,
 ) -> dict[str, Any]:
     """
     Analyze iteration history for issue patterns.
 
+    Args:
+        history: Iteration records
+        index: Index of the history's issues (see get_issue_index);
+            built in memory if not given
+
     Returns:
         Summary with most common issues, fix success rate, etc.
     """
-    all_issues = []
-    for record in history:
-        all_issues.extend(record.get("issues", []))
+    if index is None:
+        index = build_issue_index(history)
 
-    if not all_issues:
+    if not index.issues_indexed:
         return {"total_issues": 0, "unique_issues": 0, "most_common": []}
 
-    # Group similar issues
-    issue_groups: dict[str, list[dict[str, Any]]] = {}
-
-    for issue in all_issues:
-        key = _normalize_issue_key(issue)
-        matched = False
-
-        for existing_key in issue_groups:
-            if (
-                SequenceMatcher(None, key, existing_key).ratio()
-                >= ISSUE_SIMILARITY_THRESHOLD
-            ):
-                issue_groups[existing_key].append(issue)
-                matched = True
-                break
-
-        if not matched:
-            issue_groups[key] = [issue]
-
-    # Find most common issues
-    sorted_groups = sorted(issue_groups.items(), key=lambda x: len(x[1]), reverse=True)
+    # Find most common issues (similar issues are grouped by the index)
+    sorted_groups = sorted(index.groups, key=lambda g: g.count, reverse=True)
 
     most_common = []
-    for key, issues in sorted_groups[:5]:  # Top 5
+    for group in sorted_groups[:5]:  # Top 5
         most_common.append(
             {
-                "title": issues[0].get("title", key),
-                "file": issues[0].get("file"),
-                "occurrences": len(issues),
+                "title": group.title,
+                "file": group.file,
+                "occurrences": group.count,
             }
         )
 
@@ -231,8 +242,8 @@ def get_recurring_issue_summary(
     rejected_count = sum(1 for r in history if r.get("status") == "rejected")
 
     return {
-        "total_issues": len(all_issues),
-        "unique_issues": len(issue_groups),
+        "total_issues": index.issues_indexed,
+        "unique_issues": len(index.groups),
         "most_common": most_common,
         "iterations_approved": approved_count,
         "iterations_rejected": rejected_count,
@@ -261,7 +272,7 @@ async def escalate_to_human(
     from .loop import MAX_QA_ITERATIONS
 
     history = get_iteration_history(spec_dir)
-    summary = get_recurring_issue_summary(history)
+    summary = get_recurring_issue_summary(history, get_issue_index(spec_dir))
 
     escalation_file = spec_dir / "QA_ESCALATION.md"
 
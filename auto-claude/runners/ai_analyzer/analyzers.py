@@ -8,6 +8,11 @@ from typing import Any
 class BaseAnalyzer:
     """Base class for all analyzers."""
 
+    # Kinds of project files the analysis reads (see InputHasher.FILE_KINDS);
+    # cached results are reused until one of these files changes. "layout"
+    # covers file paths only, not their contents.
+    INPUT_KINDS: tuple[str, ...] = ("source",)
+
     def __init__(self, project_index: dict[str, Any]):
         """
         Initialize analyzer.
@@ -33,6 +38,18 @@ class BaseAnalyzer:
             return None
         return next(iter(services.items()))
 
+    def get_index_inputs(self) -> Any:
+        """
+        Get the part of the project index the analysis depends on.
+
+        The prompt is hashed as well, so index data already in the prompt
+        need not be repeated here.
+
+        Returns:
+            JSON-serializable subset of the project index
+        """
+        return {}
+
 
 class CodeRelationshipsAnalyzer(BaseAnalyzer):
     """Analyzes code relationships and dependencies."""
@@ -132,6 +149,15 @@ Use Read and Grep to analyze actual code logic."""
 class ArchitectureAnalyzer(BaseAnalyzer):
     """Analyzes architecture patterns and design."""
 
+    INPUT_KINDS = ("layout", "manifests")
+
+    def get_index_inputs(self) -> Any:
+        """Service types, languages and frameworks."""
+        return {
+            name: {key: data.get(key) for key in ("type", "language", "framework")}
+            for name, data in self.get_services().items()
+        }
+
     def get_prompt(self) -> str:
         """Generate analysis prompt."""
         return """Analyze the architecture patterns used in this codebase.
@@ -167,6 +193,9 @@ Analyze the actual code structure using Read, Grep, and Glob."""
 class SecurityAnalyzer(BaseAnalyzer):
     """Analyzes security vulnerabilities."""
 
+    # Greps the whole tree, so any file may hold a finding
+    INPUT_KINDS = ("source", "manifests", "config", "other")
+
     def get_prompt(self) -> str:
         """Generate analysis prompt."""
         return """Perform a security analysis of this codebase.
@@ -243,6 +272,8 @@ Use Grep to find database queries and loops."""
 class CodeQualityAnalyzer(BaseAnalyzer):
     """Analyzes code quality and maintainability."""
 
+    INPUT_KINDS = ("source", "tests")
+
     def get_prompt(self) -> str:
         """Generate analysis prompt."""
         return """Analyze code quality and maintainability.
@@ -3,15 +3,26 @@ Cache management for AI analysis results.
 """
 
 import json
-import time
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 
 class CacheManager:
-    """Manages caching of AI analysis results."""
+    """
+    Manages caching of AI analysis results.
 
-    CACHE_VALIDITY_HOURS = 24
+    Each analyzer's result is cached on its own, keyed by the hash of its
+    inputs (see InputHasher), and stays valid until those inputs change or
+    it is MAX_AGE_HOURS old. The age limit bounds how long a result can miss
+    a change to a file the analyzer read but its input hash does not cover.
+    The combined insights of the latest run are kept in ai_insights.json.
+    """
+
+    ANALYZER_CACHE_DIR = "analyzers"
+
+    MAX_AGE_HOURS = 7 * 24
 
     def __init__(self, cache_dir: Path):
         """
@@ -23,39 +34,95 @@ class CacheManager:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "ai_insights.json"
+        self.analyzer_cache_dir = self.cache_dir / self.ANALYZER_CACHE_DIR
+
+    def _analyzer_file(self, analyzer_name: str) -> Path:
+        return self.analyzer_cache_dir / f"{analyzer_name}.json"
 
-    def get_cached_result(self, skip_cache: bool = False) -> dict[str, Any] | None:
+    def get_analyzer_result(
+        self, analyzer_name: str, input_hash: str
+    ) -> dict[str, Any] | None:
         """
-        Retrieve cached analysis result if valid.
+        Retrieve an analyzer's cached result if its inputs are unchanged and
+        it has not expired.
 
         Args:
-            skip_cache: If True, always return None (force re-analysis)
+            analyzer_name: Name of the analyzer
+            input_hash: Current hash of the analyzer's inputs
 
         Returns:
-            Cached analysis result or None if cache invalid/expired
+            Cached result or None if missing, stale or expired
         """
-        if skip_cache:
+        try:
+            entry = json.loads(self._analyzer_file(analyzer_name).read_text())
+        except (OSError, json.JSONDecodeError):
             return None
-
-        if not self.cache_file.exists():
+        if not isinstance(entry, dict) or entry.get("input_hash") != input_hash:
+            return None
+        try:
+            cached_at = datetime.fromisoformat(entry["cached_at"])
+        except (KeyError, TypeError, ValueError):
             return None
+        if datetime.now() - cached_at >= timedelta(hours=self.MAX_AGE_HOURS):
+            return None
+        result = entry.get("result")
+        return result if isinstance(result, dict) else None
 
-        cache_age = time.time() - self.cache_file.stat().st_mtime
-        hours_old = cache_age / 3600
+    def has_analyzer_result(self, analyzer_name: str, input_hash: str) -> bool:
+        """Check whether an analyzer's result for these inputs is cached."""
+        return self.get_analyzer_result(analyzer_name, input_hash) is not None
 
-        if hours_old >= self.CACHE_VALIDITY_HOURS:
-            print(f"⚠️  Cache expired ({hours_old:.1f} hours old), re-analyzing...")
-            return None
+    def get_analyzer_results(
+        self, input_hashes: dict[str, str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Retrieve the cached results of several analyzers.
 
-        print(f"✓ Using cached AI insights ({hours_old:.1f} hours old)")
-        return json.loads(self.cache_file.read_text())
+        Args:
+            input_hashes: Dictionary of analyzer name to input hash
+
+        Returns:
+            Dictionary of analyzer name to cached result (hits only)
+        """
+        results = {}
+        for name, input_hash in input_hashes.items():
+            result = self.get_analyzer_result(name, input_hash)
+            if result is not None:
+                results[name] = result
+        return results
+
+    def save_analyzer_result(
+        self, analyzer_name: str, input_hash: str, result: dict[str, Any]
+    ) -> None:
+        """
+        Cache an analyzer's result for its current inputs.
+
+        Args:
+            analyzer_name: Name of the analyzer
+            input_hash: Hash of the inputs the result was computed from
+            result: Analyzer result
+        """
+        self.analyzer_cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = self._analyzer_file(analyzer_name)
+        tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(
+            json.dumps(
+                {
+                    "input_hash": input_hash,
+                    "cached_at": datetime.now().isoformat(),
+                    "result": result,
+                },
+                indent=2,
+            )
+        )
+        tmp_file.replace(cache_file)
 
     def save_result(self, result: dict[str, Any]) -> None:
         """
-        Save analysis result to cache.
+        Save the combined analysis result.
 
         Args:
-            result: Analysis result to cache
+            result: Analysis result to save
         """
         self.cache_file.write_text(json.dumps(result, indent=2))
         print(f"\n✓ AI insights cached to: {self.cache_file}")
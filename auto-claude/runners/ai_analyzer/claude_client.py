@@ -3,6 +3,7 @@ Claude SDK client wrapper for AI analysis.
 """
 
 import json
+import uuid
 from pathlib import Path
 from typing import Any
 
@@ -85,7 +86,11 @@ class ClaudeAnalysisClient:
             },
         }
 
-        settings_file = self.project_dir / ".claude_ai_analyzer_settings.json"
+        # Unique per query, so concurrent analyzers don't remove each other's file
+        settings_file = (
+            self.project_dir
+            / f".claude_ai_analyzer_settings.{uuid.uuid4().hex[:12]}.json"
+        )
         with open(settings_file, "w") as f:
             json.dump(settings, f, indent=2)
 
@@ -3,9 +3,12 @@ Cost estimation for AI analysis operations.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .models import CostEstimate
+from .models import AnalyzerType, CostEstimate
+
+if TYPE_CHECKING:
+    from .cache_manager import CacheManager
 
 
 class CostEstimator:
@@ -30,13 +33,36 @@ class CostEstimator:
         self.project_dir = project_dir
         self.project_index = project_index
 
-    def estimate_cost(self) -> CostEstimate:
+    def estimate_cost(
+        self,
+        input_hashes: dict[str, str] | None = None,
+        cache_manager: "CacheManager | None" = None,
+    ) -> CostEstimate:
         """
         Estimate API cost before running analysis.
 
+        Analyzers whose results are cached for their current input hashes
+        will not run, so they are excluded from the estimate.
+
+        Args:
+            input_hashes: Input hash per analyzer to run (default: all
+                analyzers, no cache lookup)
+            cache_manager: Cache to predict hits from
+
         Returns:
             Cost estimation data
         """
+        all_analyzers = AnalyzerType.all_analyzers()
+        analyzers = list(input_hashes) if input_hashes is not None else all_analyzers
+        cached = []
+        if input_hashes and cache_manager:
+            cached = [
+                name
+                for name, input_hash in input_hashes.items()
+                if cache_manager.has_analyzer_result(name, input_hash)
+            ]
+        to_run = len(analyzers) - len(cached)
+
         services = self.project_index.get("services", {})
         if not services:
             return CostEstimate(
@@ -45,6 +71,8 @@ class CostEstimator:
                 files_to_analyze=0,
                 routes_count=0,
                 models_count=0,
+                analyzers_to_run=to_run,
+                cached_analyzers=cached,
             )
 
         # Count items from programmatic analysis
@@ -58,12 +86,14 @@ class CostEstimator:
         # Count Python files in project (excluding virtual environments)
         total_files = self._count_python_files()
 
-        # Calculate estimated tokens
-        estimated_tokens = (
+        # Calculate estimated tokens for a full run, then for the analyzers
+        # that actually run
+        full_run_tokens = (
             (total_routes * self.TOKENS_PER_ROUTE)
             + (total_models * self.TOKENS_PER_MODEL)
             + (total_files * self.TOKENS_PER_FILE)
         )
+        estimated_tokens = full_run_tokens * to_run // len(all_analyzers)
 
         # Calculate estimated cost
         estimated_cost = (estimated_tokens / 1_000_000) * self.COST_PER_1M_TOKENS
@@ -74,6 +104,8 @@ class CostEstimator:
             files_to_analyze=total_files,
             routes_count=total_routes,
             models_count=total_models,
+            analyzers_to_run=to_run,
+            cached_analyzers=cached,
         )
 
     def _count_python_files(self) -> int:
@@ -0,0 +1,249 @@
+"""
+Input hashing for per-analyzer result caching.
+
+Each analyzer declares which kinds of project files it reads
+(BaseAnalyzer.INPUT_KINDS) and which part of the project index it depends
+on (BaseAnalyzer.get_index_inputs). Its input hash covers exactly those, so
+after a small change only the analyzers that read the changed files re-run.
+Analyzers that search the whole tree also read "other": every file that is
+not source, tests, a manifest or config (scripts, templates, JSON configs,
+Makefiles, docs).
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from .analyzers import AnalyzerFactory
+
+
+class InputHasher:
+    """Hashes the inputs of analyzers, scanning the project once."""
+
+    # Bump to invalidate every cached analyzer result
+    CACHE_VERSION = 2
+
+    FILE_KINDS = ("source", "tests", "manifests", "config", "other", "layout")
+
+    EXCLUDED_DIRS = {
+        ".git",
+        ".auto-claude",
+        ".worktrees",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "dist",
+        "build",
+        ".next",
+        ".nuxt",
+        "target",
+        "vendor",
+        "coverage",
+        ".idea",
+        ".vscode",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".tox",
+        ".turbo",
+        ".cache",
+    }
+
+    SOURCE_EXTENSIONS = {
+        ".py",
+        ".js",
+        ".jsx",
+        ".mjs",
+        ".cjs",
+        ".ts",
+        ".tsx",
+        ".vue",
+        ".svelte",
+        ".go",
+        ".rs",
+        ".java",
+        ".kt",
+        ".scala",
+        ".rb",
+        ".php",
+        ".cs",
+        ".swift",
+        ".c",
+        ".cc",
+        ".cpp",
+        ".h",
+        ".hpp",
+        ".sql",
+    }
+
+    MANIFEST_FILES = {
+        "pyproject.toml",
+        "setup.py",
+        "setup.cfg",
+        "Pipfile",
+        "Pipfile.lock",
+        "poetry.lock",
+        "uv.lock",
+        "package.json",
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "go.mod",
+        "go.sum",
+        "Cargo.toml",
+        "Cargo.lock",
+        "Gemfile",
+        "Gemfile.lock",
+        "composer.json",
+        "composer.lock",
+        "pom.xml",
+        "build.gradle",
+        "build.gradle.kts",
+    }
+
+    CONFIG_EXTENSIONS = {".yml", ".yaml", ".toml", ".ini", ".cfg", ".conf"}
+
+    TEST_DIRS = {"test", "tests", "__tests__", "spec", "specs"}
+
+    # Temporary files written into the project by ClaudeAnalysisClient
+    IGNORED_PREFIXES = (".claude_ai_analyzer_settings",)
+
+    def __init__(self, project_dir: Path, project_index: dict[str, Any]):
+        """
+        Initialize input hasher.
+
+        Args:
+            project_dir: Root directory of project
+            project_index: Output from programmatic analyzer
+        """
+        self.project_dir = project_dir
+        self.project_index = project_index
+        self._files: dict[str, list[str]] | None = None
+        self._digests: dict[str, str] = {}
+
+    def _classify(self, rel_path: str, name: str) -> str:
+        """
+        Get the kind of a project file.
+
+        Returns:
+            One of FILE_KINDS other than "layout"
+        """
+        if name in self.MANIFEST_FILES or (
+            name.startswith("requirements") and name.endswith(".txt")
+        ):
+            return "manifests"
+
+        suffix = os.path.splitext(name)[1].lower()
+        if suffix in self.SOURCE_EXTENSIONS:
+            parts = rel_path.split("/")[:-1]
+            if (
+                any(part in self.TEST_DIRS for part in parts)
+                or name.startswith("test_")
+                or ".test." in name
+                or ".spec." in name
+                or os.path.splitext(name)[0].endswith("_test")
+            ):
+                return "tests"
+            return "source"
+
+        if (
+            suffix in self.CONFIG_EXTENSIONS
+            or name.startswith("Dockerfile")
+            or name.startswith(".env")
+        ):
+            return "config"
+        return "other"
+
+    def _scan(self) -> dict[str, list[str]]:
+        """
+        List project files by kind (walks the project once).
+
+        Returns:
+            Dictionary of kind to sorted relative paths
+        """
+        if self._files is not None:
+            return self._files
+
+        files: dict[str, list[str]] = {kind: [] for kind in self.FILE_KINDS}
+        for root, dirs, names in os.walk(self.project_dir):
+            dirs[:] = [d for d in dirs if d not in self.EXCLUDED_DIRS]
+            rel_root = os.path.relpath(root, self.project_dir)
+            for name in names:
+                if name.startswith(self.IGNORED_PREFIXES):
+                    continue
+                rel_path = (name if rel_root == "." else f"{rel_root}/{name}").replace(
+                    os.sep, "/"
+                )
+                files["layout"].append(rel_path)
+                files[self._classify(rel_path, name)].append(rel_path)
+
+        for paths in files.values():
+            paths.sort()
+        self._files = files
+        return files
+
+    def _digest(self, rel_path: str) -> str:
+        """Content digest of a project file (empty if unreadable)."""
+        digest = self._digests.get(rel_path)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            try:
+                with open(self.project_dir / rel_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        hasher.update(chunk)
+                digest = hasher.hexdigest()
+            except OSError:
+                digest = ""
+            self._digests[rel_path] = digest
+        return digest
+
+    def hash_analyzer(self, analyzer_name: str) -> str:
+        """
+        Hash everything an analyzer's result depends on.
+
+        Args:
+            analyzer_name: Name of the analyzer
+
+        Returns:
+            Hex digest of the analyzer's inputs
+        """
+        analyzer = AnalyzerFactory.create(analyzer_name, self.project_index)
+        try:
+            prompt = analyzer.get_prompt()
+        except ValueError:
+            prompt = ""  # The analyzer will fail the same way when run
+
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(
+            json.dumps(
+                {
+                    "version": self.CACHE_VERSION,
+                    "analyzer": analyzer_name,
+                    "prompt": prompt,
+                    "index": analyzer.get_index_inputs(),
+                },
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+
+        files = self._scan()
+        for kind in analyzer.INPUT_KINDS:
+            for rel_path in files[kind]:
+                digest = "" if kind == "layout" else self._digest(rel_path)
+                hasher.update(f"{kind}\0{rel_path}\0{digest}\n".encode())
+        return hasher.hexdigest()
+
+    def hash_analyzers(self, analyzer_names: list[str]) -> dict[str, str]:
+        """
+        Hash the inputs of several analyzers.
+
+        Args:
+            analyzer_names: Names of the analyzers
+
+        Returns:
+            Dictionary of analyzer name to input hash
+        """
+        return {name: self.hash_analyzer(name) for name in analyzer_names}
@@ -2,7 +2,7 @@
 Data models and type definitions for AI analyzer.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -32,6 +32,8 @@ class CostEstimate:
     files_to_analyze: int
     routes_count: int = 0
     models_count: int = 0
+    analyzers_to_run: int = 0
+    cached_analyzers: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -2,6 +2,8 @@
 Main orchestrator for AI-powered project analysis.
 """
 
+import asyncio
+import os
 import time
 from datetime import datetime
 from pathlib import Path
@@ -11,25 +13,53 @@ from .analyzers import AnalyzerFactory
 from .cache_manager import CacheManager
 from .claude_client import CLAUDE_SDK_AVAILABLE, ClaudeAnalysisClient
 from .cost_estimator import CostEstimator
+from .input_hasher import InputHasher
 from .models import AnalyzerType
 from .result_parser import ResultParser
 from .summary_printer import SummaryPrinter
 
+# Default number of analyzers run at once (one Claude session each)
+DEFAULT_ANALYZER_CONCURRENCY = 3
+
+
+def get_analyzer_concurrency() -> int:
+    """Maximum number of concurrent analyzer sessions (at least 1)."""
+    try:
+        return max(
+            1,
+            int(
+                os.environ.get(
+                    "AUTO_CLAUDE_AI_ANALYZER_CONCURRENCY", DEFAULT_ANALYZER_CONCURRENCY
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_ANALYZER_CONCURRENCY
+
 
 class AIAnalyzerRunner:
     """Orchestrates AI-powered project analysis."""
 
-    def __init__(self, project_dir: Path, project_index: dict[str, Any]):
+    def __init__(
+        self,
+        project_dir: Path,
+        project_index: dict[str, Any],
+        max_concurrency: int | None = None,
+    ):
         """
         Initialize AI analyzer.
 
         Args:
             project_dir: Root directory of project
             project_index: Output from programmatic analyzer (analyzer.py)
+            max_concurrency: Maximum analyzers run at once
+                (default: get_analyzer_concurrency())
         """
         self.project_dir = project_dir
         self.project_index = project_index
+        self.max_concurrency = max_concurrency or get_analyzer_concurrency()
         self.cache_manager = CacheManager(project_dir / ".auto-claude" / "ai_cache")
+        self.input_hasher = InputHasher(project_dir, project_index)
         self.cost_estimator = CostEstimator(project_dir, project_index)
         self.result_parser = ResultParser()
         self.summary_printer = SummaryPrinter()
@@ -49,18 +79,29 @@ class AIAnalyzerRunner:
         """
         self._print_header()
 
-        # Check for cached analysis
-        cached_result = self.cache_manager.get_cached_result(skip_cache)
-        if cached_result:
-            return cached_result
-
-        if not CLAUDE_SDK_AVAILABLE:
+        # Determine which analyzers to run, and which have cached results
+        analyzers_to_run = self._get_analyzers_to_run(selected_analyzers)
+        input_hashes = self.input_hasher.hash_analyzers(analyzers_to_run)
+        cached = (
+            {} if skip_cache else self.cache_manager.get_analyzer_results(input_hashes)
+        )
+        pending = [name for name in analyzers_to_run if name not in cached]
+        if cached:
+            print(
+                f"✓ Using cached results for {len(cached)}/{len(analyzers_to_run)} "
+                f"analyzers (inputs unchanged): {', '.join(cached)}"
+            )
+
+        if pending and not CLAUDE_SDK_AVAILABLE:
             print("✗ Claude Agent SDK not available. Cannot run AI analysis.")
             return {"error": "Claude SDK not installed"}
 
         # Estimate cost before running
-        cost_estimate = self.cost_estimator.estimate_cost()
-        self.summary_printer.print_cost_estimate(cost_estimate.__dict__)
+        cost_estimate = self.cost_estimator.estimate_cost(
+            input_hashes, None if skip_cache else self.cache_manager
+        )
+        if pending:
+            self.summary_printer.print_cost_estimate(cost_estimate.__dict__)
 
         # Initialize results
         insights = {
@@ -69,18 +110,18 @@ class AIAnalyzerRunner:
             "cost_estimate": cost_estimate.__dict__,
         }
 
-        # Determine which analyzers to run
-        analyzers_to_run = self._get_analyzers_to_run(selected_analyzers)
-
-        # Run each analyzer
-        await self._run_analyzers(analyzers_to_run, insights)
+        # Run the analyzers without a cached result
+        results = dict(cached)
+        await self._run_analyzers(pending, results, input_hashes)
+        for analyzer_name in analyzers_to_run:
+            insights[analyzer_name] = results[analyzer_name]
 
         # Calculate overall score
         insights["overall_score"] = self._calculate_overall_score(
             analyzers_to_run, insights
         )
 
-        # Cache results
+        # Save combined results
         self.cache_manager.save_result(insights)
         print(f"\n📊 Overall Score: {insights['overall_score']}/100")
 
@@ -115,30 +156,57 @@ class AIAnalyzerRunner:
         return AnalyzerType.all_analyzers()
 
     async def _run_analyzers(
-        self, analyzers_to_run: list[str], insights: dict[str, Any]
+        self,
+        analyzers_to_run: list[str],
+        insights: dict[str, Any],
+        input_hashes: dict[str, str] | None = None,
     ) -> None:
         """
-        Run all specified analyzers.
+        Run all specified analyzers, at most max_concurrency at a time.
+
+        Successful results are cached under the analyzer's input hash; a result
+        equal to the analyzer's default (an empty response) is not.
 
         Args:
             analyzers_to_run: List of analyzer names to run
             insights: Dictionary to store results
+            input_hashes: Input hash per analyzer, for caching results
         """
-        for analyzer_name in analyzers_to_run:
-            print(f"\n🤖 Running {analyzer_name.replace('_', ' ').title()} Analyzer...")
-            start_time = time.time()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-            try:
-                result = await self._run_single_analyzer(analyzer_name)
-                insights[analyzer_name] = result
+        async def run(analyzer_name: str) -> dict[str, Any]:
+            async with semaphore:
+                title = analyzer_name.replace("_", " ").title()
+                print(f"\n🤖 Running {title} Analyzer...")
+                start_time = time.time()
+
+                try:
+                    result = await self._run_single_analyzer(analyzer_name)
+                except Exception as e:
+                    print(f"   ✗ {title}: Error: {e}")
+                    return {"error": str(e)}
 
                 duration = time.time() - start_time
                 score = result.get("score", 0)
-                print(f"   ✓ Completed in {duration:.1f}s (score: {score}/100)")
-
-            except Exception as e:
-                print(f"   ✗ Error: {e}")
-                insights[analyzer_name] = {"error": str(e)}
+                print(f"   ✓ {title} completed in {duration:.1f}s (score: {score}/100)")
+
+                # Responses that could not be parsed, and empty responses (for
+                # which the parser returns the bare default), are not worth keeping
+                default = AnalyzerFactory.create(
+                    analyzer_name, self.project_index
+                ).get_default_result()
+                if input_hashes and "_raw_response" not in result and result != default:
+                    try:
+                        self.cache_manager.save_analyzer_result(
+                            analyzer_name, input_hashes[analyzer_name], result
+                        )
+                    except (OSError, TypeError, ValueError) as e:
+                        print(f"   ⚠️  Could not cache {title} result: {e}")
+                return result
+
+        results = await asyncio.gather(*(run(name) for name in analyzers_to_run))
+        for analyzer_name, result in zip(analyzers_to_run, results):
+            insights[analyzer_name] = result
 
     async def _run_single_analyzer(self, analyzer_name: str) -> dict[str, Any]:
         """
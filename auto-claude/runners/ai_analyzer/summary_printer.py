@@ -94,4 +94,7 @@ class SummaryPrinter:
         print(f"   Tokens: ~{cost_estimate['estimated_tokens']:,}")
         print(f"   Cost: ~${cost_estimate['estimated_cost_usd']:.4f} USD")
         print(f"   Files: {cost_estimate['files_to_analyze']}")
+        cached = cost_estimate.get("cached_analyzers") or []
+        if cached:
+            print(f"   Cached (not re-run): {', '.join(cached)}")
         print()
@@ -21,6 +21,7 @@ Main functions:
 Command parsing:
 - extract_commands: Extract command names from shell strings
 - split_command_segments: Split compound commands into segments
+- parse_command: Memoized parse of commands and segments together
 
 Validators:
 - All validators are available via the VALIDATORS dict
@@ -41,6 +42,7 @@ from .hooks import bash_security_hook, validate_command
 from .parser import (
     extract_commands,
     get_command_for_validation,
+    parse_command,
     split_command_segments,
 )
 
@@ -79,6 +81,7 @@ __all__ = [
     "extract_commands",
     "split_command_segments",
     "get_command_for_validation",
+    "parse_command",
     # Validators
     "VALIDATORS",
     "validate_pkill_command",
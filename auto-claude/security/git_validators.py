@@ -38,7 +38,7 @@ def validate_git_commit(command_string: str) -> ValidationResult:
 
     # Import the secret scanner
     try:
-        from scan_secrets import get_staged_files, mask_secret, scan_files
+        from scan_secrets import get_staged_files, mask_secret, scan_files_cached
     except ImportError:
         # Scanner not available, allow commit (don't break the build)
         return True, ""
@@ -48,7 +48,7 @@ def validate_git_commit(command_string: str) -> ValidationResult:
     if not staged_files:
         return True, ""  # No staged files, allow commit
 
-    matches = scan_files(staged_files, Path.cwd())
+    matches = scan_files_cached(staged_files, Path.cwd())
 
     if not matches:
         return True, ""  # No secrets found, allow commit
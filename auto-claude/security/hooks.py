@@ -12,7 +12,7 @@ from typing import Any
 
 from project_analyzer import BASE_COMMANDS, SecurityProfile, is_command_allowed
 
-from .parser import extract_commands, get_command_for_validation, split_command_segments
+from .parser import parse_command
 from .profile import get_security_profile
 from .validator import VALIDATORS
 
@@ -62,24 +62,18 @@ async def bash_security_hook(
         profile = SecurityProfile()
         profile.base_commands = BASE_COMMANDS.copy()
 
-    # Extract all commands from the command string
-    commands = extract_commands(command)
+    # Parse once (memoized per command string): commands plus segments
+    parsed = parse_command(command)
 
-    if not commands:
+    if not parsed.commands:
         # Could not parse - fail safe by blocking
         return {
             "decision": "block",
             "reason": f"Could not parse command for security validation: {command}",
         }
 
-    # Split into segments for per-command validation
-    segments = split_command_segments(command)
-
-    # Get all allowed commands
-    allowed = profile.get_all_allowed_commands()
-
     # Check each command against the allowlist
-    for cmd in commands:
+    for cmd in parsed.commands:
         # Check if command is allowed
         is_allowed, reason = is_command_allowed(cmd, profile)
 
@@ -91,9 +85,7 @@ async def bash_security_hook(
 
         # Additional validation for sensitive commands
         if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
+            cmd_segment = parsed.segment_for(cmd) or command
 
             validator = VALIDATORS[cmd]
             allowed, reason = validator(cmd_segment)
@@ -121,22 +113,18 @@ def validate_command(
         project_dir = Path.cwd()
 
     profile = get_security_profile(project_dir)
-    commands = extract_commands(command)
+    parsed = parse_command(command)
 
-    if not commands:
+    if not parsed.commands:
         return False, "Could not parse command"
 
-    segments = split_command_segments(command)
-
-    for cmd in commands:
+    for cmd in parsed.commands:
         is_allowed_result, reason = is_command_allowed(cmd, profile)
         if not is_allowed_result:
             return False, reason
 
         if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
+            cmd_segment = parsed.segment_for(cmd) or command
 
             validator = VALIDATORS[cmd]
             allowed, reason = validator(cmd_segment)
@@ -37,6 +37,7 @@ from security import (
     get_security_profile,
     is_command_allowed,
     needs_validation,
+    parse_command,
     reset_profile_cache,
     split_command_segments,
     validate_command,
@@ -51,6 +52,7 @@ __all__ = [
     "extract_commands",
     "split_command_segments",
     "get_command_for_validation",
+    "parse_command",
     "VALIDATORS",
     "SecurityProfile",
     "is_command_allowed",
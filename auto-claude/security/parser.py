@@ -7,110 +7,174 @@ Handles compound commands, pipes, subshells, and various shell constructs.
 """
 
 import os
-import re
 import shlex
+from functools import lru_cache
+from typing import NamedTuple
+
+# Number of distinct command strings whose parse results are memoized.
+# Agents repeat the same commands (git status, npm test, ...) constantly.
+PARSE_CACHE_SIZE = 2048
+
+
+class ParsedCommand(NamedTuple):
+    """Immutable parse result for a full shell command string."""
+
+    commands: tuple[str, ...]
+    segments: tuple[str, ...]
+    segment_commands: tuple[tuple[str, ...], ...]
+
+    def segment_for(self, cmd: str) -> str:
+        """Return the first segment that runs the given command, or ""."""
+        for segment, commands in zip(self.segments, self.segment_commands):
+            if cmd in commands:
+                return segment
+        return ""
+
+
+# Shell keywords that precede commands
+_SHELL_KEYWORDS = frozenset(
+    {
+        "if",
+        "then",
+        "else",
+        "elif",
+        "fi",
+        "for",
+        "while",
+        "until",
+        "do",
+        "done",
+        "case",
+        "esac",
+        "in",
+        "!",
+        "{",
+        "}",
+        "(",
+        ")",
+        "function",
+    }
+)
+
+# Redirection and here-doc markers
+_REDIRECTIONS = frozenset({"<<", "<<<", ">>", ">", "<", "2>", "2>&1", "&>"})
+
+
+def _scan_segments(command_string: str) -> list[str]:
+    """
+    Split a command string on &&, || and ; in a single pass.
 
+    Operators inside quotes or escaped with a backslash do not split.
+    """
+    segments = []
+    start = 0
+    quote = ""
+    i = 0
+    length = len(command_string)
+
+    while i < length:
+        char = command_string[i]
+        if quote:
+            if char == quote:
+                quote = ""
+            elif char == "\\" and quote == '"':
+                i += 1
+        elif char == "\\":
+            i += 1
+        elif char in ("'", '"'):
+            quote = char
+        elif char == ";" or command_string.startswith(("&&", "||"), i):
+            segments.append(command_string[start:i])
+            i += 1 if char == ";" else 2
+            start = i
+            continue
+        i += 1
 
-def split_command_segments(command_string: str) -> list[str]:
+    segments.append(command_string[start:])
+    return [segment.strip() for segment in segments if segment.strip()]
+
+
+def _segment_commands(segment: str) -> list[str] | None:
     """
-    Split a compound command into individual command segments.
+    Extract command names from a single segment.
 
-    Handles command chaining (&&, ||, ;) but not pipes (those are single commands).
+    Returns:
+        Base command names, or None if the segment cannot be tokenized
     """
-    # Split on && and || while preserving the ability to handle each segment
-    segments = re.split(r"\s*(?:&&|\|\|)\s*", command_string)
+    try:
+        tokens = shlex.split(segment)
+    except ValueError:
+        # Malformed command (unclosed quotes, etc.)
+        return None
 
-    # Further split on semicolons
-    result = []
-    for segment in segments:
-        sub_segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', segment)
-        for sub in sub_segments:
-            sub = sub.strip()
-            if sub:
-                result.append(sub)
+    commands = []
+    # Track when we expect a command vs arguments
+    expect_command = True
 
-    return result
+    for token in tokens:
+        # Shell operators indicate a new command follows
+        if token in ("|", "||", "&&", "&"):
+            expect_command = True
+            continue
 
+        # Skip shell keywords, flags/options, variable assignments
+        # (VAR=value) and redirections
+        if (
+            token in _SHELL_KEYWORDS
+            or token.startswith("-")
+            or ("=" in token and not token.startswith("="))
+            or token in _REDIRECTIONS
+        ):
+            continue
 
-def extract_commands(command_string: str) -> list[str]:
+        if expect_command:
+            # Extract the base command name (handle paths like /usr/bin/python)
+            commands.append(os.path.basename(token))
+            expect_command = False
+
+    return commands
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_command(command_string: str) -> ParsedCommand:
     """
-    Extract command names from a shell command string.
+    Parse a command string into commands and per-segment commands at once.
 
-    Handles pipes, command chaining (&&, ||, ;), and subshells.
-    Returns the base command names (without paths).
+    The string is scanned once to find its segments and each segment is
+    tokenized once; the commands of the whole string are those of its
+    segments. If any segment is malformed, no commands are returned, so
+    the caller blocks the command (fail-safe). Results are memoized by
+    command string.
     """
-    commands = []
+    segments = tuple(_scan_segments(command_string))
+    segment_commands = []
+    for segment in segments:
+        commands = _segment_commands(segment)
+        if commands is None:
+            return ParsedCommand((), segments, ((),) * len(segments))
+        segment_commands.append(tuple(commands))
 
-    # Split on semicolons that aren't inside quotes
-    segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', command_string)
+    commands = tuple(cmd for cmds in segment_commands for cmd in cmds)
+    return ParsedCommand(commands, segments, tuple(segment_commands))
 
-    for segment in segments:
-        segment = segment.strip()
-        if not segment:
-            continue
 
-        try:
-            tokens = shlex.split(segment)
-        except ValueError:
-            # Malformed command (unclosed quotes, etc.)
-            # Return empty to trigger block (fail-safe)
-            return []
+def split_command_segments(command_string: str) -> list[str]:
+    """
+    Split a compound command into individual command segments.
 
-        if not tokens:
-            continue
+    Handles command chaining (&&, ||, ;) but not pipes (those are single commands).
+    """
+    return list(parse_command(command_string).segments)
 
-        # Track when we expect a command vs arguments
-        expect_command = True
-
-        for token in tokens:
-            # Shell operators indicate a new command follows
-            if token in ("|", "||", "&&", "&"):
-                expect_command = True
-                continue
-
-            # Skip shell keywords that precede commands
-            if token in (
-                "if",
-                "then",
-                "else",
-                "elif",
-                "fi",
-                "for",
-                "while",
-                "until",
-                "do",
-                "done",
-                "case",
-                "esac",
-                "in",
-                "!",
-                "{",
-                "}",
-                "(",
-                ")",
-                "function",
-            ):
-                continue
-
-            # Skip flags/options
-            if token.startswith("-"):
-                continue
-
-            # Skip variable assignments (VAR=value)
-            if "=" in token and not token.startswith("="):
-                continue
-
-            # Skip here-doc markers
-            if token in ("<<", "<<<", ">>", ">", "<", "2>", "2>&1", "&>"):
-                continue
-
-            if expect_command:
-                # Extract the base command name (handle paths like /usr/bin/python)
-                cmd = os.path.basename(token)
-                commands.append(cmd)
-                expect_command = False
 
-    return commands
+def extract_commands(command_string: str) -> list[str]:
+    """
+    Extract command names from a shell command string.
+
+    Handles pipes, command chaining (&&, ||, ;), and subshells.
+    Returns the base command names (without paths).
+    """
+    return list(parse_command(command_string).commands)
 
 
 def get_command_for_validation(cmd: str, segments: list[str]) -> str:
@@ -118,7 +182,6 @@ def get_command_for_validation(cmd: str, segments: list[str]) -> str:
     Find the specific command segment that contains the given command.
     """
     for segment in segments:
-        segment_commands = extract_commands(segment)
-        if cmd in segment_commands:
+        if cmd in (_segment_commands(segment) or []):
             return segment
     return ""
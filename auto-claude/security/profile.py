@@ -4,22 +4,34 @@ Security Profile Management
 
 Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
+
+Profiles are cached per (project_dir, spec_dir) in a small LRU so agents
+working on several projects or worktrees don't re-analyze on every switch.
+A cached profile is reused until the stat signature of the project's key
+files (see ProjectAnalyzer.hash_input_signature) changes.
 """
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from project_analyzer import (
+    ProjectAnalyzer,
     SecurityProfile,
     get_or_create_profile,
 )
 
+# Maximum number of project profiles kept in memory
+PROFILE_CACHE_SIZE = 16
+
 # =============================================================================
 # GLOBAL STATE
 # =============================================================================
 
-# Cache the security profile to avoid re-analyzing on every command
-_cached_profile: SecurityProfile | None = None
-_cached_project_dir: Path | None = None
+# (project_dir, spec_dir) -> (hash input signature, profile), in LRU order
+_CacheKey = tuple[Path, Path | None]
+_profile_cache: OrderedDict[_CacheKey, tuple[tuple, SecurityProfile]] = OrderedDict()
+_cache_lock = threading.Lock()
 
 
 def get_security_profile(
@@ -35,23 +47,33 @@ def get_security_profile(
     Returns:
         SecurityProfile for the project
     """
-    global _cached_profile, _cached_project_dir
-
     project_dir = Path(project_dir).resolve()
+    if spec_dir is not None:
+        spec_dir = Path(spec_dir).resolve()
+    key = (project_dir, spec_dir)
+
+    signature = ProjectAnalyzer(project_dir, spec_dir).hash_input_signature()
+
+    # Return cached profile if the project's key files are unchanged
+    with _cache_lock:
+        cached = _profile_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            _profile_cache.move_to_end(key)
+            return cached[1]
 
-    # Return cached profile if same project
-    if _cached_profile is not None and _cached_project_dir == project_dir:
-        return _cached_profile
+    # Analyze (or load the saved profile) outside the lock
+    profile = get_or_create_profile(project_dir, spec_dir)
 
-    # Analyze and cache
-    _cached_profile = get_or_create_profile(project_dir, spec_dir)
-    _cached_project_dir = project_dir
+    with _cache_lock:
+        _profile_cache[key] = (signature, profile)
+        _profile_cache.move_to_end(key)
+        while len(_profile_cache) > PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
 
-    return _cached_profile
+    return profile
 
 
 def reset_profile_cache() -> None:
-    """Reset the cached profile (useful for testing or re-analysis)."""
-    global _cached_profile, _cached_project_dir
-    _cached_profile = None
-    _cached_project_dir = None
+    """Reset the cached profiles (useful for testing or re-analysis)."""
+    with _cache_lock:
+        _profile_cache.clear()
@@ -7,7 +7,11 @@ Scans staged git files for potential secrets before commit.
 Designed to prevent accidental exposure of API keys, tokens, and credentials.
 
 Usage:
-    python scan_secrets.py [--staged-only] [--all-files] [--path PATH]
+    python scan_secrets.py [--staged-only] [--all-files] [--path PATH] [--jobs N]
+                           [--no-cache]
+
+Staged and --all-files scans reuse results for unchanged git blobs from a
+local cache kept in the git directory (see scan_files_cached).
 
 Exit codes:
     0 - No secrets detected
@@ -16,9 +20,15 @@ Exit codes:
 """
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -146,6 +156,89 @@ ALL_PATTERNS = (
 )
 
 
+def _required_literal(pattern: str) -> str | None:
+    """
+    Find a literal substring that every match of a pattern must contain.
+
+    Only top-level literal runs are considered (groups and character classes
+    end a run, a top-level "|" disables the shortcut entirely). The longest
+    run of at least two characters is returned lowercased, or None.
+    """
+    runs = []
+    run = ""
+    i = 0
+    depth = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if depth == 0 and not escaped.isalnum():
+                run += escaped
+            else:
+                runs.append(run)
+                run = ""
+            i += 2
+            continue
+        if char == "[":
+            # Skip the whole character class
+            i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            runs.append(run)
+            run = ""
+        elif char == "(":
+            depth += 1
+            runs.append(run)
+            run = ""
+        elif char == ")":
+            depth -= 1
+            # Quantifiers after a group apply to the group, not the run
+            if i + 1 < len(pattern) and pattern[i + 1] in "?*+{":
+                i += 1
+        elif char == "|" and depth == 0:
+            return None
+        elif depth > 0:
+            pass
+        elif char in "?*{":
+            # Preceding character is optional (or repeated a variable number of times)
+            if char == "{":
+                i = pattern.find("}", i)
+            run = run[:-1]
+            runs.append(run)
+            run = ""
+        elif char in "+.^$":
+            runs.append(run)
+            run = ""
+        else:
+            run += char
+        i += 1
+    runs.append(run)
+
+    longest = max(runs, key=len)
+    return longest.lower() if len(longest) >= 2 else None
+
+
+def _compile_patterns(
+    patterns: list[tuple[str, str]],
+) -> list[tuple[re.Pattern, str, str | None]]:
+    """Precompile secret patterns along with their required literal."""
+    compiled = []
+    for pattern, pattern_name in patterns:
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            # Invalid regex, skip
+            continue
+        compiled.append((regex, pattern_name, _required_literal(pattern)))
+    return compiled
+
+
+_COMPILED_PATTERNS = _compile_patterns(ALL_PATTERNS)
+
+# Below this many files, scanning in-process beats process pool startup
+PARALLEL_SCAN_MIN_FILES = 64
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -331,32 +424,73 @@ def mask_secret(text: str, visible_chars: int = 8) -> str:
 
 
 def scan_content(content: str, file_path: str) -> list[SecretMatch]:
-    """Scan file content for potential secrets."""
+    """
+    Scan file content for potential secrets.
+
+    Patterns whose required literal (e.g. "sk-", "akia", "ghp_") is absent
+    from the file are skipped. The remaining precompiled patterns search the
+    whole buffer to find candidate lines, and only those lines are checked
+    pattern by pattern, so results are identical to running every pattern
+    against every line.
+    """
+    if content.isascii():
+        # Case-insensitive literal check is only exact for ASCII text
+        content_lower = content.lower()
+        active = [
+            (regex, pattern_name)
+            for regex, pattern_name, literal in _COMPILED_PATTERNS
+            if literal is None or literal in content_lower
+        ]
+    else:
+        active = [
+            (regex, pattern_name) for regex, pattern_name, _ in _COMPILED_PATTERNS
+        ]
+
+    lines: list[str] | None = None
+    line_starts: list[int] = []
+    candidate_lines: set[int] = set()
+
+    for regex, _ in active:
+        pos = 0
+        while True:
+            hit = regex.search(content, pos)
+            if hit is None:
+                break
+
+            if lines is None:
+                # Offsets of each line start, consistent with str.splitlines()
+                lines = content.splitlines()
+                offset = 0
+                for raw_line in content.splitlines(keepends=True):
+                    line_starts.append(offset)
+                    offset += len(raw_line)
+
+            line_index = bisect_right(line_starts, hit.start()) - 1
+            candidate_lines.add(line_index)
+            if line_index + 1 >= len(line_starts):
+                break
+            pos = line_starts[line_index + 1]
+
     matches = []
-    lines = content.splitlines()
-
-    for line_num, line in enumerate(lines, 1):
-        for pattern, pattern_name in ALL_PATTERNS:
-            try:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    matched_text = match.group(0)
-
-                    # Skip false positives
-                    if is_false_positive(line, matched_text):
-                        continue
-
-                    matches.append(
-                        SecretMatch(
-                            file_path=file_path,
-                            line_number=line_num,
-                            pattern_name=pattern_name,
-                            matched_text=matched_text,
-                            line_content=line.strip()[:100],  # Truncate long lines
-                        )
+    for line_index in sorted(candidate_lines):
+        line = lines[line_index]
+        for regex, pattern_name in active:
+            for match in regex.finditer(line):
+                matched_text = match.group(0)
+
+                # Skip false positives
+                if is_false_positive(line, matched_text):
+                    continue
+
+                matches.append(
+                    SecretMatch(
+                        file_path=file_path,
+                        line_number=line_index + 1,
+                        pattern_name=pattern_name,
+                        matched_text=matched_text,
+                        line_content=line.strip()[:100],  # Truncate long lines
                     )
-            except re.error:
-                # Invalid regex, skip
-                continue
+                )
 
     return matches
 
@@ -391,35 +525,270 @@ def get_all_tracked_files() -> list[str]:
         return []
 
 
+def _scan_file(file_path: str, project_dir: Path) -> list[SecretMatch]:
+    """Read and scan one file (top-level so process pool workers can run it)."""
+    full_path = project_dir / file_path
+
+    # Skip if file doesn't exist or is a directory
+    if not full_path.exists() or full_path.is_dir():
+        return []
+
+    try:
+        content = full_path.read_text(encoding="utf-8", errors="ignore")
+        return scan_content(content, file_path)
+    except (OSError, UnicodeDecodeError):
+        # Skip files that can't be read
+        return []
+
+
+def _scan_file_chunk(file_paths: list[str], project_dir: Path) -> list[SecretMatch]:
+    """Scan a batch of files in a worker process."""
+    matches = []
+    for file_path in file_paths:
+        matches.extend(_scan_file(file_path, project_dir))
+    return matches
+
+
 def scan_files(
     files: list[str],
     project_dir: Path | None = None,
+    jobs: int = 1,
 ) -> list[SecretMatch]:
-    """Scan a list of files for secrets."""
+    """
+    Scan a list of files for secrets.
+
+    Args:
+        files: File paths relative to project_dir
+        project_dir: Project root (defaults to cwd)
+        jobs: Worker processes to fan files out over; 0 means one per CPU.
+            Results are returned in the same order as a sequential scan.
+    """
     if project_dir is None:
         project_dir = Path.cwd()
 
     custom_ignores = load_secretsignore(project_dir)
+
+    # Skip files based on ignore patterns
+    to_scan = [f for f in files if not should_skip_file(f, custom_ignores)]
+
+    return _scan_paths(to_scan, project_dir, jobs)
+
+
+def _scan_paths(to_scan: list[str], project_dir: Path, jobs: int) -> list[SecretMatch]:
+    """Scan already-filtered files, optionally over a process pool."""
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs <= 1 or len(to_scan) < PARALLEL_SCAN_MIN_FILES:
+        return _scan_file_chunk(to_scan, project_dir)
+
+    # Contiguous chunks keep output order identical to the sequential scan
+    chunk_size = max(1, -(-len(to_scan) // (jobs * 4)))
+    chunks = [to_scan[i : i + chunk_size] for i in range(0, len(to_scan), chunk_size)]
+
     all_matches = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for chunk_matches in executor.map(
+            _scan_file_chunk, chunks, [project_dir] * len(chunks)
+        ):
+            all_matches.extend(chunk_matches)
 
-    for file_path in files:
-        # Skip files based on ignore patterns
-        if should_skip_file(file_path, custom_ignores):
-            continue
+    return all_matches
+
+
+# =============================================================================
+# INCREMENTAL SCANNING (BLOB CACHE)
+# =============================================================================
+
+CACHE_FILENAME = "auto-claude-secrets-cache.json"
+
+# Bump when scan semantics change in a way the pattern lists don't capture
+CACHE_VERSION = 1
 
-        full_path = project_dir / file_path
+# Blobs kept in the cache. The cache is shared by all worktrees, so blobs
+# missing from one worktree's index may still be live in another; entries
+# are evicted least recently used first instead.
+MAX_CACHE_ENTRIES = 20_000
 
-        # Skip if file doesn't exist or is a directory
-        if not full_path.exists() or full_path.is_dir():
+
+def _git_output(args: list[str], project_dir: Path) -> str | None:
+    """Run a git command in project_dir and return stdout, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    return result.stdout
+
+
+def get_clean_blob_hashes(project_dir: Path) -> dict[str, str] | None:
+    """
+    Map tracked files to their index blob SHA, for files whose working tree
+    content matches the index.
+
+    Files with unstaged modifications or merge conflicts are left out since
+    their blob SHA does not describe what is on disk.
+
+    Returns:
+        Dict of path (relative to project_dir) to blob SHA, or None if
+        project_dir is not inside a git repository
+    """
+    staged = _git_output(["ls-files", "-s", "-z"], project_dir)
+    modified = _git_output(["ls-files", "-m", "-z"], project_dir)
+    if staged is None or modified is None:
+        return None
+
+    dirty = set(filter(None, modified.split("\0")))
+    blobs: dict[str, str] = {}
+    for record in filter(None, staged.split("\0")):
+        info, _, path = record.partition("\t")
+        _mode, sha, stage = info.split(" ")
+        if stage != "0" or path in dirty:
+            blobs.pop(path, None)
             continue
+        blobs[path] = sha
+    return blobs
+
 
+def _cache_fingerprint(project_dir: Path) -> str:
+    """Hash of everything that affects scan results besides file content."""
+    try:
+        secretsignore = (project_dir / ".secretsignore").read_text()
+    except OSError:
+        secretsignore = ""
+
+    payload = json.dumps(
+        [
+            CACHE_VERSION,
+            ALL_PATTERNS,
+            FALSE_POSITIVE_PATTERNS,
+            DEFAULT_IGNORE_PATTERNS,
+            sorted(BINARY_EXTENSIONS),
+            secretsignore,
+        ]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cache_path(project_dir: Path) -> Path | None:
+    """Location of the blob cache (shared by all worktrees of a repository)."""
+    git_dir = _git_output(["rev-parse", "--git-common-dir"], project_dir)
+    if not git_dir or not git_dir.strip():
+        return None
+    return (project_dir / git_dir.strip()).resolve() / CACHE_FILENAME
+
+
+def _load_blob_cache(cache_path: Path, fingerprint: str) -> dict[str, list]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return {}
+    blobs = data.get("blobs")
+    return blobs if isinstance(blobs, dict) else {}
+
+
+def _save_blob_cache(
+    cache_path: Path, fingerprint: str, blobs: dict[str, list]
+) -> None:
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=".secrets_cache_", suffix=".tmp"
+        )
         try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
-            matches = scan_content(content, file_path)
-            all_matches.extend(matches)
-        except (OSError, UnicodeDecodeError):
-            # Skip files that can't be read
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "blobs": blobs}, f)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Warning: Failed to save secret scan cache: {e}", file=sys.stderr)
+
+
+def scan_files_cached(
+    files: list[str],
+    project_dir: Path | None = None,
+    jobs: int = 1,
+) -> list[SecretMatch]:
+    """
+    Scan files for secrets, reusing results for unchanged git blobs.
+
+    Findings are cached per blob SHA (from `git ls-files -s`) in the git
+    directory, so only blobs not seen before are read and scanned. The cache
+    is discarded whenever the pattern set or .secretsignore changes, and
+    holds at most MAX_CACHE_ENTRIES blobs across all worktrees. Files with
+    unstaged changes, or outside a git repository, are always scanned.
+
+    Returns the same matches, in the same order, as scan_files().
+    """
+    if project_dir is None:
+        project_dir = Path.cwd()
+
+    blob_hashes = get_clean_blob_hashes(project_dir)
+    cache_path = _cache_path(project_dir) if blob_hashes is not None else None
+    if cache_path is None:
+        return scan_files(files, project_dir, jobs=jobs)
+
+    fingerprint = _cache_fingerprint(project_dir)
+    cached_blobs = _load_blob_cache(cache_path, fingerprint)
+
+    custom_ignores = load_secretsignore(project_dir)
+    to_scan = [f for f in files if not should_skip_file(f, custom_ignores)]
+
+    misses = list(
+        dict.fromkeys(f for f in to_scan if blob_hashes.get(f) not in cached_blobs)
+    )
+    fresh: dict[str, list[SecretMatch]] = {f: [] for f in misses}
+    for match in _scan_paths(misses, project_dir, jobs):
+        fresh[match.file_path].append(match)
+
+    for file_path in misses:
+        sha = blob_hashes.get(file_path)
+        if sha is not None and (project_dir / file_path).is_file():
+            cached_blobs[sha] = [
+                [m.line_number, m.pattern_name, m.matched_text, m.line_content]
+                for m in fresh[file_path]
+            ]
+
+    all_matches = []
+    for file_path in to_scan:
+        if file_path in fresh:
+            all_matches.extend(fresh[file_path])
             continue
+        for line_number, pattern_name, matched_text, line_content in cached_blobs[
+            blob_hashes[file_path]
+        ]:
+            all_matches.append(
+                SecretMatch(
+                    file_path=file_path,
+                    line_number=line_number,
+                    pattern_name=pattern_name,
+                    matched_text=matched_text,
+                    line_content=line_content,
+                )
+            )
+
+    if misses:
+        # Blobs used by this scan move to the end (most recently used); the
+        # least recently used are evicted once the cache is over its limit
+        used = dict.fromkeys(
+            blob_hashes[f] for f in to_scan if blob_hashes.get(f) in cached_blobs
+        )
+        blobs = {sha: v for sha, v in cached_blobs.items() if sha not in used}
+        blobs.update((sha, cached_blobs[sha]) for sha in used)
+        excess = len(blobs) - MAX_CACHE_ENTRIES
+        if excess > 0:
+            blobs = dict(list(blobs.items())[excess:])
+        _save_blob_cache(cache_path, fingerprint, blobs)
 
     return all_matches
 
@@ -510,6 +879,18 @@ def main() -> int:
     parser.add_argument(
         "--path", "-p", type=str, help="Scan a specific file or directory"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Worker processes for scanning (default: one per CPU, 1 disables)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan every file instead of reusing results for unchanged blobs",
+    )
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
     parser.add_argument(
         "--quiet", "-q", action="store_true", help="Only output if secrets are found"
@@ -544,8 +925,11 @@ def main() -> int:
     if not args.quiet and not args.json:
         print(f"Scanning {len(files)} file(s) for secrets...")
 
-    # Scan files
-    matches = scan_files(files, project_dir)
+    # Scan files (tracked files can reuse cached results per git blob)
+    if args.path or args.no_cache:
+        matches = scan_files(files, project_dir, jobs=args.jobs)
+    else:
+        matches = scan_files_cached(files, project_dir, jobs=args.jobs)
 
     # Output results
     if args.json:
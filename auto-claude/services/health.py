@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Service Readiness Checks
+========================
+
+Waits for services started by the ServiceOrchestrator to become ready.
+
+All services are probed concurrently on one event loop. A service with an
+HTTP health endpoint (taken from its docker-compose ``healthcheck``) is ready
+once the endpoint answers with a non-error status; otherwise it is ready once
+its port accepts TCP connections. Failed probes are retried with jittered
+exponential backoff that starts at a few tens of milliseconds, so fast
+services are seen as soon as they are up and slow ones do not hold up the
+others.
+
+Usage:
+    from services.health import wait_for_services
+
+    results = asyncio.run(wait_for_services(services, timeout=120))
+    for health in results:
+        print(health.name, health.ready, health.time_to_ready)
+"""
+
+import asyncio
+import functools
+import random
+import re
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
+
+if TYPE_CHECKING:
+    from .orchestrator import ServiceConfig
+
+# First retry delay and cap of the backoff between probes (seconds)
+INITIAL_BACKOFF = 0.05
+MAX_BACKOFF = 2.0
+
+# Timeout of a single TCP connect or HTTP request (seconds)
+PROBE_TIMEOUT = 1.0
+
+_URL_PATTERN = re.compile(r"https?://[^\s'\"|;&<>]+")
+_LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
+
+
+@dataclass
+class ServiceHealth:
+    """
+    Readiness of a single service.
+
+    Attributes:
+        name: Name of the service
+        ready: Whether the service became ready before the deadline
+        time_to_ready: Seconds until the first successful probe
+        attempts: Number of probes made
+        last_error: Why the last failed probe failed
+    """
+
+    name: str
+    ready: bool = False
+    time_to_ready: float | None = None
+    attempts: int = 0
+    last_error: str | None = None
+
+
+# =============================================================================
+# DOCKER-COMPOSE PARSING
+# =============================================================================
+
+
+def parse_port_mappings(ports: list[Any]) -> list[tuple[int, int]]:
+    """
+    Parse docker-compose port mappings.
+
+    Handles "HOST:CONTAINER", "IP:HOST:CONTAINER", "/protocol" suffixes and
+    the long syntax ({"published": ..., "target": ...}). Ports that are not
+    published on a fixed host port are skipped.
+
+    Args:
+        ports: The ``ports`` list of a compose service
+
+    Returns:
+        List of (host_port, container_port) tuples
+    """
+    mappings = []
+    for entry in ports or []:
+        try:
+            if isinstance(entry, dict):
+                if entry.get("published") and entry.get("target"):
+                    mappings.append((int(entry["published"]), int(entry["target"])))
+                continue
+
+            parts = str(entry).split("/")[0].split(":")
+            if len(parts) < 2 or "-" in parts[-1] or "-" in parts[-2]:
+                continue  # container-only port or port range
+            mappings.append((int(parts[-2]), int(parts[-1])))
+        except (TypeError, ValueError):
+            continue
+    return mappings
+
+
+def parse_healthcheck_url(
+    healthcheck: Any, port_mappings: list[tuple[int, int]]
+) -> str | None:
+    """
+    Derive a host-reachable HTTP health URL from a compose ``healthcheck``.
+
+    The healthcheck command runs inside the container, so the URL found in
+    it (e.g. ``curl -f http://localhost:8000/health``) is rewritten to the
+    host port its container port is published on.
+
+    Args:
+        healthcheck: The ``healthcheck`` mapping of a compose service
+        port_mappings: Output of parse_port_mappings() for the service
+
+    Returns:
+        Health URL on localhost, or None if the healthcheck has no usable URL
+    """
+    if not isinstance(healthcheck, dict) or healthcheck.get("disable"):
+        return None
+
+    test = healthcheck.get("test")
+    if isinstance(test, list):
+        if test and test[0] == "NONE":
+            return None
+        test = " ".join(str(part) for part in test)
+    if not isinstance(test, str):
+        return None
+
+    match = _URL_PATTERN.search(test)
+    if not match:
+        return None
+
+    try:
+        url = urlsplit(match.group(0))
+        container_port = url.port or (443 if url.scheme == "https" else 80)
+    except ValueError:
+        return None
+    if url.hostname not in _LOCAL_HOSTS:
+        return None  # Other containers' hostnames don't resolve on the host
+
+    host_port = {c: h for h, c in port_mappings}.get(container_port)
+    if host_port is None:
+        return None
+    return urlunsplit(
+        (url.scheme, f"localhost:{host_port}", url.path or "/", url.query, "")
+    )
+
+
+# =============================================================================
+# PROBES
+# =============================================================================
+
+
+async def probe_tcp(port: int, host: str = "localhost") -> str | None:
+    """
+    Check whether a port accepts connections.
+
+    Returns:
+        None if the connection succeeded, otherwise the error
+    """
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), PROBE_TIMEOUT
+        )
+    except TimeoutError:
+        return f"connect to port {port} timed out"
+    except OSError as e:
+        return f"port {port}: {e.strerror or e}"
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return None
+
+
+def _get_url(url: str) -> str | None:
+    try:
+        with urllib.request.urlopen(url, timeout=PROBE_TIMEOUT):
+            return None
+    except urllib.error.HTTPError as e:
+        return f"{url} returned {e.code}"
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        return f"{url}: {getattr(e, 'reason', e)}"
+
+
+async def probe_http(url: str) -> str | None:
+    """
+    Check whether a health endpoint answers with a non-error status.
+
+    Returns:
+        None if the endpoint is healthy, otherwise the error
+    """
+    return await asyncio.to_thread(_get_url, url)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential delay before retry number ``attempt`` (0-based)."""
+    delay = min(MAX_BACKOFF, INITIAL_BACKOFF * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+# =============================================================================
+# READINESS ENGINE
+# =============================================================================
+
+
+async def wait_for_service(service: "ServiceConfig", timeout: float) -> ServiceHealth:
+    """
+    Probe one service until it is ready or the timeout expires.
+
+    Args:
+        service: Service to wait for
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        ServiceHealth for the service
+    """
+    health = ServiceHealth(name=service.name)
+    if service.health_check_url:
+        probe = functools.partial(probe_http, service.health_check_url)
+    elif service.port:
+        probe = functools.partial(probe_tcp, service.port)
+    else:
+        # Nothing to probe
+        health.ready = True
+        health.time_to_ready = 0.0
+        return health
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + timeout
+
+    while True:
+        health.attempts += 1
+        health.last_error = await probe()
+        now = loop.time()
+        if health.last_error is None:
+            health.ready = True
+            health.time_to_ready = round(now - started, 3)
+            return health
+        if now >= deadline:
+            return health
+        await asyncio.sleep(min(backoff_delay(health.attempts - 1), deadline - now))
+
+
+async def wait_for_services(
+    services: list["ServiceConfig"], timeout: float
+) -> list[ServiceHealth]:
+    """
+    Probe all services concurrently until each is ready or times out.
+
+    Each service waits at most ``timeout`` seconds, or its own
+    ``startup_timeout`` if that is shorter.
+
+    Args:
+        services: Services to wait for
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        ServiceHealth per service, in the order of ``services``
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                wait_for_service(service, min(timeout, service.startup_timeout))
+                for service in services
+            )
+        )
+    )
@@ -20,13 +20,22 @@ Usage:
         orchestrator.stop_services()
 """
 
+import asyncio
+import concurrent.futures
 import json
 import subprocess
-import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .health import (
+    ServiceHealth,
+    parse_healthcheck_url,
+    parse_port_mappings,
+    wait_for_services,
+)
+from .supervisor import ProcessSupervisor
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -42,7 +51,7 @@ class ServiceConfig:
         path: Path to the service (relative to project root)
         port: Port the service runs on
         type: Type of service (docker, local, mock)
-        health_check_url: URL for health check
+        health_check_url: HTTP health endpoint (from the compose healthcheck)
         startup_command: Command to start the service
         startup_timeout: Timeout in seconds for startup
     """
@@ -66,12 +75,14 @@ class OrchestrationResult:
         services_started: List of services that were started
         services_failed: List of services that failed to start
         errors: List of error messages
+        time_to_ready: Seconds each ready service took to pass its health check
     """
 
     success: bool = False
     services_started: list[str] = field(default_factory=list)
     services_failed: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    time_to_ready: dict[str, float] = field(default_factory=dict)
 
 
 # =============================================================================
@@ -89,17 +100,21 @@ class ServiceOrchestrator:
     - Health check waiting
     """
 
-    def __init__(self, project_dir: Path) -> None:
+    def __init__(self, project_dir: Path, log_dir: Path | None = None) -> None:
         """
         Initialize the service orchestrator.
 
         Args:
             project_dir: Path to the project root
+            log_dir: Where local service output is logged
+                (default: .auto-claude/service_logs in the project)
         """
         self.project_dir = Path(project_dir)
         self._compose_file: Path | None = None
         self._services: list[ServiceConfig] = []
-        self._processes: dict[str, subprocess.Popen] = {}
+        self._supervisor = ProcessSupervisor(
+            log_dir or self.project_dir / ".auto-claude" / "service_logs"
+        )
         self._discover_services()
 
     def _discover_services(self) -> None:
@@ -175,17 +190,13 @@ class ServiceOrchestrator:
                     continue
 
                 # Extract port mapping
-                ports = config.get("ports", [])
-                port = None
-                if ports:
-                    port_mapping = str(ports[0])
-                    if ":" in port_mapping:
-                        port = int(port_mapping.split(":")[0])
-
-                # Determine health check URL
-                health_url = None
-                if port:
-                    health_url = f"http://localhost:{port}/health"
+                port_mappings = parse_port_mappings(config.get("ports", []))
+                port = port_mappings[0][0] if port_mappings else None
+
+                # HTTP health check declared by the service, if any
+                health_url = parse_healthcheck_url(
+                    config.get("healthcheck"), port_mappings
+                )
 
                 self._services.append(
                     ServiceConfig(
@@ -310,12 +321,16 @@ class ServiceOrchestrator:
                 return result
 
             # Wait for health checks
-            if self._wait_for_health(timeout):
+            if self._wait_for_health(timeout, result):
                 result.success = True
                 result.services_started = [s.name for s in self._services]
             else:
                 result.errors.append("Services did not become healthy in time")
-                result.services_failed = [s.name for s in self._services]
+                result.services_started = [
+                    s.name
+                    for s in self._services
+                    if s.name not in result.services_failed
+                ]
 
         except subprocess.TimeoutExpired:
             result.errors.append("docker-compose startup timed out")
@@ -325,30 +340,28 @@ class ServiceOrchestrator:
         return result
 
     def _start_local_services(self, timeout: int) -> OrchestrationResult:
-        """Start local services (non-docker)."""
+        """Start local services (non-docker) concurrently."""
         result = OrchestrationResult()
 
-        for service in self._services:
-            if service.startup_command:
-                try:
-                    proc = subprocess.Popen(
-                        service.startup_command,
-                        shell=True,
-                        cwd=self.project_dir / service.path
-                        if service.path
-                        else self.project_dir,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                    )
-                    self._processes[service.name] = proc
-                    result.services_started.append(service.name)
-                except Exception as e:
-                    result.errors.append(f"Failed to start {service.name}: {str(e)}")
-                    result.services_failed.append(service.name)
+        commands = [
+            (
+                service.name,
+                service.startup_command,
+                self.project_dir / service.path if service.path else self.project_dir,
+            )
+            for service in self._services
+            if service.startup_command
+        ]
+        for name, error in self._supervisor.start_all(commands).items():
+            if error is None:
+                result.services_started.append(name)
+            else:
+                result.errors.append(f"Failed to start {name}: {str(error)}")
+                result.services_failed.append(name)
 
         # Wait for services to be ready
         if result.services_started:
-            if self._wait_for_health(timeout):
+            if self._wait_for_health(timeout, result):
                 result.success = True
             else:
                 result.errors.append("Services did not become healthy in time")
@@ -378,16 +391,26 @@ class ServiceOrchestrator:
 
     def _stop_local_services(self) -> None:
         """Stop local services."""
-        for name, proc in self._processes.items():
-            try:
-                proc.terminate()
-                proc.wait(timeout=10)
-            except Exception:
-                try:
-                    proc.kill()
-                except Exception:
-                    pass
-        self._processes.clear()
+        self._supervisor.stop_all()
+
+    def get_service_output(self, name: str, lines: int | None = None) -> list[str]:
+        """
+        Get the most recent output of a local service.
+
+        The full output is in get_service_log_path(name).
+
+        Args:
+            name: Name of the service
+            lines: Number of lines (default: all lines kept in memory)
+
+        Returns:
+            Output lines, oldest first (empty if the service was not started)
+        """
+        return self._supervisor.tail(name, lines)
+
+    def get_service_log_path(self, name: str) -> Path:
+        """Get the log file that a local service's output is written to."""
+        return self._supervisor.log_path(name)
 
     def _get_docker_compose_cmd(self) -> list[str] | None:
         """Get the docker-compose command (v1 or v2)."""
@@ -417,45 +440,54 @@ class ServiceOrchestrator:
 
         return None
 
-    def _wait_for_health(self, timeout: int) -> bool:
+    def _wait_for_health(
+        self, timeout: int, result: OrchestrationResult | None = None
+    ) -> bool:
         """
         Wait for all services to become healthy.
 
+        All services are probed concurrently (see services.health).
+
         Args:
             timeout: Maximum time to wait in seconds
+            result: If given, receives per-service time-to-ready, and the
+                services that never became healthy with the reason
 
         Returns:
             True if all services became healthy
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            all_healthy = True
-
-            for service in self._services:
-                if service.port:
-                    if not self._check_port(service.port):
-                        all_healthy = False
-                        break
-
-            if all_healthy:
-                return True
+        health = self._run_health_checks(timeout)
+
+        if result is not None:
+            for service in health:
+                if service.ready:
+                    result.time_to_ready[service.name] = service.time_to_ready
+                else:
+                    if service.name not in result.services_failed:
+                        result.services_failed.append(service.name)
+                    result.errors.append(
+                        f"{service.name} not healthy after {service.attempts} "
+                        f"checks: {service.last_error}"
+                    )
 
-            time.sleep(2)
+        return all(service.ready for service in health)
 
-        return False
+    def _run_health_checks(self, timeout: int) -> list[ServiceHealth]:
+        """Run the async readiness checks from synchronous code."""
 
-    def _check_port(self, port: int) -> bool:
-        """Check if a port is responding."""
-        import socket
+        def run() -> list[ServiceHealth]:
+            return asyncio.run(wait_for_services(self._services, timeout))
 
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                result = s.connect_ex(("localhost", port))
-                return result == 0
-        except Exception:
-            return False
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop and loop.is_running():
+            # Already in an async context - run in a new thread
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                return pool.submit(run).result()
+        return run()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert orchestration config to dictionary."""
@@ -578,12 +610,15 @@ def main() -> None:
                         "success": result.success,
                         "services_started": result.services_started,
                         "errors": result.errors,
+                        "time_to_ready": result.time_to_ready,
                     },
                     indent=2,
                 )
             )
         else:
             print(f"Started: {result.services_started}")
+            for name, seconds in result.time_to_ready.items():
+                print(f"  {name} ready after {seconds:.2f}s")
             if result.errors:
                 print(f"Errors: {result.errors}")
     elif args.stop:
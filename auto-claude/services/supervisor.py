@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Service Process Supervisor
+==========================
+
+Starts local (non-docker) services and captures their output.
+
+Each service runs with stdout and stderr merged into one pipe that a
+background thread drains continuously, so a chatty dev server can never
+block on a full pipe buffer. Output goes to a size-rotated log file per
+service and to a bounded in-memory tail that the QA agent can read without
+touching the disk.
+
+Usage:
+    from services.supervisor import ProcessSupervisor
+
+    supervisor = ProcessSupervisor(project_dir / ".auto-claude" / "service_logs")
+    supervisor.start_all([("api", "npm run dev", project_dir / "api")])
+    print("\\n".join(supervisor.tail("api", 20)))
+    supervisor.stop_all()
+"""
+
+import functools
+import os
+import re
+import signal
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Rotate a service log once it reaches this size; keep this many old files
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 2
+
+# Lines of output kept in memory per service
+TAIL_LINES = 200
+
+# Longest line kept in the tail (longer lines are truncated there, not in the log)
+TAIL_LINE_CHARS = 2000
+
+# Largest single read from a service's pipe (bounds memory for huge lines)
+READ_CHUNK = 64 * 1024
+
+
+class RotatingLog:
+    """Append-only log file that rotates to name.1, name.2, ... by size."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = LOG_MAX_BYTES,
+        backup_count: int = LOG_BACKUP_COUNT,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+
+    def write(self, data: bytes) -> None:
+        """Append data, rotating first if it would exceed max_bytes."""
+        if self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _rotate(self) -> None:
+        self._file.close()
+        for index in range(self.backup_count, 0, -1):
+            source = (
+                self.path
+                if index == 1
+                else self.path.with_name(f"{self.path.name}.{index - 1}")
+            )
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index}"))
+        if self.backup_count == 0:
+            self.path.unlink(missing_ok=True)
+        self._file = open(self.path, "ab")
+        self._size = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SupervisedProcess:
+    """
+    A running service and the thread draining its output.
+
+    Attributes:
+        name: Name of the service
+        process: The child process
+        log_path: File the output is written to
+    """
+
+    def __init__(
+        self,
+        name: str,
+        process: subprocess.Popen,
+        log: RotatingLog,
+        tail_lines: int = TAIL_LINES,
+    ) -> None:
+        self.name = name
+        self.process = process
+        self.log_path = log.path
+        self._log = log
+        self._tail: deque[str] = deque(maxlen=tail_lines)
+        self._lock = threading.Lock()
+        self._drainer = threading.Thread(
+            target=self._drain, name=f"service-log-{name}", daemon=True
+        )
+        self._drainer.start()
+
+    def _drain(self) -> None:
+        """Copy the child's output to the log and the tail until EOF."""
+        try:
+            read = functools.partial(self.process.stdout.readline, READ_CHUNK)
+            for line in iter(read, b""):
+                self._log.write(line)
+                text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                with self._lock:
+                    self._tail.append(text[:TAIL_LINE_CHARS])
+        except (OSError, ValueError):
+            pass  # Pipe closed while stopping
+        finally:
+            self._log.close()
+
+    def tail(self, lines: int | None = None) -> list[str]:
+        """Most recent output lines (all kept lines if lines is None)."""
+        with self._lock:
+            kept = list(self._tail)
+        return kept if lines is None else kept[-lines:]
+
+    @property
+    def returncode(self) -> int | None:
+        """Exit code, or None while the service is running."""
+        return self.process.poll()
+
+    def _signal(self, kill: bool) -> None:
+        """Signal the service's whole process group (the shell and its children)."""
+        if os.name == "posix":
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+                return
+            except (ProcessLookupError, PermissionError):
+                pass
+        if kill:
+            self.process.kill()
+        else:
+            self.process.terminate()
+
+    def stop(self, timeout: float = 10) -> None:
+        """Terminate the service (kill it after timeout) and finish draining."""
+        try:
+            self._signal(kill=False)
+            self.process.wait(timeout=timeout)
+        except Exception:
+            try:
+                self._signal(kill=True)
+                self.process.wait(timeout=timeout)
+            except Exception:
+                pass
+        # Stray processes outside the group may keep the pipe open
+        self._drainer.join(timeout=2)
+
+
+class ProcessSupervisor:
+    """
+    Starts services concurrently and keeps their output drained.
+
+    Not tied to an event loop: services outlive any single asyncio.run(),
+    so each one gets a daemon thread that reads its pipe.
+    """
+
+    def __init__(self, log_dir: Path, tail_lines: int = TAIL_LINES) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            log_dir: Directory for the per-service log files
+            tail_lines: Lines of output kept in memory per service
+        """
+        self.log_dir = Path(log_dir)
+        self.tail_lines = tail_lines
+        self._services: dict[str, SupervisedProcess] = {}
+
+    def log_path(self, name: str) -> Path:
+        """Log file of a service."""
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+        return self.log_dir / f"{safe_name}.log"
+
+    def start(self, name: str, command: str, cwd: Path) -> SupervisedProcess:
+        """
+        Start a service.
+
+        Args:
+            name: Name of the service
+            command: Shell command that starts it
+            cwd: Working directory
+
+        Returns:
+            The supervised process
+
+        Raises:
+            OSError: If the process or its log file could not be created
+        """
+        log = RotatingLog(self.log_path(name))
+        try:
+            process = subprocess.Popen(
+                command,
+                shell=True,
+                cwd=cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                # Own process group, so stopping also reaches the shell's children
+                start_new_session=os.name == "posix",
+            )
+        except Exception:
+            log.close()
+            raise
+        supervised = SupervisedProcess(name, process, log, self.tail_lines)
+        self._services[name] = supervised
+        return supervised
+
+    def start_all(
+        self, commands: list[tuple[str, str, Path]]
+    ) -> dict[str, Exception | None]:
+        """
+        Start several services concurrently.
+
+        Args:
+            commands: (name, command, cwd) per service
+
+        Returns:
+            Mapping of service name to None if it started, or the error
+        """
+        if not commands:
+            return {}
+
+        def start(entry: tuple[str, str, Path]) -> Exception | None:
+            try:
+                self.start(*entry)
+            except Exception as e:
+                return e
+            return None
+
+        with ThreadPoolExecutor(max_workers=min(8, len(commands))) as pool:
+            errors = list(pool.map(start, commands))
+        return {name: error for (name, _, _), error in zip(commands, errors)}
+
+    def get(self, name: str) -> SupervisedProcess | None:
+        """Get a supervised service by name."""
+        return self._services.get(name)
+
+    def tail(self, name: str, lines: int | None = None) -> list[str]:
+        """Most recent output lines of a service (empty if unknown)."""
+        service = self._services.get(name)
+        return service.tail(lines) if service else []
+
+    def stop_all(self, timeout: float = 10) -> None:
+        """Stop all services concurrently."""
+        services = list(self._services.values())
+        if services:
+            with ThreadPoolExecutor(max_workers=min(8, len(services))) as pool:
+                list(pool.map(lambda s: s.stop(timeout), services))
+        self._services.clear()
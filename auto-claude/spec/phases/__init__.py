@@ -5,7 +5,7 @@ Phase Execution Module
 Individual phase implementations for spec creation pipeline.
 
 This module is organized into several submodules for better maintainability:
-- models: PhaseResult dataclass and constants
+- models: PhaseResult dataclass, phase inputs/outputs and constants
 - discovery_phases: Project discovery and context gathering
 - requirements_phases: Requirements, historical context, and research
 - spec_phases: Spec writing and self-critique
@@ -14,6 +14,6 @@ This module is organized into several submodules for better maintainability:
 """
 
 from .executor import PhaseExecutor
-from .models import MAX_RETRIES, PhaseResult
+from .models import MAX_RETRIES, PHASE_SPECS, PhaseResult, PhaseSpec
 
-__all__ = ["PhaseExecutor", "PhaseResult", "MAX_RETRIES"]
+__all__ = ["PhaseExecutor", "PhaseResult", "PhaseSpec", "PHASE_SPECS", "MAX_RETRIES"]
@@ -5,6 +5,7 @@ Discovery and Context Phase Implementations
 Phases for project discovery and context gathering.
 """
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from task_logger import LogEntryType, LogPhase
@@ -27,7 +28,10 @@ class DiscoveryPhaseMixin:
         for attempt in range(MAX_RETRIES):
             retries = attempt
 
-            success, output = discovery.run_discovery_script(
+            # Blocking subprocess; run it off the event loop so that phases
+            # scheduled alongside this one keep making progress
+            success, output = await asyncio.to_thread(
+                discovery.run_discovery_script,
                 self.project_dir,
                 self.spec_dir,
             )
@@ -79,7 +83,8 @@ class DiscoveryPhaseMixin:
                 f"Running context discovery (attempt {attempt + 1})...", "progress"
             )
 
-            success, output = context.run_context_discovery(
+            success, output = await asyncio.to_thread(
+                context.run_context_discovery,
                 self.project_dir,
                 self.spec_dir,
                 task or "unknown task",
@@ -21,3 +21,85 @@ class PhaseResult:
 
 # Maximum retry attempts for phase execution
 MAX_RETRIES = 3
+
+
+@dataclass(frozen=True)
+class PhaseSpec:
+    """Files (in the spec directory) a phase reads and writes."""
+
+    name: str
+    inputs: frozenset[str] = frozenset()
+    outputs: frozenset[str] = frozenset()
+
+
+def _spec(name: str, inputs: tuple[str, ...], outputs: tuple[str, ...]) -> PhaseSpec:
+    return PhaseSpec(name, frozenset(inputs), frozenset(outputs))
+
+
+# Declared inputs and outputs of every phase. The pipeline derives phase
+# dependencies from these, so a phase that starts reading another phase's
+# files must list them here.
+PHASE_SPECS: dict[str, PhaseSpec] = {
+    spec.name: spec
+    for spec in (
+        _spec("discovery", (), ("project_index.json",)),
+        _spec("requirements", (), ("requirements.json",)),
+        _spec(
+            "complexity_assessment",
+            ("requirements.json", "project_index.json"),
+            ("complexity_assessment.json",),
+        ),
+        _spec("historical_context", ("requirements.json",), ("graph_hints.json",)),
+        _spec("research", ("requirements.json",), ("research.json",)),
+        _spec(
+            "context", ("requirements.json", "project_index.json"), ("context.json",)
+        ),
+        _spec(
+            "spec_writing",
+            (
+                "requirements.json",
+                "project_index.json",
+                "context.json",
+                "research.json",
+                "graph_hints.json",
+            ),
+            ("spec.md",),
+        ),
+        _spec(
+            "quick_spec",
+            ("requirements.json", "project_index.json", "graph_hints.json"),
+            ("spec.md", "implementation_plan.json"),
+        ),
+        _spec(
+            "self_critique",
+            ("spec.md", "research.json"),
+            ("spec.md", "critique_report.json"),
+        ),
+        _spec(
+            "planning",
+            ("spec.md", "requirements.json", "project_index.json", "context.json"),
+            ("implementation_plan.json",),
+        ),
+        _spec(
+            "validation",
+            (
+                "project_index.json",
+                "requirements.json",
+                "complexity_assessment.json",
+                "graph_hints.json",
+                "research.json",
+                "context.json",
+                "spec.md",
+                "critique_report.json",
+                "implementation_plan.json",
+            ),
+            # The auto-fix agent may rewrite any of the validated files
+            (
+                "requirements.json",
+                "context.json",
+                "spec.md",
+                "implementation_plan.json",
+            ),
+        ),
+    )
+}
@@ -5,7 +5,9 @@ Spec Orchestrator
 Main orchestration logic for spec creation with dynamic complexity adaptation.
 """
 
+import asyncio
 import json
+import time
 from collections.abc import Callable
 from pathlib import Path
 
@@ -44,6 +46,7 @@ from .models import (
     get_specs_dir,
     rename_spec_dir_from_requirements,
 )
+from .scheduler import PhaseScheduler, ScheduleResult
 
 
 class SpecOrchestrator:
@@ -111,6 +114,15 @@ class SpecOrchestrator:
         # Stores summaries from completed phases to provide context to subsequent phases
         self._phase_summaries: dict[str, str] = {}
 
+        # Summaries still being generated in the background, in phase order
+        self._pending_summaries: dict[str, asyncio.Task] = {}
+
+        # Seconds spent generating summaries, and spent waiting for them
+        self._summary_seconds = 0.0
+        self._summary_wait_seconds = 0.0
+        self._summary_waiters = 0
+        self._summary_wait_started = 0.0
+
     def _get_agent_runner(self) -> AgentRunner:
         """Get or create the agent runner.
 
@@ -148,6 +160,7 @@ class SpecOrchestrator:
         thinking_budget = get_thinking_budget(self.thinking_level)
 
         # Format prior phase summaries for context
+        await self._collect_phase_summaries()
         prior_summaries = format_phase_summaries(self._phase_summaries)
 
         return await runner.run_agent(
@@ -158,8 +171,12 @@ class SpecOrchestrator:
             prior_phase_summaries=prior_summaries if prior_summaries else None,
         )
 
-    async def _store_phase_summary(self, phase_name: str) -> None:
-        """Summarize and store phase output for subsequent phases.
+    def _start_phase_summary(self, phase_name: str) -> None:
+        """Start summarizing a completed phase in the background.
+
+        The phase's output files are read now, before later phases can change
+        them. The summary itself is generated while the next phase runs, and
+        is only awaited when an agent needs the prior phase summaries.
 
         Args:
             phase_name: Name of the completed phase
@@ -167,23 +184,75 @@ class SpecOrchestrator:
         try:
             # Gather outputs from this phase
             phase_output = gather_phase_outputs(self.spec_dir, phase_name)
-            if not phase_output:
-                return
+        except Exception as e:
+            print_status(f"Phase summarization skipped: {e}", "warning")
+            return
+        if not phase_output:
+            return
+
+        self._pending_summaries[phase_name] = asyncio.create_task(
+            self._summarize_phase(phase_name, phase_output)
+        )
 
-            # Summarize the output
-            summary = await summarize_phase_output(
+    async def _summarize_phase(self, phase_name: str, phase_output: str) -> str:
+        """Summarize phase output, timing the summarization.
+
+        Args:
+            phase_name: Name of the completed phase
+            phase_output: Output files of the phase
+
+        Returns:
+            The summary, or an empty string if summarization failed
+        """
+        started = time.monotonic()
+        try:
+            return await summarize_phase_output(
                 phase_name,
                 phase_output,
                 model="claude-sonnet-4-5-20250929",  # Use Sonnet for efficiency
                 target_words=500,
             )
-
-            if summary:
-                self._phase_summaries[phase_name] = summary
-
         except Exception as e:
             # Don't fail the pipeline if summarization fails
             print_status(f"Phase summarization skipped: {e}", "warning")
+            return ""
+        finally:
+            self._summary_seconds += time.monotonic() - started
+
+    async def _collect_phase_summaries(self) -> None:
+        """Wait for background summaries and store them for subsequent phases."""
+        if not self._pending_summaries:
+            return
+
+        # Concurrent phases may wait at the same time; count that time once
+        if self._summary_waiters == 0:
+            self._summary_wait_started = time.monotonic()
+        self._summary_waiters += 1
+        try:
+            # Whoever resumes first stores a summary, in phase order
+            for phase_name, task in list(self._pending_summaries.items()):
+                summary = await task
+                if self._pending_summaries.pop(phase_name, None) and summary:
+                    self._phase_summaries[phase_name] = summary
+        finally:
+            self._summary_waiters -= 1
+            if self._summary_waiters == 0:
+                self._summary_wait_seconds += (
+                    time.monotonic() - self._summary_wait_started
+                )
+
+    async def _discard_phase_summaries(self) -> None:
+        """Cancel summaries no later phase will read."""
+        tasks = list(self._pending_summaries.values())
+        self._pending_summaries.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @property
+    def summary_time_saved(self) -> float:
+        """Seconds of summarization that overlapped with later phases."""
+        return max(0.0, self._summary_seconds - self._summary_wait_seconds)
 
     async def _ensure_fresh_project_index(self) -> None:
         """Ensure project_index.json is up-to-date before spec creation.
@@ -225,6 +294,14 @@ class SpecOrchestrator:
         Returns:
             True if spec creation and review completed successfully, False otherwise
         """
+        try:
+            return await self._run_phases(interactive, auto_approve)
+        finally:
+            # A failed phase leaves summaries running that nothing will read
+            await self._discard_phase_summaries()
+
+    async def _run_phases(self, interactive: bool, auto_approve: bool) -> bool:
+        """Run the spec creation phases (see run())."""
         # Import UI module for use in phases
         import ui
 
@@ -289,8 +366,8 @@ class SpecOrchestrator:
                 LogPhase.PLANNING, success=False, message="Discovery failed"
             )
             return False
-        # Store summary for subsequent phases (compaction)
-        await self._store_phase_summary("discovery")
+        # Summarize for subsequent phases (compaction), overlapping the next phase
+        self._start_phase_summary("discovery")
 
         # === PHASE 2: REQUIREMENTS GATHERING ===
         result = await run_phase(
@@ -305,8 +382,8 @@ class SpecOrchestrator:
                 message="Requirements gathering failed",
             )
             return False
-        # Store summary for subsequent phases (compaction)
-        await self._store_phase_summary("requirements")
+        # Summarize for subsequent phases (compaction), overlapping the next phase
+        self._start_phase_summary("requirements")
 
         # Rename spec folder with better name from requirements
         rename_spec_dir_from_requirements(self.spec_dir)
@@ -360,45 +437,59 @@ class SpecOrchestrator:
         print()
 
         phases_executed = ["discovery", "requirements", "complexity_assessment"]
+        runnable = []
         for phase_name in phases_to_run:
             if phase_name not in all_phases:
                 print_status(f"Unknown phase: {phase_name}, skipping", "warning")
                 continue
+            runnable.append(phase_name)
 
-            result = await run_phase(phase_name, all_phases[phase_name])
-            results.append(result)
-            phases_executed.append(phase_name)
-
-            # Store summary for subsequent phases (compaction)
+        def phase_done(result: phases.PhaseResult) -> None:
+            # Summarize for subsequent phases (compaction), overlapping the next phase
             if result.success:
-                await self._store_phase_summary(phase_name)
-
-            if not result.success:
+                self._start_phase_summary(result.phase)
+
+        # Independent phases (e.g. historical_context, research, context) run
+        # concurrently; each phase starts once the phases it depends on succeed
+        schedule = await PhaseScheduler(
+            runnable,
+            lambda name: run_phase(name, all_phases[name]),
+            on_phase_done=phase_done,
+        ).run()
+        results.extend(schedule.results)
+        phases_executed.extend(r.phase for r in schedule.results)
+
+        if not schedule.success:
+            for result in schedule.results:
+                if result.success:
+                    continue
                 print()
                 print_status(
-                    f"Phase '{phase_name}' failed after {result.retries} retries",
+                    f"Phase '{result.phase}' failed after {result.retries} retries",
                     "error",
                 )
                 print(f"  {muted('Errors:')}")
                 for err in result.errors:
                     print(f"    {icon(Icons.ARROW_RIGHT)} {err}")
-                print()
-                print_status(
-                    "Spec creation incomplete. Fix errors and retry.", "warning"
-                )
                 task_logger.log(
-                    f"Phase '{phase_name}' failed: {'; '.join(result.errors)}",
+                    f"Phase '{result.phase}' failed: {'; '.join(result.errors)}",
                     LogEntryType.ERROR,
                 )
-                task_logger.end_phase(
-                    LogPhase.PLANNING,
-                    success=False,
-                    message=f"Phase {phase_name} failed",
-                )
-                return False
+            if schedule.skipped:
+                print()
+                print(f"  {muted('Not run:')} {', '.join(schedule.skipped)}")
+            print()
+            print_status("Spec creation incomplete. Fix errors and retry.", "warning")
+            task_logger.end_phase(
+                LogPhase.PLANNING,
+                success=False,
+                message=f"Phase {', '.join(schedule.failed)} failed",
+            )
+            return False
 
-        # Summary
-        self._print_completion_summary(results, phases_executed)
+        # Summary (no phase is left to read a pending phase summary)
+        await self._discard_phase_summaries()
+        self._print_completion_summary(results, phases_executed, schedule)
 
         # End planning phase successfully
         task_logger.end_phase(
@@ -585,24 +676,41 @@ class SpecOrchestrator:
         return analyzer.analyze(self.task_description or "")
 
     def _print_completion_summary(
-        self, results: list[phases.PhaseResult], phases_executed: list[str]
+        self,
+        results: list[phases.PhaseResult],
+        phases_executed: list[str],
+        schedule: ScheduleResult | None = None,
     ) -> None:
         """Print the completion summary.
 
         Args:
             results: List of phase results
             phases_executed: List of executed phase names
+            schedule: Outcome of the scheduled (post-assessment) phases
         """
         files_created = []
         for r in results:
             for f in r.output_files:
                 files_created.append(Path(f).name)
 
+        summary_line = ""
+        if schedule and schedule.phase_seconds - schedule.elapsed >= 0.1:
+            summary_line += (
+                f"Phase time: {schedule.elapsed:.1f}s "
+                f"({schedule.phase_seconds:.1f}s if run one at a time)\n"
+            )
+        if self._summary_seconds:
+            summary_line += (
+                f"Phase summaries: {self._summary_seconds:.1f}s, "
+                f"{self.summary_time_saved:.1f}s overlapped with later phases\n"
+            )
+
         print(
             box(
                 f"Complexity: {self.assessment.complexity.value.upper()}\n"
                 f"Phases run: {len(phases_executed) + 1}\n"
-                f"Spec saved to: {self.spec_dir}\n\n"
+                + summary_line
+                + f"Spec saved to: {self.spec_dir}\n\n"
                 f"Files created:\n"
                 + "\n".join(f"  {icon(Icons.SUCCESS)} {f}" for f in files_created),
                 title=f"{icon(Icons.SUCCESS)} SPEC CREATION COMPLETE",
@@ -0,0 +1,196 @@
+"""
+Phase Scheduler
+===============
+
+Runs spec phases as a dependency graph instead of a flat list.
+
+Dependencies are derived from the files each phase declares it reads and
+writes (see phases.PHASE_SPECS), respecting the order the phases were
+planned in: a phase waits for every earlier phase that writes a file it
+reads, reads a file it writes, or writes the same file. Phases with no
+such conflict (historical_context, research and context, which only read
+requirements.json) run concurrently, up to a concurrency limit.
+
+A phase that raises is retried; a phase that fails stops the schedule:
+nothing new is started, running phases finish, and every phase that had
+not started yet is reported as skipped.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from .. import phases
+
+# Default number of phases run at once
+DEFAULT_PHASE_CONCURRENCY = 3
+
+# Extra attempts for a phase that raised (failed results are not retried:
+# phases already retry internally and return a failed result at the end)
+PHASE_EXCEPTION_RETRIES = 1
+
+
+def get_phase_concurrency() -> int:
+    """Maximum number of concurrent spec phases (at least 1)."""
+    try:
+        return max(
+            1,
+            int(
+                os.environ.get(
+                    "AUTO_CLAUDE_SPEC_PHASE_CONCURRENCY", DEFAULT_PHASE_CONCURRENCY
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_PHASE_CONCURRENCY
+
+
+def phase_dependencies(phase_names: list[str]) -> dict[str, set[str]]:
+    """
+    Derive the dependencies of planned phases from their declared files.
+
+    Phases without a declaration are treated as reading and writing
+    everything, so they run alone, after all earlier phases.
+
+    Args:
+        phase_names: Phases in planned order
+
+    Returns:
+        Mapping of each phase to the earlier phases it must wait for
+    """
+    dependencies: dict[str, set[str]] = {}
+    for index, name in enumerate(phase_names):
+        spec = phases.PHASE_SPECS.get(name)
+        dependencies[name] = set()
+        for earlier in phase_names[:index]:
+            earlier_spec = phases.PHASE_SPECS.get(earlier)
+            if (
+                spec is None
+                or earlier_spec is None
+                or spec.inputs & earlier_spec.outputs
+                or spec.outputs & (earlier_spec.inputs | earlier_spec.outputs)
+            ):
+                dependencies[name].add(earlier)
+    return dependencies
+
+
+@dataclass
+class ScheduleResult:
+    """
+    Outcome of a phase schedule.
+
+    Attributes:
+        results: Results of the phases that ran, in planned order
+        failed: Phases that failed
+        skipped: Phases not started because another phase failed
+        elapsed: Wall-clock seconds of the schedule
+        phase_seconds: Sum of the durations of all phases that ran
+    """
+
+    results: list[phases.PhaseResult] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+    phase_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed and not self.skipped
+
+
+class PhaseScheduler:
+    """Runs phases concurrently as their dependencies complete."""
+
+    def __init__(
+        self,
+        phase_names: list[str],
+        run_phase: Callable[[str], Awaitable[phases.PhaseResult]],
+        max_concurrency: int | None = None,
+        retries: int = PHASE_EXCEPTION_RETRIES,
+        on_phase_done: Callable[[phases.PhaseResult], None] | None = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            phase_names: Phases in planned order
+            run_phase: Starts a phase by name and returns its result
+            max_concurrency: Maximum phases run at once
+                (default: get_phase_concurrency())
+            retries: Extra attempts for a phase that raises
+            on_phase_done: Called with each result as soon as its phase ends
+        """
+        self.phase_names = list(phase_names)
+        self.dependencies = phase_dependencies(self.phase_names)
+        self.run_phase = run_phase
+        self.max_concurrency = max_concurrency or get_phase_concurrency()
+        self.retries = retries
+        self.on_phase_done = on_phase_done
+
+    async def _run_one(self, name: str) -> tuple[phases.PhaseResult, float]:
+        """Run a phase, retrying exceptions. Returns the result and its duration."""
+        started = time.monotonic()
+        errors = []
+        for attempt in range(self.retries + 1):
+            try:
+                result = await self.run_phase(name)
+                return result, time.monotonic() - started
+            except Exception as e:
+                errors.append(f"Attempt {attempt + 1}: {type(e).__name__}: {e}")
+        return (
+            phases.PhaseResult(name, False, [], errors, self.retries),
+            time.monotonic() - started,
+        )
+
+    async def run(self) -> ScheduleResult:
+        """
+        Run all phases.
+
+        Returns:
+            ScheduleResult of the schedule
+        """
+        started = time.monotonic()
+        schedule = ScheduleResult()
+        results: dict[str, phases.PhaseResult] = {}
+        waiting = list(self.phase_names)
+        running: dict[asyncio.Task, str] = {}
+        completed: set[str] = set()
+
+        try:
+            while True:
+                if not schedule.failed:
+                    for name in list(waiting):
+                        if len(running) >= self.max_concurrency:
+                            break
+                        if self.dependencies[name] <= completed:
+                            waiting.remove(name)
+                            running[asyncio.create_task(self._run_one(name))] = name
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = running.pop(task)
+                    result, duration = task.result()
+                    results[name] = result
+                    schedule.phase_seconds += duration
+                    if result.success:
+                        completed.add(name)
+                    else:
+                        schedule.failed.append(name)
+                    if self.on_phase_done:
+                        self.on_phase_done(result)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        schedule.results = [results[n] for n in self.phase_names if n in results]
+        schedule.skipped = waiting
+        schedule.elapsed = time.monotonic() - started
+        return schedule
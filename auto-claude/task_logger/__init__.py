@@ -8,7 +8,8 @@ Logs are organized by phase (planning, coding, validation) and stored in the spe
 Key features:
 - Phase-based log organization (collapsible in UI)
 - Streaming markers for real-time UI updates
-- Persistent storage in JSON format for easy frontend consumption
+- Persistent storage in JSON format for easy frontend consumption, with an
+  append-only journal so each log write costs O(1)
 - Tool usage tracking with start/end markers
 """
 
@@ -21,7 +22,7 @@ from .logger import TaskLogger
 from .models import LogEntry, LogEntryType, LogPhase, PhaseLog
 
 # Export storage utilities
-from .storage import get_active_phase, load_task_logs
+from .storage import TaskLogReader, get_active_phase, load_task_logs
 
 # Export utility functions
 from .utils import clear_task_logger, get_task_logger, update_task_logger_path
@@ -37,6 +38,7 @@ __all__ = [
     # Storage utilities
     "load_task_logs",
     "get_active_phase",
+    "TaskLogReader",
     # Utility functions
     "get_task_logger",
     "clear_task_logger",
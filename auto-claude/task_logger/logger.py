@@ -2,6 +2,9 @@
 Main TaskLogger class for logging task execution.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -11,6 +14,12 @@ from .models import LogEntry, LogEntryType, LogPhase
 from .storage import LogStorage
 from .streaming import emit_marker
 
+# (session, subtask) of the agent session running in the current asyncio task.
+# Concurrent sessions each set their own, so entries keep the right labels.
+_session_scope: ContextVar[tuple[int | None, str | None] | None] = ContextVar(
+    "task_log_session_scope", default=None
+)
+
 
 class TaskLogger:
     """
@@ -43,8 +52,8 @@ class TaskLogger:
         self.log_file = self.spec_dir / self.LOG_FILE
         self.emit_markers = emit_markers
         self.current_phase: LogPhase | None = None
-        self.current_session: int | None = None
-        self.current_subtask: str | None = None
+        self._session: int | None = None
+        self._subtask: str | None = None
         self.storage = LogStorage(spec_dir)
 
     @property
@@ -111,13 +120,41 @@ class TaskLogger:
         else:
             debug(module, message, **kwargs)
 
+    @property
+    def current_session(self) -> int | None:
+        scope = _session_scope.get()
+        return scope[0] if scope else self._session
+
+    @property
+    def current_subtask(self) -> str | None:
+        scope = _session_scope.get()
+        return scope[1] if scope else self._subtask
+
     def set_session(self, session: int) -> None:
         """Set the current session number."""
-        self.current_session = session
+        self._session = session
 
     def set_subtask(self, subtask_id: str | None) -> None:
         """Set the current subtask being processed."""
-        self.current_subtask = subtask_id
+        self._subtask = subtask_id
+
+    @contextmanager
+    def session_scope(self, session: int, subtask_id: str | None) -> Iterator[None]:
+        """
+        Label entries logged by the current asyncio task (or thread).
+
+        Use this instead of set_session()/set_subtask() when several agent
+        sessions run concurrently.
+
+        Args:
+            session: Session number
+            subtask_id: Subtask the session works on
+        """
+        token = _session_scope.set((session, subtask_id))
+        try:
+            yield
+        finally:
+            _session_scope.reset(token)
 
     def start_phase(self, phase: LogPhase, message: str | None = None) -> None:
         """
@@ -532,4 +569,5 @@ class TaskLogger:
 
     def clear(self) -> None:
         """Clear all logs (useful for testing)."""
+        self.storage.close()
         self.storage = LogStorage(self.spec_dir)
@@ -1,21 +1,97 @@
 """
 Storage functionality for task logs.
+
+Logs live in two files in the spec directory:
+
+- ``task_logs.json``: a compacted snapshot in the shape the UI has always read
+- ``task_logs.jsonl``: an append-only journal of changes made since the snapshot
+
+Each log call appends one sequence-numbered record to the journal, so writes
+cost the same no matter how long the log already is. The journal is folded
+back into the snapshot when a phase ends and whenever it grows larger than
+the snapshot itself, which keeps the amortized cost of compaction constant
+per record. Readers replay journal records newer than the snapshot's
+``log_seq``, and ``TaskLogReader`` does so incrementally between polls.
 """
 
 import json
 import os
 import sys
 import tempfile
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .models import LogEntry, LogPhase
 
+# fsync the journal after this many unsynced records...
+FSYNC_BATCH = 64
+
+# ...or when this many seconds have passed since the last fsync
+FSYNC_INTERVAL = 1.0
+
+# The journal is compacted once it outgrows the snapshot (and this floor)
+COMPACT_MIN_BYTES = 1024 * 1024
+
+
+def _empty_phase(phase: str) -> dict:
+    return {
+        "phase": phase,
+        "status": "pending",
+        "started_at": None,
+        "completed_at": None,
+        "entries": [],
+    }
+
+
+def apply_log_record(data: dict, record: dict) -> None:
+    """
+    Apply one journal record to a logs dictionary in place.
+
+    Args:
+        data: Logs dictionary in the task_logs.json shape
+        record: Journal record with "seq", "ts" and "op" keys
+    """
+    op = record.get("op")
+    phases = data.setdefault("phases", {})
+
+    if op == "entry":
+        entry = record["entry"]
+        phase_key = entry.get("phase")
+        if phase_key not in phases:
+            phases[phase_key] = _empty_phase(phase_key)
+        phases[phase_key]["entries"].append(entry)
+    elif op == "phase":
+        phase_key = record["phase"]
+        if phase_key not in phases:
+            phases[phase_key] = _empty_phase(phase_key)
+        for field in ("status", "started_at", "completed_at"):
+            if field in record:
+                phases[phase_key][field] = record[field]
+    elif op == "spec_id":
+        data["spec_id"] = record["spec_id"]
+
+    data["log_seq"] = record["seq"]
+    if record.get("ts"):
+        data["updated_at"] = record["ts"]
+
+
+def _parse_record(line: bytes) -> dict | None:
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(record, dict) or not isinstance(record.get("seq"), int):
+        return None
+    return record
+
 
 class LogStorage:
     """Handles persistent storage of task logs."""
 
     LOG_FILE = "task_logs.json"
+    JOURNAL_FILE = "task_logs.jsonl"
 
     def __init__(self, spec_dir: Path):
         """
@@ -26,68 +102,164 @@ class LogStorage:
         """
         self.spec_dir = Path(spec_dir)
         self.log_file = self.spec_dir / self.LOG_FILE
+        self.journal_file = self.spec_dir / self.JOURNAL_FILE
+        self._lock = threading.RLock()
+        self._journal = None
+        self._journal_bytes = 0
+        self._snapshot_bytes = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._has_snapshot = False
         self._data: dict = self._load_or_create()
+        self._seq: int = self._data.get("log_seq", 0)
+
+        # Fold records left by a previous run into the snapshot, so appends
+        # never follow a partially written line
+        if self._journal_bytes:
+            self.save()
 
     def _load_or_create(self) -> dict:
         """Load existing logs or create new structure."""
-        if self.log_file.exists():
-            try:
-                with open(self.log_file, encoding="utf-8") as f:
-                    return json.load(f)
-            except (OSError, json.JSONDecodeError):
-                pass
+        reader = TaskLogReader(self.spec_dir)
+        data = reader.read()
+        if data is not None:
+            self._journal_bytes = reader.offset
+            self._has_snapshot = True
+            self._snapshot_bytes = reader.snapshot_size
+            return data
 
         return {
             "spec_id": self.spec_dir.name,
             "created_at": self._timestamp(),
             "updated_at": self._timestamp(),
+            "log_seq": 0,
             "phases": {
-                LogPhase.PLANNING.value: {
-                    "phase": LogPhase.PLANNING.value,
-                    "status": "pending",
-                    "started_at": None,
-                    "completed_at": None,
-                    "entries": [],
-                },
-                LogPhase.CODING.value: {
-                    "phase": LogPhase.CODING.value,
-                    "status": "pending",
-                    "started_at": None,
-                    "completed_at": None,
-                    "entries": [],
-                },
-                LogPhase.VALIDATION.value: {
-                    "phase": LogPhase.VALIDATION.value,
-                    "status": "pending",
-                    "started_at": None,
-                    "completed_at": None,
-                    "entries": [],
-                },
+                phase.value: _empty_phase(phase.value)
+                for phase in (LogPhase.PLANNING, LogPhase.CODING, LogPhase.VALIDATION)
             },
         }
 
     def save(self) -> None:
-        """Save logs to file atomically to prevent corruption from concurrent reads."""
-        self._data["updated_at"] = self._timestamp()
-        try:
-            self.spec_dir.mkdir(parents=True, exist_ok=True)
-            # Write to temp file first, then atomic rename to prevent corruption
-            # when the UI reads mid-write
-            fd, tmp_path = tempfile.mkstemp(
-                dir=self.spec_dir, prefix=".task_logs_", suffix=".tmp"
-            )
+        """
+        Compact the journal into task_logs.json.
+
+        The snapshot is written atomically (temp file + rename) so readers
+        never see a partial file, then the journal it now contains is removed.
+        """
+        with self._lock:
+            self._data["updated_at"] = self._timestamp()
+            self._data["log_seq"] = self._seq
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(self._data, f, indent=2, ensure_ascii=False)
-                # Atomic rename (on POSIX systems, rename is atomic)
-                os.replace(tmp_path, self.log_file)
-            except Exception:
-                # Clean up temp file on failure
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-                raise
-        except OSError as e:
-            print(f"Warning: Failed to save task logs: {e}", file=sys.stderr)
+                self.spec_dir.mkdir(parents=True, exist_ok=True)
+                # Write to temp file first, then atomic rename to prevent corruption
+                # when the UI reads mid-write
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.spec_dir, prefix=".task_logs_", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(self._data, f, indent=2, ensure_ascii=False)
+                        f.flush()
+                        os.fsync(f.fileno())
+                        self._snapshot_bytes = f.tell()
+                    # Atomic rename (on POSIX systems, rename is atomic)
+                    os.replace(tmp_path, self.log_file)
+                    self._has_snapshot = True
+                except Exception:
+                    # Clean up temp file on failure
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+            except OSError as e:
+                print(f"Warning: Failed to save task logs: {e}", file=sys.stderr)
+                return
+
+            # Every journal record is now in the snapshot
+            self._close_journal()
+            try:
+                self.journal_file.unlink(missing_ok=True)
+            except OSError as e:
+                print(f"Warning: Failed to compact task logs: {e}", file=sys.stderr)
+            self._journal_bytes = 0
+
+    def _append(self, record: dict) -> None:
+        """Apply a change in memory and append it to the journal."""
+        with self._lock:
+            self._seq += 1
+            record = {"seq": self._seq, "ts": self._timestamp(), **record}
+            apply_log_record(self._data, record)
+
+            if not self._has_snapshot:
+                # First write: the snapshot carries created_at and the phases
+                self.save()
+                return
+
+            line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+            try:
+                if self._journal is None:
+                    self.spec_dir.mkdir(parents=True, exist_ok=True)
+                    self._journal = open(self.journal_file, "ab")
+                self._journal.write(line)
+                # Flush every record so readers see it; fsync in batches
+                self._journal.flush()
+                self._journal_bytes += len(line)
+                self._unsynced += 1
+                if (
+                    self._unsynced >= FSYNC_BATCH
+                    or time.monotonic() - self._last_sync >= FSYNC_INTERVAL
+                ):
+                    self._sync()
+            except OSError as e:
+                print(f"Warning: Failed to append task log: {e}", file=sys.stderr)
+
+            if self._journal_bytes >= max(COMPACT_MIN_BYTES, self._snapshot_bytes):
+                self.save()
+
+    def _sync(self) -> None:
+        if self._journal is not None and self._unsynced:
+            os.fsync(self._journal.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _close_journal(self) -> None:
+        if self._journal is None:
+            return
+        try:
+            self._journal.flush()
+            self._sync()
+        except OSError:
+            pass
+        finally:
+            self._journal.close()
+            self._journal = None
+
+    def flush(self) -> None:
+        """fsync journal records that are still only in the OS cache."""
+        with self._lock:
+            if self._journal is not None:
+                try:
+                    self._sync()
+                except OSError as e:
+                    print(f"Warning: Failed to sync task logs: {e}", file=sys.stderr)
+
+    def close(self) -> None:
+        """Sync and close the journal (the storage reopens it on the next write)."""
+        with self._lock:
+            self._close_journal()
+
+    def relocate(self, spec_dir: Path) -> None:
+        """
+        Point storage at a spec directory that was renamed on disk.
+
+        Args:
+            spec_dir: New path of the spec directory
+        """
+        with self._lock:
+            self._close_journal()
+            self.spec_dir = Path(spec_dir)
+            self.log_file = self.spec_dir / self.LOG_FILE
+            self.journal_file = self.spec_dir / self.JOURNAL_FILE
+            self._has_snapshot = self.log_file.exists()
 
     def _timestamp(self) -> str:
         """Get current timestamp in ISO format."""
@@ -100,19 +272,21 @@ class LogStorage:
         Args:
             entry: The log entry to add
         """
-        phase_key = entry.phase
-        if phase_key not in self._data["phases"]:
-            # Create phase if it doesn't exist
-            self._data["phases"][phase_key] = {
-                "phase": phase_key,
-                "status": "active",
-                "started_at": self._timestamp(),
-                "completed_at": None,
-                "entries": [],
-            }
-
-        self._data["phases"][phase_key]["entries"].append(entry.to_dict())
-        self.save()
+        with self._lock:
+            phase_key = entry.phase
+            if phase_key not in self._data["phases"]:
+                # Create phase if it doesn't exist
+                self._append(
+                    {
+                        "op": "phase",
+                        "phase": phase_key,
+                        "status": "active",
+                        "started_at": self._timestamp(),
+                        "completed_at": None,
+                    }
+                )
+
+            self._append({"op": "entry", "entry": entry.to_dict()})
 
     def update_phase_status(
         self, phase: str, status: str, completed_at: str | None = None
@@ -126,9 +300,10 @@ class LogStorage:
             completed_at: Optional completion timestamp
         """
         if phase in self._data["phases"]:
-            self._data["phases"][phase]["status"] = status
+            record = {"op": "phase", "phase": phase, "status": status}
             if completed_at:
-                self._data["phases"][phase]["completed_at"] = completed_at
+                record["completed_at"] = completed_at
+            self._append(record)
 
     def set_phase_started(self, phase: str, started_at: str) -> None:
         """
@@ -139,7 +314,7 @@ class LogStorage:
             started_at: Start timestamp
         """
         if phase in self._data["phases"]:
-            self._data["phases"][phase]["started_at"] = started_at
+            self._append({"op": "phase", "phase": phase, "started_at": started_at})
 
     def get_data(self) -> dict:
         """Get all log data."""
@@ -156,7 +331,107 @@ class LogStorage:
         Args:
             new_spec_id: New spec ID
         """
-        self._data["spec_id"] = new_spec_id
+        self._append({"op": "spec_id", "spec_id": new_spec_id})
+
+
+class TaskLogReader:
+    """
+    Incremental reader for task logs.
+
+    The first ``read()`` loads the snapshot and replays the journal; later
+    calls only parse journal bytes appended since the previous call. A
+    compaction (new snapshot, or a journal that shrank or skipped sequence
+    numbers) triggers a full reload.
+
+    Usage:
+        reader = TaskLogReader(spec_dir)
+        logs = reader.read()      # full load
+        ...
+        logs = reader.read()      # only new journal records are parsed
+    """
+
+    def __init__(self, spec_dir: Path):
+        self.spec_dir = Path(spec_dir)
+        self.log_file = self.spec_dir / LogStorage.LOG_FILE
+        self.journal_file = self.spec_dir / LogStorage.JOURNAL_FILE
+        self.offset = 0
+        self.snapshot_size = 0
+        self._snapshot_key: tuple | None = None
+        self._data: dict | None = None
+
+    def read(self) -> dict | None:
+        """
+        Get the current logs.
+
+        Returns:
+            Logs dictionary (updated in place between calls), or None if the
+            spec has no logs yet or the snapshot cannot be parsed
+        """
+        if self._data is not None and self._read_tail():
+            return self._data
+        return self._reload()
+
+    def _stat_key(self, st: os.stat_result) -> tuple:
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _read_tail(self) -> bool:
+        """Apply newly appended journal records; False if a reload is needed."""
+        try:
+            if self._stat_key(self.log_file.stat()) != self._snapshot_key:
+                return False
+            with open(self.journal_file, "rb") as f:
+                if os.fstat(f.fileno()).st_size < self.offset:
+                    return False
+                f.seek(self.offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            # No journal: nothing new unless we had read one before
+            return self.offset == 0
+        except OSError:
+            return False
+
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            record = _parse_record(line)
+            if record is None or record["seq"] != self._data.get("log_seq", 0) + 1:
+                return False
+            apply_log_record(self._data, record)
+        self.offset += end
+        return True
+
+    def _reload(self) -> dict | None:
+        self._data = None
+        self.offset = 0
+
+        # Journal before snapshot: a compaction in between leaves us with an
+        # old journal whose records the new snapshot already contains
+        try:
+            journal = self.journal_file.read_bytes()
+        except OSError:
+            journal = b""
+
+        try:
+            with open(self.log_file, encoding="utf-8") as f:
+                st = os.fstat(f.fileno())
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        data.setdefault("phases", {})
+        data.setdefault("log_seq", 0)
+        end = journal.rfind(b"\n") + 1
+        for line in journal[:end].splitlines():
+            record = _parse_record(line)
+            if record is not None and record["seq"] > data["log_seq"]:
+                apply_log_record(data, record)
+
+        self._data = data
+        self.offset = end
+        self.snapshot_size = st.st_size
+        self._snapshot_key = self._stat_key(st)
+        return data
 
 
 def load_task_logs(spec_dir: Path) -> dict | None:
@@ -169,15 +444,7 @@ def load_task_logs(spec_dir: Path) -> dict | None:
     Returns:
         Logs dictionary or None if not found
     """
-    log_file = spec_dir / LogStorage.LOG_FILE
-    if not log_file.exists():
-        return None
-
-    try:
-        with open(log_file, encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return None
+    return TaskLogReader(spec_dir).read()
 
 
 def get_active_phase(spec_dir: Path) -> str | None:
@@ -1,13 +1,185 @@
 """
 Streaming marker functionality for real-time UI updates.
+
+Markers go to a structured event channel when the parent process provides
+one, and to stdout otherwise:
+
+- ``AUTO_CLAUDE_EVENT_FD``: inherited pipe to write event frames to
+- ``AUTO_CLAUDE_EVENT_PARENT``: pid of the process that opened the pipe; the
+  channel is only used by its direct child, so grandchildren that inherit the
+  environment (but not the pipe) fall back to stdout
+- ``AUTO_CLAUDE_EVENT_FLUSH_MS``: how long to coalesce events (default 50)
+- ``AUTO_CLAUDE_EVENT_QUEUE_SIZE``: events buffered before producers block
+  (default 1024)
+
+Each frame is a 4-byte big-endian length followed by a UTF-8 JSON array of
+``{"type": ..., "data": ...}`` events.
 """
 
+import atexit
 import json
+import os
+import stat
+import struct
+import threading
+import time
+from collections import deque
+
+DEFAULT_FLUSH_INTERVAL = 0.05
+DEFAULT_MAX_PENDING = 1024
+
+# How long a producer waits for room in a full queue before using stdout
+BACKPRESSURE_TIMEOUT = 1.0
+
+
+def _print_marker(marker_type: str, data: dict) -> None:
+    marker = f"__TASK_LOG_{marker_type}__:{json.dumps(data)}"
+    print(marker, flush=True)
+
+
+class EventChannel:
+    """
+    Batches streaming markers into length-prefixed frames on a pipe.
+
+    ``publish`` only queues the event; a writer thread coalesces everything
+    queued within one flush interval into a single frame. When the queue is
+    full, producers wait for the writer (backpressure) instead of growing
+    memory without bound.
+    """
+
+    def __init__(
+        self,
+        fd: int,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        """
+        Args:
+            fd: Writable file descriptor (pipe or socket) owned by the channel
+            flush_interval: Seconds to coalesce events before writing a frame
+            max_pending: Queued events before publish() blocks
+        """
+        self._file = os.fdopen(fd, "wb", buffering=0)
+        self.flush_interval = max(0.0, flush_interval)
+        self.max_pending = max(1, max_pending)
+        self._pending: deque[dict] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._broken = False
+        self._thread = threading.Thread(
+            target=self._run, name="task-log-events", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def usable(self) -> bool:
+        return not self._closed and not self._broken
+
+    def publish(self, marker_type: str, data: dict) -> bool:
+        """
+        Queue an event for the next frame.
+
+        Returns:
+            False if the channel is closed, broken or stayed full for
+            BACKPRESSURE_TIMEOUT; the caller should fall back to stdout
+        """
+        deadline = time.monotonic() + BACKPRESSURE_TIMEOUT
+        with self._cond:
+            while self.usable and len(self._pending) >= self.max_pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            if not self.usable:
+                return False
+            self._pending.append({"type": marker_type, "data": data})
+            if len(self._pending) == 1:
+                self._cond.notify_all()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                # Let more events arrive before writing (skipped when closing)
+                if not self._closed and self.flush_interval:
+                    self._cond.wait(self.flush_interval)
+                batch = list(self._pending)
+                self._pending.clear()
+                self._cond.notify_all()
+
+            payload = json.dumps(batch, default=str).encode("utf-8")
+            try:
+                self._file.write(struct.pack(">I", len(payload)) + payload)
+            except (OSError, ValueError):
+                with self._cond:
+                    self._broken = True
+                    self._cond.notify_all()
+                # The reader is gone; don't lose what was already queued
+                for event in batch:
+                    try:
+                        _print_marker(event["type"], event["data"])
+                    except Exception:
+                        pass
+                return
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write queued events and close the pipe."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        try:
+            self._file.close()
+        except OSError:
+            pass
+
+
+_channel: EventChannel | None = None
+_channel_checked = False
+_channel_lock = threading.Lock()
+
+
+def _open_channel_from_env() -> EventChannel | None:
+    fd_value = os.environ.get("AUTO_CLAUDE_EVENT_FD")
+    parent = os.environ.get("AUTO_CLAUDE_EVENT_PARENT")
+    if not fd_value or not parent:
+        return None
+    try:
+        if int(parent) != os.getppid():
+            return None
+        fd = int(fd_value)
+        mode = os.fstat(fd).st_mode
+        if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)):
+            return None
+        flush_ms = float(os.environ.get("AUTO_CLAUDE_EVENT_FLUSH_MS", "50"))
+        max_pending = int(
+            os.environ.get("AUTO_CLAUDE_EVENT_QUEUE_SIZE", str(DEFAULT_MAX_PENDING))
+        )
+        return EventChannel(fd, flush_ms / 1000, max_pending)
+    except (ValueError, OSError):
+        return None
+
+
+def get_event_channel() -> EventChannel | None:
+    """Get the process-wide event channel, or None if markers use stdout."""
+    global _channel, _channel_checked
+    if not _channel_checked:
+        with _channel_lock:
+            if not _channel_checked:
+                _channel = _open_channel_from_env()
+                if _channel is not None:
+                    atexit.register(_channel.close)
+                _channel_checked = True
+    return _channel
 
 
 def emit_marker(marker_type: str, data: dict, enabled: bool = True) -> None:
     """
-    Emit a streaming marker to stdout for UI consumption.
+    Emit a streaming marker for UI consumption.
 
     Args:
         marker_type: Type of marker (e.g., "PHASE_START", "TOOL_END")
@@ -17,7 +189,10 @@ def emit_marker(marker_type: str, data: dict, enabled: bool = True) -> None:
     if not enabled:
         return
     try:
-        marker = f"__TASK_LOG_{marker_type.upper()}__:{json.dumps(data)}"
-        print(marker, flush=True)
+        marker_type = marker_type.upper()
+        channel = get_event_channel()
+        if channel is not None and channel.publish(marker_type, data):
+            return
+        _print_marker(marker_type, data)
     except Exception:
         pass  # Don't let marker emission break logging
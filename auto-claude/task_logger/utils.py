@@ -59,6 +59,9 @@ def update_task_logger_path(new_spec_dir: Path) -> None:
     _current_logger.spec_dir = Path(new_spec_dir)
     _current_logger.log_file = _current_logger.spec_dir / TaskLogger.LOG_FILE
 
+    # The journal moved with the directory
+    _current_logger.storage.relocate(new_spec_dir)
+
     # Update spec_id in the storage
     _current_logger.storage.update_spec_id(new_spec_dir.name)
 
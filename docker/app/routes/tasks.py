@@ -20,7 +20,7 @@ from database import get_db
 from db.models import User
 from dependencies import get_current_user
 from services.project_service import ProjectService
-from services.spec_service import SpecService
+from services.spec_service import SpecService, load_plan
 from services.build_runner import get_build_runner
 from routes.websocket import broadcast_task_status, broadcast_task_progress
 
@@ -109,30 +109,71 @@ def task_status_to_spec_status(task_status: str) -> str:
 async def load_implementation_plan(project_path: str, spec_id: str) -> Optional[dict]:
     """Load implementation plan from spec directory."""
     spec_dir = Path(project_path) / ".auto-claude" / "specs" / spec_id
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if plan_file.exists():
-        try:
-            async with aiofiles.open(plan_file, mode='r') as f:
-                content = await f.read()
-            return json.loads(content)
-        except json.JSONDecodeError:
-            return None
-    return None
+    return load_plan(spec_dir / "implementation_plan.json")
+
+
+def _apply_log_record(logs: dict, record: dict) -> None:
+    """Apply one task_logs.jsonl journal record (see task_logger.storage)."""
+    phases = logs.setdefault("phases", {})
+    op = record.get("op")
+    if op in ("entry", "phase"):
+        key = record["entry"].get("phase") if op == "entry" else record.get("phase")
+        phase = phases.setdefault(key, {
+            "phase": key,
+            "status": "pending",
+            "started_at": None,
+            "completed_at": None,
+            "entries": [],
+        })
+        if op == "entry":
+            phase["entries"].append(record["entry"])
+        else:
+            for field in ("status", "started_at", "completed_at"):
+                if field in record:
+                    phase[field] = record[field]
+    elif op == "spec_id":
+        logs["spec_id"] = record["spec_id"]
+    logs["log_seq"] = record["seq"]
+    if record.get("ts"):
+        logs["updated_at"] = record["ts"]
 
 
 async def load_task_logs(project_path: str, spec_id: str) -> Optional[dict]:
-    """Load task logs from spec directory."""
+    """Load task logs from spec directory.
+
+    task_logs.json is a compacted snapshot; records appended since then live
+    in task_logs.jsonl and are replayed on top of it.
+    """
     spec_dir = Path(project_path) / ".auto-claude" / "specs" / spec_id
     logs_file = spec_dir / "task_logs.json"
+    journal_file = spec_dir / "task_logs.jsonl"
 
     if logs_file.exists():
+        # Journal first: a compaction in between only adds records we skip
+        journal = ""
+        if journal_file.exists():
+            try:
+                async with aiofiles.open(journal_file, mode='r') as f:
+                    journal = await f.read()
+            except OSError:
+                journal = ""
         try:
             async with aiofiles.open(logs_file, mode='r') as f:
                 content = await f.read()
-            return json.loads(content)
+            logs = json.loads(content)
         except json.JSONDecodeError:
             return None
+
+        for line in journal.splitlines(keepends=True):
+            if not line.endswith("\n"):
+                break  # still being written
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("seq", 0) > logs.get("log_seq", 0):
+                _apply_log_record(logs, record)
+        return logs
     return None
 
 
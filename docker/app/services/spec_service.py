@@ -1,7 +1,10 @@
 """Spec management service for Auto-Claude Docker Web UI."""
 
 import json
+import os
 import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -9,6 +12,78 @@ from typing import Optional
 from config import Settings
 from models import Project, Spec, SpecStatus
 
+# Parsed plans kept in memory across requests
+PLAN_CACHE_SIZE = 256
+
+# Plans modified this recently are not cached (a same-size rewrite within
+# the filesystem's timestamp granularity would keep the same signature)
+PLAN_CACHE_MIN_AGE_NS = 2_000_000_000
+
+# plan file -> ((inode, mtime_ns, size), plan data, status derived from subtasks)
+_plan_cache: dict[Path, tuple[tuple, dict, Optional[SpecStatus]]] = {}
+_plan_cache_lock = threading.Lock()
+
+
+def _plan_status(plan_data: dict) -> Optional[SpecStatus]:
+    """Spec status implied by the plan's subtask statuses (None = no change)."""
+    # Collect all subtask statuses from phases
+    subtask_statuses = []
+    for phase in plan_data.get("phases", []):
+        for subtask in phase.get("subtasks", []):
+            subtask_statuses.append(subtask.get("status", "pending"))
+
+    if subtask_statuses:
+        all_completed = all(s == "completed" for s in subtask_statuses)
+        any_in_progress = any(s == "in_progress" for s in subtask_statuses)
+        any_failed = any(s == "failed" for s in subtask_statuses)
+
+        if all_completed or any_failed:
+            return SpecStatus.COMPLETED
+        elif any_in_progress:
+            return SpecStatus.BUILDING
+    return None
+
+
+def _load_plan_entry(plan_path: Path) -> Optional[tuple[dict, Optional[SpecStatus]]]:
+    """Read a plan, reusing the parsed copy while the file is unchanged."""
+    try:
+        st = os.stat(plan_path)
+    except OSError:
+        return None
+    signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    with _plan_cache_lock:
+        cached = _plan_cache.get(plan_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+
+    try:
+        plan_data = json.loads(plan_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(plan_data, dict):
+        return None
+    entry = (signature, plan_data, _plan_status(plan_data))
+
+    with _plan_cache_lock:
+        if time.time_ns() - st.st_mtime_ns >= PLAN_CACHE_MIN_AGE_NS:
+            _plan_cache[plan_path] = entry
+            while len(_plan_cache) > PLAN_CACHE_SIZE:
+                _plan_cache.pop(next(iter(_plan_cache)))
+        else:
+            _plan_cache.pop(plan_path, None)
+    return entry[1], entry[2]
+
+
+def load_plan(plan_path: Path) -> Optional[dict]:
+    """
+    Load an implementation_plan.json, parsing it only when it changed.
+
+    The returned dict is shared between requests and must not be modified.
+    """
+    entry = _load_plan_entry(plan_path)
+    return entry[0] if entry else None
+
 
 class SpecService:
     """Service for managing specs within projects."""
@@ -44,29 +119,10 @@ class SpecService:
                 status = SpecStatus.DRAFT
                 if (spec_path / "spec.md").exists():
                     status = SpecStatus.READY
-                if (spec_path / "implementation_plan.json").exists():
-                    # Check if build is in progress or completed based on subtask statuses
-                    try:
-                        plan_data = json.loads(
-                            (spec_path / "implementation_plan.json").read_text()
-                        )
-                        # Collect all subtask statuses from phases
-                        subtask_statuses = []
-                        for phase in plan_data.get("phases", []):
-                            for subtask in phase.get("subtasks", []):
-                                subtask_statuses.append(subtask.get("status", "pending"))
-
-                        if subtask_statuses:
-                            all_completed = all(s == "completed" for s in subtask_statuses)
-                            any_in_progress = any(s == "in_progress" for s in subtask_statuses)
-                            any_failed = any(s == "failed" for s in subtask_statuses)
-
-                            if all_completed or any_failed:
-                                status = SpecStatus.COMPLETED
-                            elif any_in_progress:
-                                status = SpecStatus.BUILDING
-                    except (json.JSONDecodeError, Exception):
-                        pass
+                # Check if build is in progress or completed based on subtask statuses
+                plan_entry = _load_plan_entry(spec_path / "implementation_plan.json")
+                if plan_entry and plan_entry[1] is not None:
+                    status = plan_entry[1]
                 if (spec_path / "qa_report.md").exists():
                     status = SpecStatus.COMPLETED
 
@@ -118,12 +174,7 @@ class SpecService:
         plan_path = (
             self._get_specs_dir(project) / spec_id / "implementation_plan.json"
         )
-        if plan_path.exists():
-            try:
-                return json.loads(plan_path.read_text())
-            except json.JSONDecodeError:
-                return None
-        return None
+        return load_plan(plan_path)
 
     async def get_qa_report(
         self,
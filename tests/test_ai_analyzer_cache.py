@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Tests for AI Analyzer Caching
+=============================
+
+Tests the per-analyzer result cache of runners/ai_analyzer:
+- Input hashes only change for analyzers that read the changed files
+- Cached results are reused until their inputs change or they expire
+- The cost estimate excludes analyzers that will be served from cache
+- Analyzers run concurrently, up to the configured limit
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add runners directory to path for imports (as ai_analyzer_runner.py does)
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude" / "runners"))
+
+from ai_analyzer import runner as runner_module
+from ai_analyzer.cache_manager import CacheManager
+from ai_analyzer.cost_estimator import CostEstimator
+from ai_analyzer.input_hasher import InputHasher
+from ai_analyzer.models import AnalyzerType
+from ai_analyzer.runner import AIAnalyzerRunner, get_analyzer_concurrency
+
+PROJECT_INDEX = {
+    "project_type": "single",
+    "services": {
+        "api": {
+            "type": "backend",
+            "language": "python",
+            "framework": "fastapi",
+            "api": {
+                "routes": [
+                    {"path": "/users", "methods": ["GET"], "file": "app/main.py"}
+                ]
+            },
+            "database": {"models": {"User": {}}},
+        }
+    },
+}
+
+
+@pytest.fixture
+def project(temp_dir: Path) -> Path:
+    """A small project with source, test, manifest, and config files."""
+    (temp_dir / "app").mkdir()
+    (temp_dir / "app" / "main.py").write_text("def main():\n    return 1\n")
+    (temp_dir / "tests").mkdir()
+    (temp_dir / "tests" / "test_main.py").write_text("def test_main():\n    pass\n")
+    (temp_dir / "requirements.txt").write_text("fastapi==0.110.0\n")
+    (temp_dir / "config.yaml").write_text("debug: false\n")
+    return temp_dir
+
+
+def _changed(before: dict[str, str], after: dict[str, str]) -> set[str]:
+    return {name for name in before if before[name] != after[name]}
+
+
+def _hashes(project_dir: Path) -> dict[str, str]:
+    return InputHasher(project_dir, PROJECT_INDEX).hash_analyzers(
+        AnalyzerType.all_analyzers()
+    )
+
+
+class TestInputHasher:
+    """Tests for per-analyzer input hashes."""
+
+    def test_hashes_are_stable(self, project: Path) -> None:
+        """Test that unchanged inputs hash the same across instances."""
+        assert _hashes(project) == _hashes(project)
+
+    def test_test_file_change_only_affects_code_quality(self, project: Path) -> None:
+        """Test that editing a test only invalidates the code quality analyzer."""
+        before = _hashes(project)
+        (project / "tests" / "test_main.py").write_text("def test_main():\n    1\n")
+
+        assert _changed(before, _hashes(project)) == {"code_quality"}
+
+    def test_manifest_change(self, project: Path) -> None:
+        """Test that a dependency bump affects architecture and security only."""
+        before = _hashes(project)
+        (project / "requirements.txt").write_text("fastapi==0.111.0\n")
+
+        assert _changed(before, _hashes(project)) == {"architecture", "security"}
+
+    def test_other_files_only_affect_security(self, project: Path) -> None:
+        """Test that files of no declared kind still invalidate security."""
+        (project / "Makefile").write_text("deploy:\n\t./deploy.sh\n")
+        (project / "tsconfig.json").write_text('{"strict": true}\n')
+        before = _hashes(project)
+
+        (project / "Makefile").write_text("deploy:\n\tcurl $(URL) | sh\n")
+        assert _changed(before, _hashes(project)) == {"security"}
+
+        before = _hashes(project)
+        (project / "tsconfig.json").write_text('{"strict": false}\n')
+        assert _changed(before, _hashes(project)) == {"security"}
+
+    def test_source_change_skips_architecture(self, project: Path) -> None:
+        """Test that editing a source file keeps the architecture result."""
+        before = _hashes(project)
+        (project / "app" / "main.py").write_text("def main():\n    return 2\n")
+
+        changed = _changed(before, _hashes(project))
+
+        assert "architecture" not in changed
+        assert {"security", "performance", "code_quality"} <= changed
+
+    def test_index_change_only_affects_dependent_analyzers(
+        self, project: Path
+    ) -> None:
+        """Test that analyzers are keyed by the index fields they use."""
+        before = _hashes(project)
+        index = {
+            "services": {
+                "api": {**PROJECT_INDEX["services"]["api"], "api": {"routes": []}},
+            }
+        }
+        after = InputHasher(project, index).hash_analyzers(
+            AnalyzerType.all_analyzers()
+        )
+
+        changed = _changed(before, after)
+
+        assert "architecture" not in changed
+        assert "code_quality" not in changed
+        assert "code_relationships" in changed
+
+    def test_ignores_excluded_dirs_and_settings_files(self, project: Path) -> None:
+        """Test that caches and the client's settings files don't count."""
+        before = _hashes(project)
+        (project / "node_modules").mkdir()
+        (project / "node_modules" / "lib.js").write_text("x = 1\n")
+        (project / ".claude_ai_analyzer_settings.1234.json").write_text("{}")
+
+        assert _hashes(project) == before
+
+
+class TestCacheManager:
+    """Tests for the per-analyzer result cache."""
+
+    def test_round_trip(self, temp_dir: Path) -> None:
+        """Test that a result is returned only for the hash it was saved with."""
+        cache = CacheManager(temp_dir / "ai_cache")
+        cache.save_analyzer_result("security", "abc", {"score": 80})
+
+        assert cache.get_analyzer_result("security", "abc") == {"score": 80}
+        assert cache.get_analyzer_result("security", "def") is None
+        assert cache.get_analyzer_results({"security": "abc", "performance": "x"}) == {
+            "security": {"score": 80}
+        }
+
+    def test_expired_entry_is_a_miss(self, temp_dir: Path) -> None:
+        """Test that a result older than the age limit is ignored."""
+        cache = CacheManager(temp_dir / "ai_cache")
+        cache.save_analyzer_result("security", "abc", {"score": 80})
+        cache_file = cache.analyzer_cache_dir / "security.json"
+        entry = json.loads(cache_file.read_text())
+        entry["cached_at"] = (
+            datetime.now() - timedelta(hours=CacheManager.MAX_AGE_HOURS + 1)
+        ).isoformat()
+        cache_file.write_text(json.dumps(entry))
+
+        assert cache.get_analyzer_result("security", "abc") is None
+
+    def test_corrupt_entry_is_a_miss(self, temp_dir: Path) -> None:
+        """Test that an unreadable cache entry is ignored."""
+        cache = CacheManager(temp_dir / "ai_cache")
+        cache.analyzer_cache_dir.mkdir()
+        (cache.analyzer_cache_dir / "security.json").write_text("{not json")
+
+        assert not cache.has_analyzer_result("security", "abc")
+
+
+class TestCostEstimator:
+    """Tests for cost estimates that account for cached results."""
+
+    def test_cached_analyzers_are_excluded(self, project: Path) -> None:
+        """Test that predicted cache hits reduce the estimate."""
+        estimator = CostEstimator(project, PROJECT_INDEX)
+        cache = CacheManager(project / ".auto-claude" / "ai_cache")
+        hashes = _hashes(project)
+        full = estimator.estimate_cost(hashes, cache)
+
+        cache.save_analyzer_result("security", hashes["security"], {"score": 1})
+        cache.save_analyzer_result("performance", "stale", {"score": 1})
+        partial = estimator.estimate_cost(hashes, cache)
+
+        assert full.cached_analyzers == []
+        assert full.analyzers_to_run == len(hashes)
+        assert partial.cached_analyzers == ["security"]
+        assert partial.analyzers_to_run == len(hashes) - 1
+        assert partial.estimated_tokens == (
+            full.estimated_tokens * (len(hashes) - 1) // len(hashes)
+        )
+
+    def test_default_estimates_all_analyzers(self, project: Path) -> None:
+        """Test that the estimate without hashes covers every analyzer."""
+        estimate = CostEstimator(project, PROJECT_INDEX).estimate_cost()
+
+        assert estimate.estimated_tokens > 0
+        assert estimate.analyzers_to_run == len(AnalyzerType.all_analyzers())
+
+
+class TestConcurrentRun:
+    """Tests for running analyzers concurrently with the cache."""
+
+    @pytest.fixture
+    def runner(self, project: Path, monkeypatch) -> AIAnalyzerRunner:
+        monkeypatch.setattr(runner_module, "CLAUDE_SDK_AVAILABLE", True)
+        runner = AIAnalyzerRunner(project, PROJECT_INDEX, max_concurrency=2)
+        runner.calls = []
+        runner.active = 0
+        runner.peak = 0
+
+        async def fake_analyzer(name: str) -> dict:
+            runner.calls.append(name)
+            runner.active += 1
+            runner.peak = max(runner.peak, runner.active)
+            await asyncio.sleep(0.01)
+            runner.active -= 1
+            if name == "performance":
+                return {"score": 50, "_raw_response": "not json"}
+            return {"score": 70}
+
+        monkeypatch.setattr(runner, "_run_single_analyzer", fake_analyzer)
+        return runner
+
+    async def test_runs_with_bounded_concurrency(self, runner) -> None:
+        """Test that all analyzers run, at most max_concurrency at a time."""
+        insights = await runner.run_full_analysis()
+
+        assert sorted(runner.calls) == sorted(AnalyzerType.all_analyzers())
+        assert runner.peak == 2
+        assert insights["overall_score"] == (70 * 5 + 50) // 6
+
+    async def test_second_run_reuses_cache(self, runner, project: Path) -> None:
+        """Test that only changed or unparsable analyzers re-run."""
+        await runner.run_full_analysis()
+        runner.calls.clear()
+
+        (project / "tests" / "test_main.py").write_text("def test_main():\n    2\n")
+        runner.input_hasher = InputHasher(project, PROJECT_INDEX)
+        insights = await runner.run_full_analysis()
+
+        assert sorted(runner.calls) == ["code_quality", "performance"]
+        assert insights["cost_estimate"]["analyzers_to_run"] == 2
+        assert insights["security"] == {"score": 70}
+
+    async def test_skip_cache_runs_everything(self, runner) -> None:
+        """Test that --skip-cache ignores cached results."""
+        await runner.run_full_analysis()
+        runner.calls.clear()
+
+        await runner.run_full_analysis(skip_cache=True)
+
+        assert len(runner.calls) == len(AnalyzerType.all_analyzers())
+
+    async def test_errors_are_not_cached(self, runner, monkeypatch) -> None:
+        """Test that a failing analyzer is retried on the next run."""
+
+        async def failing(name: str) -> dict:
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(runner, "_run_single_analyzer", failing)
+        insights = await runner.run_full_analysis(selected_analyzers=["security"])
+
+        assert insights["security"] == {"error": "boom"}
+        assert not runner.cache_manager.get_analyzer_results(
+            runner.input_hasher.hash_analyzers(["security"])
+        )
+
+    async def test_empty_responses_are_not_cached(self, runner, monkeypatch) -> None:
+        """Test that the default result of an empty response is retried."""
+        parse = runner.result_parser.parse_json_response
+
+        async def empty(name: str) -> dict:
+            return parse("", {"score": 0, "vulnerabilities": []})
+
+        monkeypatch.setattr(runner, "_run_single_analyzer", empty)
+        insights = await runner.run_full_analysis(selected_analyzers=["security"])
+
+        assert insights["security"] == {"score": 0, "vulnerabilities": []}
+        assert not runner.cache_manager.get_analyzer_results(
+            runner.input_hasher.hash_analyzers(["security"])
+        )
+
+    def test_concurrency_from_env(self, monkeypatch) -> None:
+        """Test the concurrency environment variable and its fallback."""
+        monkeypatch.setenv("AUTO_CLAUDE_AI_ANALYZER_CONCURRENCY", "5")
+        assert get_analyzer_concurrency() == 5
+        monkeypatch.setenv("AUTO_CLAUDE_AI_ANALYZER_CONCURRENCY", "0")
+        assert get_analyzer_concurrency() == 1
+        monkeypatch.setenv("AUTO_CLAUDE_AI_ANALYZER_CONCURRENCY", "many")
+        assert get_analyzer_concurrency() == 3
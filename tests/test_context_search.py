@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for Context Code Search
+=============================
+
+Tests the persistent inverted index behind context.search.CodeSearcher:
+- Index results match a direct scan of every file
+- Incremental refresh on modified, added and deleted files
+- Fallback for keywords the index cannot answer
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from context.search import CodeSearcher
+from context.search_index import SearchIndex, tokenize
+
+
+@pytest.fixture
+def service_dir(temp_dir: Path) -> Path:
+    """Create a small service with code files and a skipped directory."""
+    src = temp_dir / "src"
+    src.mkdir()
+    (src / "auth.py").write_text(
+        "def login(user):\n"
+        "    username = user.name\n"
+        "    return authenticate(username)\n"
+        "\n"
+        "# user_id and user again: user\n"
+    )
+    (src / "models.ts").write_text(
+        "export interface User {\n  id: string;\n}\nconst users: User[] = [];\n"
+    )
+    (src / "notes.md").write_text("user user user\n")
+    node_modules = temp_dir / "node_modules" / "pkg"
+    node_modules.mkdir(parents=True)
+    (node_modules / "index.js").write_text("const user = 1;\n")
+    return temp_dir
+
+
+def _as_tuples(matches):
+    return sorted(
+        (m.path, m.reason, m.relevance_score, tuple(m.matching_lines)) for m in matches
+    )
+
+
+class TestTokenize:
+    """Tests for token extraction."""
+
+    def test_counts_and_lines(self):
+        postings = tokenize("User user\nfoo_bar user\n\nuser\nuser\n")
+        count, lines = postings["user"]
+        assert count == 5
+        assert lines == [1, 2, 4]
+        assert postings["foo_bar"] == (1, [2])
+
+
+class TestCodeSearcherIndex:
+    """Tests for index-backed search."""
+
+    def test_index_matches_direct_scan(self, service_dir: Path):
+        """Index results are identical to reading every file."""
+        keywords = ["user", "login", "id", "missing"]
+        indexed = CodeSearcher(service_dir).search_service(
+            service_dir, "app", keywords
+        )
+        direct = CodeSearcher(service_dir, use_index=False).search_service(
+            service_dir, "app", keywords
+        )
+
+        assert indexed
+        assert _as_tuples(indexed) == _as_tuples(direct)
+        assert (service_dir / ".auto-claude" / "context_index.db").exists()
+
+    def test_skips_non_code_and_skip_dirs(self, service_dir: Path):
+        matches = CodeSearcher(service_dir).search_service(
+            service_dir, "app", ["user"]
+        )
+        paths = {m.path for m in matches}
+        assert str(Path("src/auth.py")) in paths
+        assert not any("node_modules" in p or p.endswith(".md") for p in paths)
+
+    def test_incremental_refresh(self, service_dir: Path):
+        """Modified, added and deleted files are picked up."""
+        searcher = CodeSearcher(service_dir)
+        searcher.search_service(service_dir, "app", ["user"])
+
+        auth = service_dir / "src" / "auth.py"
+        auth.write_text("def logout():\n    pass\n")
+        stat = auth.stat()
+        os.utime(auth, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (service_dir / "src" / "new.go").write_text("func Logout() {}\n")
+        (service_dir / "src" / "models.ts").unlink()
+
+        matches = searcher.search_service(service_dir, "app", ["logout", "user"])
+        by_path = {m.path: m for m in matches}
+        assert set(by_path) == {str(Path("src/auth.py")), str(Path("src/new.go"))}
+        assert by_path[str(Path("src/auth.py"))].matching_lines == [
+            (1, "def logout():")
+        ]
+
+    def test_unchanged_files_not_reread(self, service_dir: Path, monkeypatch):
+        index = SearchIndex(service_dir)
+        index.refresh(service_dir)
+
+        def fail_read(*args, **kwargs):
+            raise AssertionError("file should not be re-read")
+
+        monkeypatch.setattr(Path, "read_text", fail_read)
+        paths, hits = index.query(service_dir, ["user"])
+        assert hits["src/auth.py"]["user"].count == 7
+        assert "src/models.ts" in paths
+
+    def test_non_word_keywords_fall_back(self, service_dir: Path):
+        """Keywords with punctuation still use substring scanning."""
+        matches = CodeSearcher(service_dir).search_service(
+            service_dir, "app", ["user.name"]
+        )
+        assert [m.path for m in matches] == [str(Path("src/auth.py"))]
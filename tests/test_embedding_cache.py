@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for the Persistent Embedding Cache
+========================================
+
+Tests integrations.graphiti.providers_pkg.embedding_cache:
+- Vectors survive reopening the store and are shared between store handles
+- Torn appends are repaired
+- Cached embedders send only batch misses to the provider
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from integrations.graphiti.providers_pkg.embedding_cache import (
+    INDEX_FILE,
+    VECTORS_FILE,
+    EmbeddingStore,
+    cache_embeddings,
+    get_embedding_store,
+    reset_embedding_stores,
+    with_embedding_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_stores():
+    reset_embedding_stores()
+    yield
+    reset_embedding_stores()
+
+
+class FakeEmbedder:
+    def __init__(self, dimension: int = 3):
+        self.dimension = dimension
+        self.calls = []
+
+    def _vector(self, text: str) -> list[float]:
+        return [float(len(text)), 0.5, -1.0][: self.dimension]
+
+    async def create(self, input_data):
+        self.calls.append(input_data)
+        # Like graphiti's embedders: one flat vector, for text or [text]
+        if isinstance(input_data, list) and isinstance(input_data[0], str):
+            input_data = input_data[0]
+        return self._vector(str(input_data))
+
+    async def create_batch(self, input_data_list):
+        self.calls.append(list(input_data_list))
+        return [self._vector(text) for text in input_data_list]
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore."""
+
+    def test_roundtrip_and_reopen(self, temp_dir: Path):
+        store = EmbeddingStore(temp_dir, 3)
+        assert store.put_many(["a", "bb"], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]) == 2
+        assert store.put("a", [9.0, 9.0, 9.0]) is False
+        assert store.put("bad", [1.0]) is False
+        store.close()
+
+        reopened = EmbeddingStore(temp_dir, 3)
+        assert len(reopened) == 2
+        assert reopened.get_many(["bb", "missing", "a"]) == [
+            [4.0, 5.0, 6.0],
+            None,
+            [1.0, 2.0, 3.0],
+        ]
+
+    def test_sees_rows_written_by_other_handle(self, temp_dir: Path):
+        reader = EmbeddingStore(temp_dir, 2)
+        writer = EmbeddingStore(temp_dir, 2)
+
+        assert reader.get("text") is None
+        writer.put("text", [0.25, 0.75])
+        assert reader.get("text") == [0.25, 0.75]
+
+    def test_torn_append_is_truncated(self, temp_dir: Path):
+        store = EmbeddingStore(temp_dir, 2)
+        store.put("a", [1.0, 2.0])
+        store.close()
+
+        # Crash after writing half a vector and no index entry
+        with open(temp_dir / VECTORS_FILE, "ab") as f:
+            f.write(b"\x00" * 4)
+
+        store = EmbeddingStore(temp_dir, 2)
+        assert (temp_dir / VECTORS_FILE).stat().st_size == 8
+        assert (temp_dir / INDEX_FILE).stat().st_size == 16
+        store.put("b", [3.0, 4.0])
+        assert store.get_many(["a", "b"]) == [[1.0, 2.0], [3.0, 4.0]]
+
+
+class TestCachedEmbedder:
+    """Tests for cache_embeddings and with_embedding_cache."""
+
+    def test_batch_sends_only_misses(self, temp_dir: Path):
+        store = EmbeddingStore(temp_dir, 3)
+        embedder = cache_embeddings(FakeEmbedder(), store)
+        assert cache_embeddings(embedder, store) is embedder
+
+        async def run():
+            single = await embedder.create("abc")
+            batch = await embedder.create_batch(["abc", "de", "de", "f"])
+            again = await embedder.create_batch(["f", "abc"])
+            return single, batch, again
+
+        single, batch, again = asyncio.run(run())
+
+        assert single == [3.0, 0.5, -1.0]
+        assert batch == [
+            [3.0, 0.5, -1.0],
+            [2.0, 0.5, -1.0],
+            [2.0, 0.5, -1.0],
+            [1.0, 0.5, -1.0],
+        ]
+        assert again == [[1.0, 0.5, -1.0], [3.0, 0.5, -1.0]]
+        assert embedder.calls == ["abc", ["de", "f"]]
+
+    def test_graphiti_single_text_calls_hit_store(self, temp_dir: Path):
+        store = EmbeddingStore(temp_dir, 3)
+        embedder = cache_embeddings(FakeEmbedder(), store)
+
+        async def run():
+            # graphiti embeds nodes, edges and queries as create(input_data=[text])
+            return [
+                await embedder.create(input_data=["same text"]),
+                await embedder.create(input_data=["same text"]),
+                await embedder.create(["same text"]),
+                await embedder.create("same text"),
+            ]
+
+        assert asyncio.run(run()) == [[9.0, 0.5, -1.0]] * 4
+        assert embedder.calls == [["same text"]]
+
+        fresh = cache_embeddings(FakeEmbedder(), EmbeddingStore(temp_dir, 3))
+        assert asyncio.run(fresh.create(input_data=["same text"])) == [9.0, 0.5, -1.0]
+        assert fresh.calls == []
+
+    def test_non_text_inputs_pass_through(self, temp_dir: Path):
+        embedder = cache_embeddings(FakeEmbedder(), EmbeddingStore(temp_dir, 3))
+
+        asyncio.run(embedder.create([1, 2, 3]))
+        asyncio.run(embedder.create([1, 2, 3]))
+
+        assert embedder.calls == [[1, 2, 3], [1, 2, 3]]
+
+    def test_shared_across_embedders_for_same_config(self, temp_dir: Path):
+        config = SimpleNamespace(
+            embedder_provider="ollama",
+            ollama_embedding_model="nomic-embed-text:latest",
+            db_path=str(temp_dir),
+            get_embedding_dimension=lambda: 3,
+        )
+        first = with_embedding_cache(FakeEmbedder(), config)
+        asyncio.run(first.create_batch(["x", "y"]))
+
+        # e.g. a migration re-run creating a fresh embedder
+        reset_embedding_stores()
+        second = with_embedding_cache(FakeEmbedder(), config)
+        assert asyncio.run(second.create_batch(["y", "x", "z"]))[2] == [
+            1.0,
+            0.5,
+            -1.0,
+        ]
+        assert second.calls == [["z"]]
+        assert get_embedding_store(config).directory == (
+            temp_dir / "embedding_cache" / "ollama_nomic-embed-text_latest_3"
+        )
+
+    def test_disabled_by_env(self, temp_dir: Path, monkeypatch):
+        monkeypatch.setenv("GRAPHITI_EMBEDDING_CACHE", "false")
+        embedder = FakeEmbedder()
+        config = SimpleNamespace(db_path=str(temp_dir))
+
+        assert with_embedding_cache(embedder, config) is embedder
+        assert not hasattr(embedder, "_embedding_store")
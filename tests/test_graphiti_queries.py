@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Tests for Graphiti Episode Ingestion
+====================================
+
+Tests how GraphitiQueries turns structured insights into episodes and saves
+them with concurrent add_episode calls, and the search caches used by
+GraphitiSearch.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from integrations.graphiti.queries_pkg.queries import GraphitiQueries
+from integrations.graphiti.queries_pkg.schema import (
+    EPISODE_TYPE_CODEBASE_DISCOVERY,
+    EPISODE_TYPE_SESSION_INSIGHT,
+    EPISODE_TYPE_TASK_OUTCOME,
+)
+from integrations.graphiti.queries_pkg.search import GraphitiSearch
+from integrations.graphiti.queries_pkg.search_cache import (
+    SearchResultCache,
+    cache_query_embeddings,
+    get_search_cache,
+)
+
+INSIGHTS = {
+    "subtask_id": "subtask-1",
+    "session_num": 3,
+    "success": True,
+    "file_insights": [
+        {"path": "src/api/routes.py", "purpose": "HTTP routes"},
+        {"path": "src/models.py", "purpose": "ORM models"},
+    ],
+    "patterns_discovered": [
+        {"pattern": "Use dependency injection", "applies_to": "routes"},
+        "Prefer small modules",
+    ],
+    "gotchas_discovered": ["Migrations must be idempotent"],
+    "approach_outcome": {"approach_used": "TDD", "why_it_worked": "fast feedback"},
+    "recommendations": ["Add integration tests"],
+    "changed_files": ["src/api/routes.py"],
+}
+
+
+CONFIG = SimpleNamespace(db_path="/tmp/graphiti-test", database="memory")
+
+
+def _queries(graphiti=None) -> GraphitiQueries:
+    client = SimpleNamespace(graphiti=graphiti, config=CONFIG)
+    return GraphitiQueries(client, "group", "spec-001")
+
+
+class TestBuildStructuredEpisodes:
+    """Tests for GraphitiQueries.build_structured_episodes."""
+
+    def test_one_episode_per_item(self):
+        episodes = _queries().build_structured_episodes(INSIGHTS)
+
+        assert [e.kind for e in episodes] == [
+            "file insight",
+            "file insight",
+            "pattern",
+            "pattern",
+            "gotcha",
+            "task outcome",
+            "recommendations",
+        ]
+        assert len({e.name for e in episodes}) == len(episodes)
+
+        file_insight = episodes[0]
+        assert file_insight.name == "file_insight_src_api_routes.py"
+        assert file_insight.content["type"] == EPISODE_TYPE_CODEBASE_DISCOVERY
+        assert file_insight.content["spec_id"] == "spec-001"
+
+        assert episodes[3].content["pattern"] == "Prefer small modules"
+        assert episodes[3].content["applies_to"] == ""
+
+        outcome = episodes[5]
+        assert outcome.content["type"] == EPISODE_TYPE_TASK_OUTCOME
+        assert outcome.content["success"] is True
+        assert outcome.content["changed_files"] == ["src/api/routes.py"]
+        assert outcome.source_description == "Task outcome: subtask-1 succeeded"
+
+        recommendations = episodes[6]
+        assert recommendations.content["type"] == EPISODE_TYPE_SESSION_INSIGHT
+        assert recommendations.content["session_number"] == 3
+
+    def test_empty_sections(self):
+        assert _queries().build_structured_episodes({"subtask_id": "x"}) == []
+
+
+class TestAddEpisodes:
+    """Tests for GraphitiQueries.add_episodes (needs graphiti-core)."""
+
+    @pytest.fixture(autouse=True)
+    def require_graphiti(self):
+        pytest.importorskip("graphiti_core")
+
+    def test_concurrent_calls_report_each_episode(self):
+        class FakeGraphiti:
+            def __init__(self):
+                self.in_flight = 0
+                self.max_in_flight = 0
+
+            async def add_episode_bulk(self, episodes, group_id):
+                raise AssertionError("bulk ingestion is not used")
+
+            async def add_episode(self, name, **kwargs):
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                if name.startswith("gotcha"):
+                    raise RuntimeError("extraction failed")
+                if name.startswith("recommendations"):
+                    raise RuntimeError("invalid duplicate_facts idx")
+
+        graphiti = FakeGraphiti()
+        queries = _queries(graphiti)
+        episodes = queries.build_structured_episodes(INSIGHTS)
+
+        results = asyncio.run(queries.add_episodes(episodes, max_concurrency=3))
+
+        assert results == [True, True, True, True, False, True, True]
+        assert graphiti.max_in_flight == 3
+
+
+class FakeSearchGraphiti:
+    def __init__(self):
+        self.queries = []
+
+    async def search(self, query, group_ids, num_results):
+        self.queries.append(query)
+        return [SimpleNamespace(fact=f"fact for {query}", score=0.5)]
+
+
+class TestSearchCache:
+    """Tests for cached searches in GraphitiSearch."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        get_search_cache().clear()
+        yield
+        get_search_cache().clear()
+
+    def _search(self, graphiti, project_dir: Path) -> GraphitiSearch:
+        client = SimpleNamespace(graphiti=graphiti, config=CONFIG)
+        return GraphitiSearch(client, "group", "spec-001", "project", project_dir)
+
+    def test_repeated_query_hits_cache(self, temp_dir: Path):
+        graphiti = FakeSearchGraphiti()
+
+        first = asyncio.run(
+            self._search(graphiti, temp_dir).get_relevant_context("Add  login API")
+        )
+        # A new GraphitiSearch (as each memory lookup creates) shares the cache
+        second = asyncio.run(
+            self._search(graphiti, temp_dir).get_relevant_context("add login api")
+        )
+
+        assert first == second
+        assert graphiti.queries == ["Add  login API"]
+
+    def test_adding_episodes_invalidates_group(self, temp_dir: Path):
+        graphiti = FakeSearchGraphiti()
+        search = self._search(graphiti, temp_dir)
+
+        asyncio.run(search.get_similar_task_outcomes("login"))
+        _queries()._invalidate_search_cache()
+        asyncio.run(search.get_similar_task_outcomes("login"))
+
+        assert len(graphiti.queries) == 2
+
+    def test_ttl_and_overlapping_invalidation(self, monkeypatch):
+        cache = SearchResultCache(ttl=10)
+        now = [100.0]
+        monkeypatch.setattr(
+            "integrations.graphiti.queries_pkg.search_cache.time.monotonic",
+            lambda: now[0],
+        )
+
+        cache.put("db", ["g"], "query", 5, ["result"])
+        assert cache.get("db", ["g"], "query", 5) == ["result"]
+        now[0] += 11
+        assert cache.get("db", ["g"], "query", 5) is None
+
+        # Results of a search that raced with new episodes are not stored
+        generations = cache.snapshot("db", ["g", "other"])
+        cache.invalidate_group("db", "other")
+        cache.put("db", ["g", "other"], "query", 5, ["stale"], generations)
+        assert cache.get("db", ["other", "g"], "query", 5) is None
+
+    def test_query_embeddings_reused(self):
+        class FakeEmbedder:
+            def __init__(self):
+                self.calls = []
+
+            async def create(self, input_data):
+                self.calls.append(input_data)
+                return [float(len(self.calls))]
+
+        embedder = cache_query_embeddings(FakeEmbedder())
+        assert cache_query_embeddings(embedder) is embedder
+
+        async def run():
+            # graphiti's search embeds its query as create(input_data=[query])
+            return [
+                await embedder.create(input_data=["query"]),
+                await embedder.create(input_data=["query"]),
+                await embedder.create("query"),
+                await embedder.create(input_data=["a", "b"]),
+                await embedder.create(input_data=["a", "b"]),
+            ]
+
+        assert asyncio.run(run()) == [[1.0], [1.0], [1.0], [2.0], [3.0]]
+        assert embedder.calls == [["query"], ["a", "b"], ["a", "b"]]
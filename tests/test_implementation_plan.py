@@ -563,6 +563,34 @@ class TestDependencyResolution:
         assert 3 not in phase_nums
 
 
+    def test_parallel_subtasks_stop_at_sequential_phase(self):
+        """Parallel batch covers parallel-safe phases up to a sequential one."""
+        plan = ImplementationPlan(
+            feature="Test",
+            phases=[
+                Phase(phase=1, name="Setup", subtasks=[
+                    Chunk(id="c1", description="Setup", status=ChunkStatus.COMPLETED)
+                ]),
+                Phase(phase=2, name="Backend", depends_on=[1], parallel_safe=True, subtasks=[
+                    Chunk(id="c2", description="API"),
+                    Chunk(id="c3", description="Models"),
+                ]),
+                Phase(phase=3, name="Docs", depends_on=[1], subtasks=[
+                    Chunk(id="c4", description="Docs")
+                ]),
+                Phase(phase=4, name="Frontend", depends_on=[1], parallel_safe=True, subtasks=[
+                    Chunk(id="c5", description="UI")
+                ]),
+            ],
+        )
+
+        batch = plan.get_parallel_subtasks(limit=5)
+        assert [subtask.id for _, subtask in batch] == ["c2", "c3"]
+        assert [phase.phase for phase, _ in batch] == [2, 2]
+
+        assert len(plan.get_parallel_subtasks(limit=1)) == 1
+
+
 class TestChunkCritique:
     """Tests for self-critique functionality on chunks."""
 
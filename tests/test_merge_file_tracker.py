@@ -13,8 +13,10 @@ Covers:
 - Detecting conflicting files
 - Task cleanup
 - Evolution summaries
+- Incremental, lazily loaded evolution storage
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -25,6 +27,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
 # Add tests directory to path for test_fixtures
 sys.path.insert(0, str(Path(__file__).parent))
 
+from merge.file_evolution import FileEvolutionTracker
 from test_fixtures import (
     SAMPLE_PYTHON_MODULE,
     SAMPLE_PYTHON_WITH_NEW_FUNCTION,
@@ -242,3 +245,77 @@ class TestEvolutionSummary:
         summary = file_tracker.get_evolution_summary()
 
         assert summary["total_tasks"] >= 2
+
+
+class TestEvolutionStorage:
+    """Tests for incremental, lazily loaded evolution persistence."""
+
+    def _track(self, project, count=5):
+        tracker = FileEvolutionTracker(project_dir=project)
+        files = []
+        for i in range(count):
+            path = project / "src" / f"mod_{i}.py"
+            path.write_text(SAMPLE_PYTHON_MODULE)
+            files.append(path)
+        tracker.capture_baselines("task-001", files)
+        return tracker
+
+    def test_persists_across_instances(self, temp_project):
+        tracker = self._track(temp_project)
+        tracker.record_modification(
+            "task-001", "src/mod_2.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+
+        reopened = FileEvolutionTracker(project_dir=temp_project)
+        assert reopened.get_evolution_summary() == tracker.get_evolution_summary()
+        assert [f for f, _ in reopened.get_task_modifications("task-001")] == [
+            "src/mod_2.py"
+        ]
+
+    def test_modification_writes_one_record(self, temp_project):
+        tracker = self._track(temp_project)
+
+        statements = []
+        tracker.storage._conn.set_trace_callback(statements.append)
+        tracker.record_modification(
+            "task-001", "src/mod_3.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+        tracker.storage._conn.set_trace_callback(None)
+
+        writes = [s for s in statements if s.startswith("INSERT INTO evolutions")]
+        assert len(writes) == 1
+        assert "src/mod_3.py" in writes[0]
+
+    def test_lazy_loading(self, temp_project):
+        self._track(temp_project)
+
+        reopened = FileEvolutionTracker(project_dir=temp_project)
+        assert len(reopened._evolutions) == 5
+        assert reopened._evolutions.loaded() == {}
+
+        assert reopened.get_baseline_content("src/mod_1.py") == SAMPLE_PYTHON_MODULE
+        assert list(reopened._evolutions.loaded()) == ["src/mod_1.py"]
+
+    def test_cleanup_deletes_records(self, temp_project):
+        tracker = self._track(temp_project)
+        tracker.cleanup_task("task-001")
+
+        assert FileEvolutionTracker(project_dir=temp_project).storage.list_files() == []
+
+    def test_migrates_legacy_json(self, temp_project):
+        tracker = self._track(temp_project, count=2)
+        legacy = {
+            path: evolution.to_dict()
+            for path, evolution in tracker._evolutions.items()
+        }
+        storage_dir = temp_project / ".legacy"
+        storage_dir.mkdir()
+        (storage_dir / "file_evolution.json").write_text(json.dumps(legacy))
+
+        migrated = FileEvolutionTracker(project_dir=temp_project, storage_dir=storage_dir)
+
+        assert migrated.evolution_file.name == "file_evolution.db"
+        assert {
+            path: evolution.to_dict()
+            for path, evolution in migrated._evolutions.items()
+        } == legacy
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for Git Batch Object Reader
+=================================
+
+Tests the pooled git cat-file reader used by merge timelines and baselines:
+- Content matches git show, including missing files and CRLF text
+- Many files are read with a single process spawn
+- Concurrent readers and recovery from a dead process
+- Commit metadata parsed from the commit object
+"""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge import git_batch
+from merge.git_batch import CatFileProcess, get_object_pool, read_file_at, read_files_at
+from merge.git_utils import get_file_from_branch
+from merge.timeline_git import TimelineGitHelper
+
+
+@pytest.fixture(autouse=True)
+def fresh_pools():
+    """Make sure no cat-file process outlives a test."""
+    git_batch.close_object_pools()
+    yield
+    git_batch.close_object_pools()
+
+
+@pytest.fixture
+def batch_repo(temp_git_repo: Path) -> Path:
+    """Repository with a few text files, a CRLF file and a subdirectory."""
+    src = temp_git_repo / "src"
+    src.mkdir()
+    for i in range(20):
+        (src / f"mod_{i}.py").write_text(f"value = {i}\n")
+    (temp_git_repo / "windows.txt").write_bytes(b"line one\r\nline two\r\n")
+    (temp_git_repo / "with space.md").write_text("spaced\n")
+    subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Add files", "-m", "Longer body"],
+        cwd=temp_git_repo,
+        capture_output=True,
+    )
+    return temp_git_repo
+
+
+def _git_show(repo: Path, spec: str) -> str | None:
+    result = subprocess.run(
+        ["git", "show", spec], cwd=repo, capture_output=True, text=True
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+class TestReadFiles:
+    """Tests for reading blobs through the pool."""
+
+    def test_matches_git_show(self, batch_repo: Path):
+        paths = [f"src/mod_{i}.py" for i in range(20)] + [
+            "windows.txt",
+            "with space.md",
+            "missing.py",
+            "src",
+        ]
+        contents = read_files_at(batch_repo, "main", paths)
+
+        assert list(contents) == paths
+        for path in paths:
+            expected = _git_show(batch_repo, f"main:{path}")
+            if path == "src":
+                expected = None  # git show lists trees; callers want files only
+            assert contents[path] == expected, path
+
+    def test_single_file_helpers(self, batch_repo: Path):
+        assert read_file_at(batch_repo, "main", "src/mod_3.py") == "value = 3\n"
+        assert read_file_at(batch_repo, "no-such-branch", "src/mod_3.py") is None
+        assert get_file_from_branch(batch_repo, "missing.py", "main") is None
+
+    def test_one_process_for_many_files(self, batch_repo: Path, monkeypatch):
+        spawned = []
+        original_init = CatFileProcess.__init__
+
+        def counting_init(self, repo_path):
+            spawned.append(repo_path)
+            original_init(self, repo_path)
+
+        monkeypatch.setattr(CatFileProcess, "__init__", counting_init)
+
+        helper = TimelineGitHelper(batch_repo)
+        paths = [f"src/mod_{i}.py" for i in range(20)]
+        helper.get_files_content_at_commit(paths, "HEAD")
+        for path in paths:
+            helper.get_file_content_at_commit(path, "HEAD")
+
+        assert len(spawned) == 1
+
+    def test_concurrent_readers(self, batch_repo: Path):
+        errors = []
+
+        def reader(i):
+            try:
+                for _ in range(10):
+                    content = read_file_at(batch_repo, "main", f"src/mod_{i}.py")
+                    assert content == f"value = {i}\n"
+            except AssertionError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert get_object_pool(batch_repo)._created <= git_batch.POOL_SIZE
+
+    def test_recovers_from_dead_process(self, batch_repo: Path):
+        assert read_file_at(batch_repo, "main", "src/mod_1.py") == "value = 1\n"
+
+        pool = get_object_pool(batch_repo)
+        pool._idle[0]._proc.kill()
+        pool._idle[0]._proc.wait()
+
+        assert read_file_at(batch_repo, "main", "src/mod_2.py") == "value = 2\n"
+
+
+class TestCommitInfo:
+    """Tests for commit metadata read from the commit object."""
+
+    def test_matches_git_log(self, batch_repo: Path):
+        info = TimelineGitHelper(batch_repo).get_commit_info("HEAD")
+
+        def log(fmt):
+            return subprocess.run(
+                ["git", "log", "-1", f"--format={fmt}", "HEAD"],
+                cwd=batch_repo,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+
+        assert info["message"] == log("%s") == "Add files"
+        assert info["author"] == log("%an") == "Test User"
+        assert "22 files changed" in info["diff_summary"]
+
+    def test_unknown_commit(self, batch_repo: Path):
+        info = TimelineGitHelper(batch_repo).get_commit_info("0" * 40)
+        assert "message" not in info
+        assert "author" not in info
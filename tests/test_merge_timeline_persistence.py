@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for Timeline Persistence
+==============================
+
+Tests the SQLite-backed file timeline store:
+- Round trip of timelines, events and task views
+- Lazy loading of timelines on first access
+- Appending main branch events instead of rewriting timelines
+- Indexed task lookups and import of the legacy JSON layout
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge.file_timeline import (
+    BranchPoint,
+    FileTimeline,
+    FileTimelineTracker,
+    MainBranchEvent,
+    TaskFileView,
+    TimelinePersistence,
+)
+from merge.timeline_persistence import LazyTimelineMap
+
+
+def _timeline(file_path: str, tasks=("task-001",), events: int = 0) -> FileTimeline:
+    timeline = FileTimeline(file_path=file_path)
+    for task_id in tasks:
+        timeline.add_task_view(
+            TaskFileView(
+                task_id=task_id,
+                branch_point=BranchPoint("abc123", "base\n", datetime.now()),
+            )
+        )
+    for i in range(events):
+        timeline.add_main_event(_event(i))
+    return timeline
+
+
+def _event(i: int) -> MainBranchEvent:
+    return MainBranchEvent(
+        commit_hash=f"commit{i}",
+        timestamp=datetime.now(),
+        content=f"content {i}\n",
+        source="human",
+        commit_message=f"Change {i}",
+    )
+
+
+@pytest.fixture
+def persistence(temp_dir: Path):
+    store = TimelinePersistence(temp_dir)
+    yield store
+    store.close()
+
+
+class TestTimelinePersistence:
+    """Tests for the SQLite timeline store."""
+
+    def test_round_trip(self, temp_dir: Path, persistence: TimelinePersistence):
+        timeline = _timeline("src/App.tsx", tasks=("task-b", "task-a"), events=3)
+        persistence.save_timeline("src/App.tsx", timeline)
+
+        reopened = TimelinePersistence(temp_dir)
+        loaded = reopened.load_timeline("src/App.tsx")
+        reopened.close()
+
+        assert loaded.to_dict() == timeline.to_dict()
+        assert list(loaded.task_views) == ["task-b", "task-a"]
+        assert reopened.db_path.exists()
+
+    def test_events_are_appended(self, persistence: TimelinePersistence):
+        timeline = _timeline("src/app.py", events=2)
+        persistence.save_timeline("src/app.py", timeline)
+
+        statements = []
+        persistence._conn.set_trace_callback(statements.append)
+        timeline.add_main_event(_event(2))
+        persistence.save_timeline("src/app.py", timeline)
+        persistence._conn.set_trace_callback(None)
+
+        event_writes = [s for s in statements if "main_events" in s]
+        assert len(event_writes) == 1
+        assert event_writes[0].startswith("INSERT")
+        assert "commit2" in event_writes[0]
+        assert persistence.load_timeline("src/app.py").to_dict() == timeline.to_dict()
+
+    def test_unchanged_task_views_not_rewritten(
+        self, persistence: TimelinePersistence
+    ):
+        timeline = _timeline("src/app.py", tasks=("task-001", "task-002"))
+        persistence.save_timeline("src/app.py", timeline)
+
+        statements = []
+        persistence._conn.set_trace_callback(statements.append)
+        timeline.task_views["task-002"].status = "merged"
+        persistence.save_timeline("src/app.py", timeline)
+        persistence._conn.set_trace_callback(None)
+
+        view_writes = [s for s in statements if "INSERT INTO task_views" in s]
+        assert len(view_writes) == 1
+        assert "task-002" in view_writes[0]
+
+    def test_files_for_task(self, persistence: TimelinePersistence):
+        persistence.save_timeline("a.py", _timeline("a.py", tasks=("t1", "t2")))
+        persistence.save_timeline("b.py", _timeline("b.py", tasks=("t2",)))
+        merged = _timeline("c.py", tasks=("t1",))
+        merged.task_views["t1"].status = "merged"
+        persistence.save_timeline("c.py", merged)
+
+        assert persistence.files_for_task("t1") == ["a.py", "c.py"]
+        assert persistence.files_for_task("t2") == ["a.py", "b.py"]
+        assert persistence.files_for_task("t1", status="active") == ["a.py"]
+        assert persistence.files_for_task("missing") == []
+
+    def test_imports_legacy_json(self, temp_dir: Path):
+        timelines_dir = temp_dir / "file-timelines"
+        timelines_dir.mkdir()
+        legacy = _timeline("src/App.tsx", events=2)
+        (timelines_dir / "src_App.tsx.json").write_text(json.dumps(legacy.to_dict()))
+        (timelines_dir / "index.json").write_text(
+            json.dumps({"files": ["src/App.tsx", "gone.py"]})
+        )
+
+        store = TimelinePersistence(temp_dir)
+        assert store.list_timelines() == ["src/App.tsx"]
+        assert store.load_timeline("src/App.tsx").to_dict() == legacy.to_dict()
+        store.close()
+
+        # The import runs once; later JSON edits are ignored
+        (timelines_dir / "index.json").write_text(json.dumps({"files": []}))
+        store = TimelinePersistence(temp_dir)
+        assert store.list_timelines() == ["src/App.tsx"]
+        store.close()
+
+
+class TestLazyLoading:
+    """Tests for loading timelines on first access."""
+
+    def test_map_loads_on_access(self, persistence: TimelinePersistence, monkeypatch):
+        for i in range(5):
+            persistence.save_timeline(f"f{i}.py", _timeline(f"f{i}.py"))
+
+        loads = []
+        original = persistence.load_timeline
+
+        def counting_load(file_path):
+            loads.append(file_path)
+            return original(file_path)
+
+        monkeypatch.setattr(persistence, "load_timeline", counting_load)
+        timelines = LazyTimelineMap(persistence)
+
+        assert len(timelines) == 5
+        assert "f3.py" in timelines
+        assert loads == []
+
+        assert timelines["f3.py"].file_path == "f3.py"
+        assert timelines.get("f3.py") is timelines["f3.py"]
+        assert timelines.get("missing.py") is None
+        assert loads == ["f3.py"]
+
+    def test_delete_removes_stored_timeline(self, persistence: TimelinePersistence):
+        persistence.save_timeline("a.py", _timeline("a.py", events=2))
+        persistence.save_timeline("b.py", _timeline("b.py"))
+        timelines = LazyTimelineMap(persistence)
+
+        del timelines["a.py"]
+
+        assert "a.py" not in timelines
+        assert persistence.list_timelines() == ["b.py"]
+        assert persistence.load_timeline("a.py") is None
+        assert persistence.files_for_task("task-001") == ["b.py"]
+        assert "a.py" not in LazyTimelineMap(persistence)
+
+        # Saving again after a delete starts a fresh timeline
+        persistence.save_timeline("a.py", _timeline("a.py", events=1))
+        assert len(persistence.load_timeline("a.py").main_branch_history) == 1
+
+    def test_tracker_queries_use_index(self, temp_git_repo: Path, monkeypatch):
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-001", ["README.md", "new.py"], task_intent="x")
+        tracker.on_task_start("task-002", ["other.py"])
+
+        reopened = FileTimelineTracker(temp_git_repo)
+        assert reopened._timelines.loaded() == {}
+
+        assert reopened.get_files_for_task("task-001") == ["README.md", "new.py"]
+        assert reopened.get_task_drift("task-001") == {"README.md": 0, "new.py": 0}
+        assert set(reopened._timelines.loaded()) == {"README.md", "new.py"}
+
+        readme = reopened.get_timeline("README.md")
+        assert readme.task_views["task-001"].branch_point.content == "# Test Project\n"
+
+    def test_tracker_persists_merge(self, temp_git_repo: Path):
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-001", ["README.md"])
+        tracker.on_task_merged("task-001", "HEAD")
+
+        reopened = FileTimelineTracker(temp_git_repo)
+        timeline = reopened.get_timeline("README.md")
+        assert timeline.task_views["task-001"].status == "merged"
+        assert [e.source for e in timeline.main_branch_history] == ["merged_task"]
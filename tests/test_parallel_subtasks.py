@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for Parallel Subtask Selection
+====================================
+
+Tests the pieces concurrent coder sessions rely on:
+- Selecting pending subtasks from available parallel-safe phases
+- Keeping task log labels separate for concurrent sessions
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+# QA tests replace task_logger with a mock at collection time
+if isinstance(sys.modules.get("task_logger"), MagicMock):
+    del sys.modules["task_logger"]
+
+from core.progress import get_next_subtask, get_parallel_subtasks
+from task_logger import LogPhase, TaskLogger
+
+
+def _write_plan(spec_dir: Path, phases: list[dict]) -> None:
+    plan = {"feature": "Test", "workflow_type": "feature", "phases": phases}
+    (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+
+def _subtask(subtask_id: str, status: str = "pending") -> dict:
+    return {"id": subtask_id, "description": subtask_id, "status": status}
+
+
+@pytest.fixture
+def spec_dir(temp_dir: Path) -> Path:
+    _write_plan(
+        temp_dir,
+        [
+            {
+                "phase": 1,
+                "name": "Setup",
+                "subtasks": [_subtask("s1", "completed")],
+            },
+            {
+                "phase": 2,
+                "name": "Backend",
+                "depends_on": [1],
+                "parallel_safe": True,
+                "subtasks": [
+                    _subtask("b1", "completed"),
+                    _subtask("b2"),
+                    _subtask("b3"),
+                ],
+            },
+            {
+                "phase": 3,
+                "name": "Frontend",
+                "depends_on": [1],
+                "parallel_safe": True,
+                "subtasks": [_subtask("f1")],
+            },
+            {
+                "phase": 4,
+                "name": "Integration",
+                "depends_on": [2, 3],
+                "subtasks": [_subtask("i1")],
+            },
+        ],
+    )
+    return temp_dir
+
+
+class TestGetParallelSubtasks:
+    """Tests for core.progress.get_parallel_subtasks."""
+
+    def test_collects_across_parallel_phases(self, spec_dir: Path):
+        batch = get_parallel_subtasks(spec_dir, limit=10)
+
+        assert [s["id"] for s in batch] == ["b2", "b3", "f1"]
+        assert batch[0]["phase_name"] == "Backend"
+        assert batch[2]["phase_num"] == 3
+        # Same shape and order as the sequential loop
+        assert batch[0] == get_next_subtask(spec_dir)
+
+    def test_limit_and_exclude(self, spec_dir: Path):
+        assert [s["id"] for s in get_parallel_subtasks(spec_dir, 2)] == ["b2", "b3"]
+        assert [s["id"] for s in get_parallel_subtasks(spec_dir, 2, {"b2"})] == [
+            "b3",
+            "f1",
+        ]
+        assert get_parallel_subtasks(spec_dir, 0) == []
+
+    def test_sequential_phase_blocks_batch(self, temp_dir: Path):
+        _write_plan(
+            temp_dir,
+            [
+                {"phase": 1, "name": "Setup", "subtasks": [_subtask("s1")]},
+                {
+                    "phase": 2,
+                    "name": "Backend",
+                    "parallel_safe": True,
+                    "subtasks": [_subtask("b1"), _subtask("b2")],
+                },
+            ],
+        )
+
+        assert get_parallel_subtasks(temp_dir, 5) == []
+
+    def test_missing_plan(self, temp_dir: Path):
+        assert get_parallel_subtasks(temp_dir, 5) == []
+
+
+class TestSessionScope:
+    """Tests for TaskLogger.session_scope."""
+
+    def test_concurrent_sessions_keep_labels(self, temp_dir: Path):
+        logger = TaskLogger(temp_dir, emit_markers=False)
+        logger.start_phase(LogPhase.CODING)
+        logger.set_session(1)
+
+        async def session(num: int, subtask_id: str):
+            with logger.session_scope(num, subtask_id):
+                for i in range(3):
+                    logger.log(f"{subtask_id} step {i}")
+                    await asyncio.sleep(0)
+
+        async def main():
+            await asyncio.gather(session(2, "b2"), session(3, "b3"))
+
+        asyncio.run(main())
+
+        entries = logger.get_logs()["phases"]["coding"]["entries"]
+        by_subtask = {}
+        for entry in entries:
+            if entry["content"].startswith("b"):
+                assert entry["content"].startswith(entry["subtask_id"])
+                by_subtask.setdefault(entry["subtask_id"], set()).add(
+                    entry["session"]
+                )
+        assert by_subtask == {"b2": {2}, "b3": {3}}
+
+        # Outside a scope the values set by the main loop apply again
+        assert logger.current_session == 1
+        assert logger.current_subtask is None
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the Implementation Plan Cache
+=======================================
+
+Tests implementation_plan.cache and the progress helpers built on it:
+- Plans are parsed once per version of the file
+- Changes (including same-size rewrites) are picked up and reported
+- Aggregate counters and the lazily parsed ImplementationPlan
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from core.progress import count_subtasks, count_subtasks_detailed, get_next_subtask
+from implementation_plan import (
+    add_plan_listener,
+    get_cached_plan,
+    reset_plan_cache,
+)
+
+OLD_MTIME = time.time() - 3600
+
+
+def _write_plan(spec_dir: Path, statuses: list[str], mtime: float | None = None):
+    plan = {
+        "feature": "Test",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "phase": 1,
+                "name": "Build",
+                "subtasks": [
+                    {"id": f"s{i}", "description": f"Step {i}", "status": status}
+                    for i, status in enumerate(statuses)
+                ],
+            }
+        ],
+    }
+    plan_file = spec_dir / "implementation_plan.json"
+    plan_file.write_text(json.dumps(plan))
+    if mtime is not None:
+        os.utime(plan_file, (mtime, mtime))
+    return plan_file
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    reset_plan_cache()
+    yield
+    reset_plan_cache()
+
+
+class TestPlanCache:
+    """Tests for get_cached_plan."""
+
+    def test_unchanged_plan_not_reread(self, temp_dir: Path, monkeypatch):
+        _write_plan(temp_dir, ["completed", "pending"], OLD_MTIME)
+        first = get_cached_plan(temp_dir)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("plan was re-read")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        assert get_cached_plan(temp_dir) is first
+        assert count_subtasks(temp_dir) == (1, 2)
+        assert get_next_subtask(temp_dir)["id"] == "s1"
+
+    def test_change_is_reported(self, temp_dir: Path):
+        plan_file = _write_plan(temp_dir, ["pending", "pending"], OLD_MTIME)
+        get_cached_plan(temp_dir)
+
+        changes = []
+        remove = add_plan_listener(lambda path, entry: changes.append((path, entry)))
+        try:
+            _write_plan(temp_dir, ["completed", "in_progress"], OLD_MTIME + 10)
+            assert count_subtasks_detailed(temp_dir) == {
+                "completed": 1,
+                "in_progress": 1,
+                "pending": 0,
+                "failed": 0,
+                "total": 2,
+            }
+            assert [path for path, _ in changes] == [plan_file]
+
+            plan_file.unlink()
+            assert get_cached_plan(temp_dir) is None
+            assert changes[-1] == (plan_file, None)
+        finally:
+            remove()
+
+    def test_same_size_rewrite_of_recent_file(self, temp_dir: Path):
+        plan_file = _write_plan(temp_dir, ["pending", "failed"])
+        st = plan_file.stat()
+        assert get_cached_plan(temp_dir).counts["failed"] == 1
+
+        # Same size and mtime, different content
+        _write_plan(temp_dir, ["failed", "pending"])
+        os.utime(plan_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert get_next_subtask(temp_dir)["id"] == "s1"
+
+    def test_parsed_plan(self, temp_dir: Path):
+        _write_plan(temp_dir, ["completed", "pending"], OLD_MTIME)
+        cached = get_cached_plan(temp_dir / "implementation_plan.json")
+
+        plan = cached.plan
+        assert plan is cached.plan
+        assert plan.feature == "Test"
+        assert plan.get_next_subtask()[1].id == "s1"
+
+    def test_invalid_plan(self, temp_dir: Path):
+        (temp_dir / "implementation_plan.json").write_text("{not json")
+        assert get_cached_plan(temp_dir) is None
+        assert count_subtasks(temp_dir) == (0, 0)
+
+    def test_returned_subtasks_are_detached(self, temp_dir: Path):
+        _write_plan(temp_dir, ["pending"], OLD_MTIME)
+        subtask = get_next_subtask(temp_dir)
+        subtask["status"] = "completed"
+
+        assert get_next_subtask(temp_dir)["status"] == "pending"
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for Project File Census
+=============================
+
+Tests the single-pass file census shared by the project detectors:
+- Extension and filename lookups
+- Pruning of dependency and cache directories
+- ConfigParser answers identical to Path.glob for supported patterns
+- Benchmark of security profile creation with and without the census
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+from project.config_parser import ConfigParser
+from project.file_census import FileCensus
+from project.stack_detector import StackDetector
+from project_analyzer import ProjectAnalyzer
+
+
+@pytest.fixture
+def polyglot_project(temp_dir: Path) -> Path:
+    """Create a small polyglot project with a node_modules directory."""
+    (temp_dir / "pyproject.toml").write_text('[project]\nname = "app"\n')
+    (temp_dir / "main.py").write_text("print('hi')\n")
+    (temp_dir / "deploy.sh").write_text("#!/bin/sh\n")
+    (temp_dir / "src" / "web").mkdir(parents=True)
+    (temp_dir / "src" / "web" / "app.tsx").write_text("export {}\n")
+    (temp_dir / "k8s").mkdir()
+    (temp_dir / "k8s" / "deployment.yaml").write_text("apiVersion: v1\nkind: Pod\n")
+    (temp_dir / "node_modules" / "lib").mkdir(parents=True)
+    (temp_dir / "node_modules" / "lib" / "index.rs").write_text("fn main() {}\n")
+    return temp_dir
+
+
+class TestFileCensus:
+    """Tests for FileCensus lookups."""
+
+    def test_indexes_extensions_and_names(self, polyglot_project: Path):
+        census = FileCensus(polyglot_project)
+
+        assert census.count(".py") == 1
+        assert census.glob("**/*.tsx") == ["src/web/app.tsx"]
+        assert census.glob("*.tsx") == []
+        assert census.glob("*.sh") == ["deploy.sh"]
+        assert census.glob("**/deployment.yaml") == ["k8s/deployment.yaml"]
+
+    def test_prunes_dependency_dirs(self, polyglot_project: Path):
+        census = FileCensus(polyglot_project)
+
+        assert census.count(".rs") == 0
+        assert census.exists("node_modules/") is True
+        assert census.exists("node_modules/lib/index.rs") is None
+
+    def test_literal_paths(self, polyglot_project: Path):
+        census = FileCensus(polyglot_project)
+
+        assert census.exists("k8s/") is True
+        assert census.exists("k8s/deployment.yaml") is True
+        assert census.exists("charts/") is False
+
+    def test_unsupported_patterns_fall_back(self, polyglot_project: Path):
+        census = FileCensus(polyglot_project)
+
+        assert census.glob("src/**/*.tsx") is None
+        assert census.glob("**/*.d.ts") is None
+
+        parser = ConfigParser(polyglot_project, census)
+        assert parser.glob_files("src/**/*.tsx") == [
+            polyglot_project / "src" / "web" / "app.tsx"
+        ]
+
+    @pytest.mark.parametrize(
+        "pattern", ["*.py", "**/*.py", "**/*.tsx", "*.sh", "**/deployment.yaml"]
+    )
+    def test_matches_path_glob(self, polyglot_project: Path, pattern: str):
+        """Census answers match Path.glob outside pruned directories."""
+        with_census = ConfigParser(polyglot_project, FileCensus(polyglot_project))
+        without = ConfigParser(polyglot_project)
+
+        assert sorted(with_census.glob_files(pattern)) == sorted(
+            without.glob_files(pattern)
+        )
+
+
+class TestDetectorsWithCensus:
+    """Tests for detectors sharing a census."""
+
+    def test_stack_detection_matches(self, polyglot_project: Path):
+        (polyglot_project / "node_modules").rename(polyglot_project / "deps")
+        census = FileCensus(polyglot_project)
+
+        shared = StackDetector(polyglot_project, census).detect_all()
+        plain = StackDetector(polyglot_project).detect_all()
+
+        assert shared.languages == plain.languages
+        assert shared.infrastructure == plain.infrastructure
+
+    def test_analyzer_walks_once(self, polyglot_project: Path, monkeypatch):
+        walks = []
+        original_walk = FileCensus._walk
+
+        def counting_walk(self):
+            walks.append(self.project_dir)
+            original_walk(self)
+
+        monkeypatch.setattr(FileCensus, "_walk", counting_walk)
+        profile = ProjectAnalyzer(polyglot_project).analyze(force=True)
+
+        assert len(walks) == 1
+        assert "python" in profile.detected_stack.languages
+        assert "typescript" in profile.detected_stack.languages
+        assert "rust" not in profile.detected_stack.languages
+
+
+class GlobProjectAnalyzer(ProjectAnalyzer):
+    """ProjectAnalyzer whose detectors glob on their own, as before the census."""
+
+    @property
+    def census(self):
+        return None
+
+
+@pytest.mark.slow
+class TestFileCensusBenchmark:
+    """Benchmark security profile creation on a large synthetic tree."""
+
+    def _build_tree(self, root: Path, packages: int = 100, files: int = 30) -> None:
+        (root / "package.json").write_text('{"scripts": {"dev": "vite"}}')
+        for i in range(20):
+            src = root / "src" / f"module_{i}"
+            src.mkdir(parents=True)
+            for j in range(20):
+                (src / f"file_{j}.ts").write_text("")
+        for i in range(packages):
+            pkg = root / "node_modules" / f"pkg_{i}" / "lib"
+            pkg.mkdir(parents=True)
+            for j in range(files):
+                (pkg / f"file_{j}.js").write_text("")
+
+    def _time_profile(self, analyzer_class, project_dir: Path):
+        """Best of three cold (force=True) profile analyses."""
+        best = float("inf")
+        for _ in range(3):
+            analyzer = analyzer_class(project_dir)
+            start = time.perf_counter()
+            profile = analyzer.analyze(force=True)
+            best = min(best, time.perf_counter() - start)
+        return profile, best
+
+    def test_profile_creation_speedup(self, temp_dir: Path, capsys):
+        self._build_tree(temp_dir)
+
+        before, before_time = self._time_profile(GlobProjectAnalyzer, temp_dir)
+        after, after_time = self._time_profile(ProjectAnalyzer, temp_dir)
+
+        with capsys.disabled():
+            print(
+                f"\nSecurity profile creation: per-pattern glob {before_time:.3f}s, "
+                f"shared census {after_time:.3f}s "
+                f"({before_time / max(after_time, 1e-9):.1f}x)"
+            )
+
+        assert after.detected_stack == before.detected_stack
+        assert after.get_all_allowed_commands() == before.get_all_allowed_commands()
+        # Loose bound: the census skips node_modules, the globs walk all of it
+        assert after_time < before_time * 0.8
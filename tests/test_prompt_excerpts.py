@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Tests for Prompt File Excerpts
+==============================
+
+Tests prompts_pkg.excerpts and its use by load_subtask_context:
+- Head excerpts keep the existing truncation format
+- Excerpts are cached until the file changes
+- Symbol-focused windows cover the lines a subtask talks about
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from prompts_pkg import excerpts
+from prompts_pkg.excerpts import (
+    extract_symbols,
+    read_excerpt,
+    reset_excerpt_cache,
+    subtask_symbols,
+)
+from prompts_pkg.prompt_generator import load_subtask_context
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start every test with an empty excerpt cache."""
+    reset_excerpt_cache()
+    yield
+    reset_excerpt_cache()
+
+
+def _write_lines(path: Path, count: int, special: dict[int, str] | None = None):
+    special = special or {}
+    path.write_text(
+        "".join(f"{special.get(i, f'line {i}')}\n" for i in range(1, count + 1))
+    )
+
+
+class TestHeadExcerpt:
+    """Tests for excerpts of the start of a file."""
+
+    def test_truncates_with_line_count(self, temp_dir: Path) -> None:
+        """Test that long files are cut with a note of the lines left out."""
+        path = temp_dir / "big.py"
+        _write_lines(path, 250)
+
+        rendered = read_excerpt(path, max_lines=200).render()
+
+        assert rendered.startswith("line 1\n")
+        assert "line 200\n\n... (truncated, 50 more lines)" in rendered
+        assert "line 201" not in rendered
+
+    def test_short_file_is_returned_unchanged(self, temp_dir: Path) -> None:
+        """Test that files within the limit are returned as-is."""
+        path = temp_dir / "small.py"
+        path.write_text("a\r\nb\r\nc")
+
+        excerpt = read_excerpt(path, max_lines=200)
+
+        assert excerpt.render() == "a\nb\nc"
+        assert not excerpt.truncated
+
+    def test_huge_remainder_is_not_counted(self, temp_dir: Path, monkeypatch) -> None:
+        """Test that lines past the scan limit are reported in bytes."""
+        monkeypatch.setattr(excerpts, "MAX_SCAN_BYTES", 100)
+        path = temp_dir / "huge.log"
+        _write_lines(path, 100)
+
+        excerpt = read_excerpt(path, max_lines=2)
+
+        assert excerpt.more_lines is None
+        assert excerpt.render().endswith(
+            f"... (truncated, {path.stat().st_size - 14} more bytes)"
+        )
+
+
+class TestExcerptCache:
+    """Tests for reuse of excerpts across subtasks."""
+
+    def test_unchanged_file_is_read_once(self, temp_dir: Path, monkeypatch) -> None:
+        """Test that a second request is served from the cache."""
+        path = temp_dir / "pattern.py"
+        _write_lines(path, 10)
+        reads = []
+        original = excerpts._read_head
+        monkeypatch.setattr(
+            excerpts,
+            "_read_head",
+            lambda *args: reads.append(args) or original(*args),
+        )
+
+        first = read_excerpt(path, max_lines=5)
+        second = read_excerpt(path, max_lines=5)
+
+        assert first is second
+        assert len(reads) == 1
+
+    def test_modified_file_is_reread(self, temp_dir: Path) -> None:
+        """Test that a change of mtime or size invalidates the excerpt."""
+        path = temp_dir / "pattern.py"
+        path.write_text("old\n")
+        assert read_excerpt(path).text == "old\n"
+
+        path.write_text("newer\n")
+        os.utime(path, ns=(0, 10**9))
+
+        assert read_excerpt(path).text == "newer\n"
+
+
+class TestSymbolWindow:
+    """Tests for excerpts centered on symbols named by a subtask."""
+
+    def test_extract_symbols(self) -> None:
+        """Test that identifiers are found and plain words ignored."""
+        text = "Update `config.load` and parse_config() so UserService uses retry"
+        assert extract_symbols(text) == ["load", "parse_config", "UserService"]
+
+    def test_subtask_symbols_include_explicit_list(self) -> None:
+        """Test that an explicit symbols list comes first."""
+        subtask = {"symbols": ["Widget"], "description": "Fix render_widget"}
+        assert subtask_symbols(subtask) == ["Widget", "render_widget"]
+
+    def test_window_covers_definition(self, temp_dir: Path) -> None:
+        """Test that the window shows the definition, not the file head."""
+        path = temp_dir / "service.py"
+        _write_lines(
+            path,
+            500,
+            {350: "def parse_config(path):", 360: "    return parse_config(x)"},
+        )
+
+        excerpt = read_excerpt(path, max_lines=40, symbols=["parse_config"])
+        rendered = excerpt.render()
+
+        assert excerpt.start_line == 340  # definition a quarter of the way down
+        assert excerpt.end_line == 379
+        assert rendered.startswith("... (lines 340-379, around parse_config)")
+        assert "def parse_config(path):" in rendered
+        assert rendered.endswith("... (truncated, 121 more lines)")
+
+    def test_unmentioned_symbols_fall_back_to_head(self, temp_dir: Path) -> None:
+        """Test that files without the symbols get the usual head excerpt."""
+        path = temp_dir / "other.py"
+        _write_lines(path, 100)
+
+        excerpt = read_excerpt(path, max_lines=10, symbols=["parse_config"])
+
+        assert excerpt.start_line == 1
+        assert excerpt.text.startswith("line 1\n")
+
+
+class TestLoadSubtaskContext:
+    """Tests for load_subtask_context using excerpts."""
+
+    def test_loads_patterns_and_files(self, temp_dir: Path) -> None:
+        """Test context loading, including unreadable files."""
+        _write_lines(temp_dir / "pattern.py", 5)
+        _write_lines(temp_dir / "target.py", 300, {280: "class UserService:"})
+        (temp_dir / "folder").mkdir()
+        subtask = {
+            "description": "Add caching to UserService",
+            "patterns_from": ["pattern.py", "missing.py"],
+            "files_to_modify": ["target.py", "folder"],
+        }
+
+        context = load_subtask_context(temp_dir, temp_dir, subtask)
+        focused = load_subtask_context(
+            temp_dir, temp_dir, subtask, focus_on_symbols=True
+        )
+
+        pattern = (temp_dir / "pattern.py").read_text()
+        assert context["patterns"] == {"pattern.py": pattern}
+        assert context["files_to_modify"]["folder"] == "(Could not read file)"
+        assert "(truncated, 100 more lines)" in context["files_to_modify"]["target.py"]
+        assert "class UserService:" not in context["files_to_modify"]["target.py"]
+        assert "class UserService:" in focused["files_to_modify"]["target.py"]
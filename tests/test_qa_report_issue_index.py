@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for QA Report - Issue Fingerprint Index
+=============================================
+
+Tests qa/issue_index.py and its use by qa/report.py:
+- LSH lookups give the same answers as comparing every pair of issues
+- The index is persisted next to qa_iteration_history and extended
+  incrementally
+"""
+
+import random
+import sys
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pytest
+
+# Add tests directory to path for helper imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Setup mocks before importing auto-claude modules
+from qa_report_helpers import cleanup_qa_report_mocks, setup_qa_report_mocks
+
+# Setup mocks
+setup_qa_report_mocks()
+
+# Import report functions after mocking
+from qa.criteria import load_implementation_plan
+from qa.issue_index import EXACT_SCAN_LIMIT, IssueIndex
+from qa.report import (
+    ISSUE_SIMILARITY_THRESHOLD,
+    _normalize_issue_key,
+    build_issue_index,
+    get_issue_index,
+    get_recurring_issue_summary,
+    has_recurring_issues,
+    record_iteration,
+)
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture(scope="module", autouse=True)
+def cleanup_mocked_modules():
+    """Restore original modules after all tests in this module complete."""
+    yield  # Run all tests first
+    cleanup_qa_report_mocks()
+
+
+WORDS = (
+    "missing null check handler timeout retry cache invalid token session "
+    "parse error config value undefined import unused variable assertion status"
+).split()
+
+
+def _make_history(seed: int, iterations: int, per_iteration: int):
+    """History of near-duplicate issues drawn from a pool of base issues."""
+    rng = random.Random(seed)
+    files = [f"src/{w}/{m}.py" for w in WORDS[:8] for m in ("api", "models")]
+    base = [
+        {
+            "title": " ".join(rng.sample(WORDS, rng.randint(3, 6))),
+            "file": rng.choice(files),
+            "line": rng.randint(1, 300),
+        }
+        for _ in range(60)
+    ]
+
+    def variant():
+        issue = dict(rng.choice(base))
+        title = list(issue["title"])
+        for _ in range(rng.randint(0, 4)):
+            title[rng.randrange(len(title))] = rng.choice("abcdefgh ")
+        issue["title"] = "".join(title)
+        if rng.random() < 0.3:
+            issue["line"] = rng.randint(1, 300)
+        return issue
+
+    history = [
+        {"status": "rejected", "issues": [variant() for _ in range(per_iteration)]}
+        for _ in range(iterations)
+    ]
+    return history, [variant() for _ in range(15)]
+
+
+def _ratio(a, b) -> float:
+    return SequenceMatcher(
+        None, _normalize_issue_key(a), _normalize_issue_key(b)
+    ).ratio()
+
+
+# =============================================================================
+# LSH LOOKUP TESTS
+# =============================================================================
+
+
+class TestIssueIndexLookup:
+    """Tests that indexed lookups match exhaustive comparison."""
+
+    def test_recurrence_counts_match_pairwise(self) -> None:
+        """Test occurrence counts against comparing every historical issue."""
+        history, current = _make_history(seed=7, iterations=20, per_iteration=10)
+        index = build_issue_index(history)
+        assert len(index.entries) > EXACT_SCAN_LIMIT  # LSH path is used
+
+        historical = [i for record in history for i in record["issues"]]
+        _, recurring = has_recurring_issues(current, history, threshold=1, index=index)
+
+        assert [r["occurrence_count"] for r in recurring] == [
+            1 + sum(_ratio(c, h) >= ISSUE_SIMILARITY_THRESHOLD for h in historical)
+            for c in current
+        ]
+
+    def test_summary_groups_match_greedy_clustering(self) -> None:
+        """Test grouping against greedy clustering over all issues."""
+        history, _ = _make_history(seed=11, iterations=20, per_iteration=10)
+
+        groups: dict[str, list] = {}
+        for record in history:
+            for issue in record["issues"]:
+                key = _normalize_issue_key(issue)
+                for existing in groups:
+                    if (
+                        SequenceMatcher(None, key, existing).ratio()
+                        >= ISSUE_SIMILARITY_THRESHOLD
+                    ):
+                        groups[existing].append(issue)
+                        break
+                else:
+                    groups[key] = [issue]
+
+        summary = get_recurring_issue_summary(history)
+
+        assert summary["total_issues"] == 200
+        assert summary["unique_issues"] == len(groups)
+        ranked = sorted(groups.values(), key=len, reverse=True)[:5]
+        assert [c["occurrences"] for c in summary["most_common"]] == [
+            len(g) for g in ranked
+        ]
+        assert [c["title"] for c in summary["most_common"]] == [
+            g[0]["title"] for g in ranked
+        ]
+
+
+# =============================================================================
+# PERSISTENCE TESTS
+# =============================================================================
+
+
+class TestIssueIndexPersistence:
+    """Tests for the qa_issue_index stored in implementation_plan.json."""
+
+    def test_record_iteration_extends_index(self, spec_dir: Path) -> None:
+        """Test that each recorded iteration is folded into the index."""
+        issue = {"title": "Missing null check", "file": "app.py", "line": 3}
+        record_iteration(spec_dir, 1, "rejected", [issue])
+        record_iteration(spec_dir, 2, "rejected", [issue, {"title": "Other"}])
+
+        stored = load_implementation_plan(spec_dir)["qa_issue_index"]
+        assert stored["issues_indexed"] == 3
+        assert [g["count"] for g in stored["groups"]] == [2, 1]
+
+        index = get_issue_index(spec_dir)
+        assert index.count_similar(issue) == 2
+
+    def test_loaded_index_is_not_recomputed(self, spec_dir: Path, monkeypatch) -> None:
+        """Test that only issues recorded after the stored index are added."""
+        history, current = _make_history(seed=3, iterations=8, per_iteration=10)
+        for number, record in enumerate(history, 1):
+            record_iteration(spec_dir, number, "rejected", record["issues"])
+
+        added = []
+        original_add = IssueIndex.add
+        monkeypatch.setattr(
+            IssueIndex,
+            "add",
+            lambda self, issue: added.append(issue) or original_add(self, issue),
+        )
+        index = get_issue_index(spec_dir)
+
+        assert added == []
+        assert [index.count_similar(c) for c in current] == [
+            build_issue_index(history).count_similar(c) for c in current
+        ]
+
+    def test_rewritten_history_rebuilds_index(self) -> None:
+        """Test that a shorter history than the index triggers a rebuild."""
+        index = IssueIndex(_normalize_issue_key, ISSUE_SIMILARITY_THRESHOLD)
+        index.sync([{"issues": [{"title": "A"}, {"title": "B"}]}])
+        index.sync([{"issues": [{"title": "C"}]}])
+
+        assert index.issues_indexed == 1
+        assert [g.title for g in index.groups] == ["C"]
+
+    def test_incompatible_index_is_ignored(self) -> None:
+        """Test that data from another threshold or version is discarded."""
+        index = build_issue_index([{"issues": [{"title": "A"}]}])
+        data = index.to_dict()
+
+        other = IssueIndex.from_dict(
+            {**data, "threshold": 0.5}, _normalize_issue_key, ISSUE_SIMILARITY_THRESHOLD
+        )
+        assert other.issues_indexed == 0
+
+        same = IssueIndex.from_dict(
+            data, _normalize_issue_key, ISSUE_SIMILARITY_THRESHOLD
+        )
+        assert same.to_dict() == data
@@ -10,6 +10,9 @@ Tests the security.py module functionality including:
 - Security hook behavior
 """
 
+import asyncio
+import time
+
 import pytest
 
 from security import (
@@ -29,7 +32,9 @@ from security import (
     validate_mongosh_command,
     validate_mysqladmin_command,
     get_command_for_validation,
+    parse_command,
     reset_profile_cache,
+    bash_security_hook,
 )
 from project_analyzer import SecurityProfile, BASE_COMMANDS
 
@@ -323,6 +328,80 @@ class TestGetCommandForValidation:
         assert segment == ""
 
 
+class TestParseCommand:
+    """Tests for the memoized command parser."""
+
+    def test_matches_uncached_parsing(self):
+        """Commands and segments match extract/split results."""
+        command = "cd /tmp && rm -rf build; ls | wc -l"
+        parsed = parse_command(command)
+
+        assert list(parsed.commands) == extract_commands(command)
+        assert list(parsed.segments) == split_command_segments(command)
+        assert parsed.segment_for("rm") == get_command_for_validation(
+            "rm", split_command_segments(command)
+        )
+        assert parsed.segment_for("git") == ""
+
+    def test_simple_command_reuses_commands(self):
+        parsed = parse_command("rm -rf build")
+        assert parsed.segment_commands == (("rm",),)
+
+    def test_results_are_cached(self):
+        parse_command.cache_clear()
+        first = parse_command("git status")
+        second = parse_command("git status")
+
+        assert first is second
+        assert parse_command.cache_info().hits == 1
+
+    def test_unparseable_command(self):
+        assert parse_command("echo 'unclosed quote").commands == ()
+        assert parse_command("ls && echo 'unclosed").commands == ()
+
+    def test_quoted_operators_do_not_split(self):
+        parsed = parse_command("""echo "a && b; c" && grep 'x || y' f""")
+
+        assert parsed.segments == ('echo "a && b; c"', "grep 'x || y' f")
+        assert parsed.commands == ("echo", "grep")
+
+    def test_operators_without_spaces(self):
+        parsed = parse_command("cd /tmp&&rm -rf build;ls")
+
+        assert parsed.commands == ("cd", "rm", "ls")
+        assert parsed.segment_for("rm") == "rm -rf build"
+
+
+class TestAllowedCommandsCache:
+    """Tests for the precomputed allowlist on SecurityProfile."""
+
+    def test_reused_between_calls(self):
+        profile = SecurityProfile()
+        profile.base_commands = {"ls", "cat"}
+
+        assert profile.get_all_allowed_commands() is profile.get_all_allowed_commands()
+        assert isinstance(profile.get_all_allowed_commands(), frozenset)
+
+    def test_invalidated_on_change(self):
+        profile = SecurityProfile()
+        profile.base_commands = {"ls"}
+        assert "python" not in profile.get_all_allowed_commands()
+
+        profile.stack_commands = {"python"}
+        assert "python" in profile.get_all_allowed_commands()
+
+        profile.stack_commands = profile.stack_commands - {"python"} | {"pip"}
+        assert "pip" in profile.get_all_allowed_commands()
+        assert "python" not in profile.get_all_allowed_commands()
+
+    def test_command_sets_are_immutable(self):
+        profile = SecurityProfile(base_commands={"ls"})
+        assert isinstance(profile.base_commands, frozenset)
+
+        with pytest.raises(AttributeError):
+            profile.base_commands.add("rm")
+
+
 class TestSecurityProfileIntegration:
     """Tests for security profile integration."""
 
@@ -371,6 +450,74 @@ class TestSecurityProfileIntegration:
         assert profile1 is profile2
 
 
+class TestProfileCache:
+    """Tests for the per-project security profile cache."""
+
+    @pytest.fixture
+    def analysis_counter(self, monkeypatch):
+        import security.profile as profile_module
+
+        calls = []
+        original = profile_module.get_or_create_profile
+
+        def counting(project_dir, spec_dir=None):
+            calls.append(project_dir)
+            return original(project_dir, spec_dir)
+
+        monkeypatch.setattr(profile_module, "get_or_create_profile", counting)
+        reset_profile_cache()
+        yield calls
+        reset_profile_cache()
+
+    def _make_project(self, root, name):
+        project = root / name
+        project.mkdir()
+        (project / "requirements.txt").write_text("flask\n")
+        return project
+
+    def test_interleaved_projects_stay_cached(self, temp_dir, analysis_counter):
+        from security import get_security_profile
+
+        project_a = self._make_project(temp_dir, "a")
+        project_b = self._make_project(temp_dir, "b")
+
+        profile_a = get_security_profile(project_a)
+        profile_b = get_security_profile(project_b)
+        for _ in range(3):
+            assert get_security_profile(project_a) is profile_a
+            assert get_security_profile(project_b) is profile_b
+
+        assert len(analysis_counter) == 2
+
+    def test_invalidated_when_key_file_changes(self, temp_dir, analysis_counter):
+        from security import get_security_profile
+
+        project = self._make_project(temp_dir, "app")
+        first = get_security_profile(project)
+
+        (project / "package.json").write_text('{"name": "app"}')
+        second = get_security_profile(project)
+
+        assert second is not first
+        assert "npm" in second.get_all_allowed_commands()
+        assert len(analysis_counter) == 2
+
+    def test_evicts_least_recently_used(self, temp_dir, analysis_counter, monkeypatch):
+        import security.profile as profile_module
+        from security import get_security_profile
+
+        monkeypatch.setattr(profile_module, "PROFILE_CACHE_SIZE", 2)
+        projects = [self._make_project(temp_dir, f"p{i}") for i in range(3)]
+
+        for project in projects:
+            get_security_profile(project)
+        get_security_profile(projects[2])
+        assert len(analysis_counter) == 3
+
+        get_security_profile(projects[0])
+        assert len(analysis_counter) == 4
+
+
 class TestGitCommitValidator:
     """Tests for git commit validation (secret scanning)."""
 
@@ -688,3 +835,52 @@ class TestMysqladminValidator:
         """Blocks kill."""
         allowed, reason = validate_mysqladmin_command("mysqladmin kill 123")
         assert allowed is False
+
+
+@pytest.mark.slow
+class TestBashHookLatency:
+    """Microbenchmark for per-call bash_security_hook latency."""
+
+    COMMANDS = [
+        "git status",
+        "npm test && npm run lint",
+        "cd /tmp && rm -rf build; ls | wc -l",
+        "python -m pytest -q tests/ && git add -A && git commit -m 'wip'",
+        "cat file | grep pattern | sort | uniq -c | head -20",
+    ]
+
+    def _time_calls(self, iterations: int, clear_cache: bool = False) -> float:
+        async def run():
+            elapsed = 0.0
+            for _ in range(iterations):
+                if clear_cache:
+                    parse_command.cache_clear()
+                start = time.perf_counter()
+                for command in self.COMMANDS:
+                    await bash_security_hook(
+                        {"tool_name": "Bash", "tool_input": {"command": command}}
+                    )
+                elapsed += time.perf_counter() - start
+            return elapsed
+
+        return asyncio.run(run())
+
+    def test_hook_latency(self, python_project, monkeypatch, capsys):
+        monkeypatch.chdir(python_project)
+        reset_profile_cache()
+        self._time_calls(1)  # Build the profile outside the measurement
+
+        iterations = 200
+        calls = iterations * len(self.COMMANDS)
+
+        # Best of three to keep scheduler noise out of the comparison
+        cold = min(self._time_calls(iterations, clear_cache=True) for _ in range(3))
+        warm = min(self._time_calls(iterations) for _ in range(3))
+
+        with capsys.disabled():
+            print(
+                f"\nbash_security_hook: uncached {cold / calls * 1e6:.1f}us/call, "
+                f"cached {warm / calls * 1e6:.1f}us/call"
+            )
+
+        assert warm < cold
@@ -7,10 +7,17 @@ Tests cover:
 - Monorepo service discovery
 - Service configuration
 - Orchestration results
+- Concurrent readiness checks
+- Local service supervision and log capture
 """
 
+import asyncio
+import http.server
 import json
+import socket
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -27,6 +34,12 @@ from service_orchestrator import (
     is_multi_service_project,
     get_service_config,
 )
+from services.health import (
+    backoff_delay,
+    parse_port_mappings,
+    wait_for_services,
+)
+from services.supervisor import ProcessSupervisor, RotatingLog
 
 
 # =============================================================================
@@ -477,3 +490,257 @@ class TestEdgeCases:
         assert api is not None
         assert api.path == "services/api"
         assert api.type == "local"
+
+
+# =============================================================================
+# READINESS CHECKS
+# =============================================================================
+
+
+class TestHealthCheckParsing:
+    """Tests for health endpoints and ports parsed from docker-compose."""
+
+    def test_port_mappings(self):
+        """Test short and long port syntax."""
+        assert parse_port_mappings(
+            [
+                "8080:80",
+                "127.0.0.1:5433:5432/tcp",
+                3000,
+                "9000-9001:9000-9001",
+                {"published": 8443, "target": 443},
+            ]
+        ) == [(8080, 80), (5433, 5432), (8443, 443)]
+
+    def test_compose_healthcheck_url(self, temp_dir):
+        """Test that the container healthcheck URL is mapped to the host port."""
+        compose = temp_dir / "docker-compose.yml"
+        compose.write_text("""
+services:
+  api:
+    image: api
+    ports:
+      - "127.0.0.1:8081:8000"
+    healthcheck:
+      test: ["CMD-SHELL", "curl -f http://localhost:8000/healthz || exit 1"]
+  web:
+    image: web
+    ports:
+      - "3001:80"
+    healthcheck:
+      test: wget --spider -q http://127.0.0.1/
+  db:
+    image: postgres
+    ports:
+      - "5433:5432"
+    healthcheck:
+      test: ["CMD", "pg_isready"]
+""")
+
+        services = {s.name: s for s in ServiceOrchestrator(temp_dir).get_services()}
+
+        assert services["api"].port == 8081
+        assert services["api"].health_check_url == "http://localhost:8081/healthz"
+        assert services["web"].health_check_url == "http://localhost:3001/"
+        assert services["db"].port == 5433
+        assert services["db"].health_check_url is None
+
+
+class TestReadiness:
+    """Tests for concurrent readiness probing."""
+
+    def test_services_probed_concurrently(self):
+        """A slow service does not delay detecting the fast ones."""
+
+        async def scenario():
+            async def accept(reader, writer):
+                writer.close()
+
+            fast = await asyncio.start_server(accept, "localhost", 0)
+            fast_port = fast.sockets[0].getsockname()[1]
+
+            # Reserve a port for a service that only comes up later
+            late = await asyncio.start_server(accept, "localhost", 0)
+            late_port = late.sockets[0].getsockname()[1]
+            late.close()
+            await late.wait_closed()
+
+            async def start_late():
+                await asyncio.sleep(0.3)
+                return await asyncio.start_server(accept, "localhost", late_port)
+
+            starter = asyncio.create_task(start_late())
+            health = await wait_for_services(
+                [
+                    ServiceConfig(name="late", port=late_port),
+                    ServiceConfig(name="fast", port=fast_port),
+                    ServiceConfig(name="worker"),
+                ],
+                timeout=5,
+            )
+            (await starter).close()
+            fast.close()
+            return health
+
+        late, fast, worker = asyncio.run(scenario())
+
+        assert fast.ready and fast.time_to_ready < 0.2 and fast.attempts == 1
+        assert late.ready and 0.3 <= late.time_to_ready < 2
+        assert late.attempts > 1
+        assert worker.ready and worker.attempts == 0
+
+    def test_http_health_endpoint(self):
+        """Test HTTP probes and the per-service failure report."""
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200 if self.path == "/health" else 503)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.HTTPServer(("localhost", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://localhost:{server.server_address[1]}"
+        try:
+            healthy, failing = asyncio.run(
+                wait_for_services(
+                    [
+                        ServiceConfig(name="api", health_check_url=f"{url}/health"),
+                        ServiceConfig(name="admin", health_check_url=f"{url}/ready"),
+                    ],
+                    timeout=0.3,
+                )
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert healthy.ready is True
+        assert failing.ready is False
+        assert failing.attempts > 1
+        assert "503" in failing.last_error
+
+    def test_wait_for_health_reports_per_service(self, temp_dir):
+        """Test that the orchestrator records time-to-ready and failures."""
+        orchestrator = ServiceOrchestrator(temp_dir)
+        orchestrator._services = [
+            ServiceConfig(name="worker"),
+            ServiceConfig(name="closed", port=find_free_port(), startup_timeout=0),
+        ]
+        result = OrchestrationResult()
+
+        assert orchestrator._wait_for_health(5, result) is False
+        assert result.time_to_ready == {"worker": 0.0}
+        assert result.services_failed == ["closed"]
+        assert result.errors[0].startswith("closed not healthy after 1 checks")
+
+    def test_backoff_starts_small_and_is_capped(self):
+        """Test the jittered exponential backoff."""
+        assert 0.025 <= backoff_delay(0) <= 0.05
+        assert 0.05 <= backoff_delay(1) <= 0.1
+        assert 1.0 <= backoff_delay(20) <= 2.0
+
+
+def find_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+# =============================================================================
+# LOCAL SERVICE SUPERVISION
+# =============================================================================
+
+
+CHATTY_SERVICE = (
+    f'"{sys.executable}" -c "'
+    "import sys, time\n"
+    "for i in range(20000): print('line', i, 'x' * 100)\n"
+    "sys.stdout.flush()\n"
+    "open('done', 'w').close()\n"
+    'time.sleep(30)"'
+)
+
+
+def wait_until(condition, timeout: float = 10) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestProcessSupervisor:
+    """Tests for draining and capturing local service output."""
+
+    def test_chatty_service_does_not_block(self, temp_dir):
+        """Output far beyond the pipe buffer is drained to log and tail."""
+        supervisor = ProcessSupervisor(temp_dir / "logs", tail_lines=10)
+        errors = supervisor.start_all([("api", CHATTY_SERVICE, temp_dir)])
+        try:
+            assert errors == {"api": None}
+            assert wait_until(lambda: (temp_dir / "done").exists())
+            assert wait_until(lambda: supervisor.tail("api", 1) == [
+                "line 19999 " + "x" * 100
+            ])
+            assert len(supervisor.tail("api")) == 10
+            assert supervisor.get("api").returncode is None
+        finally:
+            supervisor.stop_all()
+
+        log = supervisor.log_path("api").read_text()
+        assert log.count("\n") == 20000
+
+    def test_log_rotation(self, temp_dir):
+        """Logs rotate by size and keep a bounded number of backups."""
+        log = RotatingLog(temp_dir / "svc.log", max_bytes=100, backup_count=2)
+        for i in range(10):
+            log.write(f"{i:049d}\n".encode())
+        log.close()
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == [
+            "svc.log",
+            "svc.log.1",
+            "svc.log.2",
+        ]
+        assert (temp_dir / "svc.log").read_text().startswith("8".zfill(49))
+        assert (temp_dir / "svc.log.2").read_text().startswith("4".zfill(49))
+
+    def test_orchestrator_starts_local_services(self, temp_dir):
+        """Local services start concurrently and expose their output."""
+        for name in ("api", "web"):
+            (temp_dir / "services" / name).mkdir(parents=True)
+            (temp_dir / "services" / name / "main.py").write_text("")
+
+        orchestrator = ServiceOrchestrator(temp_dir)
+        for service in orchestrator._services:
+            service.startup_command = (
+                f'"{sys.executable}" -c "print(\'{service.name} up\'); '
+                'import time; time.sleep(30)"'
+            )
+        orchestrator._services.append(
+            ServiceConfig(
+                name="broken",
+                path="missing",
+                type="local",
+                startup_command="true",
+            )
+        )
+
+        try:
+            result = orchestrator.start_services(timeout=5)
+            assert sorted(result.services_started) == ["api", "web"]
+            assert result.services_failed == ["broken"]
+            assert wait_until(
+                lambda: orchestrator.get_service_output("web") == ["web up"]
+            )
+        finally:
+            orchestrator.stop_services()
+
+        assert orchestrator.get_service_log_path("api") == (
+            temp_dir / ".auto-claude" / "service_logs" / "api.log"
+        )
+        assert orchestrator.get_service_log_path("api").read_text() == "api up\n"
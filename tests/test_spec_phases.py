@@ -8,8 +8,10 @@ Tests the PhaseExecutor class in auto-claude/spec/phases.py covering:
 - All phase methods (discovery, requirements, context, etc.)
 - Retry logic and error handling
 - File existence checks and caching
+- Dependency-driven scheduling of phases (spec/pipeline/scheduler.py)
 """
 
+import asyncio
 import json
 import pytest
 import sys
@@ -64,6 +66,7 @@ sys.modules['client'] = mock_client
 
 # Now import the phases module directly (bypasses __init__.py issues)
 from spec.phases import PhaseExecutor, PhaseResult, MAX_RETRIES
+from spec.pipeline.scheduler import PhaseScheduler, phase_dependencies
 
 
 # Cleanup fixture to restore original modules after all tests in this module
@@ -976,3 +979,121 @@ class TestPhaseWorkflow:
 
         # Verify UI print_status was called
         assert mock_ui_module.print_status.called
+
+
+COMPLEX_PHASES = [
+    "historical_context",
+    "research",
+    "context",
+    "spec_writing",
+    "self_critique",
+    "planning",
+    "validation",
+]
+
+
+class TestPhaseScheduler:
+    """Tests for running phases as a dependency graph."""
+
+    def _recorder(self, durations=None, fail=(), raise_once=()):
+        """run_phase function that records start/end order."""
+        events = []
+        raised = set()
+
+        async def run_phase(name):
+            events.append(("start", name))
+            await asyncio.sleep((durations or {}).get(name, 0.01))
+            if name in raise_once and name not in raised:
+                raised.add(name)
+                raise RuntimeError("transient")
+            events.append(("end", name))
+            return PhaseResult(name, name not in fail, [], [], 0)
+
+        return run_phase, events
+
+    def test_dependencies_from_declared_files(self):
+        """Independent phases share no dependencies; writers wait for readers."""
+        deps = phase_dependencies(COMPLEX_PHASES)
+
+        assert deps["historical_context"] == set()
+        assert deps["research"] == set()
+        assert deps["context"] == set()
+        assert deps["spec_writing"] == {"historical_context", "research", "context"}
+        assert deps["self_critique"] == {"research", "spec_writing"}
+        assert "self_critique" in deps["planning"]
+        assert deps["validation"] == set(COMPLEX_PHASES[:-1])
+
+    def test_planned_order_is_respected(self):
+        """A producer planned after its consumer runs after it."""
+        deps = phase_dependencies(["spec_writing", "research", "unknown"])
+
+        assert deps["research"] == {"spec_writing"}
+        assert deps["unknown"] == {"spec_writing", "research"}
+
+    @pytest.mark.asyncio
+    async def test_independent_phases_run_concurrently(self):
+        """Phases without dependencies overlap; the rest wait for them."""
+        run_phase, events = self._recorder(
+            {"historical_context": 0.2, "research": 0.2, "context": 0.2}
+        )
+
+        schedule = await PhaseScheduler(
+            COMPLEX_PHASES, run_phase, max_concurrency=3
+        ).run()
+
+        assert schedule.success
+        assert events[:3] == [
+            ("start", "historical_context"),
+            ("start", "research"),
+            ("start", "context"),
+        ]
+        assert events.index(("start", "spec_writing")) > events.index(
+            ("end", "context")
+        )
+        assert [r.phase for r in schedule.results] == COMPLEX_PHASES
+        assert schedule.elapsed < schedule.phase_seconds - 0.3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """No more than max_concurrency phases run at once."""
+        run_phase, events = self._recorder()
+
+        await PhaseScheduler(COMPLEX_PHASES, run_phase, max_concurrency=1).run()
+
+        assert events == [
+            (kind, name) for name in COMPLEX_PHASES for kind in ("start", "end")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_unstarted_phases(self):
+        """A failed phase stops the schedule; running phases still finish."""
+        run_phase, events = self._recorder(
+            {"research": 0.2}, fail={"historical_context"}
+        )
+        done = []
+
+        schedule = await PhaseScheduler(
+            COMPLEX_PHASES, run_phase, max_concurrency=3, on_phase_done=done.append
+        ).run()
+
+        assert not schedule.success
+        assert schedule.failed == ["historical_context"]
+        assert schedule.skipped == COMPLEX_PHASES[3:]
+        assert ("end", "research") in events
+        assert sorted(r.phase for r in done) == [
+            "context",
+            "historical_context",
+            "research",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_exceptions_are_retried(self):
+        """A phase that raises is retried, then reported as failed."""
+        run_phase, _ = self._recorder(raise_once={"research"})
+        schedule = await PhaseScheduler(["research"], run_phase, retries=1).run()
+        assert schedule.success
+
+        run_phase, _ = self._recorder(raise_once={"research"})
+        schedule = await PhaseScheduler(["research"], run_phase, retries=0).run()
+        assert schedule.failed == ["research"]
+        assert "RuntimeError: transient" in schedule.results[0].errors[0]
@@ -8,8 +8,10 @@ Tests the spec/pipeline.py module functionality including:
 - Spec directory creation and naming
 - Orphaned pending folder cleanup
 - Specs directory path resolution
+- Background phase summarization
 """
 
+import asyncio
 import json
 import pytest
 import sys
@@ -631,3 +633,67 @@ class TestSpecOrchestratorAssessment:
             orchestrator = SpecOrchestrator(project_dir=temp_dir)
 
             assert orchestrator.assessment is None
+
+
+class TestPhaseSummaryPipelining:
+    """Tests for phase summaries generated in the background."""
+
+    @pytest.fixture
+    def orchestrator(self, temp_dir: Path):
+        """SpecOrchestrator whose phase summaries take 0.2s each."""
+
+        async def summarize(phase_name, phase_output, **kwargs):
+            await asyncio.sleep(0.2)
+            return f"{phase_name} summary"
+
+        with patch('spec.pipeline.init_auto_claude_dir') as mock_init, patch(
+            'spec.pipeline.orchestrator.gather_phase_outputs',
+            return_value="phase output",
+        ), patch(
+            'spec.pipeline.orchestrator.summarize_phase_output', side_effect=summarize
+        ):
+            mock_init.return_value = (temp_dir / ".auto-claude", False)
+            (temp_dir / ".auto-claude" / "specs").mkdir(parents=True, exist_ok=True)
+            yield SpecOrchestrator(project_dir=temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_summary_overlaps_next_phase(self, orchestrator):
+        """Summarizing does not block until a later phase needs the summary."""
+        started = time.monotonic()
+        orchestrator._start_phase_summary("discovery")
+        assert time.monotonic() - started < 0.1
+
+        await asyncio.sleep(0.3)  # next phase, which doesn't read summaries
+        await orchestrator._collect_phase_summaries()
+
+        assert orchestrator._phase_summaries == {"discovery": "discovery summary"}
+        assert orchestrator.summary_time_saved >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_agent_waits_for_pending_summaries(self, orchestrator):
+        """Agents receive every prior summary, in phase order."""
+        runner = MagicMock()
+        runner.run_agent = AsyncMock(return_value=(True, "done"))
+        orchestrator._agent_runner = runner
+
+        orchestrator._start_phase_summary("discovery")
+        orchestrator._start_phase_summary("requirements")
+        await orchestrator._run_agent("spec_writer.md")
+
+        summaries = runner.run_agent.call_args.kwargs["prior_phase_summaries"]
+        assert summaries.index("discovery summary") < summaries.index(
+            "requirements summary"
+        )
+        # The agent waited for both, which ran alongside each other
+        assert 0.15 <= orchestrator.summary_time_saved < 0.3
+
+    @pytest.mark.asyncio
+    async def test_unread_summaries_are_cancelled(self, orchestrator):
+        """Summaries left pending when the run ends are cancelled."""
+        orchestrator._start_phase_summary("planning")
+        task = orchestrator._pending_summaries["planning"]
+
+        await orchestrator._discard_phase_summaries()
+
+        assert task.cancelled()
+        assert orchestrator._phase_summaries == {}
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for Task Log Streaming
+============================
+
+Tests the structured event channel for streaming markers:
+- Events are coalesced into length-prefixed JSON frames
+- Producers are held back (then fall back to stdout) when the queue is full
+- emit_marker uses the channel only when the parent provided one
+"""
+
+import json
+import os
+import struct
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# QA test modules replace task_logger with a mock while they are collected
+if isinstance(sys.modules.get("task_logger"), MagicMock):
+    del sys.modules["task_logger"]
+
+from task_logger import streaming
+from task_logger.streaming import EventChannel, emit_marker
+
+
+def _read_frames(fd: int) -> list[list[dict]]:
+    data = b""
+    while chunk := os.read(fd, 65536):
+        data += chunk
+    frames = []
+    while data:
+        (length,) = struct.unpack(">I", data[:4])
+        frames.append(json.loads(data[4 : 4 + length]))
+        data = data[4 + length :]
+    return frames
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    os.close(read_fd)
+
+
+@pytest.fixture
+def no_channel(monkeypatch):
+    monkeypatch.setattr(streaming, "_channel", None)
+    monkeypatch.setattr(streaming, "_channel_checked", False)
+
+
+class TestEventChannel:
+    """Tests for batching events onto a pipe."""
+
+    def test_coalesces_events(self, pipe):
+        read_fd, write_fd = pipe
+        channel = EventChannel(write_fd, flush_interval=0.2)
+        for i in range(50):
+            assert channel.publish("TEXT", {"content": f"line {i}"})
+        channel.close()
+
+        frames = _read_frames(read_fd)
+        events = [event for frame in frames for event in frame]
+        assert [e["data"]["content"] for e in events] == [
+            f"line {i}" for i in range(50)
+        ]
+        assert events[0]["type"] == "TEXT"
+        assert len(frames) < 5
+
+    def test_backpressure_falls_back(self, pipe, monkeypatch):
+        read_fd, write_fd = pipe
+        monkeypatch.setattr(streaming, "BACKPRESSURE_TIMEOUT", 0.05)
+        channel = EventChannel(write_fd, flush_interval=30, max_pending=2)
+
+        assert channel.publish("TEXT", {"n": 1})
+        assert channel.publish("TEXT", {"n": 2})
+        assert not channel.publish("TEXT", {"n": 3})
+        channel.close()
+
+        events = [event for frame in _read_frames(read_fd) for event in frame]
+        assert [e["data"]["n"] for e in events] == [1, 2]
+
+    def test_broken_pipe(self, capsys):
+        read_fd, write_fd = os.pipe()
+        os.close(read_fd)
+
+        channel = EventChannel(write_fd, flush_interval=0)
+        channel.publish("TOOL_END", {"tool": "Read"})
+        channel._thread.join(5)
+
+        assert not channel.usable
+        assert not channel.publish("TEXT", {})
+        assert '__TASK_LOG_TOOL_END__:{"tool": "Read"}' in capsys.readouterr().out
+        channel.close()
+
+
+class TestEmitMarker:
+    """Tests for choosing between the channel and stdout."""
+
+    def test_stdout_without_channel(self, no_channel, monkeypatch, capsys):
+        monkeypatch.delenv("AUTO_CLAUDE_EVENT_FD", raising=False)
+        emit_marker("phase_start", {"phase": "coding"})
+
+        assert capsys.readouterr().out == (
+            '__TASK_LOG_PHASE_START__:{"phase": "coding"}\n'
+        )
+
+    def test_uses_channel_from_parent(self, no_channel, pipe, monkeypatch, capsys):
+        read_fd, write_fd = pipe
+        monkeypatch.setenv("AUTO_CLAUDE_EVENT_FD", str(write_fd))
+        monkeypatch.setenv("AUTO_CLAUDE_EVENT_PARENT", str(os.getppid()))
+        monkeypatch.setenv("AUTO_CLAUDE_EVENT_FLUSH_MS", "0")
+
+        emit_marker("phase_start", {"phase": "coding"})
+        streaming.get_event_channel().close()
+
+        assert capsys.readouterr().out == ""
+        assert _read_frames(read_fd) == [
+            [{"type": "PHASE_START", "data": {"phase": "coding"}}]
+        ]
+
+    def test_ignores_channel_of_other_process(
+        self, no_channel, pipe, monkeypatch, capsys
+    ):
+        _, write_fd = pipe
+        monkeypatch.setenv("AUTO_CLAUDE_EVENT_FD", str(write_fd))
+        monkeypatch.setenv("AUTO_CLAUDE_EVENT_PARENT", str(os.getppid() + 1))
+
+        emit_marker("text", {"content": "hi"})
+
+        assert streaming.get_event_channel() is None
+        assert "__TASK_LOG_TEXT__" in capsys.readouterr().out
+        os.close(write_fd)